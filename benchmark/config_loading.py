@@ -0,0 +1,112 @@
+"""*Benchmark of loading a large configuration*
+
+It compares the way parsing the entire YAML file by *yaml.load* and then deserializing the data model from the parsed
+content (the way before the single-pass parsing) with the current way *load_config*, which builds the Python objects
+from the parsing events directly and deserializes every mocked API as soon as it has been parsed. Every way runs in
+a new process to measure its peak memory (RSS).
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmark/config_loading.py [<amount of mocked APIs>]
+"""
+
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Callable, Tuple
+
+from yaml import CDumper, CLoader, dump, load
+
+from fake_api_server.model import FakeAPIConfig, load_config
+
+
+def _generate_config(path: str, amount: int) -> None:
+    apis = {}
+    for i in range(amount):
+        apis[f"api_{i}"] = {
+            "url": f"/resource{i}/<id>",
+            "http": {
+                "request": {
+                    "method": "GET" if i % 2 == 0 else "POST",
+                    "parameters": [
+                        {"name": "id", "required": True, "type": "int", "format": None},
+                        {"name": "q", "required": False, "type": "str", "default": "x"},
+                    ],
+                },
+                "response": {
+                    "strategy": "object",
+                    "properties": [
+                        {"name": "id", "required": True, "type": "int", "format": None},
+                        {"name": "name", "required": True, "type": "str", "format": None},
+                        {
+                            "name": "items",
+                            "required": False,
+                            "type": "list",
+                            "items": [{"name": "value", "required": True, "type": "str"}],
+                        },
+                    ],
+                },
+            },
+            "tag": f"tag{i % 20}",
+        }
+    config = {
+        "name": "Large configuration",
+        "description": "The configuration for benchmark.",
+        "mocked_apis": {"template": {"activate": False}, "base": {"url": "/api/v1"}, "apis": apis},
+    }
+    with open(path, "w", encoding="utf-8") as file_stream:
+        dump(config, file_stream, Dumper=CDumper, sort_keys=False)
+
+
+def _load_and_deserialize(path: str) -> FakeAPIConfig:
+    # The way before: parse the entire file and then deserialize the data model
+    with open(path, "r", encoding="utf-8") as file_stream:
+        data = load(file_stream, Loader=CLoader)
+    api_config = FakeAPIConfig()
+    api_config.config_file_name = os.path.basename(path)
+    api_config.base_file_path = os.path.dirname(path)
+    return api_config.deserialize(data=data)  # type: ignore[return-value]
+
+
+def _load_config(path: str) -> FakeAPIConfig:
+    return load_config(path)  # type: ignore[return-value]
+
+
+def _measure_in_process(load_function: Callable, path: str, result: multiprocessing.Queue) -> None:
+    start = time.perf_counter()
+    api_config = load_function(path)
+    cost = time.perf_counter() - start
+    assert api_config.apis is not None
+    # The unit of *ru_maxrss* is KB in Linux
+    result.put((cost, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, len(api_config.apis)))
+
+
+def _measure(load_function: Callable, path: str) -> Tuple[float, float, int]:
+    result: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_measure_in_process, args=(load_function, path, result))
+    process.start()
+    measured = result.get()
+    process.join()
+    return measured
+
+
+def run(amount: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = os.path.join(tmp_dir, "api.yaml")
+        _generate_config(config_path, amount)
+        size = os.path.getsize(config_path) / 1024 / 1024
+        print(f"Configuration: {amount} mocked APIs, {size:.1f} MB")
+        print(f"{'way':>22} | {'time (s)':>10} | {'peak RSS (MB)':>14}")
+        for name, load_function in (("yaml.load+deserialize", _load_and_deserialize), ("load_config", _load_config)):
+            cost, peak_memory, apis_amount = _measure(load_function, config_path)
+            assert apis_amount == amount
+            print(f"{name:>22} | {cost:>10.2f} | {peak_memory:>14.1f}")
+
+
+if __name__ == "__main__":
+    run(amount=int(sys.argv[1]) if len(sys.argv) > 1 else 65000)
@@ -0,0 +1,123 @@
+"""*Benchmark of the memory of configuration data model*
+
+It deserializes a large configuration which has many request parameters and nested response properties (like the
+configuration pulled from a big OpenAPI document) and measures the memory allocated by the data model with
+*tracemalloc*. It also counts the objects of the property data models.
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmark/config_memory.py [<amount of mocked APIs>]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List
+
+from fake_api_server.model import FakeAPIConfig
+from fake_api_server.model.api_config.apis import APIParameter, ResponseProperty
+from fake_api_server.model.api_config.format import Format
+from fake_api_server.model.api_config.item import IteratorItem
+from fake_api_server.model.api_config.variable import Digit, Size, Variable
+
+_Counted_Types = (APIParameter, ResponseProperty, IteratorItem, Format, Digit, Size, Variable)
+
+
+def _generate_properties(index: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": "id",
+            "required": True,
+            "type": "int",
+            "format": {"strategy": "by_data_type", "digit": {"integer": 6}},
+        },
+        {"name": "name", "required": True, "type": "str", "format": {"strategy": "by_data_type", "size": {"max": 16}}},
+        {
+            "name": "code",
+            "required": False,
+            "type": "str",
+            "format": {
+                "strategy": "customize",
+                "customize": "<prefix>-<number>",
+                "variables": [
+                    {"name": "prefix", "value_format": "enum", "enum": ["A", "B"]},
+                    {"name": "number", "value_format": "int", "digit": {"integer": 4}},
+                ],
+            },
+        },
+        {
+            "name": "items",
+            "required": True,
+            "type": "list",
+            "items": [
+                {"name": "value", "required": True, "type": "str"},
+                {"name": "amount", "required": True, "type": "int"},
+                {"name": "enabled", "required": False, "type": "bool"},
+            ],
+        },
+        {
+            "name": "status",
+            "required": True,
+            "type": "str",
+            "format": {"strategy": "from_enums", "enums": ["ok", f"status{index % 10}"]},
+        },
+    ]
+
+
+def _generate_config(amount: int) -> Dict[str, Any]:
+    apis = {}
+    for i in range(amount):
+        apis[f"api_{i}"] = {
+            "url": f"/resource{i}/<id>",
+            "http": {
+                "request": {
+                    "method": "GET",
+                    "parameters": [
+                        {"name": "id", "required": True, "type": "int"},
+                        {"name": "q", "required": False, "type": "str", "default": "x"},
+                        {"name": "size", "required": False, "type": "int", "default": 10},
+                    ],
+                },
+                "response": {"strategy": "object", "properties": _generate_properties(i)},
+            },
+        }
+    return {
+        "name": "Large configuration",
+        "mocked_apis": {"template": {"activate": False}, "base": {"url": "/api/v1"}, "apis": apis},
+    }
+
+
+def _count_property_objects() -> Counter:
+    counter: Counter = Counter()
+    for obj in gc.get_objects():
+        if isinstance(obj, _Counted_Types):
+            counter[type(obj).__name__] += 1
+    return counter
+
+
+def run(amount: int) -> None:
+    config = _generate_config(amount)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    api_config = FakeAPIConfig().deserialize(config)
+    cost = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert api_config is not None
+
+    counter = _count_property_objects()
+    print(f"Configuration: {amount} mocked APIs, {sum(counter.values())} property objects")
+    for type_name, objects_amount in sorted(counter.items()):
+        print(f"{type_name:>18}: {objects_amount}")
+    print(f"Deserializing time: {cost:.2f} s")
+    print(f"Memory of the data model: {current / 1024 / 1024:.1f} MB (peak {peak / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    run(amount=int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,362 @@
+"""*Benchmark of the request path of the mocked web application*
+
+It generates the synthetic configurations which have different amounts of mocked APIs. The mocked APIs use all the
+response strategies (*string*, *file* and *object*) with static or parameterized URLs, and the response properties of
+strategy *object* use all the format strategies. For every amount of mocked APIs, it measures the startup time, the
+memory and the latency of every kind of request through:
+
+* *flask*: the test client of *Flask* with **FlaskServer**.
+* *fastapi*: the *TestClient* of *FastAPI* with **FastAPIServer**.
+* *direct*: calling **HTTPRequestProcess** and **HTTPResponseProcess** directly without any web framework. The request
+  has been routed, so it doesn't include the time of routing.
+
+The result would be printed and written as JSON for tracking the regression.
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmark/request_path.py [--amounts 10,1000,10000] [--requests 200] [--targets flask,fastapi,direct] \\
+        [--output benchmark-request-path.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fake_api_server.__pkg_info__ import __version__
+from fake_api_server.model import MockAPIs
+from fake_api_server.server.rest.application import (
+    BaseAppServer,
+    FastAPIServer,
+    FlaskServer,
+)
+from fake_api_server.server.rest.application.asgi import ASGIRequestContext
+from fake_api_server.server.rest.application.process import (
+    HTTPRequestProcess,
+    HTTPResponseProcess,
+)
+from fake_api_server.server.rest.application.request import ASGIRequest
+from fake_api_server.server.rest.application.response import ASGIResponse
+
+_Base_URL = "/api/v1"
+_Response_Strategies = ("string", "file", "object")
+
+# The kinds of requests which be measured: (<response strategy>, <whether the URL has a variable or not>)
+_Request_Cases: List[Tuple[str, bool]] = [
+    (strategy, parameterized) for strategy in _Response_Strategies for parameterized in (False, True)
+]
+
+
+def _object_properties() -> List[Dict[str, Any]]:
+    # All the format strategies: by_data_type, from_enums, customize and from_template
+    return [
+        {
+            "name": "id",
+            "required": True,
+            "type": "int",
+            "format": {"strategy": "by_data_type", "digit": {"integer": 6}},
+        },
+        {
+            "name": "status",
+            "required": True,
+            "type": "str",
+            "format": {"strategy": "from_enums", "enums": ["active", "inactive", "deleted"]},
+        },
+        {
+            "name": "code",
+            "required": True,
+            "type": "str",
+            "format": {
+                "strategy": "customize",
+                "customize": "<prefix>-<number>",
+                "variables": [
+                    {"name": "prefix", "value_format": "enum", "enum": ["A", "B", "C"]},
+                    {"name": "number", "value_format": "int", "digit": {"integer": 4}},
+                ],
+            },
+        },
+        {
+            "name": "price",
+            "required": True,
+            "type": "str",
+            "format": {"strategy": "from_template", "use_name": "price"},
+        },
+        {
+            "name": "items",
+            "required": True,
+            "type": "list",
+            "items": [
+                {"name": "name", "required": True, "type": "str"},
+                {"name": "amount", "required": True, "type": "int"},
+            ],
+        },
+    ]
+
+
+def _api_url(index: int, parameterized: bool) -> str:
+    return f"/resource{index}/<id>" if parameterized else f"/resource{index}"
+
+
+def _generate_config(amount: int, file_path: str) -> Dict[str, Any]:
+    apis = {}
+    for i in range(amount):
+        strategy, parameterized = _Request_Cases[i % len(_Request_Cases)]
+        response: Dict[str, Any] = {"strategy": strategy}
+        if strategy == "string":
+            response["value"] = json.dumps({"id": i, "name": f"resource {i}"})
+        elif strategy == "file":
+            response["path"] = file_path
+        else:
+            response["properties"] = _object_properties()
+        apis[f"api_{i}"] = {
+            "url": _api_url(i, parameterized),
+            "http": {
+                "request": {
+                    "method": "GET",
+                    "parameters": [{"name": "q", "required": False, "type": "str", "default": "x"}],
+                },
+                "response": response,
+            },
+        }
+    return {
+        "template": {
+            "activate": False,
+            "common_config": {
+                "activate": False,
+                "format": {
+                    "entities": [
+                        {
+                            "name": "price",
+                            "config": {
+                                "strategy": "customize",
+                                "customize": "<amount> <currency>",
+                                "variables": [
+                                    {"name": "amount", "value_format": "big_decimal", "digit": {"integer": 4}},
+                                    {"name": "currency", "value_format": "enum", "enum": ["USD", "EUR", "TWD"]},
+                                ],
+                            },
+                        },
+                    ],
+                },
+            },
+        },
+        "base": {"url": _Base_URL},
+        "apis": apis,
+    }
+
+
+def _request_paths(amount: int) -> Dict[str, Tuple[str, str]]:
+    # The request path and the API URL of every kind of request, the APIs in the middle of configuration are used
+    paths = {}
+    for case_index, (strategy, parameterized) in enumerate(_Request_Cases):
+        if case_index >= amount:
+            break
+        middle = (amount // 2) - (amount // 2) % len(_Request_Cases) + case_index
+        api_index = middle if middle < amount else case_index
+        url = f"{_Base_URL}{_api_url(api_index, parameterized)}"
+        case_name = f"{strategy}-{'parameterized' if parameterized else 'static'}"
+        paths[case_name] = (url.replace("<id>", "12345"), url)
+    return paths
+
+
+def _measure(call: Callable[[], Any], requests: int) -> Dict[str, float]:
+    # Warm up, e.g., compiling the response
+    for _ in range(min(10, requests)):
+        call()
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    latencies.sort()
+    return {
+        "mean_us": round(statistics.fmean(latencies), 2),
+        "p50_us": round(latencies[len(latencies) // 2], 2),
+        "p95_us": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+    }
+
+
+class _Target:
+    name: str = ""
+
+    def start(self, config: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def request(self, path: str, url: str) -> Callable[[], Any]:
+        raise NotImplementedError
+
+
+class _WebFrameworkTarget(_Target):
+    server_type: type = BaseAppServer
+
+    def __init__(self):
+        self._client: Any = None
+
+    def start(self, config: Dict[str, Any]) -> None:
+        app_server: BaseAppServer = self.server_type()
+        app_server.create_api(MockAPIs().deserialize(config))
+        self._client = self._test_client(app_server.web_application)
+
+    def _test_client(self, web_application: Any) -> Any:
+        raise NotImplementedError
+
+    def request(self, path: str, url: str) -> Callable[[], Any]:
+        client = self._client
+
+        def _request() -> None:
+            response = client.get(path)
+            assert response.status_code == 200, f"Fail to request *{path}*: {response.status_code}"
+
+        return _request
+
+
+class _FlaskTarget(_WebFrameworkTarget):
+    name = "flask"
+    server_type = FlaskServer
+
+    def _test_client(self, web_application: Any) -> Any:
+        return web_application.test_client()
+
+
+class _FastAPITarget(_WebFrameworkTarget):
+    name = "fastapi"
+    server_type = FastAPIServer
+
+    def _test_client(self, web_application: Any) -> Any:
+        from fastapi.testclient import TestClient
+
+        return TestClient(web_application)
+
+
+class _DirectTarget(_Target):
+    name = "direct"
+
+    def __init__(self):
+        self._http_request: Optional[HTTPRequestProcess] = None
+        self._http_response: Optional[HTTPResponseProcess] = None
+
+    def start(self, config: Dict[str, Any]) -> None:
+        mocked_apis = MockAPIs().deserialize(config)
+        assert mocked_apis is not None
+        base_url = mocked_apis.base.url if mocked_apis.base else ""
+        details = {
+            f"{base_url}{url}": {api.http.request.method.upper(): api for api in apis}  # type: ignore[union-attr]
+            for url, apis in mocked_apis.group_by_url().items()
+        }
+        self._http_request = HTTPRequestProcess(request=ASGIRequest(), response=ASGIResponse())
+        self._http_response = HTTPResponseProcess(request=ASGIRequest(), response=ASGIResponse())
+        self._http_request.mock_api_details = details
+        self._http_response.mock_api_details = details
+
+    def request(self, path: str, url: str) -> Callable[[], Any]:
+        http_request, http_response = self._http_request, self._http_response
+        assert http_request is not None and http_response is not None
+
+        def _request() -> None:
+            request = ASGIRequestContext(method="GET", path=path, query={}, headers={}, body=b"", api_path=url)
+            assert http_request.process(request=request).status_code == 200
+            http_response.process(request=request)
+
+        return _request
+
+
+_Targets: Dict[str, Callable[[], _Target]] = {
+    _FlaskTarget.name: _FlaskTarget,
+    _FastAPITarget.name: _FastAPITarget,
+    _DirectTarget.name: _DirectTarget,
+}
+
+
+def run(amounts: List[int], requests: int, targets: List[str]) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "response.json")
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump({"data": [{"id": i, "name": f"item {i}"} for i in range(20)]}, file)
+
+        for amount in amounts:
+            config = _generate_config(amount, file_path=file_path)
+            for target_name in targets:
+                # Import the modules which be imported lazily before measuring
+                _Targets[target_name]().start(_generate_config(1, file_path=file_path))
+
+                # Measure the memory in another round, tracing memory slows down the startup
+                gc.collect()
+                tracemalloc.start()
+                traced_target = _Targets[target_name]()
+                traced_target.start(config)
+                gc.collect()
+                memory, _ = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                del traced_target
+
+                target = _Targets[target_name]()
+                gc.collect()
+                start = time.perf_counter()
+                target.start(config)
+                startup = time.perf_counter() - start
+
+                result: Dict[str, Any] = {
+                    "target": target_name,
+                    "apis": amount,
+                    "startup_seconds": round(startup, 4),
+                    "memory_mb": round(memory / 1024 / 1024, 2),
+                    "requests": {},
+                }
+                for case_name, (path, url) in _request_paths(amount).items():
+                    result["requests"][case_name] = _measure(target.request(path, url), requests)
+                results.append(result)
+                _print_result(result)
+    return {
+        "benchmark": "request_path",
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "fake_api_server": __version__,
+        },
+        "requests_per_case": requests,
+        "results": results,
+    }
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    print(
+        f"[{result['target']:>7}] {result['apis']:>6} APIs: startup {result['startup_seconds']:.3f} s, "
+        f"memory {result['memory_mb']:.1f} MB"
+    )
+    for case_name, latency in result["requests"].items():
+        print(
+            f"{'':>10}{case_name:<24} mean {latency['mean_us']:>9.1f} us, p50 {latency['p50_us']:>9.1f} us, "
+            f"p95 {latency['p95_us']:>9.1f} us"
+        )
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark of the request path of the mocked web application.")
+    parser.add_argument("--amounts", default="10,1000,10000", help="The amounts of mocked APIs, split by comma.")
+    parser.add_argument("--requests", type=int, default=200, help="The amount of requests of every kind.")
+    parser.add_argument("--targets", default=",".join(_Targets.keys()), help="The targets to measure, split by comma.")
+    parser.add_argument("--output", default="benchmark-request-path.json", help="The file path of JSON result.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _parse_args(sys.argv[1:])
+    benchmark_result = run(
+        amounts=[int(amount) for amount in args.amounts.split(",")],
+        requests=args.requests,
+        targets=[target for target in args.targets.split(",") if target],
+    )
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(benchmark_result, output_file, indent=2)
+    print(f"Write the result into {args.output}.")
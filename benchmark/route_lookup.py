@@ -0,0 +1,67 @@
+"""*Micro-benchmark of resolving the request path which has variable(s) in it*
+
+It compares the linear scan with regular expression (the way before having route index) with the prebuilt route
+index *APIRouteIndex*. The time of route index should keep flat no matter how many APIs there are.
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmark/route_lookup.py
+"""
+
+import re
+import timeit
+from typing import Dict, List
+
+from fake_api_server.server.rest.application.route import APIRouteIndex
+
+
+def _generate_urls(amount: int) -> List[str]:
+    urls = []
+    for i in range(amount):
+        if i % 3 == 0:
+            urls.append(f"/api/v1/resource{i}")
+        elif i % 3 == 1:
+            urls.append(f"/api/v1/resource{i}/<id>")
+        else:
+            urls.append(f"/api/v1/resource{i}/<id>/sub/<sub_id>")
+    return urls
+
+
+def _linear_scan(mock_api_details: Dict[str, dict], api_path: str) -> str:
+    def _find_mapping_api(api: str):
+        simple_api_path_parts = re.sub(r"<\w{1,32}>", "<>", api).split("<>")
+        search_regular = r""
+        for api_part in simple_api_path_parts:
+            search_regular += re.escape(api_part) + r"\w{1,256}"
+        return re.search(search_regular, api_path)
+
+    api_has_variable = list(filter(lambda p: re.search(r"<\w{1,32}>", p) is not None, mock_api_details.keys()))
+    mapping_variable_api = list(filter(lambda api: _find_mapping_api(api) is not None, api_has_variable))
+    if len(mapping_variable_api) > 1:
+        mapping_variable_api = list(
+            filter(lambda api: len(api) == max(map(lambda a: len(a), mapping_variable_api)), mapping_variable_api)
+        )
+    return mapping_variable_api[0]
+
+
+def run(amounts: List[int], number: int = 200) -> None:
+    print(f"{'APIs':>8} | {'linear scan (us)':>18} | {'route index (us)':>18}")
+    for amount in amounts:
+        urls = _generate_urls(amount)
+        mock_api_details = {url: {} for url in urls}
+        route_index = APIRouteIndex(urls)
+        # The last one which has variables is the worst case of linear scan
+        target_url = [url for url in urls if "<sub_id>" in url][-1]
+        api_path = target_url.replace("<id>", "123").replace("<sub_id>", "666")
+        assert _linear_scan(mock_api_details, api_path) == route_index.match(api_path) == target_url
+
+        linear_number = max(1, number // max(1, amount // 100))
+        linear_cost = timeit.timeit(lambda: _linear_scan(mock_api_details, api_path), number=linear_number)
+        index_cost = timeit.timeit(lambda: route_index.match(api_path), number=number)
+        print(f"{amount:>8} | {linear_cost / linear_number * 1e6:>18.2f} | {index_cost / number * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    run(amounts=[10, 100, 1500, 10000])
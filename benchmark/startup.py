@@ -0,0 +1,58 @@
+"""*Benchmark of creating APIs in the web application when it starts up*
+
+It measures *BaseAppServer.create_api* which registers the handler of every API as a closure in the web application.
+Every worker of *gunicorn* or *uvicorn* pays this cost when it boots.
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmark/startup.py
+"""
+
+import time
+from typing import List, Type
+
+from fake_api_server.model import MockAPIs
+from fake_api_server.server.rest.application import (
+    BaseAppServer,
+    FastAPIServer,
+    FlaskServer,
+    PureASGIServer,
+)
+
+
+def _generate_mocked_apis(amount: int) -> MockAPIs:
+    apis = {}
+    for i in range(amount):
+        url = f"/resource{i}" if i % 2 == 0 else f"/resource{i}/<id>"
+        apis[f"api_{i}"] = {
+            "url": url,
+            "http": {
+                "request": {
+                    "method": "GET" if i % 4 < 2 else "POST",
+                    "parameters": [{"name": "param1", "required": False, "type": "str"}],
+                },
+                "response": {"strategy": "string", "value": f'{{"id": {i}}}'},
+            },
+        }
+    return MockAPIs().deserialize({"base": {"url": "/api/v1"}, "apis": apis})
+
+
+def _measure(server_type: Type[BaseAppServer], mocked_apis: MockAPIs) -> float:
+    app_server = server_type()
+    start = time.perf_counter()
+    app_server.create_api(mocked_apis)
+    return time.perf_counter() - start
+
+
+def run(amounts: List[int]) -> None:
+    print(f"{'server':>14} | {'APIs':>8} | {'create APIs (s)':>16}")
+    for server_type in (FlaskServer, FastAPIServer, PureASGIServer):
+        for amount in amounts:
+            cost = _measure(server_type, _generate_mocked_apis(amount))
+            print(f"{server_type.__name__:>14} | {amount:>8} | {cost:>16.3f}")
+
+
+if __name__ == "__main__":
+    run(amounts=[100, 1000, 10000])
@@ -0,0 +1,179 @@
+"""*Cache of the file content*
+
+Keep the parsed content of files in memory so that it doesn't need to read and parse the same file again and again.
+The cached content would be invalidated if the modified time or size of the file changes.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+FileCacheInfo = namedtuple(
+    "FileCacheInfo", ("hits", "misses", "invalidations", "evictions", "currsize", "currbytes", "maxbytes")
+)
+
+_SettingType = TypeVar("_SettingType", int, float)
+
+Default_Max_Bytes: int = 64 * 1024 * 1024
+Default_Check_Interval: float = 1.0
+
+
+def _setting_from_env(name: str, value_type: Callable[[str], _SettingType], default: _SettingType) -> _SettingType:
+    value = os.environ.get(name, "")
+    if value:
+        try:
+            return value_type(value)
+        except ValueError:
+            logger.warning(
+                f"The environment variable *{name}* should be a number, but it's *{value}*. It would use the default "
+                f"value *{default}*."
+            )
+    return default
+
+
+class _FileCacheEntry:
+    __slots__ = ("content", "mtime_ns", "size", "checked_at")
+
+    def __init__(self, content: Any, stat_result: os.stat_result, checked_at: float):
+        self.content = content
+        self.mtime_ns: int = stat_result.st_mtime_ns
+        self.size: int = stat_result.st_size
+        self.checked_at: float = checked_at
+
+
+class FileContentCache:
+    """*LRU cache of file content bounded by the total bytes of the cached files*
+
+    It won't check the file status in every lookup. It only checks the modified time and size of file if it has
+    passed the interval since the last checking.
+    """
+
+    def __init__(self, max_bytes: int = Default_Max_Bytes, check_interval: float = Default_Check_Interval):
+        self._max_bytes = max_bytes
+        self._check_interval = check_interval
+        self._entries: "OrderedDict[str, _FileCacheEntry]" = OrderedDict()
+        self._current_bytes: int = 0
+        self._lock = threading.Lock()
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._invalidations: int = 0
+        self._evictions: int = 0
+
+    @classmethod
+    def from_env(cls) -> "FileContentCache":
+        """Instantiate the cache with the settings from environment variables.
+
+        * *MockAPI_File_Cache_Max_Bytes*: the maximum total bytes of cached files. Setting *0* would disable the cache.
+        * *MockAPI_File_Cache_Check_Interval*: the interval (in seconds) to check whether the file changes or not.
+
+        Returns:
+            A **FileContentCache** type object.
+
+        """
+        return cls(
+            max_bytes=_setting_from_env("MockAPI_File_Cache_Max_Bytes", int, Default_Max_Bytes),
+            check_interval=_setting_from_env("MockAPI_File_Cache_Check_Interval", float, Default_Check_Interval),
+        )
+
+    @property
+    def enable(self) -> bool:
+        return self._max_bytes > 0
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Get the cached content of the file.
+
+        Args:
+            path (str): The file path.
+            default (Any): The value which would be returned if the file content is not in cache or it's out of date.
+
+        Returns:
+            The cached content of the file.
+
+        """
+        if not self.enable:
+            return default
+        with self._lock:
+            entry = self._entries.get(path, None)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            now = time.monotonic()
+            if now - entry.checked_at >= self._check_interval:
+                if not self._is_fresh(path, entry):
+                    self._remove(path)
+                    self._invalidations += 1
+                    self._misses += 1
+                    logger.info(f"The file {path} has been changed, invalidate its cache. {self.cache_info()}")
+                    return default
+                entry.checked_at = now
+
+            self._entries.move_to_end(path)
+            self._hits += 1
+            return entry.content
+
+    def set(self, path: str, content: Any, stat_result: os.stat_result) -> None:
+        """Cache the content of the file.
+
+        Args:
+            path (str): The file path.
+            content (Any): The content of the file which has been parsed.
+            stat_result (os.stat_result): The status of the file before reading it.
+
+        Returns:
+            None
+
+        """
+        if not self.enable or stat_result.st_size > self._max_bytes:
+            return
+        with self._lock:
+            if path in self._entries:
+                self._remove(path)
+            self._entries[path] = _FileCacheEntry(content, stat_result, checked_at=time.monotonic())
+            self._current_bytes += stat_result.st_size
+            while self._current_bytes > self._max_bytes:
+                evicted_path, evicted_entry = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_entry.size
+                self._evictions += 1
+                logger.info(f"Evict the cache of file {evicted_path}. {self.cache_info()}")
+
+    def cache_info(self) -> FileCacheInfo:
+        return FileCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            evictions=self._evictions,
+            currsize=len(self._entries),
+            currbytes=self._current_bytes,
+            maxbytes=self._max_bytes,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path)
+        self._current_bytes -= entry.size
+
+    @staticmethod
+    def _is_fresh(path: str, entry: _FileCacheEntry) -> bool:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return False
+        return stat_result.st_mtime_ns == entry.mtime_ns and stat_result.st_size == entry.size
+
+    @staticmethod
+    def stat(path: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
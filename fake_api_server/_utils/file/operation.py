@@ -6,9 +6,25 @@ Read the configuration and parse its content to a specific data object so that i
 import json
 import os
 from abc import ABCMeta, abstractmethod
-from typing import Union
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from yaml import dump, load
+from yaml.error import Mark
+from yaml.events import (
+    AliasEvent,
+    DocumentEndEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import ScalarNode
 
 try:
     from yaml import CDumper as Dumper
@@ -16,12 +32,72 @@ try:
 except ImportError:
     from yaml import Dumper, Loader  # type: ignore
 
+# The lists which record the paths of files be read. It could record in nested contexts, and all of them would be
+# appended when reading a file.
+_Read_File_Paths: ContextVar[Tuple[List[str], ...]] = ContextVar("_Read_File_Paths", default=())
+
+
+@contextmanager
+def record_read_files() -> Iterator[List[str]]:
+    """Record the paths of all configuration files which be read in the context.
+
+    Returns:
+        A list of the absolute paths of files. It would be appended when any file be read in the context.
+
+    """
+    paths: List[str] = []
+    token = _Read_File_Paths.set(_Read_File_Paths.get() + (paths,))
+    try:
+        yield paths
+    finally:
+        _Read_File_Paths.reset(token)
+
+
+# The mapping in the document which its entries would be converted one by one as soon as they have been parsed, so it
+# doesn't need to keep the parsed data of all entries at the same time. The data structure would be:
+# * path: The keys from the root of the document to the mapping, e.g., ``("mocked_apis", "apis")``.
+# * prepare: The callable which would be called with the parent mapping (only has the entries which have been parsed)
+#     before converting any entry of the mapping.
+# * convert: The callable which would be called with the key and the value of every entry, and the value of the entry
+#     would be replaced by its return value.
+MappingConverter = namedtuple("MappingConverter", ("path", "prepare", "convert"))
+
+
+def _record_read_file(path: str) -> None:
+    all_paths = _Read_File_Paths.get()
+    if all_paths:
+        abs_path = os.path.abspath(path)
+        for paths in all_paths:
+            paths.append(abs_path)
+
 
 class _BaseFileOperation(metaclass=ABCMeta):
     @abstractmethod
-    def read(self, path: str) -> dict:
+    def read(self, path: str, mapping_converter: Optional[MappingConverter] = None) -> dict:
         pass
 
+    def read_many(self, paths: List[str], workers: int = 1) -> List[dict]:
+        """Read and parse multiple files. It would parse them in a process pool if it has more than 1 worker, because
+        parsing the content is CPU-bound.
+
+        Args:
+            paths (List[str]): The file paths.
+            workers (int): The maximum amount of processes to parse the files.
+
+        Returns:
+            A list of the content of the files in the same order as the file paths.
+
+        """
+        if workers <= 1 or len(paths) <= 1:
+            return [self.read(path) for path in paths]
+
+        chunk_size = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            data = list(executor.map(self.read, paths, chunksize=chunk_size))
+        for path in paths:
+            _record_read_file(path)
+        return data
+
     @abstractmethod
     def write(self, path: str, config: Union[str, dict], mode: str = "a+") -> None:
         pass
@@ -31,14 +107,219 @@ class _BaseFileOperation(metaclass=ABCMeta):
         pass
 
 
+class _UnsupportedYAMLContent(Exception):
+    pass
+
+
+class _YAMLCollection:
+    """The mapping or sequence which is being built from the parsing events."""
+
+    __slots__ = ("data", "anchor", "key", "has_key", "matched_path", "merged")
+
+    def __init__(self, data: Union[dict, list], anchor: Optional[str], matched_path: int):
+        self.data = data
+        self.anchor = anchor
+        self.key: Any = None
+        self.has_key = False
+        # The amount of the keys of *MappingConverter.path* which this collection matches. It's -1 if it doesn't match.
+        self.matched_path = matched_path
+        self.merged: List[dict] = []
+
+
+_Merge_Key = object()
+
+
+class _YAMLDocumentBuilder:
+    """*Build the Python objects of a YAML document from the parsing events directly*
+
+    It doesn't compose the entire node tree of the document and then construct the Python objects from the nodes like
+    function *yaml.load*. It builds the Python objects in one pass, and the same short scalar values share the same
+    objects. So it costs much less time and memory, especially for a large document. It could also convert the entries
+    of one specific mapping one by one by **MappingConverter**.
+
+    It raises **_UnsupportedYAMLContent** if the document has the contents which it doesn't support, e.g., recursive
+    objects or the explicit tags of collections. Please use function *yaml.load* to parse it in this case.
+    """
+
+    _Str_Tag = "tag:yaml.org,2002:str"
+    _Merge_Tag = "tag:yaml.org,2002:merge"
+    _Collection_Tags = ("tag:yaml.org,2002:map", "tag:yaml.org,2002:seq")
+    # Only share the objects of the short scalar values
+    _Max_Shared_Scalar_Length = 128
+
+    def __init__(self, loader: Any, mapping_converter: Optional[MappingConverter] = None):
+        self._loader = loader
+        self._mapping_converter = mapping_converter
+        self._converted_path: Tuple[str, ...] = tuple(mapping_converter.path) if mapping_converter else ()
+        self._anchors: Dict[str, Any] = {}
+        # The data structure would be:
+        # {
+        #     (<scalar value>, <whether it's implicit>): <the Python object of the scalar value>
+        # }
+        self._scalars: Dict[Tuple[str, Tuple[bool, bool]], Any] = {}
+
+    def build(self) -> Any:
+        loader = self._loader
+        stack: List[_YAMLCollection] = []
+        document: Any = None
+        while True:
+            event = loader.get_event()
+            event_type = type(event)
+            if event_type is ScalarEvent:
+                is_key = bool(stack) and type(stack[-1].data) is dict and not stack[-1].has_key
+                value = self._build_scalar(event, is_key=is_key)
+            elif event_type is MappingStartEvent or event_type is SequenceStartEvent:
+                stack.append(self._start_collection(event, stack[-1] if stack else None))
+                continue
+            elif event_type is MappingEndEvent or event_type is SequenceEndEvent:
+                collection = stack.pop()
+                value = self._end_collection(collection)
+            elif event_type is AliasEvent:
+                if event.anchor not in self._anchors:
+                    # The recursive object
+                    raise _UnsupportedYAMLContent(f"The anchor *{event.anchor}* has not been built.")
+                value = self._anchors[event.anchor]
+            elif event_type is DocumentEndEvent:
+                if not loader.check_event(StreamEndEvent):
+                    raise _UnsupportedYAMLContent("It has multiple documents.")
+                return document
+            elif event_type is StreamEndEvent:
+                # Empty stream
+                return None
+            else:
+                continue
+
+            if not stack:
+                document = value
+            else:
+                self._add_to_collection(stack[-1], value)
+
+    def _build_scalar(self, event: ScalarEvent, is_key: bool) -> Any:
+        shared_key = None
+        if (event.tag is None or event.tag == "!") and len(event.value) <= self._Max_Shared_Scalar_Length:
+            shared_key = (event.value, event.implicit)
+            if shared_key in self._scalars:
+                value = self._scalars[shared_key]
+                if event.anchor:
+                    self._anchors[event.anchor] = value
+                return value
+
+        if event.tag is None or event.tag == "!":
+            tag = self._loader.resolve(ScalarNode, event.value, event.implicit)
+        else:
+            tag = event.tag
+        if tag == self._Str_Tag:
+            value = event.value
+        elif tag == self._Merge_Tag and is_key:
+            return _Merge_Key
+        else:
+            # The events of *CLoader* carry the marks of its C extension, which have the same attributes
+            start_mark, end_mark = cast(Optional[Mark], event.start_mark), cast(Optional[Mark], event.end_mark)
+            node = ScalarNode(tag, event.value, start_mark, end_mark, style=event.style)
+            value = self._loader.construct_object(node)
+            # Don't let the loader keep all the nodes
+            self._loader.constructed_objects.pop(node, None)
+
+        if shared_key is not None:
+            self._scalars[shared_key] = value
+        if event.anchor:
+            self._anchors[event.anchor] = value
+        return value
+
+    def _start_collection(self, event: Any, parent: Optional[_YAMLCollection]) -> _YAMLCollection:
+        is_mapping = type(event) is MappingStartEvent
+        if event.tag not in (None, "!") and event.tag not in self._Collection_Tags:
+            raise _UnsupportedYAMLContent(f"It doesn't support the explicit tag *{event.tag}* of collection.")
+
+        matched_path = -1
+        if not is_mapping or not self._converted_path:
+            pass
+        elif parent is None:
+            matched_path = 0
+        elif (
+            0 <= parent.matched_path < len(self._converted_path)
+            and parent.key == self._converted_path[parent.matched_path]
+        ):
+            matched_path = parent.matched_path + 1
+            if matched_path == len(self._converted_path):
+                self._mapping_converter.prepare(parent.data)  # type: ignore[union-attr]
+        return _YAMLCollection(data={} if is_mapping else [], anchor=event.anchor, matched_path=matched_path)
+
+    def _end_collection(self, collection: _YAMLCollection) -> Any:
+        data = collection.data
+        if collection.merged:
+            # The explicit keys override the merged ones, and the former merged mappings override the latter ones
+            merged_data: dict = {}
+            for merged_mapping in reversed(collection.merged):
+                merged_data.update(merged_mapping)
+            merged_data.update(data)
+            data = merged_data
+        if collection.anchor:
+            self._anchors[collection.anchor] = data
+        return data
+
+    def _add_to_collection(self, collection: _YAMLCollection, value: Any) -> None:
+        if type(collection.data) is list:
+            collection.data.append(value)
+            return
+        if not collection.has_key:
+            if isinstance(value, (dict, list)):
+                raise _UnsupportedYAMLContent("It doesn't support the mapping or sequence as key.")
+            collection.key = value
+            collection.has_key = True
+            return
+
+        key = collection.key
+        collection.key = None
+        collection.has_key = False
+        is_converted = bool(self._converted_path) and collection.matched_path == len(self._converted_path)
+        if key is _Merge_Key:
+            if is_converted:
+                raise _UnsupportedYAMLContent("It doesn't support merging into the converted mapping.")
+            self._merge(collection, value)
+            return
+        if is_converted:
+            value = self._mapping_converter.convert(key, value)  # type: ignore[union-attr]
+        collection.data[key] = value
+
+    @staticmethod
+    def _merge(collection: _YAMLCollection, value: Any) -> None:
+        merged_mappings = value if isinstance(value, list) else [value]
+        for merged_mapping in merged_mappings:
+            if not isinstance(merged_mapping, dict):
+                raise _UnsupportedYAMLContent("It only could merge mappings.")
+            collection.merged.append(merged_mapping)
+
+
 class YAML(_BaseFileOperation):
-    def read(self, path: str) -> dict:
+    def read(self, path: str, mapping_converter: Optional[MappingConverter] = None) -> dict:
+        """Read and parse the YAML file.
+
+        Args:
+            path (str): The file path.
+            mapping_converter (Optional[MappingConverter]): Convert the entries of one specific mapping as soon as
+                they have been parsed. It's best-effort, the entries may not be converted if the document has the
+                contents which the single-pass parsing doesn't support. So the caller should handle both of the
+                converted and the parsed entries.
+
+        Returns:
+            The content of the file.
+
+        """
         exist_file = os.path.exists(path)
         if not exist_file:
             raise FileNotFoundError(f"The target configuration file {path} doesn't exist.")
 
+        _record_read_file(path)
         with open(path, "r", encoding="utf-8") as file_stream:
-            data: dict = load(stream=file_stream, Loader=Loader)
+            loader = Loader(file_stream)
+            try:
+                data: dict = _YAMLDocumentBuilder(loader, mapping_converter=mapping_converter).build()
+            except _UnsupportedYAMLContent:
+                file_stream.seek(0)
+                data = load(stream=file_stream, Loader=Loader)
+            finally:
+                loader.dispose()
         return data
 
     def write(self, path: str, config: Union[str, dict], mode: str = "a+") -> None:
@@ -51,11 +332,13 @@ class YAML(_BaseFileOperation):
 
 
 class JSON(_BaseFileOperation):
-    def read(self, path: str) -> dict:
+    def read(self, path: str, mapping_converter: Optional[MappingConverter] = None) -> dict:
+        # It doesn't convert any mapping while parsing. Argument *mapping_converter* is best-effort.
         exist_file = os.path.exists(path)
         if not exist_file:
             raise FileNotFoundError(f"The target configuration file {path} doesn't exist.")
 
+        _record_read_file(path)
         with open(path, "r", encoding="utf-8") as file_stream:
             data: dict = json.loads(file_stream.read())
         return data
@@ -0,0 +1,179 @@
+"""*Watch the changes of files*
+
+Poll the modification time and the size of files, and the entries of directories, to find which files have been
+changed, added or removed. It doesn't depend on any file system notification library, so it works in all platforms.
+"""
+
+import logging
+import os
+import threading
+import weakref
+from collections import namedtuple
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+FileState = namedtuple("FileState", ("mtime", "size"))
+
+
+class FileWatcher:
+    """*Watch the files and directories by polling*
+
+    The files be added into the watched directories would be watched automatically. It could poll the changes by
+    itself with a daemon thread. The thread doesn't exist in the child process after forking (e.g., the workers of
+    *gunicorn* with preloading application), so it would be started again in the child process.
+    """
+
+    def __init__(self, files: Iterable[str] = (), directories: Iterable[str] = (), extensions: Tuple[str, ...] = ()):
+        """
+
+        Args:
+            files (Iterable[str]): The file paths to watch.
+            directories (Iterable[str]): The directory paths to watch whether any file or directory be added into or
+                be removed from them.
+            extensions (Tuple[str, ...]): Only watch the files with these extensions in the directories. It would
+                watch all files if it's empty.
+        """
+        self._extensions = extensions
+        # The data structure would be:
+        # {
+        #     <absolute file path>: <the state of file. It's None if the file doesn't exist.>
+        # }
+        self._files: Dict[str, Optional[FileState]] = {}
+        # The data structure would be:
+        # {
+        #     <absolute directory path>: <the names of files and directories in it>
+        # }
+        self._directories: Dict[str, Set[str]] = {}
+        self.add(files=files, directories=directories)
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._on_change: Optional[Callable[[Set[str]], None]] = None
+        self._interval: float = 1.0
+        if hasattr(os, "register_at_fork"):
+            watcher_ref = weakref.ref(self)
+
+            def _reset_in_child() -> None:
+                watcher = watcher_ref()
+                if watcher is not None:
+                    watcher._reset_after_fork()
+
+            os.register_at_fork(after_in_child=_reset_in_child)
+
+    @property
+    def files(self) -> Set[str]:
+        return set(self._files.keys())
+
+    @property
+    def directories(self) -> Set[str]:
+        return set(self._directories.keys())
+
+    def add(self, files: Iterable[str] = (), directories: Iterable[str] = ()) -> None:
+        """Watch more files and directories. The files and directories which have been watched would be ignored.
+
+        Args:
+            files (Iterable[str]): The file paths.
+            directories (Iterable[str]): The directory paths.
+
+        Returns:
+            None
+
+        """
+        for path in files:
+            path = os.path.abspath(path)
+            if path not in self._files:
+                self._files[path] = self._file_state(path)
+        for path in directories:
+            path = os.path.abspath(path)
+            if path not in self._directories:
+                self._directories[path] = self._directory_entries(path)
+
+    def poll(self) -> Set[str]:
+        """Check all the watched files and directories once.
+
+        Returns:
+            The absolute paths of the files which have been modified, added or removed, and the directories which have
+            been added or removed.
+
+        """
+        changed_paths: Set[str] = set()
+        for path, state in list(self._files.items()):
+            current_state = self._file_state(path)
+            if current_state != state:
+                self._files[path] = current_state
+                changed_paths.add(path)
+
+        for directory, entries in list(self._directories.items()):
+            current_entries = self._directory_entries(directory)
+            if current_entries == entries:
+                continue
+            self._directories[directory] = current_entries
+            for entry in current_entries ^ entries:
+                path = os.path.join(directory, entry)
+                changed_paths.add(path)
+                if entry in current_entries and os.path.isfile(path) and path not in self._files:
+                    # Watch the new file
+                    self._files[path] = self._file_state(path)
+        return changed_paths
+
+    def start(self, on_change: Callable[[Set[str]], None], interval: float = 1.0) -> None:
+        """Poll the changes by a daemon thread.
+
+        Args:
+            on_change (Callable[[Set[str]], None]): The callback with the changed paths. It would only be called if
+                anything has been changed.
+            interval (float): The interval seconds between 2 polls.
+
+        Returns:
+            None
+
+        """
+        self._on_change = on_change
+        self._interval = interval
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="fake-api-config-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _reset_after_fork(self) -> None:
+        thread_is_running = self._thread is not None
+        self._thread = None
+        if thread_is_running and self._on_change is not None:
+            self.start(on_change=self._on_change, interval=self._interval)
+
+    def _run(self) -> None:
+        stop_event = self._stop_event
+        while not stop_event.wait(self._interval):
+            changed_paths = self.poll()
+            if not changed_paths or self._on_change is None:
+                continue
+            try:
+                self._on_change(changed_paths)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.exception(f"Fail to handle the changes of files {sorted(changed_paths)}: {e}")
+
+    @staticmethod
+    def _file_state(path: str) -> Optional[FileState]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return FileState(mtime=stat.st_mtime_ns, size=stat.st_size)
+
+    def _directory_entries(self, path: str) -> Set[str]:
+        try:
+            entries = os.listdir(path)
+        except OSError:
+            return set()
+        return {
+            entry
+            for entry in entries
+            if not self._extensions or entry.endswith(self._extensions) or os.path.isdir(os.path.join(path, entry))
+        }
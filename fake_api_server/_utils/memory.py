@@ -0,0 +1,70 @@
+"""*Memory usage of the current process*
+
+Read the memory usage of the current process. It reads the details from *procfs* in Linux, and it falls back to the
+peak resident set size by module *resource* in other platforms.
+"""
+
+import os
+import sys
+from collections import namedtuple
+from typing import Dict, Optional
+
+MemoryUsage = namedtuple("MemoryUsage", ("rss", "shared", "private"))
+
+
+def _read_proc_file(path: str, keys: tuple) -> Dict[str, int]:
+    values: Dict[str, int] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as proc_file:
+            for line in proc_file:
+                key, _, value = line.partition(":")
+                if key in keys:
+                    # The unit of values in procfs is kB
+                    values[key] = int(value.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        return {}
+    return values
+
+
+def _peak_rss() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The unit of *ru_maxrss* is bytes in macOS but it's kB in Linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def memory_usage(pid: Optional[int] = None) -> MemoryUsage:
+    """Get the memory usage of the process.
+
+    Args:
+        pid (Optional[int]): The process ID. It would be the current process if it's ``None``.
+
+    Returns:
+        A **MemoryUsage** type object with the resident set size, the shared and the private memory in bytes. The
+        value would be ``None`` if it cannot get it in current platform.
+
+    """
+    proc_dir = f"/proc/{pid or 'self'}"
+    status = _read_proc_file(os.path.join(proc_dir, "status"), keys=("VmRSS",))
+    rollup = _read_proc_file(
+        os.path.join(proc_dir, "smaps_rollup"),
+        keys=("Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty"),
+    )
+    rss = status.get("VmRSS", None)
+    if rss is None and pid is None:
+        rss = _peak_rss()
+    shared = private = None
+    if rollup:
+        shared = rollup.get("Shared_Clean", 0) + rollup.get("Shared_Dirty", 0)
+        private = rollup.get("Private_Clean", 0) + rollup.get("Private_Dirty", 0)
+    return MemoryUsage(rss=rss, shared=shared, private=private)
+
+
+def format_memory_usage(usage: MemoryUsage) -> str:
+    def _mb(value: Optional[int]) -> str:
+        return "unknown" if value is None else f"{value / (1024 * 1024):.1f} MB"
+
+    return f"RSS: {_mb(usage.rss)}, shared: {_mb(usage.shared)}, private: {_mb(usage.private)}"
@@ -1,11 +1,14 @@
 import datetime
+import hashlib
 import random
 import string
 import uuid
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import Any, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypeVar
 
 from fake_api_server._utils.uri_protocol import IPVersion, URIScheme
 
@@ -13,6 +16,90 @@ ValueSize = namedtuple("ValueSize", ("min", "max"), defaults=(-127, 128))
 DigitRange = namedtuple("DigitRange", ("integer", "decimal"))
 
 
+_T = TypeVar("_T")
+
+_Int64_Min: int = -(2**63)
+_Int64_Max: int = 2**63 - 1
+
+
+_Seeded_Random: ContextVar[Optional[random.Random]] = ContextVar("_Seeded_Random", default=None)
+
+
+def _random() -> Any:
+    """Get the source of randomness. It's the random instance which be seeded in current context if it's in the
+    deterministic mode, nor it's module *random* (the global random state)."""
+    seeded_random = _Seeded_Random.get()
+    return random if seeded_random is None else seeded_random
+
+
+@contextmanager
+def seeded_random(seed: int) -> Iterator[random.Random]:
+    """Let all the random generators in current context generate values by a random instance with the seed, so the
+    values could be reproduced with the same seed.
+
+    Args:
+        seed (int): The seed of random instance.
+
+    Returns:
+        The seeded random instance.
+
+    """
+    random_instance = random.Random(seed)
+    token = _Seeded_Random.set(random_instance)
+    try:
+        yield random_instance
+    finally:
+        _Seeded_Random.reset(token)
+
+
+def seeded_iterator(seed: int, iterator: Iterator[_T]) -> Iterator[_T]:
+    """Let all the random generators generate values by a random instance with the seed while the iterator is
+    generating every value, so the values which be generated lazily could be reproduced with the same seed.
+
+    Args:
+        seed (int): The seed of random instance.
+        iterator (Iterator[_T]): The iterator which generates values lazily.
+
+    Returns:
+        An iterator of the values.
+
+    """
+    random_instance = random.Random(seed)
+    while True:
+        token = _Seeded_Random.set(random_instance)
+        try:
+            value = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _Seeded_Random.reset(token)
+        yield value
+
+
+def seed_by_key(seed: int, key: str) -> int:
+    """Derive a new seed from the configured seed and a key, e.g., the request path with its parameters.
+
+    Args:
+        seed (int): The configured seed.
+        key (str): The key to derive seed.
+
+    Returns:
+        A new seed which is always the same with the same seed and key.
+
+    """
+    return int.from_bytes(hashlib.sha256(f"{seed}:{key}".encode("utf-8")).digest()[:8], "big")
+
+
+def _numpy() -> Optional[Any]:
+    """Import *numpy* if it has been installed in current runtime environment. It's optional."""
+    try:
+        import numpy
+
+        return numpy
+    except ImportError:
+        return None
+
+
 class BaseRandomGenerator(metaclass=ABCMeta):
 
     def __init__(self):
@@ -23,18 +110,58 @@ class BaseRandomGenerator(metaclass=ABCMeta):
     def generate(cls, *args, **kwargs) -> Any:
         pass
 
+    @classmethod
+    def generate_many(cls, n: int, *args, **kwargs) -> List[Any]:
+        """Generate *n* random values at once. The subclass should override it if it could generate the values in
+        bulk more efficiently than generating them one by one.
+
+        Args:
+            n (int): The amount of values.
+            *args: The arguments of function *generate*.
+            **kwargs: The arguments of function *generate*.
+
+        Returns:
+            A list of random values.
+
+        """
+        return [cls.generate(*args, **kwargs) for _ in range(n)]
+
 
 class RandomString(BaseRandomGenerator):
     @classmethod
     def generate(cls, size: ValueSize = ValueSize(min=1)) -> str:
-        string_size = random.randint(size.min, size.max)
-        return "".join([random.choice(string.ascii_letters) for _ in range(string_size)])
+        string_size = _random().randint(size.min, size.max)
+        return "".join(_random().choices(string.ascii_letters, k=string_size))
+
+    @classmethod
+    def generate_many(cls, n: int, size: ValueSize = ValueSize(min=1)) -> List[str]:
+        string_sizes = RandomInteger.generate_many(n, value_range=size)
+        all_chars = "".join(_random().choices(string.ascii_letters, k=sum(string_sizes)))
+        values = []
+        start = 0
+        for string_size in string_sizes:
+            values.append(all_chars[start : start + string_size])
+            start += string_size
+        return values
 
 
 class RandomInteger(BaseRandomGenerator):
     @classmethod
     def generate(cls, value_range: ValueSize = ValueSize()) -> int:
-        return random.randint(value_range.min, value_range.max)
+        return _random().randint(value_range.min, value_range.max)
+
+    @classmethod
+    def generate_many(cls, n: int, value_range: ValueSize = ValueSize()) -> List[int]:
+        numpy = _numpy()
+        if (
+            numpy is not None
+            and _Seeded_Random.get() is None
+            and _Int64_Min <= value_range.min <= value_range.max < _Int64_Max
+        ):
+            return numpy.random.randint(value_range.min, value_range.max + 1, size=n, dtype=numpy.int64).tolist()
+        randrange = _random().randrange
+        start, stop = value_range.min, value_range.max + 1
+        return [randrange(start, stop) for _ in range(n)]
 
 
 class RandomBigDecimal(BaseRandomGenerator):
@@ -46,25 +173,56 @@ class RandomBigDecimal(BaseRandomGenerator):
         decimal = RandomInteger.generate(value_range=decimal_range)
         return Decimal(f"{integer}.{decimal}")
 
+    @classmethod
+    def generate_many(
+        cls, n: int, integer_range: ValueSize = ValueSize(), decimal_range: ValueSize = ValueSize(min=0, max=128)
+    ) -> List[Decimal]:
+        integers = RandomInteger.generate_many(n, value_range=integer_range)
+        decimals = RandomInteger.generate_many(n, value_range=decimal_range)
+        return [Decimal(f"{integer}.{decimal}") for integer, decimal in zip(integers, decimals)]
+
 
 class RandomBoolean(BaseRandomGenerator):
     @classmethod
     def generate(cls) -> bool:
-        return random.choice([True, False])
+        return _random().choice([True, False])
+
+    @classmethod
+    def generate_many(cls, n: int) -> List[bool]:
+        bits = _random().getrandbits(n) if n > 0 else 0
+        return [(bits >> i) & 1 == 1 for i in range(n)]
 
 
 class RandomFromSequence(BaseRandomGenerator):
     @classmethod
     def generate(cls, sequence: Sequence) -> Any:
-        return random.choice(sequence)
+        return _random().choice(sequence)
+
+    @classmethod
+    def generate_many(cls, n: int, sequence: Sequence) -> List[Any]:
+        if not sequence:
+            raise IndexError("Cannot choose from an empty sequence")
+        return _random().choices(sequence, k=n)
 
 
 class RandomDate(BaseRandomGenerator):
     _DateTime_Format: str = "%Y-%m-%d"
+    _Days_Range: int = 30
 
     @classmethod
     def generate(cls) -> str:
-        return RandomFromSequence.generate([cls._generate_and_format_value(d) for d in range(0, 30)])
+        return cls._generate_and_format_value(_random().randrange(cls._Days_Range))
+
+    @classmethod
+    def generate_many(cls, n: int) -> List[str]:
+        now = datetime.datetime.now()
+        formatted_values: Dict[int, str] = {}
+        values = []
+        for days in _random().choices(range(cls._Days_Range), k=n):
+            if days not in formatted_values:
+                formatted_values[days] = (now - datetime.timedelta(days=days)).strftime(cls._DateTime_Format)
+            values.append(formatted_values[days])
+        return values
 
     @classmethod
     def _generate_and_format_value(cls, days: int) -> str:
@@ -78,10 +236,6 @@ class RandomDate(BaseRandomGenerator):
 class RandomDateTime(RandomDate):
     _DateTime_Format: str = "%Y-%m-%dT%H:%M:%SZ"
 
-    @classmethod
-    def generate(cls) -> str:
-        return RandomFromSequence.generate([cls._generate_and_format_value(d) for d in range(0, 30)])
-
 
 class RandomEMail(BaseRandomGenerator):
     _EMail_Service: List[str] = ["gmail", "outlook", "yahoo"]
@@ -98,31 +252,33 @@ class RandomEMail(BaseRandomGenerator):
 class RandomUUID(BaseRandomGenerator):
     @classmethod
     def generate(cls) -> str:
+        seeded_random = _Seeded_Random.get()
+        if seeded_random is not None:
+            # The UUID version 1 is composed by time and node, so it needs to generate it by the seeded random
+            # instance for reproducing the same value.
+            return str(uuid.UUID(int=seeded_random.getrandbits(128), version=1))
         return str(uuid.uuid1())
 
 
 class RandomIP(BaseRandomGenerator):
+    _IPv4_Parts: List[str] = [str(i) for i in range(1, 257)]
+    _IPv6_Hex_Chars: List[str] = [hex(i)[-1] for i in range(0, 17)]
+
     @classmethod
     def generate(cls, version: IPVersion) -> str:
-        def _randomly_int() -> int:
-            return RandomInteger.generate(value_range=ValueSize(min=1, max=256))
+        return cls.generate_many(1, version=version)[0]
 
+    @classmethod
+    def generate_many(cls, n: int, version: IPVersion) -> List[str]:
         if version is IPVersion.IPv4:
-            ip_address = ".".join([str(_randomly_int()) for _ in range(4)])
+            parts = _random().choices(cls._IPv4_Parts, k=4 * n)
+            return [".".join(parts[i : i + 4]) for i in range(0, 4 * n, 4)]
         elif version is IPVersion.IPv6:
-
-            def _random_hex_string() -> str:
-                return hex(RandomInteger.generate(value_range=ValueSize(min=0, max=16)))[-1]
-
-            def _random_one_part() -> str:
-                return "".join([_random_hex_string() for _ in range(4)])
-
-            ip_address = ":".join([_random_one_part() for _ in range(8)])
+            hex_chars = "".join(_random().choices(cls._IPv6_Hex_Chars, k=32 * n))
+            return [":".join(hex_chars[i + j : i + j + 4] for j in range(0, 32, 4)) for i in range(0, 32 * n, 32)]
         else:
             raise NotImplementedError(f"Not support the IP version *{version}*.")
 
-        return ip_address
-
 
 class RandomURI(BaseRandomGenerator):
     @classmethod
@@ -0,0 +1,76 @@
+"""*Cache of the compiled regular expressions*"""
+
+import logging
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Callable, Hashable, Pattern
+
+logger = logging.getLogger(__name__)
+
+RegexCacheInfo = namedtuple("RegexCacheInfo", ("hits", "misses", "maxsize", "currsize"))
+
+
+class RegexCache:
+    """*Bounded LRU cache of compiled regular expressions*
+
+    The regular expression of a format setting is composed from many settings, e.g., the data type, size, digit,
+    variables, etc. It's expensive to compose and compile it again for every value which needs to be checked. This
+    cache keeps the compiled pattern by the key which is composed from these settings.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("The maximum size of regular expression cache must be greater than 0.")
+        self._maxsize = maxsize
+        self._patterns: "OrderedDict[Hashable, Pattern]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def compile(self, key: Hashable, regex: Callable[[], str], flags: int = 0) -> Pattern:
+        """Get the compiled pattern from cache or compile it if it doesn't exist in cache.
+
+        Args:
+            key (Hashable): The key of the regular expression. It must be composed by all the settings which affect
+                the regular expression.
+            regex (Callable[[], str]): The callable object which generates the regular expression. It only be called
+                if the pattern doesn't exist in cache.
+            flags (int): The flags of compiling the regular expression.
+
+        Returns:
+            The compiled pattern.
+
+        """
+        cache_key = (key, flags)
+        try:
+            with self._lock:
+                pattern = self._patterns.get(cache_key, None)
+                if pattern is not None:
+                    self._patterns.move_to_end(cache_key)
+                    self._hits += 1
+                    return pattern
+        except TypeError:
+            # The key is not hashable, so it won't be cached.
+            logger.debug(f"The key of regular expression is not hashable: {key}")
+            return re.compile(regex(), flags)
+
+        pattern = re.compile(regex(), flags)
+        with self._lock:
+            self._misses += 1
+            self._patterns[cache_key] = pattern
+            if len(self._patterns) > self._maxsize:
+                self._patterns.popitem(last=False)
+        return pattern
+
+    def cache_info(self) -> RegexCacheInfo:
+        return RegexCacheInfo(hits=self._hits, misses=self._misses, maxsize=self._maxsize, currsize=len(self._patterns))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._patterns.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+Regex_Cache = RegexCache()
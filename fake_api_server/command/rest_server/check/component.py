@@ -3,7 +3,7 @@ import re
 import sys
 from abc import ABCMeta, abstractmethod
 from argparse import ArgumentParser
-from typing import Any, Optional
+from typing import Any, Optional, Set
 
 from fake_api_server._utils.api_client import URLLibHTTPClient
 from fake_api_server.command._base.component import BaseSubCmdComponent
@@ -15,6 +15,7 @@ from fake_api_server.model import (
     load_config,
 )
 from fake_api_server.model.api_config.apis import APIParameter as MockedAPIParameter
+from fake_api_server.model.api_config.apis.index import IndexedMockAPIs
 from fake_api_server.model.api_config.apis.response_strategy import ResponseStrategy
 from fake_api_server.model.rest_api_doc_config._base_model_adapter import (
     BaseAPIAdapter as SwaggerAPI,
@@ -154,12 +155,16 @@ class SwaggerDiffChecking(_BaseChecking):
     def check(self, args: SubcmdCheckArguments, api_config: Optional[FakeAPIConfig]) -> FakeAPIConfig:
         assert api_config
         mocked_apis_config = api_config.apis
-        base_info = mocked_apis_config.base  # type: ignore[union-attr]
-        mocked_apis_info = mocked_apis_config.apis  # type: ignore[union-attr]
+        assert mocked_apis_config
+        base_info = mocked_apis_config.base
+        mocked_apis_info = mocked_apis_config.apis
+        if not isinstance(mocked_apis_info, IndexedMockAPIs):
+            mocked_apis_info = IndexedMockAPIs(mocked_apis_info)
+        mocked_apis_path: Set[Optional[str]]
         if base_info:
-            mocked_apis_path = list(map(lambda p: f"{base_info.url}{p.url}", mocked_apis_info.values()))
+            mocked_apis_path = set(map(lambda url: f"{base_info.url}{url}", mocked_apis_info.urls()))
         else:
-            mocked_apis_path = list(map(lambda p: p.url, mocked_apis_info.values()))
+            mocked_apis_path = set(mocked_apis_info.urls())
         swagger_api_doc_model = self._get_swagger_config(swagger_url=args.swagger_doc_url)
         for path, swagger_api_config in swagger_api_doc_model.paths.items():
             apis = swagger_api_config.to_adapter(path)
@@ -172,9 +177,10 @@ class SwaggerDiffChecking(_BaseChecking):
                     )
                     continue
 
-                mocked_api_config = mocked_apis_config.get_api_config_by_url(  # type: ignore[union-attr]
-                    one_swagger_api_config.path, base=base_info
-                )
+                # Find the mocked API with the same HTTP method first if there are multiple mocked APIs with the URL
+                mocked_api_config = mocked_apis_config.get_api_config_by_url_and_method(
+                    one_swagger_api_config.path, method=str(one_swagger_api_config.http_method), base=base_info
+                ) or mocked_apis_config.get_api_config_by_url(one_swagger_api_config.path, base=base_info)
                 api_http_config = mocked_api_config.http  # type: ignore[union-attr]
 
                 if (
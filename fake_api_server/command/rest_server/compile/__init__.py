@@ -0,0 +1 @@
+from .component import SubCmdCompileComponent
@@ -0,0 +1,26 @@
+import logging
+import sys
+from argparse import ArgumentParser
+
+from fake_api_server.command._base.component import BaseSubCmdComponent
+from fake_api_server.model import SubcmdCompileArguments
+from fake_api_server.model.snapshot import ConfigSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SubCmdCompileComponent(BaseSubCmdComponent):
+    def process(self, parser: ArgumentParser, args: SubcmdCompileArguments) -> None:  # type: ignore[override]
+        snapshot = ConfigSnapshot(config_path=args.config_path, snapshot_path=args.output_path or None)
+        try:
+            snapshot_info = snapshot.compile()
+        except FileNotFoundError as e:
+            logger.error(f"❌  {e}")
+            sys.exit(1)
+        if snapshot_info is None:
+            logger.error(f"❌  The configuration {args.config_path} is empty.")
+            sys.exit(1)
+        logger.info(
+            f"🍻  Compile {len(snapshot_info.sources)} configuration files into snapshot {snapshot_info.path} "
+            f"(content hash: {snapshot_info.content_hash})."
+        )
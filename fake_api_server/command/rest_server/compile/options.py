@@ -0,0 +1,30 @@
+from fake_api_server.command._base.options import MetaCommandOption
+from fake_api_server.command.rest_server.option import BaseSubCommandRestServer
+from fake_api_server.command.subcommand import SubCommandLine
+from fake_api_server.model.subcmd_common import SubParserAttr
+
+
+class SubCommandCompileOption(BaseSubCommandRestServer):
+    sub_parser: SubParserAttr = SubParserAttr(
+        name=SubCommandLine.Compile,
+        help="Compile the configuration as a binary snapshot to load it quickly when the server starts up.",
+    )
+
+
+BaseSubCmdCompileOption: type = MetaCommandOption("BaseSubCmdCompileOption", (SubCommandCompileOption,), {})
+
+
+class ConfigPath(BaseSubCmdCompileOption):
+    cli_option: str = "-p, --config-path"
+    name: str = "config_path"
+    help_description: str = "The file path of configuration."
+    default_value: str = "api.yaml"
+
+
+class OutputPath(BaseSubCmdCompileOption):
+    cli_option: str = "-o, --output-path"
+    name: str = "output_path"
+    help_description: str = (
+        "The file path of snapshot. In default, it would be the configuration file path with extension '.snapshot'."
+    )
+    default_value: str = ""
@@ -0,0 +1,22 @@
+from argparse import Namespace
+
+from fake_api_server.command._base.process import BaseCommandProcessor
+from fake_api_server.command.subcommand import SubCommandLine
+from fake_api_server.model import SubcmdCompileArguments, deserialize_args
+from fake_api_server.model.subcmd_common import SysArg
+
+from .component import SubCmdCompileComponent
+
+
+class SubCmdCompile(BaseCommandProcessor):
+    responsible_subcommand: SysArg = SysArg(
+        pre_subcmd=SysArg(pre_subcmd=SysArg(subcmd=SubCommandLine.Base), subcmd=SubCommandLine.RestServer),
+        subcmd=SubCommandLine.Compile,
+    )
+
+    @property
+    def _subcmd_component(self) -> SubCmdCompileComponent:
+        return SubCmdCompileComponent()
+
+    def _parse_process(self, args: Namespace) -> SubcmdCompileArguments:
+        return deserialize_args.cli_rest_server.subcmd_compile(args)
@@ -6,7 +6,12 @@ from fake_api_server._utils import import_web_lib
 from fake_api_server.command._base.component import BaseSubCmdComponent
 from fake_api_server.exceptions import InvalidAppType, NoValidWebLibrary
 from fake_api_server.model import SubcmdRunArguments
-from fake_api_server.server import BaseSGIServer, setup_asgi, setup_wsgi
+from fake_api_server.server import (
+    BaseSGIServer,
+    setup_asgi,
+    setup_pure_asgi,
+    setup_wsgi,
+)
 
 
 def _option_cannot_be_empty_assertion(cmd_option: str) -> str:
@@ -29,6 +34,22 @@ class SubCmdRunComponent(BaseSubCmdComponent):
         if parser_options.config:
             os.environ["MockAPI_Config"] = parser_options.config
 
+        # Handle *watch*
+        if parser_options.watch:
+            os.environ["MockAPI_Config_Watch"] = "true"
+
+        # Handle *lazy-loading*
+        if parser_options.lazy_loading:
+            os.environ["MockAPI_Config_Lazy_Loading"] = "true"
+
+        # Handle *metrics-path*
+        if parser_options.metrics_path:
+            os.environ["MockAPI_Metrics_Path"] = parser_options.metrics_path
+
+        # Handle *snapshot*
+        if parser_options.snapshot:
+            os.environ["MockAPI_Config_Snapshot"] = parser_options.snapshot
+
         # Handle *app-type*
         assert parser_options.app_type, _option_cannot_be_empty_assertion("--app-type")
         self._initial_server_gateway(lib=parser_options.app_type)
@@ -43,5 +64,7 @@ class SubCmdRunComponent(BaseSubCmdComponent):
             self._server_gateway = setup_wsgi()
         elif re.search(r"fastapi", lib, re.IGNORECASE):
             self._server_gateway = setup_asgi()
+        elif re.search(r"^asgi$", lib, re.IGNORECASE):
+            self._server_gateway = setup_pure_asgi()
         else:
             raise InvalidAppType
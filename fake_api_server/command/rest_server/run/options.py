@@ -25,13 +25,15 @@ class WebAppType(BaseSubCmdRunOption):
         * *auto*: it would automatically scan which Python web library it could use to initial and set up server gateway in current runtime environment.
         * *flask*: Use Python web framework Flask (https://palletsprojects.com/p/flask/) to set up web application.
         * *fastapi*: Use Python web framework FastAPI (https://fastapi.tiangolo.com/) to set up web application.
+        * *asgi*: Use the minimal pure ASGI web application without any Python web framework. It dispatches requests
+          by the route table directly and runs by *uvicorn*.
     """
 
     cli_option: str = "--app-type"
     name: str = "app_type"
     help_description: str = "Which Python web framework it should use to set up web server for mocking APIs."
     default_value: str = "auto"
-    _options: List[str] = ["auto", "flask", "fastapi"]
+    _options: List[str] = ["auto", "flask", "fastapi", "asgi"]
 
 
 class Config(BaseSubCmdRunOption):
@@ -77,3 +79,58 @@ class AccessLogFile(BaseSubCmdRunOption):
     name: str = "access_log_file"
     help_description: str = "The file which program would use to write the access log to for record."
     default_value: str = "fake-api-server.log"
+
+
+class Watch(BaseSubCmdRunOption):
+    cli_option: str = "--watch"
+    name: str = "watch"
+    help_description: str = (
+        "Watch the configuration files and reload the changed mocked APIs without restarting the server."
+    )
+    action: str = "store_true"
+    default_value: bool = False
+    option_value_type: Optional[type] = None
+
+
+class LazyLoading(BaseSubCmdRunOption):
+    cli_option: str = "--lazy-loading"
+    name: str = "lazy_loading"
+    help_description: str = (
+        "Only load the URL and the HTTP method of every mocked API at startup, and deserialize the entire "
+        "configuration of it when it's requested at the first time."
+    )
+    action: str = "store_true"
+    default_value: bool = False
+    option_value_type: Optional[type] = None
+
+
+class MetricsPath(BaseSubCmdRunOption):
+    cli_option: str = "--metrics-path"
+    name: str = "metrics_path"
+    help_description: str = (
+        "Expose the metrics of the latency of handling requests, the amount of requests by status code and the hit "
+        "ratio of caches on the URL path, e.g., /_fake/metrics. It doesn't expose the metrics if it's empty."
+    )
+    default_value: str = ""
+
+
+class Snapshot(BaseSubCmdRunOption):
+    cli_option: str = "--snapshot"
+    name: str = "snapshot"
+    help_description: str = (
+        "Load the configuration from the snapshot which be compiled by subcommand line 'rest-server compile' if it's "
+        "fresh. It doesn't load any snapshot if it's empty."
+    )
+    default_value: str = ""
+
+
+class Preload(BaseSubCmdRunOption):
+    cli_option: str = "--preload"
+    name: str = "preload"
+    help_description: str = (
+        "Load the configuration once in the master process and share it with the workers by copy-on-write. It only "
+        "works with *gunicorn*."
+    )
+    action: str = "store_true"
+    default_value: bool = False
+    option_value_type: Optional[type] = None
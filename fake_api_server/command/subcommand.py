@@ -13,6 +13,7 @@ class SubCommandLine(Enum):
     Get = "get"
     Sample = "sample"
     Pull = "pull"
+    Compile = "compile"
 
     @staticmethod
     def to_enum(v: Union[str, "SubCommandLine"]) -> "SubCommandLine":
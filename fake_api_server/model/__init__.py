@@ -11,6 +11,7 @@ from fake_api_server.model.command.rest_server.cmd_args import (
     ParserArguments,
     SubcmdAddArguments,
     SubcmdCheckArguments,
+    SubcmdCompileArguments,
     SubcmdGetArguments,
     SubcmdPullArguments,
     SubcmdRunArguments,
@@ -47,12 +48,15 @@ def deserialize_api_doc_config(data: dict) -> BaseAPIDocumentConfig:
         )
 
 
-def load_config(path: str, is_pull: bool = False, base_file_path: str = "") -> Optional[FakeAPIConfig]:
+def load_config(
+    path: str, is_pull: bool = False, base_file_path: str = "", lazy: bool = False
+) -> Optional[FakeAPIConfig]:
     api_config = FakeAPIConfig()
     api_config_path = pathlib.Path(path)
     api_config.config_file_name = api_config_path.name
     api_config.base_file_path = base_file_path if base_file_path else str(api_config_path.parent)
     api_config.is_pull = is_pull
+    api_config.lazy_deserialization = lazy
     return api_config.from_yaml(path=path, is_pull=is_pull)
 
 
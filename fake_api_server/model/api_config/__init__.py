@@ -5,10 +5,15 @@ content ...
 
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from fake_api_server._utils import YAML
-from fake_api_server._utils.file.operation import _BaseFileOperation
+from fake_api_server._utils.file.operation import (
+    MappingConverter,
+    _BaseFileOperation,
+    record_read_files,
+)
 
 from ._base import _Checkable, _Config
 from .apis import (
@@ -19,6 +24,8 @@ from .apis import (
     MockAPI,
     ResponseProperty,
 )
+from .apis.index import IndexedMockAPIs
+from .apis.lazy import lazy_mock_api
 from .base import BaseConfig
 from .item import IteratorItem
 from .template import TemplateConfig
@@ -35,6 +42,10 @@ from .template._load.process import (
     _BaseTemplateConfigLoader,
 )
 
+# The configuration files of one mocked API which be loaded from divided files. *path* is the file of the mocked API,
+# and *files* are all the files which be read to load it (includes the divided HTTP, request and response files).
+MockAPISource = namedtuple("MockAPISource", ("path", "files"))
+
 
 class MockAPIs(_OperatingTemplatableConfig, _Checkable):
     """*The **mocked_apis** section*"""
@@ -43,7 +54,7 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
 
     _template: TemplateConfig
     _base: Optional[BaseConfig]
-    _apis: Dict[str, Optional[MockAPI]]
+    _apis: IndexedMockAPIs
 
     _configuration: _BaseFileOperation = YAML()
     _need_template_in_config: bool = True
@@ -57,11 +68,18 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
         super().__init__()
         self._template = template if template is not None else TemplateConfig()
         self._base = base
-        self._apis = apis
+        self._apis = self._index_apis(apis)
+        self._api_sources: Dict[str, MockAPISource] = {}
+        # The section *template* which the mocked APIs be deserialized by while parsing the configuration file
+        self._template_is_deserialized: bool = False
+        self._parsed_template_info: Optional[dict] = None
 
         self.divide_strategy: DivideStrategy = DivideStrategy()
         self.is_pull: bool = False
         self._base_file_path: str = ""
+        # Only keep the URL and the HTTP method of every mocked API when loading, and deserialize it when it's used at
+        # the first time.
+        self.lazy_deserialization: bool = False
 
         if self._template_config_loader is None:
             self.initial_loadable_data_modal()
@@ -129,11 +147,23 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
                 raise ValueError("It has multiple types of the data content. Please unify these objects data type.")
 
             if False in ele_types:
-                self._apis = {}
+                self._apis = IndexedMockAPIs()
                 for api_name, api_config in apis.items():
                     self._apis[api_name] = MockAPI().deserialize(data=(api_config or {}))
             else:
-                self._apis = apis  # type: ignore
+                self._apis = self._index_apis(apis)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _index_apis(apis: Dict[str, Optional[MockAPI]]) -> IndexedMockAPIs:
+        if isinstance(apis, IndexedMockAPIs) or not isinstance(apis, dict):
+            return apis
+        return IndexedMockAPIs(apis)
+
+    @property
+    def api_sources(self) -> Dict[str, MockAPISource]:
+        """:obj:`Dict[str, MockAPISource]`: The configuration files of the mocked APIs which be loaded from divided
+        files by their keys. It doesn't have the mocked APIs which be set in the configuration directly."""
+        return self._api_sources
 
     @property
     def set_template_in_config(self) -> bool:
@@ -157,8 +187,9 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
         # Process section *base*
         api_info: dict = {
             "base": BaseConfig().serialize(data=base),
-            "apis": {},
         }
+        # Section *template* is before section *apis*, so the mocked APIs could be deserialized while parsing the
+        # configuration file.
         if self._need_template_in_config:
             if self.is_pull:
                 template.activate = True
@@ -254,16 +285,10 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
 
         """
         # Processing section *template*
-        template_info = data.get("template", {})
-        if not template_info:
-            self._need_template_in_config = False
-        self.template.absolute_model_key = self.key
-        if self.is_pull:
-            self.template.activate = True
-            self.template.file.activate = True
-            if self.base_file_path:
-                self.template.file.config_path_values.base_file_path = self.base_file_path
-        self.template.deserialize(data=template_info)
+        if not self.can_use_deserialized_apis(data):
+            raise ValueError("The mocked APIs have been deserialized by the other section *template*.")
+        if not self._template_is_deserialized:
+            self._deserialize_template(data.get("template", {}))
 
         # Processing section *base*
         base_info = data.get("base", None)
@@ -277,6 +302,60 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
         self._template_config_loader.load_config(mocked_apis_info)
         return self
 
+    def _deserialize_template(self, template_info: Optional[Dict[str, Any]]) -> None:
+        if not template_info:
+            self._need_template_in_config = False
+        self.template.absolute_model_key = self.key
+        if self.is_pull:
+            self.template.activate = True
+            self.template.file.activate = True
+            if self.base_file_path:
+                self.template.file.config_path_values.base_file_path = self.base_file_path
+        self.template.deserialize(data=template_info or {})
+
+    def prepare_to_deserialize_apis(self, data: Dict[str, Any]) -> None:
+        """Deserialize section *template* before parsing section *apis*, so that every mocked API could be
+        deserialized by function *deserialize_api* as soon as it has been parsed.
+
+        Args:
+            data (Dict[str, Any]): The sections of *mocked_apis* which have been parsed before section *apis*.
+
+        Returns:
+            None
+
+        """
+        template_info = data.get("template", None)
+        self._deserialize_template(template_info)
+        self._parsed_template_info = template_info
+        self._template_is_deserialized = True
+
+    def deserialize_api(self, api_key: str, data: Optional[Dict[str, Any]]) -> Optional[MockAPI]:
+        """Deserialize one mocked API in section *apis*.
+
+        Args:
+            api_key (str): The key of the mocked API.
+            data (Optional[Dict[str, Any]]): The content of the mocked API.
+
+        Returns:
+            A **MockAPI** type object.
+
+        """
+        assert isinstance(self._template_config_loader, TemplateConfigLoader)
+        return self._template_config_loader.deserialize_config(api_key, data)  # type: ignore[return-value]
+
+    def can_use_deserialized_apis(self, data: Dict[str, Any]) -> bool:
+        """Check whether the mocked APIs which have been deserialized while parsing are deserialized by the section
+        *template* of the data. It's not if the section *template* is after section *apis* in the configuration file.
+
+        Args:
+            data (Dict[str, Any]): The content of section *mocked_apis*.
+
+        Returns:
+            It's ``True`` if it could use them.
+
+        """
+        return not self._template_is_deserialized or data.get("template", None) is self._parsed_template_info
+
     def is_work(self) -> bool:
         under_check = {
             f"{self.absolute_model_key}.<API name>": self.apis,
@@ -310,6 +389,7 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
             self.apis[api_key] = api_config
         else:
             self.apis = {}
+            self._api_sources = {}
 
     @property
     def _template_config(self) -> TemplateConfig:
@@ -327,35 +407,78 @@ class MockAPIs(_OperatingTemplatableConfig, _Checkable):
 
     def _set_template_config(self, config: MockAPI, **kwargs) -> None:  # type: ignore[override]
         # Read YAML config
-        mock_api_config_name = os.path.basename(kwargs["path"])
-        format_rule_string = self._config_file_format.replace("**", "")
-        mock_api_config_key = mock_api_config_name.replace(format_rule_string, "")
+        mock_api_config_key = self.get_api_key_by_config_path(kwargs["path"])
         # Set the data model in config
         self.apis[mock_api_config_key] = config
+        self._api_sources[mock_api_config_key] = MockAPISource(
+            path=os.path.abspath(kwargs["path"]), files=sorted(set(kwargs.get("sources", None) or []))
+        )
+
+    def _lazy_config(  # type: ignore[override]
+        self, data: Optional[dict], source: str, deserialize: Callable[[], Optional[MockAPI]]
+    ) -> Optional[MockAPI]:
+        if not self.lazy_deserialization:
+            return None
+        return lazy_mock_api(data, source=source, deserialize=deserialize)
+
+    def load_api_config(self, path: str) -> Tuple[str, Optional[MockAPI], MockAPISource]:
+        """Load one mocked API from its divided configuration file without setting it into the configuration.
+
+        Args:
+            path (str): The file path of the mocked API configuration.
+
+        Returns:
+            A tuple of the key of the mocked API, the **MockAPI** type object and the **MockAPISource** type object.
+
+        """
+        assert self._template_config_loader
+        with record_read_files() as read_files:
+            api_config = self._template_config_loader._deserialize_template_config(path)
+        source = MockAPISource(path=os.path.abspath(path), files=sorted(set(read_files)))
+        return self.get_api_key_by_config_path(path), api_config, source  # type: ignore[return-value]
+
+    def get_api_key_by_config_path(self, path: str) -> str:
+        """Get the key of the mocked API by the file path of its divided configuration.
+
+        Args:
+            path (str): The file path of the mocked API configuration, e.g., *./foo/get_foo-api.yaml*.
+
+        Returns:
+            The key of the mocked API, e.g., *get_foo*.
+
+        """
+        mock_api_config_name = os.path.basename(path)
+        format_rule_string = self._config_file_format.replace("**", "")
+        return mock_api_config_name.replace(format_rule_string, "")
+
+    def has_api_url(self, url: str, base: Optional[BaseConfig] = None) -> bool:
+        url = url.replace(base.url, "") if base else url
+        return self._apis.has_url(url)
 
     def get_api_config_by_url(self, url: str, base: Optional[BaseConfig] = None) -> Optional[MockAPI]:
         url = url.replace(base.url, "") if base else url
-        for k, v in self._apis.items():
-            if v and v.url == url:
-                return self._apis[k]
-        return None
+        return self._apis.get_by_url(url)
 
     def get_all_api_config_by_url(self, url: str, base: Optional[BaseConfig] = None) -> Dict[str, MockAPI]:
         url = url.replace(base.url, "") if base else url
-        all_api_configs: Dict[str, MockAPI] = {}
-        for k, v in self._apis.items():
-            if v and v.url == url:
-                all_api_configs[v.http.request.method.upper()] = self._apis[k]  # type: ignore[union-attr,assignment]
-        return all_api_configs
+        return self._apis.get_all_by_url(url)
+
+    def get_api_config_by_url_and_method(
+        self, url: str, method: str, base: Optional[BaseConfig] = None
+    ) -> Optional[MockAPI]:
+        url = url.replace(base.url, "") if base else url
+        return self._apis.get_by_url_and_method(url, method)
+
+    def get_all_api_config_by_tag(self, tag: str) -> List[MockAPI]:
+        return self._apis.get_all_by_tag(tag)
 
     def group_by_url(self) -> Dict[str, List[MockAPI]]:
         apis = self._apis
+        assert None not in apis.values()
         aggregated_apis: Dict[str, List[MockAPI]] = {}
-        for api_name, api_config in apis.items():
-            assert api_config and api_config.url
-            one_url_details = aggregated_apis.get(api_config.url, [])
-            one_url_details.append(api_config)
-            aggregated_apis[api_config.url] = one_url_details
+        for url in apis.urls():
+            assert url
+            aggregated_apis[url] = [apis[api_key] for api_key in apis.keys_by_url(url)]  # type: ignore[misc]
         return aggregated_apis
 
 
@@ -381,6 +504,7 @@ class FakeAPIConfig(_Config, _Checkable):
 
         self.is_pull: bool = False
         self._base_file_path: str = ""
+        self.lazy_deserialization: bool = False
 
     def __len__(self):
         return len(self._apis) if self._apis else 0
@@ -550,11 +674,19 @@ class FakeAPIConfig(_Config, _Checkable):
             A **APIConfig** type object.
 
         """
+        return self._deserialize(data, mock_apis_data_model=self._new_mock_apis_data_model())
+
+    def _deserialize(self, data: Dict[str, Any], mock_apis_data_model: MockAPIs) -> "FakeAPIConfig":
         self.name = data.get("name", None)
         self.description = data.get("description", None)
 
         mocked_apis = data.get("mocked_apis", None)
         mocked_apis = {"template": {}} if not mocked_apis else mocked_apis
+        self.apis = mock_apis_data_model.deserialize(data=mocked_apis)
+
+        return self
+
+    def _new_mock_apis_data_model(self) -> MockAPIs:
         mock_apis_data_model = MockAPIs()
         mock_apis_data_model.set_template_in_config = self.set_template_in_config
         mock_apis_data_model.config_file_name = self.config_file_name
@@ -562,9 +694,8 @@ class FakeAPIConfig(_Config, _Checkable):
         mock_apis_data_model.divide_strategy = self._divide_strategy
         mock_apis_data_model.is_pull = self.is_pull
         mock_apis_data_model.base_file_path = self.base_file_path
-        self.apis = mock_apis_data_model.deserialize(data=mocked_apis)
-
-        return self
+        mock_apis_data_model.lazy_deserialization = self.lazy_deserialization
+        return mock_apis_data_model
 
     def is_work(self) -> bool:
         if not self.should_not_be_none(
@@ -581,7 +712,26 @@ class FakeAPIConfig(_Config, _Checkable):
 
     def from_yaml(self, path: str, is_pull: bool = False) -> Optional["FakeAPIConfig"]:
         self.is_pull = is_pull
-        return self.deserialize(data=self._config_operation.read(path))
+        # Deserialize the mocked APIs one by one while parsing the configuration file, so it doesn't need to keep the
+        # parsed content of all the mocked APIs at the same time.
+        mock_apis_data_model = self._new_mock_apis_data_model()
+        data = self._config_operation.read(
+            path,
+            mapping_converter=MappingConverter(
+                path=(mock_apis_data_model.key, "apis"),
+                prepare=mock_apis_data_model.prepare_to_deserialize_apis,
+                convert=mock_apis_data_model.deserialize_api,
+            ),
+        )
+        if not data:
+            return None
+        mocked_apis = data.get("mocked_apis", None)
+        if mocked_apis and not mock_apis_data_model.can_use_deserialized_apis(mocked_apis):
+            # Section *template* is after section *apis* in the configuration file, so the mocked APIs have been
+            # deserialized without it. Parse the configuration file again to deserialize them with it.
+            logging.info(f"Section *template* is after section *apis* in {path}, parse it again.")
+            return self.deserialize(data=self._config_operation.read(path))
+        return self._deserialize(data, mock_apis_data_model=mock_apis_data_model)
 
     def to_yaml(self, path: str) -> None:
         self._config_operation.write(path=path, config=(self.serialize() or {}))
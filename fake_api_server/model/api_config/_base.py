@@ -1,12 +1,17 @@
 import logging
 import sys
 from abc import ABC, ABCMeta, abstractmethod
+from collections import namedtuple
 from copy import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 logger = logging.getLogger(__name__)
 
+# The index of the elements (which have attribute *name*) in a list by their names. *elements* and *size* are the list
+# and its size when building the index, it needs to be built again if the list has been replaced or resized.
+NameIndex = namedtuple("NameIndex", ("elements", "size", "index"))
+
 # The truly semantically is more near like following:
 #
 # ConfigType = TypeVar("ConfigType" bound="_Config")
@@ -21,8 +26,16 @@ logger = logging.getLogger(__name__)
 SelfType = Any
 
 
-class _Config(metaclass=ABCMeta):
-    _absolute_key: str = field(init=False, repr=False, default_factory=str)
+class _ConfigState:
+    # The attributes of the mixin classes *_Config* and *_Checkable*. A class cannot inherit from 2 classes which both
+    # have non-empty *__slots__*, so the mixin classes keep their attributes here and have empty *__slots__*.
+    __slots__ = ("_absolute_key", "_stop_if_fail", "_config_is_wrong")
+
+
+class _Config(_ConfigState, metaclass=ABCMeta):
+    __slots__ = ()
+
+    _absolute_key: str
 
     def __eq__(self, other: SelfType) -> bool:
         if other is None:
@@ -40,13 +53,12 @@ class _Config(metaclass=ABCMeta):
 
     @property
     def absolute_model_key(self) -> str:
-        return self._absolute_key
+        return getattr(self, "_absolute_key", "")
 
     @absolute_model_key.setter
     def absolute_model_key(self, key: str) -> None:
-        self._absolute_key = key
-        if self._absolute_key:
-            self._absolute_key += f".{self.key}"
+        # There are only a few different keys for a huge amount of data models, so let them share the same strings
+        self._absolute_key = sys.intern(f"{key}.{self.key}") if key else key
 
     @property
     @abstractmethod
@@ -103,13 +115,15 @@ class _Config(metaclass=ABCMeta):
         pass
 
 
-class _Checkable(metaclass=ABCMeta):
-    _stop_if_fail: Optional[bool] = field(init=False, repr=False, default=None)
-    _config_is_wrong: bool = field(init=False, repr=False, default=False)
+class _Checkable(_ConfigState, metaclass=ABCMeta):
+    __slots__ = ()
+
+    _stop_if_fail: Optional[bool]
+    _config_is_wrong: bool
 
     @property
     def stop_if_fail(self) -> Optional[bool]:
-        return self._stop_if_fail
+        return getattr(self, "_stop_if_fail", None)
 
     @stop_if_fail.setter
     def stop_if_fail(self, s: bool) -> None:
@@ -126,7 +140,7 @@ class _Checkable(metaclass=ABCMeta):
         if (config_value is None) or (accept_empty and not config_value):
             logger.error(err_msg if err_msg else f"Configuration *{config_key}* content cannot be empty.")
             self._config_is_wrong = True
-            if self._stop_if_fail:
+            if self.stop_if_fail:
                 self._exit_program(1)
             return False
         else:
@@ -144,7 +158,7 @@ class _Checkable(metaclass=ABCMeta):
         if (config_value is not None) or (accept_empty and config_value):
             logger.error(err_msg if err_msg else f"Configuration *{config_key}* content should be None or empty.")
             self._config_is_wrong = True
-            if self._stop_if_fail:
+            if self.stop_if_fail:
                 self._exit_program(1)
             return False
         else:
@@ -193,7 +207,7 @@ class _Checkable(metaclass=ABCMeta):
         if not is_valid:
             logger.error(f"Configuration *{config_key}* value is invalid.")
             self._config_is_wrong = True
-            if self._stop_if_fail:
+            if self.stop_if_fail:
                 self._exit_program(1)
         else:
             if valid_callback:
@@ -210,7 +224,7 @@ class _Checkable(metaclass=ABCMeta):
             base_error_msg = f"Configuration *{config_key}* setting is invalid."
             logger.error(f"{base_error_msg} {err_msg}" if err_msg else base_error_msg)
             self._config_is_wrong = True
-            if self._stop_if_fail:
+            if self.stop_if_fail:
                 self._exit_program(1)
             return False
         else:
@@ -227,6 +241,10 @@ class _Checkable(metaclass=ABCMeta):
 
 @dataclass(eq=False)
 class _BaseConfig(_Config, ABC):
+    # The attributes of the mixin classes *_HasItemsPropConfig* and *_HasFormatPropConfig*, which are mixed in the same
+    # property data models.
+    __slots__ = ("items", "value_format")
+
     def __post_init__(self):
         """
         For the Python MRO, some specific base data models would need to override this method to reach some feature like
@@ -236,7 +254,9 @@ class _BaseConfig(_Config, ABC):
 
 @dataclass(eq=False)
 class _HasItemsPropConfig(_BaseConfig, _Checkable, ABC):
-    items: Optional[List["_HasItemsPropConfig"]] = None
+    __slots__ = ()
+
+    items: Optional[List["_HasItemsPropConfig"]]
 
     def _compare(self, other: "_HasItemsPropConfig") -> bool:
         items_prop_is_same: bool = True
@@ -339,3 +359,26 @@ _ConfigType = TypeVar("_ConfigType", bound=_Config)
 _CheckableType = TypeVar("_CheckableType", bound=_Checkable)
 _CheckableConfigType = TypeVar("_CheckableConfigType", bound=_CheckableConfig)
 _HasItemsPropConfigType = TypeVar("_HasItemsPropConfigType", bound=_HasItemsPropConfig)
+
+
+def index_by_name(elements: List[Any], name_index: Optional[NameIndex] = None) -> NameIndex:
+    """Get the index of the elements by their names. It reuses the built index if the list is still the same one.
+
+    Args:
+        elements (List[Any]): The elements which have attribute *name*.
+        name_index (Optional[NameIndex]): The index which has been built before.
+
+    Returns:
+        A **NameIndex** type object. Its property *index* is a dict of the elements (in a list) by their names.
+
+    """
+    if name_index is None or name_index.elements is not elements or name_index.size != len(elements):
+        # The data structure would be:
+        # {
+        #     <name>: [<element>],
+        # }
+        index: Dict[str, List[Any]] = {}
+        for element in elements:
+            index.setdefault(element.name, []).append(element)
+        name_index = NameIndex(elements=elements, size=len(elements), index=index)
+    return name_index
@@ -25,7 +25,14 @@ from fake_api_server.model.api_config.template.file import (
 )
 
 from .request import APIParameter, HTTPRequest
-from .response import HTTPResponse, ResponseProperty
+from .response import (
+    HTTPResponse,
+    Latency,
+    LatencyDistribution,
+    ResponseProperty,
+    StreamFormat,
+    ValuePool,
+)
 from .response_strategy import ResponseStrategy
 
 logger = logging.getLogger(__name__)
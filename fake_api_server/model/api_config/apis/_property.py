@@ -4,17 +4,39 @@ from pydoc import locate
 from typing import Any, Dict, List, Optional, Type
 
 from fake_api_server.model.api_config._base import _Config, _HasItemsPropConfig
-from fake_api_server.model.api_config.format import _HasFormatPropConfig
+from fake_api_server.model.api_config.format import Format, _HasFormatPropConfig
 from fake_api_server.model.api_config.item import IteratorItem
-from fake_api_server.model.api_config.template import _BaseTemplateAccessable
+from fake_api_server.model.api_config.template import (
+    TemplateConfig,
+    _BaseTemplateAccessable,
+)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, init=False)
 class BaseProperty(_HasItemsPropConfig, _HasFormatPropConfig, _BaseTemplateAccessable, ABC):
-    name: str = field(default_factory=str)
-    required: Optional[bool] = None
-    value_type: Optional[str] = None  # A type value as string
-    items: Optional[List[IteratorItem]] = None  # type: ignore[assignment]
+    __slots__ = ("_current_template", "name", "required", "value_type")
+
+    name: str
+    required: Optional[bool]
+    value_type: Optional[str]  # A type value as string
+    items: Optional[List[IteratorItem]]  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        _current_template: Optional[TemplateConfig] = None,
+        value_format: Optional[Format] = None,
+        items: Optional[List[IteratorItem]] = None,
+        name: str = "",
+        required: Optional[bool] = None,
+        value_type: Optional[str] = None,
+    ):
+        self._current_template = _current_template if _current_template is not None else TemplateConfig()
+        self.value_format = value_format
+        self.items = items
+        self.name = name
+        self.required = required
+        self.value_type = value_type
+        self.__post_init__()
 
     def _compare(self, other: "BaseProperty") -> bool:  # type: ignore[override]
         return (
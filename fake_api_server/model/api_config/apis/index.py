@@ -0,0 +1,243 @@
+"""*The mocked APIs with the indexes to look up them*
+
+Looking up the mocked APIs by URL (e.g., checking every API of a Swagger API document with the configuration) needs
+to scan all the mocked APIs every time. The mocked APIs are kept in a dict which also keeps the indexes of them by URL,
+by URL and HTTP method, and by tag, so the lookup only costs the mocked APIs which have the same URL or tag.
+
+The indexes are built when looking up at the first time, and they would be updated when setting or removing any mocked
+API in the dict. So it still needs to set the mocked API again if its URL, HTTP method or tag has been modified.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import MockAPI
+from .lazy import is_deserialized
+
+_Missing = object()
+
+
+def _api_url(api_config: MockAPI) -> Optional[str]:
+    return api_config.url
+
+
+def _api_http_method(api_config: MockAPI) -> Optional[str]:
+    if not is_deserialized(api_config):
+        # It could get the HTTP method of the lazy mocked API without deserializing it
+        return api_config.method.upper()  # type: ignore[attr-defined]
+    if api_config.http is None or api_config.http.request is None or not api_config.http.request.method:
+        return None
+    return api_config.http.request.method.upper()
+
+
+class IndexedMockAPIs(Dict[str, Optional[MockAPI]]):
+    """*The mocked APIs by their keys with the indexes of URL, HTTP method and tag*
+
+    It's a dict of the mocked APIs, all the operations of dict could be used as before.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # The data structure would be:
+        # {
+        #     <URL>: {
+        #         <key of mocked API>: None,    # Only keep the keys in order
+        #     }
+        # }
+        self._url_index: Optional[Dict[Optional[str], Dict[str, None]]] = None
+        # The data structure would be:
+        # {
+        #     <URL>: {
+        #         <HTTP method in upper case>: <key of mocked API>,
+        #     }
+        # }
+        self._url_method_index: Dict[Optional[str], Dict[str, str]] = {}
+        # The URL of every mocked API when it's indexed
+        self._indexed_urls: Dict[str, Optional[str]] = {}
+        # The data structure would be:
+        # {
+        #     <tag>: [<key of mocked API>],
+        # }
+        # It is only built if it's needed, because the tag of lazy mocked API needs to deserialize it.
+        self._tag_index: Optional[Dict[str, List[str]]] = None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Don't keep the indexes, they would be built again when looking up
+        return self.__class__, (dict(self),)
+
+    def __setitem__(self, key: str, value: Optional[MockAPI]) -> None:
+        is_new_key = key not in self
+        super().__setitem__(key, value)
+        self._tag_index = None
+        if self._url_index is not None:
+            self._index_api(key, value, is_new_key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._tag_index = None
+        if self._url_index is not None:
+            self._unindex_api(key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        value = super().pop(key, _Missing)
+        if value is _Missing:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        self._tag_index = None
+        if self._url_index is not None:
+            self._unindex_api(key)
+        return value
+
+    def popitem(self) -> Tuple[str, Optional[MockAPI]]:
+        key, value = super().popitem()
+        self._tag_index = None
+        if self._url_index is not None:
+            self._unindex_api(key)
+        return key, value
+
+    def setdefault(self, key: str, default: Optional[MockAPI] = None) -> Optional[MockAPI]:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    # mypy checks the in-place operator against the overloads of *dict.__or__* in the type stubs, no signature which
+    # only accepts the mocked APIs could pass it.
+    def __ior__(self, other: Any) -> "IndexedMockAPIs":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def copy(self) -> "IndexedMockAPIs":
+        return self.__class__(self)
+
+    def _invalidate(self) -> None:
+        self._url_index = None
+        self._url_method_index = {}
+        self._indexed_urls = {}
+        self._tag_index = None
+
+    def _build_url_index(self) -> Dict[Optional[str], Dict[str, None]]:
+        if self._url_index is None:
+            self._url_index = {}
+            self._url_method_index = {}
+            self._indexed_urls = {}
+            for key, api_config in self.items():
+                if api_config:
+                    url = _api_url(api_config)
+                    self._indexed_urls[key] = url
+                    self._url_index.setdefault(url, {})[key] = None
+            for url in self._url_index.keys():
+                self._index_url_methods(url)
+        return self._url_index
+
+    def _index_api(self, key: str, api_config: Optional[MockAPI], is_new_key: bool) -> None:
+        assert self._url_index is not None
+        if not api_config:
+            self._unindex_api(key)
+            return
+        new_url = _api_url(api_config)
+        if not is_new_key and (key not in self._indexed_urls or self._indexed_urls[key] != new_url):
+            # The existing key would be at the different position in the URL index, so build the indexes again.
+            self._invalidate()
+            return
+        self._indexed_urls[key] = new_url
+        self._url_index.setdefault(new_url, {})[key] = None
+        self._index_url_methods(new_url)
+
+    def _unindex_api(self, key: str) -> None:
+        assert self._url_index is not None
+        if key not in self._indexed_urls:
+            return
+        url = self._indexed_urls.pop(key)
+        keys = self._url_index.get(url, {})
+        keys.pop(key, None)
+        if not keys:
+            self._url_index.pop(url, None)
+        self._index_url_methods(url)
+
+    def _index_url_methods(self, url: Optional[str]) -> None:
+        assert self._url_index is not None
+        # The last one would be used if there are multiple mocked APIs with the same URL and HTTP method
+        methods: Dict[str, str] = {}
+        for key in self._url_index.get(url, {}):
+            method = _api_http_method(self[key])  # type: ignore[arg-type]
+            if method:
+                methods[method] = key
+        if methods:
+            self._url_method_index[url] = methods
+        else:
+            self._url_method_index.pop(url, None)
+
+    def has_url(self, url: str) -> bool:
+        return url in self._build_url_index()
+
+    def urls(self) -> Iterable[Optional[str]]:
+        return self._build_url_index().keys()
+
+    def keys_by_url(self, url: str) -> Iterator[str]:
+        return iter(self._build_url_index().get(url, {}))
+
+    def get_by_url(self, url: str) -> Optional[MockAPI]:
+        """Get the first mocked API which has the URL.
+
+        Args:
+            url (str): The URL of the mocked API.
+
+        Returns:
+            A **MockAPI** type object. It's ``None`` if it cannot find any mocked API with the URL.
+
+        """
+        key = next(self.keys_by_url(url), None)
+        return self[key] if key is not None else None
+
+    def get_all_by_url(self, url: str) -> Dict[str, MockAPI]:
+        """Get all the mocked APIs which have the URL by their HTTP methods.
+
+        Args:
+            url (str): The URL of the mocked API.
+
+        Returns:
+            A dict of the mocked APIs by their HTTP methods in upper case.
+
+        """
+        self._build_url_index()
+        return {method: self[key] for method, key in self._url_method_index.get(url, {}).items()}  # type: ignore[misc]
+
+    def get_by_url_and_method(self, url: str, method: str) -> Optional[MockAPI]:
+        """Get the mocked API which has the URL and the HTTP method.
+
+        Args:
+            url (str): The URL of the mocked API.
+            method (str): The HTTP method of the mocked API. It's case-insensitive.
+
+        Returns:
+            A **MockAPI** type object. It's ``None`` if it cannot find the mocked API.
+
+        """
+        self._build_url_index()
+        key = self._url_method_index.get(url, {}).get(method.upper(), None)
+        return self[key] if key is not None else None
+
+    def get_all_by_tag(self, tag: str) -> List[MockAPI]:
+        """Get all the mocked APIs which have the tag.
+
+        Args:
+            tag (str): The tag of the mocked APIs. The mocked APIs without any tag have tag as empty string.
+
+        Returns:
+            A list of the mocked APIs in order.
+
+        """
+        if self._tag_index is None:
+            self._tag_index = {}
+            for key, api_config in self.items():
+                if api_config:
+                    self._tag_index.setdefault(api_config.tag or "", []).append(key)
+        return [self[key] for key in self._tag_index.get(tag, [])]  # type: ignore[misc]
@@ -0,0 +1,143 @@
+"""*The mocked API which would be deserialized lazily*
+
+Deserializing every mocked API (the request parameters, the formats and the trees of response properties) costs
+time and memory at startup, but most of the mocked APIs may not be requested at all in one test run. The lazy mocked
+API only has the URL, the HTTP method and the source of configuration, which are enough to register the route of it.
+It would be deserialized when it's used at the first time.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from . import MockAPI
+
+# Deserializing the lazy mocked APIs would be rare, so they share one lock.
+_Deserializing_Lock = threading.RLock()
+
+
+class LazyMockAPI(MockAPI):
+    """*The stub of **MockAPI** which would be deserialized in place when it's used at the first time*
+
+    It would deserialize the entire configuration and become a **MockAPI** type object itself when accessing any
+    attribute except the URL, so all the references to it (e.g., the routes of web application) could still be used
+    and it only be deserialized once.
+    """
+
+    # The attributes which could be accessed without deserializing it
+    _Stub_Attributes = frozenset(("_url", "url", "method", "source", "deserialize_now"))
+
+    def __init__(self, url: str, method: str, source: str, deserialize: Callable[[], Optional[MockAPI]]):
+        """
+
+        Args:
+            url (str): The URL of the mocked API.
+            method (str): The HTTP method of the mocked API.
+            source (str): Where the configuration of the mocked API is, e.g., the file path of the configuration.
+            deserialize (Callable[[], Optional[MockAPI]]): The callable to deserialize the entire configuration.
+        """
+        # Don't initial the attributes of **MockAPI**, it would get them by deserializing.
+        stub_attributes = object.__getattribute__(self, "__dict__")
+        stub_attributes["_url"] = url
+        stub_attributes["_lazy_method"] = method
+        stub_attributes["_lazy_source"] = source
+        stub_attributes["_lazy_deserialize"] = deserialize
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in LazyMockAPI._Stub_Attributes or (name.startswith("__") and name.endswith("__")):
+            return object.__getattribute__(self, name)
+        object.__getattribute__(self, "deserialize_now")()
+        return object.__getattribute__(self, name)
+
+    def __repr__(self) -> str:
+        stub_attributes: Dict[str, Any] = object.__getattribute__(self, "__dict__")
+        return (
+            f"{LazyMockAPI.__name__}(url={stub_attributes['_url']!r}, method={stub_attributes['_lazy_method']!r}, "
+            f"source={stub_attributes['_lazy_source']!r})"
+        )
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Don't pickle or copy the stub with the callable
+        self.deserialize_now()
+        return self.__reduce_ex__(protocol)
+
+    @property
+    def method(self) -> str:
+        return object.__getattribute__(self, "__dict__")["_lazy_method"]
+
+    @property
+    def source(self) -> str:
+        return object.__getattribute__(self, "__dict__")["_lazy_source"]
+
+    def deserialize_now(self) -> None:
+        """Deserialize the entire configuration and become a **MockAPI** type object in place.
+
+        Returns:
+            None
+
+        """
+        with _Deserializing_Lock:
+            if type(self) is not LazyMockAPI:
+                # It has been deserialized by the other thread
+                return
+            stub_attributes: Dict[str, Any] = object.__getattribute__(self, "__dict__")
+            api_config = stub_attributes["_lazy_deserialize"]()
+            if api_config is None:
+                raise ValueError(f"Cannot deserialize the mocked API from {stub_attributes['_lazy_source']}.")
+            for stub_attribute in ("_lazy_method", "_lazy_source", "_lazy_deserialize"):
+                stub_attributes.pop(stub_attribute)
+            stub_attributes.update(api_config.__dict__)
+            object.__setattr__(self, "__class__", type(api_config))
+
+
+def is_deserialized(api_config: MockAPI) -> bool:
+    """Check whether the mocked API has been deserialized. It's always ``True`` if it's not lazy.
+
+    Args:
+        api_config (MockAPI): The mocked API.
+
+    Returns:
+        It's ``False`` if it's a lazy mocked API which hasn't been used.
+
+    """
+    return type(api_config) is not LazyMockAPI
+
+
+def http_method(api_config: MockAPI) -> str:
+    """Get the HTTP method of the mocked API without deserializing it if it's lazy.
+
+    Args:
+        api_config (MockAPI): The mocked API.
+
+    Returns:
+        The HTTP method.
+
+    """
+    if type(api_config) is LazyMockAPI:
+        return api_config.method
+    return api_config.http.request.method  # type: ignore[union-attr]
+
+
+def lazy_mock_api(
+    data: Optional[Dict[str, Any]], source: str, deserialize: Callable[[], Optional[MockAPI]]
+) -> Optional[LazyMockAPI]:
+    """Create the lazy mocked API by the parsed configuration.
+
+    Args:
+        data (Optional[Dict[str, Any]]): The parsed configuration of the mocked API.
+        source (str): Where the configuration of the mocked API is.
+        deserialize (Callable[[], Optional[MockAPI]]): The callable to deserialize the entire configuration.
+
+    Returns:
+        A **LazyMockAPI** type object. It's ``None`` if the URL or the HTTP method is not in the parsed configuration
+        directly (e.g., they are in the other divided configuration file), so it needs to be deserialized now.
+
+    """
+    if not isinstance(data, dict):
+        return None
+    url = data.get("url", None)
+    http = data.get("http", None)
+    request = http.get("request", None) if isinstance(http, dict) else None
+    method = request.get("method", None) if isinstance(request, dict) else None
+    if not (url and isinstance(url, str) and method and isinstance(method, str)):
+        return None
+    return LazyMockAPI(url=url, method=method, source=source, deserialize=deserialize)
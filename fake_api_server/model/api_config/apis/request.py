@@ -12,9 +12,15 @@ from fake_api_server.model.api_config.template.file import TemplateConfigPathReq
 from ._property import BaseProperty
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, init=False)
 class APIParameter(BaseProperty):
-    default: Optional[Any] = None
+    __slots__ = ("default",)
+
+    default: Optional[Any]
+
+    def __init__(self, *args: Any, default: Optional[Any] = None, **kwargs: Any):
+        self.default = default
+        super().__init__(*args, **kwargs)
 
     def _compare(self, other: "APIParameter") -> bool:  # type: ignore[override]
         # TODO: Let it could automatically scan what properties it has and compare all of their value.
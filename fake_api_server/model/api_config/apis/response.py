@@ -3,7 +3,8 @@ import logging
 import pathlib
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from typing import Any, ClassVar, Dict, List, Optional, Union
 
 from fake_api_server.model.api_config._base import _Checkable, _Config
 from fake_api_server.model.api_config.template._base_wrapper import (
@@ -17,9 +18,15 @@ from .response_strategy import ResponseStrategy
 logger = logging.getLogger(__name__)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, init=False)
 class ResponseProperty(BaseProperty):
-    is_empty: Optional[bool] = None
+    __slots__ = ("is_empty",)
+
+    is_empty: Optional[bool]
+
+    def __init__(self, *args: Any, is_empty: Optional[bool] = None, **kwargs: Any):
+        self.is_empty = is_empty
+        super().__init__(*args, **kwargs)
 
     def _compare(self, other: "ResponseProperty") -> bool:  # type: ignore[override]
         return super()._compare(other) and self.is_empty == other.is_empty
@@ -82,6 +89,236 @@ class ResponseProperty(BaseProperty):
         return True
 
 
+@dataclass(eq=False)
+class ValuePool(_Config, _Checkable):
+    """*The **http.response.pool** section in **mocked_apis.<api>***
+
+    Keep the random values of every property with format setting in a pool, so that the values could be generated
+    in background instead of generating them when handling request.
+    """
+
+    _default_size: ClassVar[int] = 1000
+    _default_watermark: ClassVar[int] = 250
+
+    size: int = _default_size
+    """The maximum amount of values which be kept in the pool."""
+
+    watermark: int = _default_watermark
+    """It would refill the pool in background if the amount of values in the pool is less than this value."""
+
+    def _compare(self, other: "ValuePool") -> bool:
+        return self.size == other.size and self.watermark == other.watermark
+
+    @property
+    def key(self) -> str:
+        return "pool"
+
+    def serialize(self, data: Optional["ValuePool"] = None) -> Optional[Dict[str, Any]]:
+        size: int = self._get_prop(data, prop="size")
+        watermark: int = self._get_prop(data, prop="watermark")
+        return {
+            "size": (size if size is not None else self._default_size),
+            "watermark": (watermark if watermark is not None else self._default_watermark),
+        }
+
+    @_Config._ensure_process_with_not_empty_value
+    def deserialize(self, data: Dict[str, Any]) -> Optional["ValuePool"]:
+        self.size = data.get("size", self._default_size)
+        self.watermark = data.get("watermark", self._default_watermark)
+        return self
+
+    def is_work(self) -> bool:
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.size",
+            condition=(not isinstance(self.size, int) or self.size <= 0),
+            err_msg="The size of value pool must be a positive integer.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.watermark",
+            condition=(not isinstance(self.watermark, int) or not 0 <= self.watermark < self.size),
+            err_msg="The watermark of value pool must be an integer which is not less than 0 and less than its size.",
+        ):
+            return False
+        return True
+
+
+class StreamFormat(Enum):
+    JSON = "json"
+    NDJSON = "ndjson"
+
+
+class LatencyDistribution(Enum):
+    FIXED = "fixed"
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+    PERCENTILE = "percentile"
+
+
+@dataclass(eq=False)
+class Latency(_Config, _Checkable):
+    """*The **http.response.latency** section in **mocked_apis.<api>***
+
+    Simulate the latency of a slow upstream. It delays the response by the seconds which be sampled from the
+    distribution, and it could also throttle the bandwidth of sending the response body.
+    """
+
+    distribution: Optional[LatencyDistribution] = None
+    """
+    Distribution:
+    * fixed: Delay the response with the seconds *value*.
+    * uniform: Delay the response with the seconds which be sampled uniformly between *min* and *max*.
+    * normal: Delay the response with the seconds which be sampled from the normal distribution with *mean* and
+      *stddev*. It would be 0 if the sampled value is negative.
+    * percentile: Delay the response with the seconds which be sampled from the percentile table *percentiles*. The
+      seconds between 2 percentiles would be interpolated linearly.
+    """
+
+    # Distribution: fixed
+    value: float = 0
+
+    # Distribution: uniform
+    min: float = 0
+    max: float = 0
+
+    # Distribution: normal
+    mean: float = 0
+    stddev: float = 0
+
+    # Distribution: percentile
+    percentiles: Dict[Union[int, float], float] = field(default_factory=dict)
+
+    bandwidth: Optional[int] = None
+    """The bytes per second of sending the response body. It doesn't throttle the bandwidth if it's empty."""
+
+    def _compare(self, other: "Latency") -> bool:
+        return self.serialize() == other.serialize()
+
+    def __post_init__(self) -> None:
+        if isinstance(self.distribution, str):
+            self.distribution = LatencyDistribution(self.distribution)
+
+    @property
+    def key(self) -> str:
+        return "latency"
+
+    def serialize(self, data: Optional["Latency"] = None) -> Optional[Dict[str, Any]]:
+        distribution: Optional[LatencyDistribution] = self._get_prop(data, prop="distribution")
+        serialized_data: Dict[str, Any] = {}
+        if distribution is not None:
+            serialized_data["distribution"] = distribution.value
+        if distribution is LatencyDistribution.FIXED:
+            serialized_data["value"] = self._get_prop(data, prop="value")
+        elif distribution is LatencyDistribution.UNIFORM:
+            serialized_data["min"] = self._get_prop(data, prop="min")
+            serialized_data["max"] = self._get_prop(data, prop="max")
+        elif distribution is LatencyDistribution.NORMAL:
+            serialized_data["mean"] = self._get_prop(data, prop="mean")
+            serialized_data["stddev"] = self._get_prop(data, prop="stddev")
+        elif distribution is LatencyDistribution.PERCENTILE:
+            serialized_data["percentiles"] = self._get_prop(data, prop="percentiles")
+        bandwidth: Optional[int] = self._get_prop(data, prop="bandwidth")
+        if bandwidth is not None:
+            serialized_data["bandwidth"] = bandwidth
+        return serialized_data
+
+    @_Config._ensure_process_with_not_empty_value
+    def deserialize(self, data: Dict[str, Any]) -> Optional["Latency"]:
+        """Convert data to **Latency** type object.
+
+        The data structure should be like following:
+
+        * Example data:
+        .. code-block:: python
+
+            {
+                'latency': {
+                    'distribution': 'percentile',
+                    'percentiles': {50: 0.1, 90: 0.5, 99: 2},
+                    'bandwidth': 102400,
+                },
+            }
+
+        Args:
+            data (Dict[str, Any]): Target data to convert.
+
+        Returns:
+            A **Latency** type object.
+
+        """
+        distribution = data.get("distribution", None)
+        self.distribution = LatencyDistribution(distribution) if distribution is not None else None
+        self.value = data.get("value", 0)
+        self.min = data.get("min", 0)
+        self.max = data.get("max", 0)
+        self.mean = data.get("mean", 0)
+        self.stddev = data.get("stddev", 0)
+        self.percentiles = data.get("percentiles", {})
+        self.bandwidth = data.get("bandwidth", None)
+        return self
+
+    def is_work(self) -> bool:
+        def _is_seconds(value: Any) -> bool:
+            return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
+        if self.distribution is LatencyDistribution.FIXED:
+            if not self.condition_should_be_true(
+                config_key=f"{self.absolute_model_key}.value",
+                condition=not _is_seconds(self.value),
+                err_msg="The latency value must be the seconds which is not negative.",
+            ):
+                return False
+        elif self.distribution is LatencyDistribution.UNIFORM:
+            if not self.condition_should_be_true(
+                config_key=f"{self.absolute_model_key}.min",
+                condition=not (_is_seconds(self.min) and _is_seconds(self.max) and self.min <= self.max),
+                err_msg="The latency min and max must be the seconds which are not negative, and min must not be "
+                "greater than max.",
+            ):
+                return False
+        elif self.distribution is LatencyDistribution.NORMAL:
+            if not self.condition_should_be_true(
+                config_key=f"{self.absolute_model_key}.mean",
+                condition=not (_is_seconds(self.mean) and _is_seconds(self.stddev)),
+                err_msg="The latency mean and stddev must be the seconds which are not negative.",
+            ):
+                return False
+        elif self.distribution is LatencyDistribution.PERCENTILE:
+            percentiles = self.percentiles if isinstance(self.percentiles, dict) else {}
+            sorted_percentiles = sorted(percentiles.items()) if all(map(_is_seconds, percentiles.keys())) else []
+            if not self.condition_should_be_true(
+                config_key=f"{self.absolute_model_key}.percentiles",
+                condition=(
+                    not sorted_percentiles
+                    or not all(0 < percentile <= 100 for percentile, _ in sorted_percentiles)
+                    or not all(_is_seconds(seconds) for _, seconds in sorted_percentiles)
+                    or any(
+                        sorted_percentiles[i][1] > sorted_percentiles[i + 1][1]
+                        for i in range(len(sorted_percentiles) - 1)
+                    )
+                ),
+                err_msg="The latency percentiles must be a table of the percentiles (greater than 0 and not greater "
+                "than 100) and their seconds, and the seconds must not decrease with the percentiles.",
+            ):
+                return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.bandwidth",
+            condition=(
+                self.bandwidth is not None
+                and (not isinstance(self.bandwidth, int) or isinstance(self.bandwidth, bool) or self.bandwidth <= 0)
+            ),
+            err_msg="The bandwidth must be a positive integer of bytes per second.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.distribution",
+            condition=(self.distribution is None and self.bandwidth is None),
+            err_msg="The latency needs the distribution or the bandwidth at least.",
+        ):
+            return False
+        return True
+
+
 @dataclass(eq=False)
 class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
     """*The **http.response** section in **mocked_apis.<api>***"""
@@ -104,6 +341,25 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
 
     # Strategy: object
     properties: List[ResponseProperty] = field(default_factory=list)
+    pool: Optional[ValuePool] = None
+    stream_format: StreamFormat = StreamFormat.JSON
+    """
+    Stream format:
+    * json: Send the response as a JSON object chunk by chunk, the elements of list properties are generated batch by
+      batch while sending them.
+    * ndjson: Send every element of the only one list property as one line of NDJSON.
+    """
+
+    # Strategy: file and object
+    stream: bool = False
+    """
+    Strategy file: Stream the file as raw bytes chunk by chunk without loading and parsing it, so it could be a huge
+    file or any format file (e.g., NDJSON or binary file). The content type would be inferred from the file extension.
+    Strategy object: Generate and send the response incrementally by the stream format, so the huge lists never be
+    kept in memory.
+    """
+
+    latency: Optional[Latency] = None
 
     def _compare(self, other: "HTTPResponse") -> bool:
         templatable_config = super()._compare(other)
@@ -111,12 +367,19 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             raise ValueError("Miss necessary argument *strategy*.")
         if self.strategy is not other.strategy:
             raise TypeError("Different HTTP response strategy cannot compare with each other.")
+        templatable_config = templatable_config and self.latency == other.latency
         if ResponseStrategy(self.strategy) is ResponseStrategy.STRING:
             return templatable_config and self.value == other.value
         elif ResponseStrategy(self.strategy) is ResponseStrategy.FILE:
-            return templatable_config and self.path == other.path
+            return templatable_config and self.path == other.path and self.stream == other.stream
         elif ResponseStrategy(self.strategy) is ResponseStrategy.OBJECT:
-            return templatable_config and self.properties == other.properties
+            return (
+                templatable_config
+                and self.properties == other.properties
+                and self.pool == other.pool
+                and self.stream == other.stream
+                and (not self.stream or self.stream_format is other.stream_format)
+            )
         else:
             raise NotImplementedError
 
@@ -125,6 +388,12 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             self._convert_strategy()
         if self.properties is not None:
             self._convert_properties()
+        if self.pool is not None:
+            self._convert_pool()
+        if self.latency is not None:
+            self._convert_latency()
+        if isinstance(self.stream_format, str):
+            self.stream_format = StreamFormat(self.stream_format)
 
     def _convert_strategy(self) -> None:
         if isinstance(self.strategy, str):
@@ -135,6 +404,18 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             raise TypeError("The data type of key *properties* must be dict or ResponseProperty.")
         self.properties = [ResponseProperty().deserialize(i) if isinstance(i, dict) else i for i in self.properties]
 
+    def _convert_pool(self) -> None:
+        if not isinstance(self.pool, (dict, ValuePool)):
+            raise TypeError("The data type of key *pool* must be dict or ValuePool.")
+        if isinstance(self.pool, dict):
+            self.pool = ValuePool().deserialize(self.pool)
+
+    def _convert_latency(self) -> None:
+        if not isinstance(self.latency, (dict, Latency)):
+            raise TypeError("The data type of key *latency* must be dict or Latency.")
+        if isinstance(self.latency, dict):
+            self.latency = Latency().deserialize(self.latency)
+
     @property
     def key(self) -> str:
         return "response"
@@ -142,6 +423,9 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
     def serialize(self, data: Optional["HTTPResponse"] = None) -> Optional[Dict[str, Any]]:
         serialized_data = super().serialize(data)
         assert serialized_data is not None
+        latency: Optional[Latency] = self._get_prop(data, prop="latency")
+        if latency is not None:
+            serialized_data["latency"] = latency.serialize()
         strategy: ResponseStrategy = self.strategy or ResponseStrategy(self._get_prop(data, prop="strategy"))
         if not isinstance(strategy, ResponseStrategy):
             raise TypeError("Argument *strategy* data type is invalid. It only accepts *ResponseStrategy* type value.")
@@ -162,6 +446,8 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                     "path": path,
                 }
             )
+            if self._get_prop(data, prop="stream"):
+                serialized_data["stream"] = True
             return serialized_data
         elif strategy is ResponseStrategy.OBJECT:
             all_properties = (data or self).properties if (data and data.properties) or self.properties else None
@@ -172,6 +458,12 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                     "properties": properties,
                 }
             )
+            pool: Optional[ValuePool] = self._get_prop(data, prop="pool")
+            if pool is not None:
+                serialized_data["pool"] = pool.serialize()
+            if self._get_prop(data, prop="stream"):
+                serialized_data["stream"] = True
+                serialized_data["stream_format"] = StreamFormat(self._get_prop(data, prop="stream_format")).value
             return serialized_data
         else:
             raise NotImplementedError
@@ -212,13 +504,28 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             self.value = data.get("value", None)
         elif self.strategy is ResponseStrategy.FILE:
             self.path = data.get("path", None)
+            self.stream = data.get("stream", False)
         elif self.strategy is ResponseStrategy.OBJECT:
             properties = data.get("properties", None)
             if properties is not None:
                 properties = [_deserialize_response_property(prop) for prop in (properties or [])]
             self.properties = properties
+            pool = data.get("pool", None)
+            if pool is not None:
+                value_pool = ValuePool()
+                value_pool.absolute_model_key = self.key
+                pool = value_pool.deserialize(pool)
+            self.pool = pool
+            self.stream = data.get("stream", False)
+            self.stream_format = StreamFormat(data.get("stream_format", StreamFormat.JSON.value))
         else:
             raise NotImplementedError
+        latency = data.get("latency", None)
+        if latency is not None:
+            response_latency = Latency()
+            response_latency.absolute_model_key = self.key
+            latency = response_latency.deserialize(latency)
+        self.latency = latency
         return self
 
     @property
@@ -227,6 +534,10 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
 
     def is_work(self) -> bool:
         assert self.strategy is not None
+        if self.latency is not None:
+            self.latency.stop_if_fail = self.stop_if_fail
+            if not self.latency.is_work():
+                return False
         if ResponseStrategy(self.strategy) is ResponseStrategy.STRING:
             return self.should_not_be_none(
                 config_key=f"{self.absolute_model_key}.value",
@@ -234,6 +545,12 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                 valid_callback=self._chk_response_value_validity,
             )
         elif ResponseStrategy(self.strategy) is ResponseStrategy.FILE:
+            if not self.condition_should_be_true(
+                config_key=f"{self.absolute_model_key}.stream",
+                condition=not isinstance(self.stream, bool),
+                err_msg="The setting *stream* must be a boolean value.",
+            ):
+                return False
             return self.should_not_be_none(
                 config_key=f"{self.absolute_model_key}.path",
                 config_value=self.path,
@@ -248,6 +565,27 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                 valid_callback=self._chk_response_value_validity,
             ):
                 return False
+            if self.pool is not None:
+                self.pool.stop_if_fail = self.stop_if_fail
+                if not self.pool.is_work():
+                    return False
+            if not self.condition_should_be_true(
+                config_key=f"{self.absolute_model_key}.stream",
+                condition=not isinstance(self.stream, bool),
+                err_msg="The setting *stream* must be a boolean value.",
+            ):
+                return False
+            if not self.condition_should_be_true(
+                config_key=f"{self.absolute_model_key}.stream_format",
+                condition=(
+                    self.stream
+                    and self.stream_format is StreamFormat.NDJSON
+                    and [p.value_type for p in self.properties] != ["list"]
+                ),
+                err_msg="Streaming the response as NDJSON needs the only one property whose type is *list*, every "
+                "element of it would be one line.",
+            ):
+                return False
         else:
             raise NotImplementedError
         return True
@@ -271,7 +609,7 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
                         "If HTTP response strategy is *string* and its value seems like JSON format, its format is not a valid JSON format."
                     )
                     self._config_is_wrong = True
-                    if self._stop_if_fail:
+                    if self.stop_if_fail:
                         self._exit_program(1)
                     return False
             return True
@@ -282,7 +620,7 @@ class HTTPResponse(_DividableOnlyTemplatableConfig, _Checkable):
             if not pathlib.Path(config_value).exists():
                 logger.error("The file which is the response content doesn't exist.")
                 self._config_is_wrong = True
-                if self._stop_if_fail:
+                if self.stop_if_fail:
                     self._exit_program(1)
                 return False
             return True
@@ -11,11 +11,13 @@ class BaseConfig(_Config, _Checkable):
     """*The **base** section in **mocked_apis***"""
 
     url: str = field(default_factory=str)
+    seed: Optional[int] = None
+    seed_cache_size: int = 0
 
     _absolute_key: str = field(init=False, repr=False)
 
     def _compare(self, other: "BaseConfig") -> bool:
-        return self.url == other.url
+        return self.url == other.url and self.seed == other.seed and self.seed_cache_size == other.seed_cache_size
 
     @property
     def key(self) -> str:
@@ -23,11 +25,18 @@ class BaseConfig(_Config, _Checkable):
 
     def serialize(self, data: Optional["BaseConfig"] = None) -> Optional[Dict[str, Any]]:
         url: str = self._get_prop(data, prop="url")
-        if not url:
+        seed: Optional[int] = self._get_prop(data, prop="seed")
+        seed_cache_size: int = self._get_prop(data, prop="seed_cache_size")
+        if not url and seed is None:
             return None
-        return {
+        serialized_data: Dict[str, Any] = {
             "url": url,
         }
+        if seed is not None:
+            serialized_data["seed"] = seed
+            if seed_cache_size:
+                serialized_data["seed_cache_size"] = seed_cache_size
+        return serialized_data
 
     @_Config._ensure_process_with_not_empty_value
     def deserialize(self, data: Dict[str, Any]) -> Optional["BaseConfig"]:
@@ -40,7 +49,9 @@ class BaseConfig(_Config, _Checkable):
 
             {
                 'base': {
-                    'url': '/test/v1'
+                    'url': '/test/v1',
+                    'seed': 42,
+                    'seed_cache_size': 1024,
                 },
             }
 
@@ -52,9 +63,25 @@ class BaseConfig(_Config, _Checkable):
 
         """
         self.url = data.get("url", None)
+        self.seed = data.get("seed", None)
+        self.seed_cache_size = data.get("seed_cache_size", 0)
         return self
 
     def is_work(self) -> bool:
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.seed",
+            condition=self.seed is not None and (not isinstance(self.seed, int) or isinstance(self.seed, bool)),
+            err_msg="The setting *seed* must be an integer.",
+        ):
+            return False
+        if not self.condition_should_be_true(
+            config_key=f"{self.absolute_model_key}.seed_cache_size",
+            condition=not isinstance(self.seed_cache_size, int)
+            or isinstance(self.seed_cache_size, bool)
+            or self.seed_cache_size < 0,
+            err_msg="The setting *seed_cache_size* must be an integer which is not less than 0.",
+        ):
+            return False
         if not self.url:
             return True
         valid_url = re.findall(r"\/[\w,\-,\_]{1,32}", self.url)
@@ -2,38 +2,82 @@ import copy
 import logging
 import re
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from decimal import Decimal
 from pydoc import locate
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Union
 
-from ._base import _BaseConfig, _Checkable, _Config
+from fake_api_server._utils.regex import Regex_Cache
+
+from ._base import (
+    NameIndex,
+    _BaseConfig,
+    _Checkable,
+    _Config,
+    index_by_name,
+)
 from .value import FormatStrategy, ValueFormat
 from .variable import Digit, Size, Variable
 
 logger = logging.getLogger(__name__)
 
+# The default value of the list arguments, it would be a new empty list for every object.
+_New_List: Any = object()
 
-@dataclass(eq=False)
-class Format(_Config, _Checkable):
 
-    strategy: Optional[FormatStrategy] = None
+@dataclass(eq=False, init=False)
+class Format(_Config, _Checkable):
+    __slots__ = (
+        "strategy",
+        "digit",
+        "size",
+        "enums",
+        "customize",
+        "variables",
+        "use_name",
+        "_current_template",
+        "_variables_index",
+    )
+
+    strategy: Optional[FormatStrategy]
 
     # For general --- by data type strategy
-    digit: Optional[Digit] = None
-    size: Optional[Size] = None
+    digit: Optional[Digit]
+    size: Optional[Size]
 
     # For enum strategy
-    enums: List[str] = field(default_factory=list)
+    enums: List[str]
 
     # For customize strategy
-    customize: str = field(default_factory=str)
-    variables: List[Variable] = field(default_factory=list)
+    customize: str
+    variables: List[Variable]
 
     # For from template strategy
-    use_name: str = field(default_factory=str)
-    # Type is *TemplateConfig*, but it has circular import issue currently.
-    _current_template: Any = field(default=None, repr=False)
+    use_name: str
+
+    def __init__(
+        self,
+        strategy: Optional[FormatStrategy] = None,
+        digit: Optional[Digit] = None,
+        size: Optional[Size] = None,
+        enums: List[str] = _New_List,
+        customize: str = "",
+        variables: List[Variable] = _New_List,
+        use_name: str = "",
+        _current_template: Any = None,
+    ):
+        self.strategy = strategy
+        self.digit = digit
+        self.size = size
+        self.enums = [] if enums is _New_List else enums
+        self.customize = customize
+        self.variables = [] if variables is _New_List else variables
+        self.use_name = use_name
+        # Type is *TemplateConfig*, but it has circular import issue currently.
+        self._current_template: Any = _current_template
+        # The index of variables by their names
+        self._variables_index: Optional[NameIndex] = None
+        self.__post_init__()
 
     def __post_init__(self) -> None:
         if self.strategy is not None:
@@ -155,6 +199,8 @@ class Format(_Config, _Checkable):
         self.enums = data.get("enums", [])
         self.customize = data.get("customize", "")
         self.variables = [_deserialize_variable(var) for var in (data.get("variables", []) or [])]
+        if self.variables:
+            self._variables_index = index_by_name(self.variables)
         self.use_name = data.get("use_name", "")
         return self
 
@@ -191,95 +237,212 @@ class Format(_Config, _Checkable):
         return True
 
     def value_format_is_match(self, data_type: Union[str, type], value: Any) -> bool:
+        return self.value_format_matcher(data_type=data_type)(value)
+
+    def value_format_matcher(self, data_type: Union[str, type]) -> Callable[[Any], bool]:
+        """Resolve the format setting once and return a callable object to check whether the value matches it.
+
+        Args:
+            data_type (Union[str, type]): The data type of the value.
+
+        Returns:
+            A callable object which receives the value and returns *True* if the value matches the format.
+
+        """
         assert self.strategy
         if self.strategy is FormatStrategy.BY_DATA_TYPE:
-            data_type = "big_decimal" if isinstance(data_type, float) else data_type
-            data_type = locate(data_type) if (data_type != "big_decimal" and isinstance(data_type, str)) else data_type  # type: ignore[assignment]
-            digit = self.digit
-            if digit is None:
-                digit = Digit(integer=128, decimal=128) if data_type == "big_decimal" else Digit()
-            size = Size() if self.size is None else self.size
-            regex = self.strategy.to_value_format(data_type).generate_regex(
-                size=size.to_value_size(), digit=digit.to_digit_range()
-            )
-            search_result = re.search(regex, str(value))
-            if search_result is None:
-                # Cannot find any mapping format string
-                return False
-            return len(str(value)) == len(search_result.group(0))
+            data_type_pattern = self._by_data_type_pattern(data_type)
+
+            def _data_type_is_match(value: Any) -> bool:
+                str_value = str(value)
+                search_result = data_type_pattern.search(str_value)
+                if search_result is None:
+                    # Cannot find any mapping format string
+                    return False
+                return len(str_value) == len(search_result.group(0))
+
+            return _data_type_is_match
         elif self.strategy is FormatStrategy.FROM_ENUMS:
-            return isinstance(value, str) and value in self.enums
+            enums = self.enums
+            return lambda value: isinstance(value, str) and value in enums
         elif self.strategy is FormatStrategy.CUSTOMIZE:
-            all_vars_in_customize = re.findall(r"<\w{1,128}>", str(self.customize), re.IGNORECASE)
-            regex = re.escape(copy.copy(self.customize))
-            for var in all_vars_in_customize:
-                pure_var = var.replace("<", "").replace(">", "")
-                find_result = self._get_format_config(pure_var)
-                assert find_result[0].value_format
-                digit = find_result[0].digit
-                if digit is None:
-                    digit = (
-                        Digit(integer=128, decimal=128)
-                        if find_result[0].value_format is ValueFormat.BigDecimal
-                        else Digit()
-                    )
-                size = find_result[0].size  # type: ignore[assignment]
-                if size is None:
-                    size = Size()
-                one_var_regex = find_result[0].value_format.generate_regex(
-                    enums=find_result[0].enum or [], size=size.to_value_size(), digit=digit.to_digit_range()
-                )
-                regex = regex.replace(var, one_var_regex)
-            return re.search(regex, str(value), re.IGNORECASE) is not None
+            customize_pattern = Regex_Cache.compile(
+                key=self._customize_regex_key(), regex=self._customize_regex, flags=re.IGNORECASE
+            )
+            return lambda value: customize_pattern.search(str(value)) is not None
         elif self.strategy is FormatStrategy.FROM_TEMPLATE:
             format_config: Format = self._current_template.common_config.format.get_format(self.use_name)
             format_config._current_template = self._current_template
-            return format_config.value_format_is_match(data_type=data_type, value=value)
+            return format_config.value_format_matcher(data_type=data_type)
         else:
             raise NotImplementedError(
                 f"Doesn't implement how it should generate the response setting by strategy {self}."
             )
 
+    def _by_data_type_pattern(self, data_type: Union[str, type]) -> Pattern:
+        assert self.strategy
+        data_type = "big_decimal" if isinstance(data_type, float) else data_type
+        data_type = locate(data_type) if (data_type != "big_decimal" and isinstance(data_type, str)) else data_type  # type: ignore[assignment]
+        digit = self.digit
+        if digit is None:
+            digit = Digit(integer=128, decimal=128) if data_type == "big_decimal" else Digit()
+        size = Size() if self.size is None else self.size
+        return self.strategy.to_value_format(data_type).compile_regex(
+            size=size.to_value_size(), digit=digit.to_digit_range()
+        )
+
+    def _customize_regex_key(self) -> tuple:
+        def _variable_key(variable: Variable) -> tuple:
+            return (
+                variable.name,
+                variable.value_format,
+                variable.digit.to_digit_range() if variable.digit else None,
+                variable.size.to_value_size() if variable.size else None,
+                tuple(variable.enum) if variable.enum else None,
+            )
+
+        template_variables: List[Variable] = []
+        if self._current_template and self._current_template.common_config:
+            template_variables = self._current_template.common_config.format.variables or []
+            if not isinstance(template_variables, list):
+                template_variables = []
+        return (
+            FormatStrategy.CUSTOMIZE,
+            self.customize,
+            tuple(_variable_key(v) for v in self.variables),
+            tuple(_variable_key(v) for v in template_variables),
+        )
+
+    def _customize_regex(self) -> str:
+        all_vars_in_customize = re.findall(r"<\w{1,128}>", str(self.customize), re.IGNORECASE)
+        regex = re.escape(copy.copy(self.customize))
+        for var in all_vars_in_customize:
+            pure_var = var.replace("<", "").replace(">", "")
+            find_result = self._get_format_config(pure_var)
+            assert find_result[0].value_format
+            digit = find_result[0].digit
+            if digit is None:
+                digit = (
+                    Digit(integer=128, decimal=128)
+                    if find_result[0].value_format is ValueFormat.BigDecimal
+                    else Digit()
+                )
+            size = find_result[0].size
+            if size is None:
+                size = Size()
+            one_var_regex = find_result[0].value_format.generate_regex(
+                enums=find_result[0].enum or [], size=size.to_value_size(), digit=digit.to_digit_range()
+            )
+            regex = regex.replace(var, one_var_regex)
+        return regex
+
     def generate_value(self, data_type: type) -> Union[str, int, bool, Decimal]:
+        return self.value_generator(data_type=data_type)()
+
+    def value_generator(self, data_type: type) -> Callable[[], Union[str, int, bool, Decimal]]:
+        """Resolve the format setting once and return a callable object to generate the random value by it.
+
+        Args:
+            data_type (type): The data type of the value.
+
+        Returns:
+            A callable object which generates one random value by the format setting in every calling.
+
+        """
         assert self.strategy
         if self.strategy is FormatStrategy.CUSTOMIZE:
-            all_vars_in_customize = re.findall(r"<\w{1,128}>", str(self.customize), re.IGNORECASE)
-            value = copy.copy(self.customize)
-            for var in all_vars_in_customize:
-                pure_var = var.replace("<", "").replace(">", "")
-                find_result = self._get_format_config(pure_var)
-                assert find_result[0].value_format
-                digit = find_result[0].digit
-                if digit is None:
-                    digit = Digit()
-                size = find_result[0].size
-                if size is None:
-                    size = Size()
-                new_value = find_result[0].value_format.generate_value(
-                    enums=find_result[0].enum or [], size=size.to_value_size(), digit=digit.to_digit_range()
-                )
-                value = value.replace(var, str(new_value))
-            return value
+            customize = copy.copy(self.customize)
+            vars_generator = self._customize_vars_generator()
+
+            def _generate_customize_value() -> str:
+                value = customize
+                for var, value_format, enums, value_size, digit_range in vars_generator:
+                    new_value = value_format.generate_value(enums=enums, size=value_size, digit=digit_range)
+                    value = value.replace(var, str(new_value))
+                return value
+
+            return _generate_customize_value
         elif self.strategy is FormatStrategy.FROM_TEMPLATE:
             format_config: Format = self._current_template.common_config.format.get_format(self.use_name)
             format_config._current_template = self._current_template
-            return format_config.generate_value(data_type=data_type)
+            return format_config.value_generator(data_type=data_type)
         else:
-            digit = self.digit
+            strategy = self.strategy
+            enums = self.enums
+            value_size = (Size() if self.size is None else self.size).to_value_size()
+            digit_range = (Digit() if self.digit is None else self.digit).to_digit_range()
+            return lambda: strategy.generate_not_customize_value(
+                data_type=data_type, enums=enums, size=value_size, digit=digit_range
+            )
+
+    def values_generator(self, data_type: type) -> Callable[[int], List[Union[str, int, bool, Decimal]]]:
+        """Resolve the format setting once and return a callable object to generate multiple random values at once.
+
+        Args:
+            data_type (type): The data type of the values.
+
+        Returns:
+            A callable object which receives the amount of values and generates them in bulk.
+
+        """
+        assert self.strategy
+        if self.strategy is FormatStrategy.CUSTOMIZE:
+            customize = copy.copy(self.customize)
+            vars_generator = self._customize_vars_generator()
+
+            def _generate_customize_values(n: int) -> List[Union[str, int, bool, Decimal]]:
+                values = [customize] * n
+                for var, value_format, enums, value_size, digit_range in vars_generator:
+                    new_values = value_format.generate_many_values(n, enums=enums, size=value_size, digit=digit_range)
+                    values = [value.replace(var, str(new_value)) for value, new_value in zip(values, new_values)]
+                return values  # type: ignore[return-value]
+
+            return _generate_customize_values
+        elif self.strategy is FormatStrategy.FROM_TEMPLATE:
+            format_config: Format = self._current_template.common_config.format.get_format(self.use_name)
+            format_config._current_template = self._current_template
+            return format_config.values_generator(data_type=data_type)
+        else:
+            strategy = self.strategy
+            enums = self.enums
+            value_size = (Size() if self.size is None else self.size).to_value_size()
+            digit_range = (Digit() if self.digit is None else self.digit).to_digit_range()
+            return lambda n: strategy.generate_not_customize_values(
+                n, data_type=data_type, enums=enums, size=value_size, digit=digit_range
+            )
+
+    def _customize_vars_generator(self) -> List[tuple]:
+        all_vars_in_customize = re.findall(r"<\w{1,128}>", str(self.customize), re.IGNORECASE)
+        vars_generator: List[tuple] = []
+        for var in all_vars_in_customize:
+            pure_var = var.replace("<", "").replace(">", "")
+            find_result = self._get_format_config(pure_var)
+            assert find_result[0].value_format
+            digit = find_result[0].digit
             if digit is None:
                 digit = Digit()
-            size = self.size
+            size = find_result[0].size
             if size is None:
                 size = Size()
-            return self.strategy.generate_not_customize_value(
-                data_type=data_type, enums=self.enums, size=size.to_value_size(), digit=digit.to_digit_range()
+            vars_generator.append(
+                (
+                    var,
+                    find_result[0].value_format,
+                    find_result[0].enum or [],
+                    size.to_value_size(),
+                    digit.to_digit_range(),
+                )
             )
+        return vars_generator
 
     def _get_format_config(self, pure_var: str) -> List[Variable]:
         format_config_in_template: Optional[Variable] = None
         if self._current_template and self._current_template.common_config:
             format_config_in_template = self._current_template.common_config.format.get_variable(pure_var)
-        find_result_in_format: List[Variable] = list(filter(lambda v: pure_var == v.name, self.variables))
+        find_result_in_format: List[Variable] = []
+        if self.variables:
+            self._variables_index = index_by_name(self.variables, self._variables_index)
+            find_result_in_format = self._variables_index.index.get(pure_var, [])
         find_result = find_result_in_format if find_result_in_format else [format_config_in_template]  # type: ignore[list-item]
         assert len(find_result) == 1 and None not in find_result, "Cannot find the mapping name of variable setting."
         return find_result
@@ -301,7 +464,9 @@ class Format(_Config, _Checkable):
 
 @dataclass(eq=False)
 class _HasFormatPropConfig(_BaseConfig, _Checkable, ABC):
-    value_format: Optional[Format] = None
+    __slots__ = ()
+
+    value_format: Optional[Format]
 
     def __post_init__(self) -> None:
         if self.value_format is not None:
@@ -3,18 +3,35 @@ from pydoc import locate
 from typing import Any, Dict, List, Optional, Type
 
 from ._base import _Config, _HasItemsPropConfig
-from .format import _HasFormatPropConfig
+from .format import Format, _HasFormatPropConfig
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, init=False)
 class IteratorItem(_HasFormatPropConfig, _HasItemsPropConfig):
-    name: str = field(default_factory=str)
-    required: Optional[bool] = None
-    value_type: Optional[str] = None  # A type value as string
-    items: Optional[List["IteratorItem"]] = None  # type: ignore[assignment]
+    __slots__ = ("name", "required", "value_type")
+
+    name: str
+    required: Optional[bool]
+    value_type: Optional[str]  # A type value as string
+    items: Optional[List["IteratorItem"]]  # type: ignore[assignment]
 
     _absolute_key: str = field(init=False, repr=False)
 
+    def __init__(
+        self,
+        items: Optional[List["IteratorItem"]] = None,
+        value_format: Optional[Format] = None,
+        name: str = "",
+        required: Optional[bool] = None,
+        value_type: Optional[str] = None,
+    ):
+        self.items = items
+        self.value_format = value_format
+        self.name = name
+        self.required = required
+        self.value_type = value_type
+        self.__post_init__()
+
     def _compare(self, other: "IteratorItem") -> bool:  # type: ignore[override]
         return (
             self.name == other.name
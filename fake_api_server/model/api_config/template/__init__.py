@@ -70,6 +70,7 @@ class TemplateConfig(_Config, _Checkable):
         return isinstance(self.activate, bool) and self.file.is_work()
 
 
-@dataclass(eq=False)
 class _BaseTemplateAccessable(metaclass=ABCMeta):
-    _current_template: TemplateConfig = field(default_factory=TemplateConfig, repr=False)
+    __slots__ = ()
+
+    _current_template: TemplateConfig
@@ -8,12 +8,14 @@ from fake_api_server._utils import YAML
 from fake_api_server._utils.file.operation import _BaseFileOperation
 from fake_api_server.model.api_config._base import SelfType, _Config
 
-from . import _BaseTemplateAccessable
+from . import TemplateConfig, _BaseTemplateAccessable
 from .file import TemplateConfigPathSetting
 
 
 @dataclass(eq=False)
 class _BaseTemplatableConfig(_Config, _BaseTemplateAccessable, ABC):
+    _current_template: TemplateConfig = field(default_factory=TemplateConfig, repr=False)
+
     apply_template_props: bool = field(default=True)
 
     # The settings which could be set by section *template* or override the values
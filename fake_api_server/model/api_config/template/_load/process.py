@@ -1,12 +1,20 @@
 import fnmatch
 import glob
+import logging
 import os
 import pathlib
 from abc import ABCMeta, abstractmethod
-from typing import Dict, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional
 
 from fake_api_server._utils import YAML
-from fake_api_server._utils.file.operation import _BaseFileOperation
+from fake_api_server._utils.file.operation import (
+    _BaseFileOperation,
+    _record_read_file,
+    record_read_files,
+)
 from fake_api_server.model.api_config.template import TemplateConfig
 from fake_api_server.model.api_config.template._base import (
     _BaseTemplatableConfig,
@@ -15,6 +23,41 @@ from fake_api_server.model.api_config.template._base import (
 
 from .key import ConfigLoadingOrder, ConfigLoadingOrderKey, set_loading_function
 
+logger = logging.getLogger(__name__)
+
+# The content of divided configuration files which have been parsed in parallel. The data structure would be:
+# {
+#     <absolute path of the configuration file>: <the content of the file>
+# }
+_Parsed_Configs: ContextVar[Optional[Dict[str, dict]]] = ContextVar("_Parsed_Configs", default=None)
+
+# It only parses the divided configuration files in parallel if the amount of them is not less than this threshold,
+# because it costs time to start the worker processes.
+Parallel_Loading_Threshold: int = 64
+
+
+def config_loading_workers() -> int:
+    """Get the amount of worker processes to parse the divided configuration files in parallel.
+
+    It could be set by environment variable *MockAPI_Config_Loading_Workers*. Setting *1* would parse the files one
+    by one in current process. In default, it would be the amount of CPUs but 8 at most.
+
+    Returns:
+        The amount of worker processes.
+
+    """
+    default_workers = min(os.cpu_count() or 1, 8)
+    workers = os.environ.get("MockAPI_Config_Loading_Workers", "")
+    if workers:
+        try:
+            return max(int(workers), 1)
+        except ValueError:
+            logger.warning(
+                f"The environment variable *MockAPI_Config_Loading_Workers* should be an integer, but it's "
+                f"*{workers}*. It would use the default amount of worker processes *{default_workers}*."
+            )
+    return default_workers
+
 
 class TemplateConfigOpts(metaclass=ABCMeta):
     _config_file_name: str = "api.yaml"
@@ -52,6 +95,13 @@ class TemplateConfigOpts(metaclass=ABCMeta):
     def _set_mocked_apis(self, api_key: str = "", api_config: Optional[_Config] = None) -> None:
         raise NotImplementedError
 
+    def _lazy_config(
+        self, data: Optional[dict], source: str, deserialize: Callable[[], Optional[_Config]]
+    ) -> Optional[_Config]:
+        # The configuration which would be deserialized when it's used at the first time. It doesn't support it in
+        # default, so it needs to be deserialized now.
+        return None
+
 
 class _BaseTemplateConfigLoader:
     """The data model which could load template configuration."""
@@ -68,22 +118,82 @@ class _BaseTemplateConfigLoader:
         pass
 
     def _deserialize_and_set_template_config(self, path: str) -> None:
-        config = self._deserialize_template_config(path)
+        # Record all the files which be read for this configuration (includes the divided files in it), so it could
+        # know which configuration should be reloaded when any file changes.
+        with record_read_files() as read_files:
+            config = self._deserialize_template_config(path, lazy=True)
         assert config is not None, "Configuration should not be empty."
         args = {
             "path": path,
+            "sources": read_files,
         }
         self._template_config_opts._set_template_config(config, **args)
 
-    def _deserialize_template_config(self, path: str) -> Optional[_Config]:
+    def _deserialize_template_config(self, path: str, lazy: bool = False) -> Optional[_Config]:
         # Read YAML config
-        yaml_config = self._configuration.read(path)
+        yaml_config = self._read_config(path)
+        if lazy:
+            # It would read the file again when deserializing it, so it doesn't need to keep the parsed content
+            lazy_config = self._template_config_opts._lazy_config(
+                yaml_config, source=os.path.abspath(path), deserialize=partial(self._deserialize_template_config, path)
+            )
+            if lazy_config is not None:
+                return lazy_config
         # Deserialize YAML config content as PyFake-API-Server data model
         config = self._template_config_opts._deserialize_as_template_config
         config.base_file_path = str(pathlib.Path(path).parent)
         config.config_path = pathlib.Path(path).name
         return config.deserialize(yaml_config)
 
+    def _read_config(self, path: str) -> dict:
+        parsed_configs = _Parsed_Configs.get()
+        if parsed_configs is not None:
+            # Pop it because the deserialization may modify the content
+            yaml_config = parsed_configs.pop(os.path.abspath(path), None)
+            if yaml_config is not None:
+                _record_read_file(path)
+                return yaml_config
+        return self._configuration.read(path)
+
+    @contextmanager
+    def _parse_configs_in_parallel(self, directories: List[str]) -> Iterator[None]:
+        """Parse all the divided configuration files in the directories in parallel. The files would be deserialized
+        and be set into the data model in the same order as loading them one by one in the context, so the result is
+        deterministic.
+
+        Args:
+            directories (List[str]): The directories which have the divided configuration files.
+
+        """
+        workers = config_loading_workers()
+        paths: List[str] = []
+        if workers > 1 and _Parsed_Configs.get() is None:
+            paths = self._divided_config_paths(directories)
+        if len(paths) < Parallel_Loading_Threshold:
+            yield
+            return
+
+        yaml_configs = self._configuration.read_many(paths, workers=workers)
+        token = _Parsed_Configs.set(dict(zip(paths, yaml_configs)))
+        try:
+            yield
+        finally:
+            _Parsed_Configs.reset(token)
+
+    def _divided_config_paths(self, directories: List[str]) -> List[str]:
+        config_path_values = self._template_config_opts._template_config.file.config_path_values
+        config_path_formats = [
+            config_path_values.api.config_path_format,
+            config_path_values.http.config_path_format,
+            config_path_values.request.config_path_format,
+            config_path_values.response.config_path_format,
+        ]
+        paths = set()
+        for directory in directories:
+            for config_path_format in config_path_formats:
+                paths.update(glob.glob(str(pathlib.Path(directory, config_path_format))))
+        return sorted(os.path.abspath(path) for path in paths)
+
 
 class TemplateConfigLoaderWithAPIConfig(_BaseTemplateConfigLoader):
     def register(self, template_config_ops: TemplateConfigOpts) -> None:
@@ -96,13 +206,27 @@ class TemplateConfigLoaderWithAPIConfig(_BaseTemplateConfigLoader):
     def load_config(self, mocked_apis_data: dict) -> None:
         self._template_config_opts._set_mocked_apis()
         if mocked_apis_data:
-            for mock_api_name in mocked_apis_data.keys():
-                api_config = self._template_config_opts._deserialize_as_template_config
-                api_config.config_path = f"{mock_api_name}{api_config.config_file_tail}.yaml"
-                self._template_config_opts._set_mocked_apis(
-                    api_key=mock_api_name,
-                    api_config=api_config.deserialize(data=mocked_apis_data.get(mock_api_name, None)),
+            for mock_api_name, mock_api_data in mocked_apis_data.items():
+                # It may have been deserialized while parsing the configuration file
+                api_config = (
+                    mock_api_data
+                    if isinstance(mock_api_data, _Config)
+                    else self.deserialize_config(mock_api_name, mock_api_data)
                 )
+                self._template_config_opts._set_mocked_apis(api_key=mock_api_name, api_config=api_config)
+
+    def deserialize_config(self, name: str, data: Optional[dict]) -> Optional[_Config]:
+        lazy_config = self._template_config_opts._lazy_config(
+            data, source=name, deserialize=partial(self._deserialize_config, name, data)
+        )
+        if lazy_config is not None:
+            return lazy_config
+        return self._deserialize_config(name, data)
+
+    def _deserialize_config(self, name: str, data: Optional[dict]) -> Optional[_Config]:
+        api_config = self._template_config_opts._deserialize_as_template_config
+        api_config.config_path = f"{name}{api_config.config_file_tail}.yaml"
+        return api_config.deserialize(data=data)
 
 
 class TemplateConfigLoaderByScanFile(_BaseTemplateConfigLoader):
@@ -117,15 +241,18 @@ class TemplateConfigLoaderByScanFile(_BaseTemplateConfigLoader):
         customize_config_file_format = "**"
         config_file_format = f"[!_**]{customize_config_file_format}"
         config_base_path = self._template_config_opts._template_config.file.config_path_values.base_file_path
-        all_paths = glob.glob(str(pathlib.Path(config_base_path, config_file_format)))
+        # Sort the paths to load the files in deterministic order in any file system
+        all_paths = sorted(glob.glob(str(pathlib.Path(config_base_path, config_file_format))))
         api_config_path = str(pathlib.Path(config_base_path, self._template_config_opts.config_file_name))
         if os.path.exists(api_config_path):
             all_paths.remove(api_config_path)
-        for path in all_paths:
-            if os.path.isdir(path):
-                self._iterate_files_to_deserialize_template_config(path)
-            else:
-                self._use_specific_file_to_deserialize_template_config(path)
+        directories = [config_base_path] + [path for path in all_paths if os.path.isdir(path)]
+        with self._parse_configs_in_parallel(directories):
+            for path in all_paths:
+                if os.path.isdir(path):
+                    self._iterate_files_to_deserialize_template_config(path)
+                else:
+                    self._use_specific_file_to_deserialize_template_config(path)
 
     def _iterate_files_to_deserialize_template_config(self, path: str) -> None:
         # Has tag as directory
@@ -148,7 +275,9 @@ class TemplateConfigLoaderByScanFile(_BaseTemplateConfigLoader):
             # are not relative with it at all.
             # Please refer to test data *divide_api_http_response_with_nested_data+has_tag_include_template*
             # to clear the usage scenario.
-            for path_with_tag in glob.glob(str(pathlib.Path(path, self._template_config_opts._config_file_format))):
+            for path_with_tag in sorted(
+                glob.glob(str(pathlib.Path(path, self._template_config_opts._config_file_format)))
+            ):
                 # In the tag directory, it's config
                 self._deserialize_and_set_template_config(path_with_tag)
 
@@ -173,13 +302,13 @@ class TemplateConfigLoaderByApply(_BaseTemplateConfigLoader):
             all_ele_is_dict = list(map(lambda e: isinstance(e, dict), apply_apis))
             config_path_format = self._template_config_opts._config_file_format
             config_base_path = self._template_config_opts._template_config.file.config_path_values.base_file_path
+            config_paths: List[str] = []
             if False in all_ele_is_dict:
                 # no tag API
                 for api in apply_apis:
                     assert isinstance(api, str)
                     api_config = config_path_format.replace("**", api)
-                    config_path = str(pathlib.Path(config_base_path, api_config))
-                    self._deserialize_and_set_template_config(config_path)
+                    config_paths.append(str(pathlib.Path(config_base_path, api_config)))
             else:
                 # API with tag
                 for tag_apis in apply_apis:
@@ -187,8 +316,12 @@ class TemplateConfigLoaderByApply(_BaseTemplateConfigLoader):
                     for tag, apis in tag_apis.items():
                         for api in apis:
                             api_config = config_path_format.replace("**", api)
-                            config_path = str(pathlib.Path(config_base_path, tag, api_config))
-                            self._deserialize_and_set_template_config(config_path)
+                            config_paths.append(str(pathlib.Path(config_base_path, tag, api_config)))
+
+            directories = sorted({str(pathlib.Path(path).parent) for path in config_paths})
+            with self._parse_configs_in_parallel(directories):
+                for config_path in config_paths:
+                    self._deserialize_and_set_template_config(config_path)
 
 
 class TemplateConfigLoader(_BaseTemplateConfigLoader):
@@ -209,6 +342,22 @@ class TemplateConfigLoader(_BaseTemplateConfigLoader):
         for loader in self._loaders.values():
             loader.register(template_config_ops)
 
+    def deserialize_config(self, name: str, data: Optional[dict]) -> Optional[_Config]:
+        """Deserialize one configuration which is set in the configuration file directly, e.g., one mocked API in
+        section *mocked_apis.apis*.
+
+        Args:
+            name (str): The key of the configuration.
+            data (Optional[dict]): The content of the configuration.
+
+        Returns:
+            The data model of the configuration.
+
+        """
+        apis_loader = self._loaders[ConfigLoadingOrderKey.APIs.value]
+        assert isinstance(apis_loader, TemplateConfigLoaderWithAPIConfig)
+        return apis_loader.deserialize_config(name, data)
+
     def load_config(self, mocked_apis_data: dict) -> None:
         loading_order = self._template_config_opts._template_config.file.load_config.order
 
@@ -2,10 +2,12 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
 from fake_api_server.model.api_config._base import (
+    NameIndex,
     _Checkable,
     _CheckableConfigType,
     _Config,
     _ConfigType,
+    index_by_name,
 )
 from fake_api_server.model.api_config.format import Format
 from fake_api_server.model.api_config.variable import Variable
@@ -77,6 +79,10 @@ class TemplateFormatConfig(_Config, _Checkable):
     entities: List[TemplateFormatEntity] = field(default_factory=list)
     variables: List[Variable] = field(default_factory=list)
 
+    # The indexes of the format entities and variables by their names
+    _entities_index: Optional[NameIndex] = field(default=None, init=False, repr=False)
+    _variables_index: Optional[NameIndex] = field(default=None, init=False, repr=False)
+
     def __post_init__(self) -> None:
         if self.entities is not None and len(self.entities) != 0:
             self._convert_entities()
@@ -184,6 +190,8 @@ class TemplateFormatConfig(_Config, _Checkable):
             _deserialize_variable(variable) if isinstance(variable, dict) else variable
             for variable in (data.get("variables", []) or [])
         ]
+        self._entities_index = index_by_name(self.entities)
+        self._variables_index = index_by_name(self.variables)
         return self
 
     def is_work(self) -> bool:
@@ -229,13 +237,15 @@ class TemplateFormatConfig(_Config, _Checkable):
         return True
 
     def get_format(self, name: str) -> Optional[Format]:
-        find_result: List[TemplateFormatEntity] = list(filter(lambda e: e.name == name, self.entities))
+        self._entities_index = index_by_name(self.entities, self._entities_index)
+        find_result: List[TemplateFormatEntity] = self._entities_index.index.get(name, [])
         if len(find_result) == 0:
             return None
         return find_result[0].config
 
     def get_variable(self, name: str) -> Optional[Variable]:
-        find_result: List[Variable] = list(filter(lambda e: e.name == name, self.variables))
+        self._variables_index = index_by_name(self.variables, self._variables_index)
+        find_result: List[Variable] = self._variables_index.index.get(name, [])
         if len(find_result) == 0:
             return None
         return find_result[0]
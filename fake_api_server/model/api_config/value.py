@@ -1,7 +1,7 @@
 import re
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional, Union
+from typing import List, Optional, Pattern, Union
 
 from fake_api_server._utils.random import (
     DigitRange,
@@ -18,6 +18,7 @@ from fake_api_server._utils.random import (
     RandomUUID,
     ValueSize,
 )
+from fake_api_server._utils.regex import Regex_Cache
 from fake_api_server._utils.uri_protocol import IPVersion, URIScheme
 
 Default_Value_Size = ValueSize(max=10, min=1)
@@ -118,9 +119,72 @@ class ValueFormat(Enum):
         else:
             raise NotImplementedError(f"Doesn't implement how to generate the value by format {self}.")
 
+    def generate_many_values(
+        self,
+        n: int,
+        enums: List[str] = [],
+        size: ValueSize = Default_Value_Size,
+        digit: DigitRange = Default_Digit_Range,
+    ) -> List[Union[str, int, bool, Decimal]]:
+        """Generate *n* random values by the format at once.
+
+        Args:
+            n (int): The amount of values.
+            enums (List[str]): The enums setting for format *enum*.
+            size (ValueSize): The size setting for format *str*.
+            digit (DigitRange): The digit setting for format *int* and *big_decimal*.
+
+        Returns:
+            A list of random values.
+
+        """
+
+        def _generate_max_value(digit_number: int) -> int:
+            return int("".join(["9" for _ in range(digit_number)])) if digit_number > 0 else 0
+
+        self._ensure_setting_value_is_valid(enums=enums, size=size, digit=digit)
+        if self is ValueFormat.String:
+            return RandomString.generate_many(n, size=size)  # type: ignore[return-value]
+        elif self is ValueFormat.Integer:
+            max_value = _generate_max_value(digit.integer)
+            return RandomInteger.generate_many(n, value_range=ValueSize(min=0 - max_value, max=max_value))  # type: ignore[return-value]
+        elif self is ValueFormat.BigDecimal:
+            max_integer_value = _generate_max_value(digit.integer)
+            max_decimal_value = _generate_max_value(digit.decimal)
+            return RandomBigDecimal.generate_many(  # type: ignore[return-value]
+                n,
+                integer_range=ValueSize(min=0 - max_integer_value, max=max_integer_value),
+                decimal_range=ValueSize(min=0, max=max_decimal_value),
+            )
+        elif self is ValueFormat.Boolean:
+            return RandomBoolean.generate_many(n)  # type: ignore[return-value]
+        elif self is ValueFormat.Date:
+            return RandomDate.generate_many(n)  # type: ignore[return-value]
+        elif self is ValueFormat.DateTime:
+            return RandomDateTime.generate_many(n)  # type: ignore[return-value]
+        elif self is ValueFormat.Enum:
+            return RandomFromSequence.generate_many(n, enums)
+        elif self is ValueFormat.IPv4:
+            return RandomIP.generate_many(n, IPVersion.IPv4)  # type: ignore[return-value]
+        elif self is ValueFormat.IPv6:
+            return RandomIP.generate_many(n, IPVersion.IPv4)  # type: ignore[return-value]
+        else:
+            return [self.generate_value(enums=enums, size=size, digit=digit) for _ in range(n)]
+
     def generate_regex(
         self, enums: List[str] = [], size: ValueSize = Default_Value_Size, digit: DigitRange = Default_Digit_Range
     ) -> str:
+        return self.compile_regex(enums=enums, size=size, digit=digit).pattern
+
+    def compile_regex(
+        self, enums: List[str] = [], size: ValueSize = Default_Value_Size, digit: DigitRange = Default_Digit_Range
+    ) -> Pattern:
+        return Regex_Cache.compile(
+            key=(self, tuple(enums or []), size, digit),
+            regex=lambda: self._generate_regex(enums=enums, size=size, digit=digit),
+        )
+
+    def _generate_regex(self, enums: List[str], size: ValueSize, digit: DigitRange) -> str:
         self._ensure_setting_value_is_valid(enums=enums, size=size, digit=digit)
         if self is ValueFormat.String:
             return (
@@ -210,3 +274,20 @@ class FormatStrategy(Enum):
                 data_type = "enum"  # type: ignore[assignment]
             return self.to_value_format(data_type=data_type).generate_value(enums=enums, size=size, digit=digit)
         raise ValueError(f"This function doesn't support *{self}* currently.")
+
+    def generate_not_customize_values(
+        self,
+        n: int,
+        data_type: Optional[type] = None,
+        enums: List[str] = [],
+        size: ValueSize = Default_Value_Size,
+        digit: DigitRange = Default_Digit_Range,
+    ) -> List[Union[str, int, bool, Decimal]]:
+        if self in [FormatStrategy.BY_DATA_TYPE, FormatStrategy.FROM_ENUMS]:
+            assert data_type is not None, "Format setting require *data_type* must not be empty."
+            if self is FormatStrategy.FROM_ENUMS:
+                data_type = "enum"  # type: ignore[assignment]
+            return self.to_value_format(data_type=data_type).generate_many_values(
+                n, enums=enums, size=size, digit=digit
+            )
+        raise ValueError(f"This function doesn't support *{self}* currently.")
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from fake_api_server._utils.random import DigitRange, RandomInteger, ValueSize
 
@@ -7,13 +7,19 @@ from ._base import _Checkable, _Config
 from .value import ValueFormat
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, init=False)
 class Digit(_Config, _Checkable):
-    _default_integer: int = 8
-    _default_decimal: int = 4
+    __slots__ = ("integer", "decimal")
 
-    integer: int = _default_integer
-    decimal: int = _default_decimal
+    _default_integer: ClassVar[int] = 8
+    _default_decimal: ClassVar[int] = 4
+
+    integer: int
+    decimal: int
+
+    def __init__(self, integer: int = _default_integer, decimal: int = _default_decimal):
+        self.integer = integer
+        self.decimal = decimal
 
     def _compare(self, other: "Digit") -> bool:
         return self.integer == other.integer and self.decimal == other.decimal
@@ -59,14 +65,23 @@ class Digit(_Config, _Checkable):
         return DigitRange(integer=self.integer, decimal=self.decimal)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, init=False)
 class Size(_Config, _Checkable):
-    _default_max_value: int = 10
-    _default_min_value: int = 0
+    __slots__ = ("max_value", "min_value", "only_equal")
+
+    _default_max_value: ClassVar[int] = 10
+    _default_min_value: ClassVar[int] = 0
 
-    max_value: int = _default_max_value
-    min_value: int = _default_min_value
-    only_equal: Optional[int] = None
+    max_value: int
+    min_value: int
+    only_equal: Optional[int]
+
+    def __init__(
+        self, max_value: int = _default_max_value, min_value: int = _default_min_value, only_equal: Optional[int] = None
+    ):
+        self.max_value = max_value
+        self.min_value = min_value
+        self.only_equal = only_equal
 
     def _compare(self, other: "Size") -> bool:
         return (
@@ -132,16 +147,33 @@ class Size(_Config, _Checkable):
         return RandomInteger.generate(value_range=self.to_value_size())
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, init=False)
 class Variable(_Config, _Checkable):
-    name: str = field(default_factory=str)
-    value_format: Optional[ValueFormat] = None
-    digit: Optional[Digit] = None
-    size: Optional[Size] = None
-    enum: Optional[List[str]] = None
+    __slots__ = ("name", "value_format", "digit", "size", "enum")
+
+    name: str
+    value_format: Optional[ValueFormat]
+    digit: Optional[Digit]
+    size: Optional[Size]
+    enum: Optional[List[str]]
 
     _absolute_key: str = field(init=False, repr=False)
 
+    def __init__(
+        self,
+        name: str = "",
+        value_format: Optional[ValueFormat] = None,
+        digit: Optional[Digit] = None,
+        size: Optional[Size] = None,
+        enum: Optional[List[str]] = None,
+    ):
+        self.name = name
+        self.value_format = value_format
+        self.digit = digit
+        self.size = size
+        self.enum = enum
+        self.__post_init__()
+
     def __post_init__(self) -> None:
         if self.value_format is not None:
             self._convert_value_format()
@@ -4,6 +4,7 @@ from .cmd_args import (
     ParserArguments,
     SubcmdAddArguments,
     SubcmdCheckArguments,
+    SubcmdCompileArguments,
     SubcmdGetArguments,
     SubcmdPullArguments,
     SubcmdRunArguments,
@@ -90,3 +91,16 @@ class RestServerCliArgsDeserialization:
 
         """
         return SubcmdPullArguments.deserialize(args)
+
+    @classmethod
+    def subcmd_compile(cls, args: Namespace) -> SubcmdCompileArguments:
+        """Deserialize the object *argparse.Namespace* to *ParserArguments*.
+
+        Args:
+            args (Namespace): The arguments which be parsed from current command line.
+
+        Returns:
+            A *ParserArguments* type object.
+
+        """
+        return SubcmdCompileArguments.deserialize(args)
@@ -50,6 +50,11 @@ class SubcmdRunArguments(ParserArguments):
     log_level: str
     daemon: bool
     access_log_file: str
+    preload: bool = False
+    watch: bool = False
+    lazy_loading: bool = False
+    metrics_path: str = ""
+    snapshot: str = ""
 
     @classmethod
     def deserialize(cls, args: Namespace) -> "SubcmdRunArguments":
@@ -62,6 +67,11 @@ class SubcmdRunArguments(ParserArguments):
             log_level=args.log_level,
             daemon=args.daemon,
             access_log_file=args.access_log_file,
+            preload=args.preload,
+            watch=args.watch,
+            lazy_loading=args.lazy_loading,
+            metrics_path=args.metrics_path,
+            snapshot=args.snapshot,
         )
 
 
@@ -163,6 +173,20 @@ class SubcmdGetArguments(ParserArguments):
         )
 
 
+@dataclass(frozen=True)
+class SubcmdCompileArguments(ParserArguments):
+    config_path: str
+    output_path: str
+
+    @classmethod
+    def deserialize(cls, args: Namespace) -> "SubcmdCompileArguments":
+        return SubcmdCompileArguments(
+            subparser_structure=ParserArguments.parse_subparser_cmd(args),
+            config_path=args.config_path,
+            output_path=args.output_path,
+        )
+
+
 @dataclass(frozen=True)
 class SubcmdSampleArguments(ParserArguments):
     generate_sample: bool
@@ -0,0 +1,227 @@
+"""*Incremental reloading of configuration*
+
+Find which mocked APIs should be reloaded by the changed configuration files, and only deserialize the divided
+configuration files of them again. So the time to reload doesn't grow with the size of the entire configuration. It
+only reloads the entire configuration if the main configuration file has been changed, or it cannot know which mocked
+API a changed file belongs to.
+"""
+
+import fnmatch
+import logging
+import os
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .api_config import FakeAPIConfig, MockAPIs, MockAPISource
+from .api_config.apis import MockAPI
+from .api_config.base import BaseConfig
+from .api_config.template._load.key import ConfigLoadingOrder
+
+logger = logging.getLogger(__name__)
+
+Config_File_Extensions: Tuple[str, ...] = (".yaml", ".yml", ".json")
+
+# The changes of mocked APIs after reloading. The data structures would be:
+# * changes:
+#     {
+#         <key of mocked API>: (<the mocked API before reloading>, <the mocked API after reloading>)
+#     }
+#     The mocked API before reloading is None if it's a new one, and the one after reloading is None if it has been
+#     removed.
+# * sources:
+#     {
+#         <key of mocked API>: <the configuration files of the mocked API after reloading>
+#     }
+# * config: The entire configuration which be loaded again. It's None if it only reloads some mocked APIs.
+ReloadedAPIs = namedtuple("ReloadedAPIs", ("changes", "sources", "config"))
+
+
+class ConfigReloader:
+    """*Reload the mocked APIs by the changed configuration files*"""
+
+    def __init__(self, config_path: str, api_config: FakeAPIConfig):
+        assert api_config.apis is not None, "The configuration should have section *mocked_apis*."
+        self._config_path = os.path.abspath(config_path)
+        self._api_config = api_config
+        # The data structure would be:
+        # {
+        #     <absolute path of configuration file>: {<keys of the mocked APIs which read the file>}
+        # }
+        self._file_to_apis: Dict[str, Set[str]] = {}
+        for api_key, source in self.mocked_apis.api_sources.items():
+            self._index_source(api_key, source)
+
+    @property
+    def mocked_apis(self) -> MockAPIs:
+        assert self._api_config.apis is not None
+        return self._api_config.apis
+
+    @property
+    def watched_files(self) -> List[str]:
+        return [self._config_path] + sorted(self._file_to_apis.keys())
+
+    @property
+    def watched_directories(self) -> List[str]:
+        directories = {os.path.dirname(source.path) for source in self.mocked_apis.api_sources.values()}
+        if self._scan_file_is_enabled():
+            base_file_path = self.mocked_apis.template.file.config_path_values.base_file_path
+            directories.add(os.path.abspath(base_file_path or os.path.dirname(self._config_path)))
+        return sorted(directories)
+
+    def reload(self, changed_paths: Iterable[str]) -> ReloadedAPIs:
+        """Reload the mocked APIs which be affected by the changed files. It doesn't modify the current configuration
+        until calling function *apply*.
+
+        Args:
+            changed_paths (Iterable[str]): The paths of the files which have been modified, added or removed.
+
+        Returns:
+            A **ReloadedAPIs** type object.
+
+        """
+        changed_paths = sorted({os.path.abspath(path) for path in changed_paths})
+        if self._config_path in changed_paths:
+            logger.info(f"The configuration {self._config_path} has been changed, reload the entire configuration.")
+            return self._reload_all()
+
+        api_keys: Set[str] = set()
+        new_api_config_paths: List[str] = []
+        for path in changed_paths:
+            if path in self._file_to_apis:
+                api_keys.update(self._file_to_apis[path])
+                continue
+            if os.path.isdir(path):
+                # A new or removed directory of tag
+                logger.info(f"The directory {path} has been changed, reload the entire configuration.")
+                return self._reload_all()
+            if self._match_config_format(path, self.mocked_apis._config_file_format):
+                if self._scan_file_is_enabled() and os.path.exists(path):
+                    new_api_config_paths.append(path)
+                continue
+            divided_api_key = self._find_api_key_by_divided_file(path)
+            if divided_api_key is None:
+                # It's not a configuration file, or it's a divided file of the mocked API which be set in the main
+                # configuration directly.
+                if self._is_divided_config_file(path):
+                    logger.info(f"Cannot find the mocked API of file {path}, reload the entire configuration.")
+                    return self._reload_all()
+                continue
+            api_keys.add(divided_api_key)
+
+        changes: Dict[str, Tuple[Optional[MockAPI], Optional[MockAPI]]] = {}
+        sources: Dict[str, MockAPISource] = {}
+        for api_key in sorted(api_keys):
+            source = self.mocked_apis.api_sources.get(api_key, None)
+            old_api_config = self.mocked_apis.apis.get(api_key, None)
+            if source is None or not os.path.exists(source.path):
+                changes[api_key] = (old_api_config, None)
+                continue
+            _, api_config, new_source = self.mocked_apis.load_api_config(source.path)
+            changes[api_key] = (old_api_config, api_config)
+            sources[api_key] = new_source
+        for path in new_api_config_paths:
+            api_key, api_config, new_source = self.mocked_apis.load_api_config(path)
+            changes[api_key] = (self.mocked_apis.apis.get(api_key, None), api_config)
+            sources[api_key] = new_source
+        return ReloadedAPIs(changes=changes, sources=sources, config=None)
+
+    def apply(self, reloaded: ReloadedAPIs, api_keys: Optional[Iterable[str]] = None) -> None:
+        """Set the reloaded mocked APIs into the current configuration.
+
+        Args:
+            reloaded (ReloadedAPIs): The reloaded mocked APIs by function *reload*.
+            api_keys (Optional[Iterable[str]]): Only apply the changes of these mocked APIs. It would apply all changes
+                if it's ``None``.
+
+        Returns:
+            None
+
+        """
+        if reloaded.config is not None and reloaded.config.apis is not None:
+            # The settings of template would be used when reloading the divided files next time
+            self.mocked_apis.template = reloaded.config.apis.template
+        for api_key in reloaded.changes.keys() if api_keys is None else api_keys:
+            old_source = self.mocked_apis.api_sources.pop(api_key, None)
+            if old_source is not None:
+                self._unindex_source(api_key, old_source)
+            _, api_config = reloaded.changes[api_key]
+            if api_config is None:
+                self.mocked_apis.apis.pop(api_key, None)
+                continue
+            self.mocked_apis.apis[api_key] = api_config
+            new_source = reloaded.sources.get(api_key, None)
+            if new_source is not None:
+                self.mocked_apis.api_sources[api_key] = new_source
+                self._index_source(api_key, new_source)
+
+    def _reload_all(self) -> ReloadedAPIs:
+        # Import here to avoid circular import
+        from . import load_config
+
+        api_config = load_config(path=self._config_path)
+        if api_config is None or api_config.apis is None:
+            logger.warning(f"The configuration {self._config_path} is empty, keep using the current one.")
+            return ReloadedAPIs(changes={}, sources={}, config=None)
+        if BaseConfig().serialize(data=api_config.apis.base) != BaseConfig().serialize(data=self.mocked_apis.base):
+            logger.warning("It needs to restart the web server to apply the changes of section *mocked_apis.base*.")
+
+        new_apis = api_config.apis.apis
+        changes: Dict[str, Tuple[Optional[MockAPI], Optional[MockAPI]]] = {}
+        for api_key, old_api_config in self.mocked_apis.apis.items():
+            changes[api_key] = (old_api_config, new_apis.get(api_key, None))
+        for api_key, new_api_config in new_apis.items():
+            if api_key not in changes:
+                changes[api_key] = (None, new_api_config)
+        return ReloadedAPIs(changes=changes, sources=dict(api_config.apis.api_sources), config=api_config)
+
+    def _scan_file_is_enabled(self) -> bool:
+        file_config = self.mocked_apis.template.file
+        return file_config.activate and ConfigLoadingOrder.FILE in file_config.load_config.order
+
+    def _is_divided_config_file(self, path: str) -> bool:
+        config_path_values = self.mocked_apis.template.file.config_path_values
+        return any(
+            self._match_config_format(path, config_path_format)
+            for config_path_format in (
+                config_path_values.api.config_path_format,
+                config_path_values.http.config_path_format,
+                config_path_values.request.config_path_format,
+                config_path_values.response.config_path_format,
+            )
+        )
+
+    def _find_api_key_by_divided_file(self, path: str) -> Optional[str]:
+        # The divided HTTP, request or response file of the mocked API has the same name head as the mocked API file,
+        # e.g., *get_foo-http.yaml* and *get_foo-api.yaml*.
+        config_path_values = self.mocked_apis.template.file.config_path_values
+        for config_path_format in (
+            config_path_values.http.config_path_format,
+            config_path_values.request.config_path_format,
+            config_path_values.response.config_path_format,
+        ):
+            if not self._match_config_format(path, config_path_format):
+                continue
+            name_head = os.path.basename(path).replace(config_path_format.replace("**", ""), "")
+            api_config_path = os.path.join(
+                os.path.dirname(path), self.mocked_apis._config_file_format.replace("**", name_head)
+            )
+            for api_key in self._file_to_apis.get(api_config_path, set()):
+                if self.mocked_apis.api_sources[api_key].path == api_config_path:
+                    return api_key
+        return None
+
+    @staticmethod
+    def _match_config_format(path: str, config_path_format: str) -> bool:
+        return fnmatch.fnmatch(os.path.basename(path), config_path_format.replace("**", "*"))
+
+    def _index_source(self, api_key: str, source: MockAPISource) -> None:
+        for path in {source.path, *source.files}:
+            self._file_to_apis.setdefault(path, set()).add(api_key)
+
+    def _unindex_source(self, api_key: str, source: MockAPISource) -> None:
+        for path in {source.path, *source.files}:
+            api_keys = self._file_to_apis.get(path, None)
+            if api_keys is not None:
+                api_keys.discard(api_key)
+                if not api_keys:
+                    self._file_to_apis.pop(path)
@@ -0,0 +1,172 @@
+"""*Compiled snapshot of configuration*
+
+Loading the configuration needs to parse the YAML files, deserialize the entire data model tree and read the divided
+files by the templates. The snapshot keeps the configuration data model which has been resolved (includes all divided
+files) in a binary file, and it also keeps the content hash of all source files which be read when loading it. So it
+could load the data model directly from the snapshot if all source files don't change.
+
+The snapshot file includes 2 *pickle* objects: the header which has the format version and the details of source files
+for checking whether it's fresh or not, and the configuration data model.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from collections import namedtuple
+from typing import Any, Dict, List, Optional
+
+from fake_api_server.__pkg_info__ import __version__
+from fake_api_server._utils.file.operation import record_read_files
+
+from .api_config import FakeAPIConfig
+
+logger = logging.getLogger(__name__)
+
+Snapshot_Format_Version: int = 4
+
+SnapshotInfo = namedtuple("SnapshotInfo", ("path", "content_hash", "sources"))
+
+_Config_File_Extensions = (".yaml", ".yml", ".json")
+
+
+def default_snapshot_path(config_path: str) -> str:
+    return f"{config_path}.snapshot"
+
+
+class ConfigSnapshot:
+    """*The binary snapshot of one configuration*
+
+    It's fresh only if the format version, the version of *PyFake-API-Server*, the Python version and the content hash
+    of the source files are all the same as it's compiled.
+    """
+
+    def __init__(self, config_path: str, snapshot_path: Optional[str] = None):
+        self._config_path = config_path
+        self._snapshot_path = snapshot_path or default_snapshot_path(config_path)
+
+    @property
+    def path(self) -> str:
+        return self._snapshot_path
+
+    def compile(self) -> Optional[SnapshotInfo]:
+        """Load the configuration from the YAML files and write it as snapshot.
+
+        Returns:
+            A **SnapshotInfo** type object. It would be ``None`` if the configuration is empty.
+
+        """
+        # Import here to avoid circular import
+        from . import load_config
+
+        with record_read_files() as read_files:
+            api_config = load_config(path=self._config_path)
+        if api_config is None:
+            return None
+
+        sources = sorted(set(read_files))
+        directories = self._list_directories(sources)
+        header = {
+            "format_version": Snapshot_Format_Version,
+            "package_version": __version__,
+            "python_version": tuple(sys.version_info[:2]),
+            "config_path": os.path.abspath(self._config_path),
+            "sources": sources,
+            "directories": directories,
+            "content_hash": self._content_hash(sources, directories),
+        }
+        self._write(header, api_config)
+        logger.info(f"Compile the configuration {self._config_path} as snapshot {self._snapshot_path}.")
+        return SnapshotInfo(path=self._snapshot_path, content_hash=header["content_hash"], sources=sources)
+
+    def load(self) -> Optional[FakeAPIConfig]:
+        """Load the configuration data model from the snapshot if it's fresh.
+
+        Returns:
+            A **FakeAPIConfig** type object. It would be ``None`` if the snapshot doesn't exist, it's stale or it's
+            broken.
+
+        """
+        if not os.path.exists(self._snapshot_path):
+            return None
+        try:
+            with open(self._snapshot_path, "rb") as snapshot_file:
+                header = pickle.load(snapshot_file)
+                if not self._is_fresh(header):
+                    logger.info(f"The snapshot {self._snapshot_path} is stale, load the configuration from YAML.")
+                    return None
+                api_config = pickle.load(snapshot_file)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Cannot load the snapshot {self._snapshot_path}, load the configuration from YAML: {e}")
+            return None
+        logger.info(f"Load the configuration from snapshot {self._snapshot_path}.")
+        return api_config
+
+    def is_fresh(self) -> bool:
+        if not os.path.exists(self._snapshot_path):
+            return False
+        try:
+            with open(self._snapshot_path, "rb") as snapshot_file:
+                return self._is_fresh(pickle.load(snapshot_file))
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def _is_fresh(self, header: Any) -> bool:
+        if not isinstance(header, dict) or header.get("format_version") != Snapshot_Format_Version:
+            return False
+        if header.get("package_version") != __version__ or header.get("python_version") != tuple(sys.version_info[:2]):
+            return False
+        if header.get("config_path") != os.path.abspath(self._config_path):
+            return False
+        sources: List[str] = header["sources"]
+        directories = self._list_directories(sources)
+        try:
+            return self._content_hash(sources, directories) == header["content_hash"]
+        except OSError:
+            # Some source files have been removed
+            return False
+
+    def _write(self, header: dict, api_config: FakeAPIConfig) -> None:
+        snapshot_dir = os.path.dirname(os.path.abspath(self._snapshot_path))
+        # Write to a temporary file and replace the snapshot by it to avoid reading an incomplete snapshot
+        fd, tmp_path = tempfile.mkstemp(prefix=".snapshot-", dir=snapshot_dir)
+        try:
+            with os.fdopen(fd, "wb") as snapshot_file:
+                pickle.dump(header, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(api_config, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._snapshot_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _list_directories(sources: List[str]) -> Dict[str, List[str]]:
+        # The divided configuration files would be found by scanning the directories, so it also needs to check
+        # whether any configuration file or directory has been added into or removed from them.
+        directories: Dict[str, List[str]] = {}
+        for directory in sorted({os.path.dirname(source) for source in sources}):
+            try:
+                entries = os.listdir(directory)
+            except OSError:
+                entries = []
+            directories[directory] = sorted(
+                entry
+                for entry in entries
+                if entry.endswith(_Config_File_Extensions) or os.path.isdir(os.path.join(directory, entry))
+            )
+        return directories
+
+    @staticmethod
+    def _content_hash(sources: List[str], directories: Dict[str, List[str]]) -> str:
+        content_hash = hashlib.sha256()
+        for source in sources:
+            content_hash.update(source.encode("utf-8") + b"\0")
+            with open(source, "rb") as source_file:
+                content_hash.update(source_file.read())
+            content_hash.update(b"\0")
+        for directory, entries in directories.items():
+            content_hash.update(directory.encode("utf-8") + b"\0" + "\0".join(entries).encode("utf-8") + b"\0")
+        return content_hash.hexdigest()
@@ -10,13 +10,20 @@ from fake_api_server._utils.importing import ensure_importing, import_web_lib
 from fake_api_server.server.rest.sgi.cmd import ASGIServer, BaseSGIServer, WSGIServer
 
 from .mock import MockHTTPServer
-from .rest.application import BaseAppServer, FastAPIServer, FlaskServer
+from .rest.application import (
+    BaseAppServer,
+    FastAPIServer,
+    FlaskServer,
+    PureASGIServer,
+)
+from .rest.application.asgi import ASGIApplication
 from .rest.sgi import setup_server_gateway
 from .rest.sgi._model import Command, CommandOptions
 from .rest.sgi.cmd import ASGIServer, BaseSGIServer, WSGIServer
 
 flask_app: "flask.Flask" = None  # type: ignore
 fastapi_app: "fastapi.FastAPI" = None  # type: ignore
+asgi_app: ASGIApplication = None  # type: ignore
 
 
 def create_flask_app() -> "flask.Flask":  # type: ignore
@@ -29,6 +36,11 @@ def create_fastapi_app() -> "fastapi.FastAPI":  # type: ignore
     return fastapi_app
 
 
+def create_asgi_app() -> ASGIApplication:
+    load_app.by_asgi()
+    return asgi_app
+
+
 def setup_wsgi() -> WSGIServer:
     return setup_server_gateway.wsgi(web_app=create_flask_app, module_dict=globals())
 
@@ -37,6 +49,10 @@ def setup_asgi() -> ASGIServer:
     return setup_server_gateway.asgi(web_app=create_fastapi_app, module_dict=globals())
 
 
+def setup_pure_asgi() -> ASGIServer:
+    return setup_server_gateway.asgi(web_app=create_asgi_app, module_dict=globals())
+
+
 class load_app:
     """*Set up and safely load the web application with Python web framework*
 
@@ -71,6 +87,18 @@ class load_app:
         config = cls._get_config_path()
         fastapi_app = cls._initial_mock_server(config_path=config, app_server=FastAPIServer()).web_app
 
+    @classmethod
+    def by_asgi(cls) -> None:
+        """Set up the minimal pure ASGI web application. It doesn't need any Python web framework.
+
+        Returns:
+            None
+
+        """
+        global asgi_app
+        config = cls._get_config_path()
+        asgi_app = cls._initial_mock_server(config_path=config, app_server=PureASGIServer()).web_app
+
     @classmethod
     def _get_config_path(cls) -> str:
         """Get the configuration file path by environment variable in OS runtime environment.
@@ -3,12 +3,19 @@
 This module provides objects for mocking APIs as a web application with different Python framework.
 """
 
-from typing import Any, Optional
+import logging
+import os
+from typing import Any, Iterable, Optional
 
+from fake_api_server._utils.file.watch import FileWatcher
 from fake_api_server.model import FakeAPIConfig, MockAPIs, load_config
+from fake_api_server.model.reload import Config_File_Extensions, ConfigReloader
+from fake_api_server.model.snapshot import ConfigSnapshot
 
 from .rest.application import BaseAppServer, FlaskServer
 
+logger = logging.getLogger(__name__)
+
 
 class MockHTTPServer:
     """*Mocking APIs as web application with HTTP*
@@ -22,6 +29,10 @@ class MockHTTPServer:
         config_path: Optional[str] = None,
         app_server: Optional[BaseAppServer] = None,
         auto_setup: Optional[bool] = False,
+        snapshot_path: Optional[str] = None,
+        watch: Optional[bool] = None,
+        lazy_loading: Optional[bool] = None,
+        metrics_path: Optional[str] = None,
     ):
         """
 
@@ -33,11 +44,28 @@ class MockHTTPServer:
                 *Flask* to set up the web application.
             auto_setup (auto_setup): Initial and create mocked APIs when instantiate this object. In default, it's
                 ``False``.
+            snapshot_path (str): The file path of the snapshot which be compiled by subcommand line
+                ``rest-server compile``. It would load the configuration from the snapshot if it's fresh, or it would
+                load the configuration from YAML. In default, it would be the value of environment variable
+                *MockAPI_Config_Snapshot*, and it doesn't load any snapshot if it's empty.
+            watch (bool): Watch the configuration files and reload the changed mocked APIs when it sets up the mocked
+                APIs automatically. In default, it would be ``True`` if the environment variable *MockAPI_Config_Watch*
+                is *true*.
+            lazy_loading (bool): Only load the URL and the HTTP method of every mocked API at startup, and deserialize
+                the entire configuration of it when it's requested at the first time. It doesn't work if it loads the
+                configuration from the snapshot. In default, it would be ``True`` if the environment variable
+                *MockAPI_Config_Lazy_Loading* is *true*.
+            metrics_path (str): Expose the metrics of the web application, e.g., the latency of every phase of
+                handling requests, on the URL path in the text exposition format of *Prometheus*. In default, it would
+                be the value of environment variable *MockAPI_Metrics_Path*, and it doesn't enable the metrics if it's
+                empty.
         """
         if not config_path:
             config_path = "api.yaml"
         self._config_path = config_path
-        self._api_config: Optional[FakeAPIConfig] = load_config(path=self._config_path)
+        if lazy_loading is None:
+            lazy_loading = os.environ.get("MockAPI_Config_Lazy_Loading", "").lower() == "true"
+        self._api_config: Optional[FakeAPIConfig] = self._load_config(snapshot_path, lazy=lazy_loading)
 
         if app_server and not isinstance(app_server, BaseAppServer):
             raise TypeError(
@@ -48,8 +76,29 @@ class MockHTTPServer:
         self._app_server = app_server
         self._web_application = None
 
+        if metrics_path is None:
+            metrics_path = os.environ.get("MockAPI_Metrics_Path", "")
+        if metrics_path:
+            self._app_server.enable_metrics(path=metrics_path)
+
+        self._config_reloader: Optional[ConfigReloader] = None
+        self._config_watcher: Optional[FileWatcher] = None
+
         if auto_setup and (self._api_config and self._api_config.apis):
             self.create_apis(mocked_apis=self._api_config.apis)
+            if watch is None:
+                watch = os.environ.get("MockAPI_Config_Watch", "").lower() == "true"
+            if watch:
+                self.watch(interval=float(os.environ.get("MockAPI_Config_Watch_Interval", "1")))
+
+    def _load_config(self, snapshot_path: Optional[str], lazy: bool = False) -> Optional[FakeAPIConfig]:
+        snapshot_path = snapshot_path or os.environ.get("MockAPI_Config_Snapshot", None)
+        # The snapshot is a *pickle* file, so only load it if it's requested explicitly
+        if snapshot_path:
+            api_config = ConfigSnapshot(config_path=self._config_path, snapshot_path=snapshot_path).load()
+            if api_config is not None:
+                return api_config
+        return load_config(path=self._config_path, lazy=lazy)
 
     @property
     def web_app(self) -> Any:
@@ -68,3 +117,55 @@ class MockHTTPServer:
 
         """
         self._app_server.create_api(mocked_apis)
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Watch the configuration files by polling in background, and reload the changed mocked APIs.
+
+        Args:
+            interval (float): The interval seconds between 2 polls.
+
+        Returns:
+            None
+
+        """
+        if not (self._api_config and self._api_config.apis):
+            return
+        self._config_reloader = ConfigReloader(config_path=self._config_path, api_config=self._api_config)
+        self._config_watcher = FileWatcher(
+            files=self._config_reloader.watched_files,
+            directories=self._config_reloader.watched_directories,
+            extensions=Config_File_Extensions,
+        )
+        self._config_watcher.start(on_change=self.reload, interval=interval)
+        logger.info(f"Watch the configuration files of {self._config_path} every {interval} seconds.")
+
+    def reload(self, changed_paths: Iterable[str]) -> None:
+        """Reload the mocked APIs which be affected by the changed configuration files.
+
+        Args:
+            changed_paths (Iterable[str]): The paths of the files which have been modified, added or removed.
+
+        Returns:
+            None
+
+        """
+        if self._config_reloader is None:
+            if self._api_config is None:
+                raise ValueError(
+                    f"Cannot reload the mocked APIs because it doesn't load any configuration from {self._config_path}."
+                )
+            self._config_reloader = ConfigReloader(config_path=self._config_path, api_config=self._api_config)
+        reloaded = self._config_reloader.reload(changed_paths)
+        if not reloaded.changes:
+            return
+        mocked_apis = self._config_reloader.mocked_apis
+        base_url = mocked_apis.base.url if mocked_apis.base else None
+        updated_api_keys = self._app_server.update_apis(reloaded.changes, base_url=base_url)
+        self._config_reloader.apply(reloaded, api_keys=updated_api_keys)
+        if self._config_watcher is not None:
+            sources = [reloaded.sources[api_key] for api_key in updated_api_keys if api_key in reloaded.sources]
+            self._config_watcher.add(
+                files=[path for source in sources for path in (source.path, *source.files)],
+                directories={os.path.dirname(source.path) for source in sources},
+            )
+        logger.info(f"Reload {len(updated_api_keys)} mocked APIs: {', '.join(updated_api_keys)}")
@@ -3,22 +3,58 @@
 This module provides which library of Python web framework you could use to set up a web application.
 """
 
+import ast
+import asyncio
+import inspect
+import json
 import logging
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from pydoc import locate
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union, cast
 
 from fake_api_server._utils import import_web_lib
 from fake_api_server.model.api_config import MockAPIs
-from fake_api_server.model.api_config.apis import MockAPI
-
+from fake_api_server.model.api_config.apis import APIParameter, HTTPRequest, MockAPI
+from fake_api_server.model.api_config.apis.lazy import http_method
+
+from .asgi import (
+    ASGIApplication,
+    ASGIFileBody,
+    ASGIHTTPResponse,
+    ASGIRequestContext,
+)
 from .code_generator import (
     BaseWebServerCodeGenerator,
     FastAPICodeGenerator,
     FlaskCodeGenerator,
 )
+from .latency import (
+    SimulatedLatency,
+    async_throttled_body,
+    cooperative_sleep,
+    throttled_body,
+)
+from .metrics import (
+    ASGIMetricsMiddleware,
+    Metrics_Path_Default,
+    Request_Timing_Key,
+    RequestTiming,
+    ServerMetrics,
+    WSGIMetricsMiddleware,
+)
+from .pool import AsyncioValuePoolRefiller
 from .process import HTTPRequestProcess, HTTPResponseProcess
-from .request import FastAPIRequest, FlaskRequest
-from .response import FastAPIResponse, FlaskResponse
+from .request import ASGIRequest, FastAPIRequest, FlaskRequest
+from .response import (
+    ASGIResponse,
+    FastAPIResponse,
+    FlaskResponse,
+)
+from .response import HTTPResponse as MockHTTPResponse
+from .response import JSON_Content_Type, Text_Content_Type
+from .route import APIRouteIndex
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +78,10 @@ class BaseAppServer(metaclass=ABCMeta):
 
         self._http_request = self.init_http_request_process()
         self._http_response = self.init_http_response_process()
+        # Apply the current settings of file cache from the environment variables
+        MockHTTPResponse.reset_file_cache()
+
+        self._metrics: Optional[ServerMetrics] = None
 
     @property
     def web_application(self) -> Any:
@@ -52,11 +92,44 @@ class BaseAppServer(metaclass=ABCMeta):
 
     @property
     def mock_api_details(self) -> Dict[str, Dict[str, MockAPI]]:
-        if not self._mock_api_details:
+        if not self._mock_api_details and self._code_generator is not None:
             self._mock_api_details = getattr(self._code_generator, "_mock_api_details")
             return self._mock_api_details
         return self._mock_api_details
 
+    @property
+    def metrics(self) -> Optional[ServerMetrics]:
+        """:obj:`ServerMetrics`: Property with only getter for the metrics. It's ``None`` if it isn't enabled."""
+        return self._metrics
+
+    def enable_metrics(self, path: str = Metrics_Path_Default) -> ServerMetrics:
+        """Measure the latency of every phase of handling requests, count the requests by status code and the lookups
+        of caches, and expose the metrics on the URL path in the text exposition format of *Prometheus*.
+
+        Args:
+            path (str): The URL path to expose the metrics.
+
+        Returns:
+            A **ServerMetrics** type object.
+
+        """
+        if self._metrics is None:
+            self._metrics = ServerMetrics(path=path)
+            self._http_request.metrics = self._metrics
+            self._http_response.metrics = self._metrics
+            self._add_metrics_middleware(self._metrics)
+        return self._metrics
+
+    def _add_metrics_middleware(self, metrics: ServerMetrics) -> None:
+        """Add the middleware which measures every request and serves the metrics into the web application."""
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support the metrics.")
+
+    def _request_timing(self, scope: Optional[Mapping[str, Any]]) -> Optional[RequestTiming]:
+        """Get the timing of current request from its ASGI scope or WSGI environ if the metrics are enabled."""
+        if self._metrics is None or scope is None:
+            return None
+        return scope.get(Request_Timing_Key, None)
+
     @abstractmethod
     def setup(self) -> Any:
         """Initial object for setting up web application.
@@ -67,7 +140,7 @@ class BaseAppServer(metaclass=ABCMeta):
         """
 
     @abstractmethod
-    def init_code_generator(self) -> BaseWebServerCodeGenerator:
+    def init_code_generator(self) -> Optional[BaseWebServerCodeGenerator]:
         pass
 
     @abstractmethod
@@ -80,22 +153,136 @@ class BaseAppServer(metaclass=ABCMeta):
 
     def create_api(self, mocked_apis: MockAPIs) -> None:
         """
-        [Entry point for generating Python code]
+        [Entry point for creating APIs]
+
+        Register the handler of every API to the web application. The handlers are closures which be built from the
+        API details directly, so it doesn't need to generate and execute Python code for every API.
         """
+        base_url = mocked_apis.base.url if mocked_apis.base else None
         aggregated_mocked_apis = self._get_all_api_details(mocked_apis)
         for api_name, api_config in aggregated_mocked_apis.items():
             if api_name and api_config:
                 logger.debug(f"api_name: {api_name}")
-                annotate_function_pycode = self._code_generator.annotate_function(api_name, api_config)
-                add_api_pycode = self._code_generator.add_api(
-                    api_name, api_config, base_url=mocked_apis.base.url if mocked_apis.base else None
+                self._add_api(api_name, api_config, base_url=base_url)
+        self._setup_processes(mocked_apis)
+
+    @abstractmethod
+    def _add_api(
+        self, api_name: str, api_config: Union[MockAPI, List[MockAPI]], base_url: Optional[str] = None
+    ) -> None:
+        """
+        Part of [Entry point for creating APIs]
+        """
+
+    def _setup_processes(self, mocked_apis: MockAPIs) -> None:
+        # Set the API details into the processes only once here, and swap them only by reloading APIs. Every request
+        # is processed with the snapshot of the API details, so it never changes the shared processes.
+        self._http_request.mock_api_details = self.mock_api_details
+        self._http_response.mock_api_details = self.mock_api_details
+        self._build_route_index()
+        if mocked_apis.base is not None:
+            self._http_response.set_seed(mocked_apis.base.seed, cache_size=mocked_apis.base.seed_cache_size)
+
+    def _build_route_index(self) -> None:
+        route_index = APIRouteIndex(self.mock_api_details.keys())
+        self._http_request.route_index = route_index
+        self._http_response.route_index = route_index
+
+    def update_apis(
+        self,
+        changes: Dict[str, Tuple[Optional[MockAPI], Optional[MockAPI]]],
+        base_url: Optional[str] = None,
+    ) -> List[str]:
+        """
+        [Entry point for reloading APIs]
+
+        Swap the changed APIs while the web application is running. It only compiles the changed APIs, and the new API
+        details would be swapped at once, so the requests which are being processed won't be dropped.
+
+        Args:
+            changes (Dict[str, Tuple[Optional[MockAPI], Optional[MockAPI]]]): The changed APIs by their keys. The value
+                is a tuple of the API before changing (``None`` if it's a new API) and the API after changing (``None``
+                if it has been removed).
+            base_url (Optional[str]): The base URL of all APIs.
+
+        Returns:
+            The keys of APIs which have been updated. The changes which cannot be applied without restarting the web
+            application would be skipped.
+
+        """
+        current_details = self.mock_api_details
+        details = dict(current_details)
+        copied_urls: Set[str] = set()
+        added: List[MockAPI] = []
+        removed: List[MockAPI] = []
+        updated_api_keys: List[str] = []
+        for api_key, (old_api_config, new_api_config) in changes.items():
+            if old_api_config is new_api_config:
+                continue
+            if not self._can_update_api(old_api_config, new_api_config):
+                logger.warning(
+                    f"It needs to restart the web server to apply the changes of API *{api_key}*, so it would keep "
+                    "using the current one."
                 )
-                logger.debug(f"annotate_function_pycode: {annotate_function_pycode}")
-                # pylint: disable=exec-used
-                exec(annotate_function_pycode)
-                # pylint: disable=exec-used
-                logger.debug(f"add_api_pycode: {add_api_pycode}")
-                exec(add_api_pycode)
+                continue
+            if old_api_config is not None:
+                url = self._api_url(old_api_config, base_url)
+                url_details = self._copy_url_details(details, url, copied_urls)
+                method = self._api_http_method(old_api_config)
+                if url_details.get(method, None) is old_api_config:
+                    del url_details[method]
+                    if not url_details:
+                        del details[url]
+                removed.append(old_api_config)
+            if new_api_config is not None:
+                url = self._api_url(new_api_config, base_url)
+                url_details = self._copy_url_details(details, url, copied_urls)
+                url_details[self._api_http_method(new_api_config)] = new_api_config
+                added.append(new_api_config)
+            updated_api_keys.append(api_key)
+        if not updated_api_keys:
+            return updated_api_keys
+
+        route_index = self._http_request.route_index
+        for url in copied_urls:
+            if url in current_details and url not in details and route_index is not None:
+                route_index.remove(url)
+        self._http_request.compile_mock_apis(added)
+        self._http_response.compile_mock_apis(added)
+        # The only one swap of the API details. The request is processed with the snapshot of the API details, so both
+        # of validating the request and generating the response use the same one, never a mixed state.
+        self._mock_api_details = details
+        if self._code_generator is not None:
+            setattr(self._code_generator, "_mock_api_details", details)
+        self._http_request.update_mock_api_details(details, removed=removed)
+        self._http_response.update_mock_api_details(details, removed=removed)
+        for url in copied_urls:
+            if url not in current_details and url in details and route_index is not None:
+                route_index.add(url)
+        return updated_api_keys
+
+    def _can_update_api(self, old_api_config: Optional[MockAPI], new_api_config: Optional[MockAPI]) -> bool:
+        """Whether the web application could apply the change of the API without restarting or not."""
+        return True
+
+    @staticmethod
+    def _api_url(api_config: MockAPI, base_url: Optional[str] = None) -> str:
+        assert api_config.url
+        return f"{base_url}{api_config.url}" if base_url else api_config.url
+
+    @staticmethod
+    def _api_http_method(api_config: MockAPI) -> str:
+        return http_method(api_config)
+
+    @staticmethod
+    def _copy_url_details(
+        details: Dict[str, Dict[str, MockAPI]], url: str, copied_urls: Set[str]
+    ) -> Dict[str, MockAPI]:
+        # Copy the details of URL before modifying it, because the current details are still being used
+        if url not in copied_urls:
+            details[url] = dict(details.get(url, {}))
+            copied_urls.add(url)
+        return details.setdefault(url, {})
 
     @abstractmethod
     def _get_all_api_details(self, mocked_apis) -> Dict[str, Union[Optional[MockAPI], List[MockAPI]]]:
@@ -103,14 +290,50 @@ class BaseAppServer(metaclass=ABCMeta):
         Part of [Entry point for generating Python code]
         """
 
-    def _request_process(self, **kwargs) -> "flask.Response":  # type: ignore
-        self._http_request.mock_api_details = self.mock_api_details
-        return self._http_request.process(**kwargs)
+    def _process_api(self, timing: Optional[RequestTiming] = None, **kwargs) -> Tuple[Any, Optional[SimulatedLatency]]:
+        """Validate the request and generate the response of the mocked API. It also measures both of them if the
+        timing of current request is given.
 
-    def _response_process(self, **kwargs) -> Union[str, dict]:
+        Returns:
+            A tuple of the response and the simulated latency of the mocked API. The simulated latency is ``None`` if
+            the request is invalid or the mocked API doesn't set it.
+
+        """
+        # Take the snapshot of the API details, so the swapping of hot reloading won't affect this request
+        api_details = self.mock_api_details
+        if timing is None:
+            process_result = self._request_process(api_details=api_details, **kwargs)
+            if process_result.status_code != 200:
+                return process_result, None
+            return self._response_process(api_details=api_details, **kwargs)
+
+        start = time.perf_counter()
+        process_result = self._request_process(api_details=api_details, **kwargs)
+        validated = time.perf_counter()
+        timing.validation = validated - start
+        if process_result.status_code != 200:
+            return process_result, None
+        response = self._response_process(api_details=api_details, **kwargs)
+        timing.generation = time.perf_counter() - validated
+        return response
+
+    def _request_process(
+        self, api_details: Optional[Dict[str, Dict[str, MockAPI]]] = None, **kwargs
+    ) -> "flask.Response":  # type: ignore[name-defined]
+        return self._http_request.process(mock_api_details=api_details, **kwargs)
+
+    def _response_process(
+        self, api_details: Optional[Dict[str, Dict[str, MockAPI]]] = None, **kwargs
+    ) -> Tuple[Any, Optional[SimulatedLatency]]:
         # TODO: Add the setting logic to unit test
-        self._http_response.mock_api_details = self.mock_api_details
-        return self._http_response.process(**kwargs)
+        return self._http_response.process_with_latency(mock_api_details=api_details, **kwargs)
+
+    @staticmethod
+    def _delay(latency: SimulatedLatency, timing: Optional[RequestTiming] = None) -> float:
+        seconds = latency.delay()
+        if timing is not None:
+            timing.simulated = seconds
+        return seconds
 
 
 class FlaskServer(BaseAppServer):
@@ -125,6 +348,61 @@ class FlaskServer(BaseAppServer):
     def _get_all_api_details(self, mocked_apis: MockAPIs) -> Dict[str, List[MockAPI]]:  # type: ignore[override]
         return mocked_apis.group_by_url()
 
+    def _add_api(  # type: ignore[override]
+        self, api_name: str, api_config: List[MockAPI], base_url: Optional[str] = None
+    ) -> None:
+        url_path = self._code_generator.record_api(api_name, api_config, base_url=base_url)
+        api_url = f"{base_url}{api_name}" if base_url else api_name
+
+        def _api_handler(**_) -> Any:
+            if self._metrics is None:
+                response, latency = self._process_api()
+                return response if latency is None else self._simulate_latency(response, latency)
+            request = import_web_lib.flask().request
+            timing = self._request_timing(request.environ)
+            if timing is not None:
+                timing.api = api_url
+                timing.method = request.method
+            response, latency = self._process_api(timing)
+            return response if latency is None else self._simulate_latency(response, latency, timing)
+
+        acceptance_method = [http_method(ac) for ac in api_config]
+        self.web_application.add_url_rule(
+            url_path,
+            endpoint=self._code_generator.api_function_name(api_name, api_config),
+            view_func=_api_handler,
+            methods=acceptance_method,
+        )
+
+    def _can_update_api(self, old_api_config: Optional[MockAPI], new_api_config: Optional[MockAPI]) -> bool:
+        # The URL rules of *Flask* cannot be added or removed after it starts to handle requests
+        return (
+            old_api_config is not None
+            and new_api_config is not None
+            and old_api_config.url == new_api_config.url
+            and self._api_http_method(old_api_config) == self._api_http_method(new_api_config)
+        )
+
+    def _add_metrics_middleware(self, metrics: ServerMetrics) -> None:
+        self.web_application.wsgi_app = WSGIMetricsMiddleware(self.web_application.wsgi_app, metrics=metrics)
+
+    def _simulate_latency(
+        self, response: Any, latency: SimulatedLatency, timing: Optional[RequestTiming] = None
+    ) -> "flask.Response":  # type: ignore
+        # It yields to the other requests if the worker is *gevent*, e.g., *gunicorn* with *--worker-class gevent*
+        cooperative_sleep(self._delay(latency, timing))
+        if not latency.bandwidth:
+            return response
+        flask = import_web_lib.flask()
+        response = flask.current_app.make_response(response)
+        # The streaming response (e.g., the file) would be throttled chunk by chunk without loading all of it
+        body = response.response if response.is_streamed else response.get_data()
+        return flask.Response(
+            throttled_body(latency, body),
+            status=response.status_code,
+            content_type=response.content_type,
+        )
+
     def init_http_request_process(self) -> HTTPRequestProcess:
         return HTTPRequestProcess(
             request=FlaskRequest(),
@@ -134,6 +412,7 @@ class FlaskServer(BaseAppServer):
     def init_http_response_process(self) -> HTTPResponseProcess:
         return HTTPResponseProcess(
             request=FlaskRequest(),
+            response=FlaskResponse(),
         )
 
 
@@ -153,6 +432,146 @@ class FastAPIServer(BaseAppServer):
     def _get_all_api_details(self, mocked_apis: MockAPIs) -> Dict[str, Optional[MockAPI]]:  # type: ignore[override]
         return mocked_apis.apis
 
+    def _add_api(  # type: ignore[override]
+        self, api_name: str, api_config: MockAPI, base_url: Optional[str] = None
+    ) -> None:
+        url_path = self._code_generator.record_api(api_name, api_config, base_url=base_url)
+        http_request = cast(HTTPRequest, api_config.http.request)  # type: ignore[union-attr]
+        is_get_method = http_request.method.upper() == "GET"
+        api_url = self._api_url(api_config, base_url)
+        api_method = http_request.method.upper()
+        has_params = bool(http_request.parameters)
+        param_names = [param.name for param in http_request.parameters]
+
+        def _process_request(**kwargs) -> Tuple[Any, Optional[SimulatedLatency], Optional[RequestTiming]]:
+            request = kwargs["request"]
+            if not has_params:
+                process_kwargs = {"request": request}
+            elif is_get_method:
+                model = SimpleNamespace(**{name: kwargs[name] for name in param_names})
+                process_kwargs = {"model": model, "request": request}
+            else:
+                process_kwargs = {"model": kwargs["model"], "request": request}
+            timing = self._request_timing(request.scope)
+            if timing is not None:
+                timing.api = api_url
+                timing.method = api_method
+            response, latency = self._process_api(timing, **process_kwargs)
+            return response, latency, timing
+
+        def _sync_api_handler(**kwargs) -> Any:
+            # *FastAPI* runs it in the thread pool, so a slow API never blocks the other requests
+            return _process_request(**kwargs)[0]
+
+        async def _async_api_handler(**kwargs) -> Any:
+            # Only wait for the simulated latency on the event loop, processing the API is still in the thread pool
+            run_in_threadpool = import_web_lib.fastapi().concurrency.run_in_threadpool
+            response, latency, timing = await run_in_threadpool(_process_request, **kwargs)
+            if latency is None:
+                return response
+            return await self._simulate_latency(response, latency, timing)
+
+        _api_handler: Callable[..., Any] = (
+            _async_api_handler if self._api_has_latency(api_config) else _sync_api_handler
+        )
+        _api_handler.__name__ = self._code_generator.api_function_name(api_name, api_config)
+        _api_handler.__signature__ = self._api_handler_signature(api_name, api_config)  # type: ignore[attr-defined]
+        getattr(self.web_application, http_request.method.lower())(path=url_path)(_api_handler)
+
+    def _api_handler_signature(self, api_name: str, api_config: MockAPI) -> inspect.Signature:
+        # Both of them are the dependencies of *FastAPI*
+        import pydantic
+        from typing_extensions import Annotated
+
+        fastapi = import_web_lib.fastapi()
+        http_request = cast(HTTPRequest, api_config.http.request)  # type: ignore[union-attr]
+        variables_in_url = self._code_generator._parse_variable_in_api(api_config.url).values()
+        parameters = [
+            inspect.Parameter(str(var).replace("var_", ""), inspect.Parameter.KEYWORD_ONLY) for var in variables_in_url
+        ]
+        parameters.append(inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=fastapi.Request))
+        if http_request.method.upper() == "GET":
+            for param in http_request.parameters:
+                if param.value_type == "list":
+                    annotation: Any = Annotated[Union[List[str], None], fastapi.Query()]
+                    default = None
+                else:
+                    annotation = locate(param.value_type)  # type: ignore[arg-type]
+                    default = self._parameter_default_value(param)
+                parameters.append(
+                    inspect.Parameter(
+                        param.name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation
+                    )
+                )
+        elif http_request.parameters:
+            fields: Dict[str, Any] = {}
+            for param in http_request.parameters:
+                default = self._parameter_default_value(param)
+                if param.default is None and param.required:
+                    default = ...
+                fields[param.name] = (locate(param.value_type), default)  # type: ignore[arg-type]
+            model = pydantic.create_model(
+                self._code_generator.api_parameters_model_name(api_name, api_config), **fields
+            )
+            parameters.append(inspect.Parameter("model", inspect.Parameter.KEYWORD_ONLY, annotation=model))
+        return inspect.Signature(parameters)
+
+    @staticmethod
+    def _parameter_default_value(param: APIParameter) -> Any:
+        if param.default is None or param.value_type == "str" or not isinstance(param.default, str):
+            return param.default
+        # Keep the same behavior as the default value which be written in Python code as literal value
+        try:
+            return ast.literal_eval(param.default)
+        except (ValueError, SyntaxError):
+            return param.default
+
+    def _can_update_api(self, old_api_config: Optional[MockAPI], new_api_config: Optional[MockAPI]) -> bool:
+        # The routes of *FastAPI* cannot be removed, and their parameters have been analyzed when adding them
+        if old_api_config is None or new_api_config is None:
+            return False
+        old_request = cast(HTTPRequest, old_api_config.http.request)  # type: ignore[union-attr]
+        new_request = cast(HTTPRequest, new_api_config.http.request)  # type: ignore[union-attr]
+        return (
+            old_api_config.url == new_api_config.url
+            and old_request.method == new_request.method
+            and [p.serialize() for p in old_request.parameters] == [p.serialize() for p in new_request.parameters]
+            # The handler of the API without latency is synchronous, it cannot wait for the latency on the event loop
+            and self._api_has_latency(old_api_config) == self._api_has_latency(new_api_config)
+        )
+
+    @staticmethod
+    def _api_has_latency(api_config: MockAPI) -> bool:
+        http_response = api_config.http.response if api_config.http is not None else None
+        return http_response is not None and http_response.latency is not None
+
+    def _add_metrics_middleware(self, metrics: ServerMetrics) -> None:
+        self.web_application.add_middleware(ASGIMetricsMiddleware, metrics=metrics)
+
+    async def _simulate_latency(
+        self, response: Any, latency: SimulatedLatency, timing: Optional[RequestTiming] = None
+    ) -> Any:
+        seconds = self._delay(latency, timing)
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+        if not latency.bandwidth:
+            return response
+        fastapi = import_web_lib.fastapi()
+        if not isinstance(response, fastapi.Response):
+            # The same as the response which *FastAPI* returns for the data, e.g., the decimal value would be a number
+            response = fastapi.responses.JSONResponse(content=fastapi.encoders.jsonable_encoder(response))
+        if isinstance(response, fastapi.responses.FileResponse):
+            body: Any = ASGIFileBody(response.path)
+        elif isinstance(response, fastapi.responses.StreamingResponse):
+            body = response.body_iterator
+        else:
+            body = response.body
+        return fastapi.responses.StreamingResponse(
+            async_throttled_body(latency, body, timing),
+            status_code=response.status_code,
+            media_type=response.media_type,
+        )
+
     def init_http_request_process(self) -> HTTPRequestProcess:
         return HTTPRequestProcess(
             request=FastAPIRequest(),
@@ -162,4 +581,99 @@ class FastAPIServer(BaseAppServer):
     def init_http_response_process(self) -> HTTPResponseProcess:
         return HTTPResponseProcess(
             request=FastAPIRequest(),
+            response=FastAPIResponse(),
         )
+
+
+class PureASGIServer(BaseAppServer):
+    """*Build a minimal pure ASGI web application*
+
+    It doesn't generate any code for the APIs. All the requests would be dispatched by the route table to the compiled
+    request validator and response generator directly.
+    """
+
+    def setup(self) -> ASGIApplication:
+        return ASGIApplication(handler=self.handle)
+
+    def init_code_generator(self) -> None:
+        return None
+
+    def _get_all_api_details(self, mocked_apis: MockAPIs) -> Dict[str, List[MockAPI]]:  # type: ignore[override]
+        return mocked_apis.group_by_url()
+
+    def _add_metrics_middleware(self, metrics: ServerMetrics) -> None:
+        self.web_application.add_middleware(ASGIMetricsMiddleware, metrics=metrics)
+
+    def init_http_request_process(self) -> HTTPRequestProcess:
+        return HTTPRequestProcess(
+            request=ASGIRequest(),
+            response=ASGIResponse(),
+        )
+
+    def init_http_response_process(self) -> HTTPResponseProcess:
+        return HTTPResponseProcess(
+            request=ASGIRequest(),
+            response=ASGIResponse(),
+            pool_refiller=AsyncioValuePoolRefiller(),
+        )
+
+    def _add_api(  # type: ignore[override]
+        self, api_name: str, api_config: List[MockAPI], base_url: Optional[str] = None
+    ) -> None:
+        url = f"{base_url}{api_name}" if base_url else api_name
+        url_details = self._mock_api_details.setdefault(url, {})
+        for ac in api_config:
+            url_details[self._api_http_method(ac)] = ac
+
+    @staticmethod
+    def _api_http_method(api_config: MockAPI) -> str:
+        return http_method(api_config).upper()
+
+    async def handle(self, request: ASGIRequestContext) -> ASGIHTTPResponse:
+        """Handle the HTTP request of the ASGI application.
+
+        Args:
+            request (ASGIRequestContext): The HTTP request.
+
+        Returns:
+            An **ASGIHTTPResponse** type object.
+
+        """
+        timing = self._request_timing(request.scope)
+        start = time.perf_counter() if timing is not None else 0.0
+        api_path = self._find_api_path(request.path)
+        if api_path is None:
+            return ASGIHTTPResponse(body=b"Not Found", status_code=404, content_type=Text_Content_Type)
+        if request.method not in self.mock_api_details.get(api_path, {}):
+            return ASGIHTTPResponse(body=b"Method Not Allowed", status_code=405, content_type=Text_Content_Type)
+        request.api_path = api_path
+        if timing is not None:
+            timing.api = api_path
+            timing.method = request.method
+            timing.routing = time.perf_counter() - start
+
+        response, latency = self._process_api(timing, request=request)
+        asgi_response = self._to_asgi_response(response)
+        if latency is None:
+            return asgi_response
+        seconds = self._delay(latency, timing)
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+        if not latency.bandwidth:
+            return asgi_response
+        return asgi_response._replace(body=async_throttled_body(latency, asgi_response.body, timing))
+
+    def _find_api_path(self, path: str) -> Optional[str]:
+        if path in self.mock_api_details:
+            return path
+        route_index = self._http_request.route_index
+        return route_index.match(path) if route_index is not None else None
+
+    @staticmethod
+    def _to_asgi_response(response: Any) -> ASGIHTTPResponse:
+        if isinstance(response, ASGIHTTPResponse):
+            return response
+        if isinstance(response, (dict, list)):
+            body = json.dumps(response, ensure_ascii=False, default=str).encode("utf-8")
+            return ASGIHTTPResponse(body=body, status_code=200, content_type=JSON_Content_Type)
+        return ASGIHTTPResponse(body=str(response).encode("utf-8"), status_code=200, content_type=Text_Content_Type)
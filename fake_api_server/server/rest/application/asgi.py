@@ -0,0 +1,185 @@
+"""*Minimal pure ASGI application*
+
+The web application which implements the ASGI (Asynchronous Server Gateway Interface) protocol directly without any
+Python web framework. It doesn't generate any code for the APIs. It dispatches the request to the handler directly,
+and the handler finds the API by the route table and processes it with the compiled validator and response.
+"""
+
+import asyncio
+import logging
+import os
+from collections import namedtuple
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+)
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+# The same types as the ASGI application of *Starlette*, so the application could be used by its test client and
+# middlewares
+ASGIScope = MutableMapping[str, Any]
+ASGIReceive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+ASGISend = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[ASGIScope, ASGIReceive, ASGISend], Awaitable[None]]
+
+# The body is bytes, a file, or an (asynchronous) iterator of bytes for sending the body chunk by chunk
+ASGIHTTPResponse = namedtuple("ASGIHTTPResponse", ("body", "status_code", "content_type"))
+
+
+class ASGIRequestContext:
+    """*The HTTP request which be received by the ASGI application*"""
+
+    __slots__ = ("method", "path", "api_path", "query", "headers", "body", "scope")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, List[str]],
+        headers: Dict[str, str],
+        body: bytes,
+        api_path: str = "",
+        scope: Optional[ASGIScope] = None,
+    ):
+        self.method = method
+        self.path = path
+        self.api_path = api_path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.scope = scope
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "")
+
+
+class ASGIFileBody:
+    """*The file which be sent as the response body chunk by chunk*
+
+    It reads the file in the thread pool, so reading a huge file never blocks the event loop. It would be sent by the
+    ASGI server directly if the server supports the extension *http.response.pathsend*.
+    """
+
+    __slots__ = ("path", "size")
+
+    chunk_size: int = 64 * 1024
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = os.path.getsize(path)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        with open(self.path, "rb") as file:
+            while True:
+                chunk = await loop.run_in_executor(None, file.read, self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+
+ASGIRequestHandler = Callable[[ASGIRequestContext], Awaitable[ASGIHTTPResponse]]
+
+
+class ASGIApplication:
+    """*The ASGI application which dispatches all HTTP requests to one handler*"""
+
+    def __init__(self, handler: ASGIRequestHandler):
+        self._handler = handler
+        self._http_app: ASGIApp = self._http
+
+    def add_middleware(self, middleware_class: type, **options: Any) -> None:
+        """Wrap the handling of HTTP requests with the ASGI middleware. It's the same usage as *Starlette*.
+
+        Args:
+            middleware_class (type): The ASGI middleware class. It would be instantiated with the wrapped ASGI
+                application and the options.
+            **options (Any): The other arguments of the middleware.
+
+        Returns:
+            None
+
+        """
+        self._http_app = middleware_class(self._http_app, **options)
+
+    async def __call__(self, scope: ASGIScope, receive: ASGIReceive, send: ASGISend) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http_app(scope, receive, send)
+        else:
+            raise NotImplementedError(f"Not support the ASGI scope type *{scope['type']}*.")
+
+    async def _lifespan(self, receive: ASGIReceive, send: ASGISend) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: ASGIScope, receive: ASGIReceive, send: ASGISend) -> None:
+        request = ASGIRequestContext(
+            method=scope["method"].upper(),
+            path=scope.get("root_path", "") + scope["path"],
+            query=parse_qs(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True),
+            headers={k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])},
+            body=await self._read_body(receive),
+            scope=scope,
+        )
+        try:
+            response = await self._handler(request)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.exception(f"Fail to handle the request *{request.method} {request.path}*: {e}")
+            response = ASGIHTTPResponse(body=b"Internal Server Error", status_code=500, content_type=None)
+        await self._send_response(send, response, scope=scope)
+
+    @staticmethod
+    async def _read_body(receive: ASGIReceive) -> bytes:
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        return body
+
+    @staticmethod
+    async def _send_response(send: ASGISend, response: ASGIHTTPResponse, scope: Optional[ASGIScope] = None) -> None:
+        body = response.body
+        if isinstance(body, bytes):
+            headers = [(b"content-length", str(len(body)).encode("latin-1"))]
+        elif isinstance(body, ASGIFileBody):
+            headers = [(b"content-length", str(body.size).encode("latin-1"))]
+        else:
+            # The length of streaming body is unknown, the server would send it with chunked transfer encoding
+            headers = []
+        content_type: Optional[str] = response.content_type
+        if content_type:
+            headers.append((b"content-type", content_type.encode("latin-1")))
+        await send({"type": "http.response.start", "status": response.status_code, "headers": headers})
+        if isinstance(body, bytes):
+            await send({"type": "http.response.body", "body": body})
+            return
+        if isinstance(body, ASGIFileBody) and "http.response.pathsend" in (scope or {}).get("extensions", {}):
+            await send({"type": "http.response.pathsend", "path": body.path})
+            return
+        if isinstance(body, AsyncIterable):
+            async for chunk in body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            # The chunks are generated in batches, every batch is generated as fast as the response without streaming
+            for chunk in body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -0,0 +1,175 @@
+"""*Simulated latency of the mocked APIs*
+
+Delay the response with the seconds which be sampled from the distribution of the **http.response.latency** setting,
+and throttle the bandwidth of sending the response body. Waiting never blocks the worker: the ASGI applications wait by
+*asyncio.sleep*, and the WSGI application waits by *gevent.sleep* if *gevent* is used (e.g., the *gevent* worker of
+*gunicorn*), so one worker could hold a lot of slow connections at once.
+"""
+
+import asyncio
+import bisect
+import random
+import sys
+import time
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from fake_api_server.model.api_config.apis import Latency, LatencyDistribution
+
+from .metrics import RequestTiming
+
+# Sending the throttled response body chunk by chunk, every chunk would be sent after this seconds.
+_Throttling_Interval: float = 0.1
+
+
+class SimulatedLatency:
+    """*The compiled latency setting of one mocked API*"""
+
+    __slots__ = ("_sample", "bandwidth")
+
+    def __init__(self, latency: Latency):
+        # Don't share the random state with the responses, the deterministic mode seeds the responses only.
+        random_instance = random.Random()
+        self._sample: Callable[[], float] = self._compile_sampler(latency, random_instance)
+        self.bandwidth: Optional[int] = latency.bandwidth
+
+    @staticmethod
+    def _compile_sampler(latency: Latency, random_instance: random.Random) -> Callable[[], float]:
+        if latency.distribution is LatencyDistribution.FIXED:
+            value = float(latency.value)
+            return lambda: value
+        elif latency.distribution is LatencyDistribution.UNIFORM:
+            minimum, maximum = float(latency.min), float(latency.max)
+            return lambda: random_instance.uniform(minimum, maximum)
+        elif latency.distribution is LatencyDistribution.NORMAL:
+            mean, stddev = float(latency.mean), float(latency.stddev)
+            return lambda: max(random_instance.gauss(mean, stddev), 0.0)
+        elif latency.distribution is LatencyDistribution.PERCENTILE:
+            table = sorted((float(percentile), float(seconds)) for percentile, seconds in latency.percentiles.items())
+            if table[0][0] > 0:
+                # It's 0 second at the percentile 0
+                table.insert(0, (0.0, 0.0))
+            percentiles = [percentile for percentile, _ in table]
+            seconds = [second for _, second in table]
+
+            def _sample_by_percentile() -> float:
+                percentile = random_instance.uniform(0, 100)
+                index = bisect.bisect_left(percentiles, percentile)
+                if index >= len(percentiles):
+                    return seconds[-1]
+                if index == 0:
+                    return seconds[0]
+                lower, upper = percentiles[index - 1], percentiles[index]
+                ratio = (percentile - lower) / (upper - lower)
+                return seconds[index - 1] + (seconds[index] - seconds[index - 1]) * ratio
+
+            return _sample_by_percentile
+        return lambda: 0.0
+
+    def delay(self) -> float:
+        """Sample the seconds to delay the response.
+
+        Returns:
+            The seconds.
+
+        """
+        return self._sample()
+
+    def throttle(self, body: bytes) -> List[Tuple[float, bytes]]:
+        """Split the response body as the chunks which be sent with the throttled bandwidth.
+
+        Args:
+            body (bytes): The response body.
+
+        Returns:
+            A list of the seconds to wait before sending the chunk, and the chunk.
+
+        """
+        if not self.bandwidth:
+            return [(0.0, body)]
+        chunk_size = max(int(self.bandwidth * _Throttling_Interval), 1)
+        return [
+            (len(body[i : i + chunk_size]) / self.bandwidth, body[i : i + chunk_size])
+            for i in range(0, len(body), chunk_size)
+        ] or [(0.0, b"")]
+
+
+def cooperative_sleep(seconds: float) -> None:
+    """Sleep in the WSGI application. It yields to the other greenlets if *gevent* is used, or it blocks the thread.
+
+    Args:
+        seconds (float): The seconds to sleep.
+
+    Returns:
+        None
+
+    """
+    if seconds <= 0:
+        return
+    gevent = sys.modules.get("gevent", None)
+    if gevent is not None:
+        gevent.sleep(seconds)
+    else:
+        time.sleep(seconds)
+
+
+def throttled_body(latency: SimulatedLatency, body: Union[bytes, Iterable[bytes]]) -> Iterator[bytes]:
+    """Send the response body with the throttled bandwidth in the WSGI application.
+
+    Args:
+        latency (SimulatedLatency): The simulated latency.
+        body (Union[bytes, Iterable[bytes]]): The response body, or the chunks of streaming response body.
+
+    Returns:
+        An iterator of the chunks of response body.
+
+    """
+    for body_chunk in [body] if isinstance(body, bytes) else body:
+        for seconds, chunk in latency.throttle(body_chunk):
+            cooperative_sleep(seconds)
+            yield chunk
+
+
+async def async_throttled_body(
+    latency: SimulatedLatency,
+    body: Union[bytes, Iterable[bytes], AsyncIterable[bytes]],
+    timing: Optional[RequestTiming] = None,
+) -> AsyncIterator[bytes]:
+    """Send the response body with the throttled bandwidth in the ASGI application.
+
+    Args:
+        latency (SimulatedLatency): The simulated latency.
+        body (Union[bytes, Iterable[bytes], AsyncIterable[bytes]]): The response body, or the chunks of streaming
+            response body.
+        timing (Optional[RequestTiming]): The timing of current request. The seconds of throttling would be added
+            into it if it's given, because the ASGI metrics middleware measures the request until the body is sent.
+
+    Returns:
+        An asynchronous iterator of the chunks of response body.
+
+    """
+    if isinstance(body, bytes):
+        body = [body]
+    if not isinstance(body, AsyncIterable):
+        body = _as_async_iterable(body)
+    async for body_chunk in body:
+        for seconds, chunk in latency.throttle(body_chunk):
+            if seconds > 0:
+                await asyncio.sleep(seconds)
+                if timing is not None:
+                    timing.simulated = (timing.simulated or 0.0) + seconds
+            yield chunk
+
+
+async def _as_async_iterable(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
@@ -0,0 +1,359 @@
+"""*Metrics of the mocked web application*
+
+The latency of every phase of handling request (routing, validating the request parameters, generating the response,
+the simulated latency of the mocked API and the rest of it which is the overhead of web framework), the amount of
+requests by status code and the hit ratio of caches. They would be exposed on an internal URL path in the text
+exposition format of *Prometheus*.
+
+Recording a request only appends one record into a deque, which is thread-safe without locking, so the threads (or
+greenlets, or asyncio tasks) which handle requests never wait for each other. The records would be aggregated into the
+histograms when there are enough of them or the metrics are scraped. Every worker process has its own metrics.
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from .asgi import ASGIReceive, ASGIScope, ASGISend
+
+Metrics_Path_Default: str = "/_fake/metrics"
+Metrics_Content_Type: str = "text/plain; version=0.0.4; charset=utf-8"
+
+# The key of the request timing in the ASGI scope or WSGI environ of a request
+Request_Timing_Key: str = "fake_api_server.request_timing"
+
+Latency_Buckets: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+_Request_Record = 0
+_Cache_Record = 1
+
+
+class RequestTiming:
+    """*The seconds of every phase of handling one request*
+
+    It's created by the metrics middleware for every request, and the handler of the mocked API fills the phases which
+    it measures.
+    """
+
+    __slots__ = ("api", "method", "routing", "validation", "generation", "simulated")
+
+    def __init__(self):
+        self.api: str = ""
+        self.method: str = ""
+        self.routing: Optional[float] = None
+        self.validation: Optional[float] = None
+        self.generation: Optional[float] = None
+        # The seconds of the simulated latency of the mocked API, it's not the overhead of web framework
+        self.simulated: Optional[float] = None
+
+
+class _Histogram:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int):
+        self.buckets: List[int] = [0] * size
+        self.sum: float = 0.0
+        self.count: int = 0
+
+
+class ServerMetrics:
+    """*The metrics of one worker of the mocked web application*"""
+
+    def __init__(
+        self,
+        path: str = Metrics_Path_Default,
+        buckets: Iterable[float] = Latency_Buckets,
+        aggregate_size: int = 512,
+    ):
+        """
+
+        Args:
+            path (str): The URL path to expose the metrics.
+            buckets (Iterable[float]): The upper bounds (in seconds) of the buckets of latency histograms.
+            aggregate_size (int): Aggregate the records into histograms when the amount of them reaches it.
+        """
+        self.path = path
+        self._buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._aggregate_size = aggregate_size
+
+        self._records: Deque[tuple] = deque()
+        # Only the thread which aggregates the records needs it, recording never waits for it
+        self._aggregating_lock = threading.Lock()
+
+        # The data structure would be:
+        # {
+        #     (<API URL>, <HTTP method>, <phase>): <histogram>
+        # }
+        self._histograms: Dict[Tuple[str, str, str], _Histogram] = {}
+        # The data structure would be:
+        # {
+        #     (<API URL>, <HTTP method>, <status code>): <amount of requests>
+        # }
+        self._requests: Dict[Tuple[str, str, int], int] = {}
+        # The data structure would be:
+        # {
+        #     <cache name>: [<amount of hits>, <amount of misses>]
+        # }
+        self._caches: Dict[str, List[int]] = {}
+
+    def observe_request(self, timing: RequestTiming, status_code: int, seconds: float) -> None:
+        """Record the request which has been handled.
+
+        Args:
+            timing (RequestTiming): The seconds of the phases which be measured by the handler of mocked API.
+            status_code (int): The status code of the response.
+            seconds (float): The total seconds of handling the request.
+
+        Returns:
+            None
+
+        """
+        self._records.append(
+            (
+                _Request_Record,
+                timing.api,
+                timing.method,
+                status_code,
+                seconds,
+                timing.routing,
+                timing.validation,
+                timing.generation,
+                timing.simulated,
+            )
+        )
+        self._aggregate_if_full()
+
+    def count_cache(self, cache: str, hit: bool) -> None:
+        """Record one lookup of the cache.
+
+        Args:
+            cache (str): The name of cache, e.g., *compiled_response*.
+            hit (bool): Whether the value is in the cache or not.
+
+        Returns:
+            None
+
+        """
+        self._records.append((_Cache_Record, cache, hit))
+        self._aggregate_if_full()
+
+    def _aggregate_if_full(self) -> None:
+        # Don't wait for the other thread which is aggregating, the records would be aggregated by it or next time
+        if len(self._records) >= self._aggregate_size and self._aggregating_lock.acquire(blocking=False):
+            try:
+                self._aggregate()
+            finally:
+                self._aggregating_lock.release()
+
+    def _aggregate(self) -> None:
+        records = self._records
+        while True:
+            try:
+                record = records.popleft()
+            except IndexError:
+                return
+            if record[0] == _Request_Record:
+                _, api, method, status_code, seconds, routing, validation, generation, simulated = record
+                request_key = (api, method, status_code)
+                self._requests[request_key] = self._requests.get(request_key, 0) + 1
+                self._observe(api, method, "request", seconds)
+                if routing is not None:
+                    self._observe(api, method, "routing", routing)
+                if validation is not None:
+                    self._observe(api, method, "validation", validation)
+                if generation is not None:
+                    self._observe(api, method, "generation", generation)
+                if simulated is not None:
+                    self._observe(api, method, "simulated_latency", simulated)
+                if validation is not None:
+                    # The rest of time is spent by the web framework and server, e.g., parsing HTTP request and
+                    # serializing response
+                    framework = seconds - (routing or 0.0) - validation - (generation or 0.0) - (simulated or 0.0)
+                    self._observe(api, method, "framework", max(framework, 0.0))
+            else:
+                _, cache, hit = record
+                counts = self._caches.setdefault(cache, [0, 0])
+                counts[0 if hit else 1] += 1
+
+    def _observe(self, api: str, method: str, phase: str, seconds: float) -> None:
+        key = (api, method, phase)
+        histogram = self._histograms.get(key, None)
+        if histogram is None:
+            histogram = self._histograms[key] = _Histogram(len(self._buckets) + 1)
+        histogram.buckets[bisect.bisect_left(self._buckets, seconds)] += 1
+        histogram.sum += seconds
+        histogram.count += 1
+
+    def render(self) -> str:
+        """Aggregate all the records and render the metrics in the text exposition format of *Prometheus*.
+
+        Returns:
+            The metrics in text.
+
+        """
+        with self._aggregating_lock:
+            self._aggregate()
+            lines: List[str] = [
+                "# HELP fake_api_server_requests_total The amount of handled HTTP requests.",
+                "# TYPE fake_api_server_requests_total counter",
+            ]
+            for (api, method, status_code), amount in sorted(self._requests.items()):
+                labels = _labels(api=api, method=method, status=str(status_code))
+                lines.append(f"fake_api_server_requests_total{{{labels}}} {amount}")
+
+            lines.append(
+                "# HELP fake_api_server_request_phase_seconds The latency of every phase of handling HTTP request."
+            )
+            lines.append("# TYPE fake_api_server_request_phase_seconds histogram")
+            for (api, method, phase), histogram in sorted(self._histograms.items()):
+                labels = _labels(api=api, method=method, phase=phase)
+                cumulative = 0
+                for bound, amount in zip(self._buckets, histogram.buckets):
+                    cumulative += amount
+                    lines.append(f'fake_api_server_request_phase_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'fake_api_server_request_phase_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"fake_api_server_request_phase_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"fake_api_server_request_phase_seconds_count{{{labels}}} {histogram.count}")
+
+            lines.append("# HELP fake_api_server_cache_lookups_total The amount of looking up the caches.")
+            lines.append("# TYPE fake_api_server_cache_lookups_total counter")
+            for cache, (hits, misses) in sorted(self._caches.items()):
+                lines.append(f"fake_api_server_cache_lookups_total{{{_labels(cache=cache, result='hit')}}} {hits}")
+                lines.append(f"fake_api_server_cache_lookups_total{{{_labels(cache=cache, result='miss')}}} {misses}")
+            lines.append("# HELP fake_api_server_cache_hit_ratio The ratio of the cache hits to all lookups.")
+            lines.append("# TYPE fake_api_server_cache_hit_ratio gauge")
+            for cache, (hits, misses) in sorted(self._caches.items()):
+                lines.append(f"fake_api_server_cache_hit_ratio{{{_labels(cache=cache)}}} {hits / (hits + misses)}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class ASGIMetricsMiddleware:
+    """*The ASGI middleware which measures every request and exposes the metrics*"""
+
+    def __init__(self, app: Callable, metrics: ServerMetrics):
+        self._app = app
+        self._metrics = metrics
+
+    async def __call__(self, scope: ASGIScope, receive: ASGIReceive, send: ASGISend) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+        if scope["path"] == self._metrics.path:
+            body = self._metrics.render().encode("utf-8")
+            headers = [
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"content-type", Metrics_Content_Type.encode("latin-1")),
+            ]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        timing = scope[Request_Timing_Key] = RequestTiming()
+        status_code = 500
+
+        async def _send(message: MutableMapping[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self._app(scope, receive, _send)
+        finally:
+            self._metrics.observe_request(timing, status_code, time.perf_counter() - start)
+
+
+class WSGIMetricsMiddleware:
+    """*The WSGI middleware which measures every request and exposes the metrics*"""
+
+    def __init__(self, app: Callable, metrics: ServerMetrics):
+        self._app = app
+        self._metrics = metrics
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        if environ.get("PATH_INFO", "") == self._metrics.path:
+            body = self._metrics.render().encode("utf-8")
+            start_response("200 OK", [("Content-Length", str(len(body))), ("Content-Type", Metrics_Content_Type)])
+            return [body]
+
+        timing = environ[Request_Timing_Key] = RequestTiming()
+        status_code = 500
+
+        def _start_response(status: str, headers: List[Tuple[str, str]], exc_info: Any = None) -> Callable:
+            nonlocal status_code
+            status_code = int(status.split(" ", 1)[0])
+            return start_response(status, headers, exc_info)
+
+        def _observe() -> None:
+            self._metrics.observe_request(timing, status_code, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        try:
+            app_iter = self._app(environ, _start_response)
+        except BaseException:
+            _observe()
+            raise
+        # The body (e.g., the streaming or throttled one) is sent after returning, so record the request when the WSGI
+        # server closes it
+        return _ClosingBody(app_iter, on_close=_observe)
+
+
+class _ClosingBody:
+    """*The response body of WSGI which calls back when the WSGI server closes it*
+
+    It's the same as *werkzeug.wsgi.ClosingIterator*.
+    """
+
+    __slots__ = ("_body", "_on_close")
+
+    def __init__(self, body: Iterable[bytes], on_close: Callable[[], None]):
+        self._body = body
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._body)
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._body, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._on_close()
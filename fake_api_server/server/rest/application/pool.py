@@ -0,0 +1,226 @@
+"""*Pools of pre-generated random values*
+
+Generating random values by the format settings costs CPU time of handling request. The pool keeps the values which
+have been generated in advance, and it would be refilled in background by a thread or an asyncio task.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import weakref
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RandomValuePool:
+    """*Ring buffer of the random values of one property*
+
+    It pops the values which have been generated from the buffer. It would notify the refiller to refill the buffer
+    if the amount of values in the buffer is less than the watermark. And it would generate the values directly if
+    the buffer has been drained.
+    """
+
+    def __init__(
+        self,
+        generator: Callable[[int], List[Any]],
+        size: int,
+        watermark: int,
+        refiller: Optional["BaseValuePoolRefiller"] = None,
+    ):
+        self._generator = generator
+        self._size = size
+        self._watermark = watermark
+        self._refiller = refiller
+        self._values: Deque[Any] = deque(maxlen=size)
+        self._refilling: bool = False
+        self._misses: int = 0
+        self._request_refill()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def misses(self) -> int:
+        """:obj:`int`: The amount of popping which the pool has been drained and generates values directly."""
+        return self._misses
+
+    def pop(self) -> Any:
+        return self.pop_many(1)[0]
+
+    def pop_many(self, n: int) -> List[Any]:
+        values: List[Any] = []
+        try:
+            for _ in range(n):
+                values.append(self._values.popleft())
+        except IndexError:
+            self._misses += 1
+            values.extend(self._generator(n - len(values)))
+        if len(self._values) < self._watermark:
+            self._request_refill()
+        return values
+
+    def refill(self, max_amount: Optional[int] = None) -> int:
+        """Generate the values to fill the pool.
+
+        Args:
+            max_amount (Optional[int]): The maximum amount of values to generate in this time. It would fill the
+                pool to be full if it's ``None``.
+
+        Returns:
+            The amount of values the pool still needs to be full.
+
+        """
+        amount = self._size - len(self._values)
+        if max_amount is not None:
+            amount = min(amount, max_amount)
+        if amount > 0:
+            self._values.extend(self._generator(amount))
+        remaining = self._size - len(self._values)
+        if remaining <= 0 or max_amount is None:
+            self._refilling = False
+        return max(remaining, 0)
+
+    def _request_refill(self) -> None:
+        if self._refilling:
+            return
+        self._refilling = True
+        if self._refiller is None:
+            self.refill()
+        else:
+            self._refiller.notify(self)
+
+
+class BaseValuePoolRefiller(metaclass=ABCMeta):
+    """*Base class to refill the value pools in background*"""
+
+    @abstractmethod
+    def notify(self, pool: RandomValuePool) -> None:
+        """Notify the refiller the pool needs to be refilled.
+
+        Args:
+            pool (RandomValuePool): The pool which needs to be refilled.
+
+        Returns:
+            None
+
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+
+class ThreadValuePoolRefiller(BaseValuePoolRefiller):
+    """*Refill the value pools by a daemon thread*
+
+    The thread only be started when it's notified at the first time. The thread doesn't exist in the child process
+    after forking (e.g., the workers of *gunicorn* with preloading application), so it would be started again in the
+    child process with the pools which haven't been refilled.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[RandomValuePool]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._refilling_pool: Optional[RandomValuePool] = None
+        if hasattr(os, "register_at_fork"):
+            refiller_ref = weakref.ref(self)
+
+            def _reset_in_child() -> None:
+                refiller = refiller_ref()
+                if refiller is not None:
+                    refiller._reset_after_fork()
+
+            os.register_at_fork(after_in_child=_reset_in_child)
+
+    def notify(self, pool: RandomValuePool) -> None:
+        self._ensure_started()
+        self._queue.put(pool)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                self._queue.put(None)
+                self._thread.join(timeout=5)
+            self._thread = None
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="fake-api-value-pool-refiller", daemon=True)
+                self._thread.start()
+
+    def _reset_after_fork(self) -> None:
+        pending_pools: List[RandomValuePool] = [p for p in list(self._queue.queue) if p is not None]
+        if self._refilling_pool is not None:
+            pending_pools.insert(0, self._refilling_pool)
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._refilling_pool = None
+        for pool in pending_pools:
+            self.notify(pool)
+
+    def _run(self) -> None:
+        while True:
+            pool = self._queue.get()
+            if pool is None:
+                break
+            self._refilling_pool = pool
+            try:
+                pool.refill()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"Fail to refill the value pool: {e}")
+            finally:
+                self._refilling_pool = None
+
+
+class AsyncioValuePoolRefiller(BaseValuePoolRefiller):
+    """*Refill the value pools by an asyncio task in the event loop*
+
+    It refills the pool chunk by chunk and yields the control back to event loop between the chunks, so that it
+    won't block the requests handling for too long.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None, chunk_size: int = 256):
+        self._loop = loop
+        self._chunk_size = chunk_size
+        self._pools: Deque[RandomValuePool] = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    def notify(self, pool: RandomValuePool) -> None:
+        loop = self._loop
+        if loop is None:
+            try:
+                loop = self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop is running, so refill the pool directly.
+                pool.refill()
+                return
+        loop.call_soon_threadsafe(self._schedule, pool)
+
+    def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def _schedule(self, pool: RandomValuePool) -> None:
+        self._pools.append(pool)
+        if self._task is None or self._task.done():
+            assert self._loop is not None
+            self._task = self._loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._pools:
+            pool = self._pools.popleft()
+            try:
+                while pool.refill(max_amount=self._chunk_size) > 0:
+                    await asyncio.sleep(0)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"Fail to refill the value pool: {e}")
+            await asyncio.sleep(0)
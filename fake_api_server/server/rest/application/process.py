@@ -1,18 +1,32 @@
-import re
+import json
+import logging
+import threading
 from abc import ABC, ABCMeta, abstractmethod
-from pydoc import locate
-from typing import Any, Dict, List, Union, cast
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
+from fake_api_server._utils.random import seed_by_key, seeded_iterator, seeded_random
 from fake_api_server.model import MockAPI
 from fake_api_server.model.api_config.apis import (
     APIParameter,
     HTTPRequest,
     HTTPResponse,
+    Latency,
 )
+from fake_api_server.model.api_config.apis.lazy import is_deserialized
+from fake_api_server.model.api_config.apis.response_strategy import ResponseStrategy
 
+from .latency import SimulatedLatency
+from .metrics import ServerMetrics
+from .pool import BaseValuePoolRefiller, ThreadValuePoolRefiller
 from .request import BaseCurrentRequest
 from .response import BaseResponse
 from .response import HTTPResponse as MockHTTPResponse
+from .response import PreparedFile, PreparedResponse, PreparedStream
+from .route import APIRouteIndex
+from .validator import RequestParametersValidator
+
+logger = logging.getLogger(__name__)
 
 
 class BaseMockAPIProcess(metaclass=ABCMeta):
@@ -33,6 +47,9 @@ class BaseHTTPProcess(BaseMockAPIProcess, ABC):
         # }
         self._mock_api_details: Dict[str, Dict[str, MockAPI]] = {}
 
+        # Count the lookups of the compiled caches if the metrics are enabled
+        self.metrics: Optional[ServerMetrics] = None
+
     @property
     def mock_api_details(self) -> Dict[str, Dict[str, MockAPI]]:
         return self._mock_api_details
@@ -41,11 +58,57 @@ class BaseHTTPProcess(BaseMockAPIProcess, ABC):
     def mock_api_details(self, details: Dict[str, Dict[str, MockAPI]]) -> None:
         self._mock_api_details = details
 
+    def update_mock_api_details(
+        self,
+        details: Dict[str, Dict[str, MockAPI]],
+        added: Iterable[MockAPI] = (),
+        removed: Iterable[MockAPI] = (),
+    ) -> None:
+        """Swap the API details with the new one which only has a few APIs be changed. It only compiles the added APIs
+        before swapping it and discards the compiled removed APIs after swapping it, so the requests which are being
+        processed won't be affected and it doesn't need to compile all APIs again.
+
+        Args:
+            details (Dict[str, Dict[str, MockAPI]]): The new API details.
+            added (Iterable[MockAPI]): The APIs which are in the new API details but not in the current one.
+            removed (Iterable[MockAPI]): The APIs which are in the current API details but not in the new one.
+
+        Returns:
+            None
+
+        """
+        self.compile_mock_apis(added)
+        self._mock_api_details = details
+
+    def compile_mock_apis(self, api_configs: Iterable[MockAPI]) -> None:
+        """Compile the APIs before they're in the API details, so the first request of them won't pay the cost.
+
+        Args:
+            api_configs (Iterable[MockAPI]): The APIs to compile.
+
+        Returns:
+            None
+
+        """
+
+    @property
+    def route_index(self) -> Optional[APIRouteIndex]:
+        return self._request.route_index
+
+    @route_index.setter
+    def route_index(self, index: APIRouteIndex) -> None:
+        self._request.route_index = index
+
     def _get_current_request(self, **kwargs) -> Any:
         return self._request.request_instance(**kwargs)
 
+    def _get_current_api_details(self, **kwargs) -> Dict[str, Dict[str, MockAPI]]:
+        # The snapshot of the API details which the request is processed with, or the current one if it isn't given
+        mock_api_details = kwargs.get("mock_api_details", None)
+        return self.mock_api_details if mock_api_details is None else mock_api_details
+
     def _get_current_api_parameters(self, **kwargs) -> dict:
-        kwargs["mock_api_details"] = self.mock_api_details
+        kwargs["mock_api_details"] = self._get_current_api_details(**kwargs)
         return self._request.api_parameters(**kwargs)
 
     def _get_current_api_path(self, request: Any) -> str:
@@ -54,8 +117,8 @@ class BaseHTTPProcess(BaseMockAPIProcess, ABC):
     def _get_current_request_http_method(self, request: Any) -> str:
         return self._request.http_method(request=request)
 
-    def _find_detail_by_api_path(self, api_path: str) -> dict:
-        return self._request.find_api_detail_by_api_path(self.mock_api_details, api_path)
+    def _find_detail_by_api_path(self, api_path: str, **kwargs) -> dict:
+        return self._request.find_api_detail_by_api_path(self._get_current_api_details(**kwargs), api_path)
 
 
 class HTTPRequestProcess(BaseHTTPProcess):
@@ -63,94 +126,306 @@ class HTTPRequestProcess(BaseHTTPProcess):
         super().__init__(request=request)
         self._response: BaseResponse = response
 
+        # The data structure would be:
+        # {
+        #     <id of the API details>: (<API details>, <validator of the API parameters>)
+        # }
+        self._validators: Dict[int, Tuple[MockAPI, RequestParametersValidator]] = {}
+
+    @BaseHTTPProcess.mock_api_details.setter  # type: ignore[attr-defined]
+    def mock_api_details(self, details: Dict[str, Dict[str, MockAPI]]) -> None:
+        if details is not self._mock_api_details:
+            # Reuse the validators of the APIs which are the same objects, and only compile the others
+            compiled_validators = self._validators
+            self._validators = {}
+            for api_details in details.values():
+                for api_config in api_details.values():
+                    if not is_deserialized(api_config):
+                        # Compile it when it's requested at the first time
+                        continue
+                    compiled_validator = compiled_validators.get(id(api_config), None)
+                    if compiled_validator is not None and compiled_validator[0] is api_config:
+                        self._validators[id(api_config)] = compiled_validator
+                    else:
+                        self._get_validator(api_config)
+        self._mock_api_details = details
+
+    def update_mock_api_details(
+        self,
+        details: Dict[str, Dict[str, MockAPI]],
+        added: Iterable[MockAPI] = (),
+        removed: Iterable[MockAPI] = (),
+    ) -> None:
+        self.compile_mock_apis(added)
+        self._mock_api_details = details
+        for api_config in removed:
+            compiled_validator = self._validators.get(id(api_config), None)
+            if compiled_validator is not None and compiled_validator[0] is api_config:
+                del self._validators[id(api_config)]
+
+    def compile_mock_apis(self, api_configs: Iterable[MockAPI]) -> None:
+        for api_config in api_configs:
+            if is_deserialized(api_config):
+                self._get_validator(api_config)
+
     def process(self, **kwargs) -> Any:
         request = self._get_current_request(**kwargs)
         req_params = self._get_current_api_parameters(**kwargs)
 
-        api_params_info: List[APIParameter] = self._find_detail_by_api_path(self._get_current_api_path(request))[
+        api_config: MockAPI = self._find_detail_by_api_path(self._get_current_api_path(request), **kwargs)[
             self._get_current_request_http_method(request)
-        ].http.request.parameters
-        for param_info in api_params_info:
-            # Check the required parameter
-            one_req_param_value = req_params.get(param_info.name, None)
-            if param_info.required and (param_info.name not in req_params.keys() or one_req_param_value is None):
-                return self._generate_http_response(f"Miss required parameter *{param_info.name}*.", status_code=400)
-            if one_req_param_value:
-                # Check the data type of parameter
-                assert param_info.value_type, "It must cannot miss the value type value of each parameters."
-                value_py_data_type: type = locate(param_info.value_type)  # type: ignore[assignment]
-                if value_py_data_type in [int, float, "big_decimal"] and self._request.int_type_value_is_string:
-                    # For the Flask part. It would always be string type of each API parameter.
-                    if re.search(r"\d{1,128}", str(one_req_param_value)) is None:
-                        return self._generate_http_response(
-                            f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different with the "
-                            f"implementation of Back-End site (*{value_py_data_type}*).",
-                            status_code=400,
-                        )
-                else:
-                    if param_info.value_type and not isinstance(one_req_param_value, value_py_data_type):
-                        return self._generate_http_response(
-                            f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different with the "
-                            f"implementation of Back-End site (*{value_py_data_type}*).",
-                            status_code=400,
-                        )
-                # Check the element of list
-                if param_info.value_type and value_py_data_type is list and param_info.items:
-                    assert isinstance(one_req_param_value, list)
-                    for e in one_req_param_value:
-                        if len(param_info.items) > 1:
-                            assert isinstance(e, dict), "The data type of item object must be *dict* type."
-                            for item in param_info.items:
-                                if item.required is True and item.name not in e.keys():
-                                    return self._generate_http_response(
-                                        f"Miss required parameter *{param_info.name}.{item.name}*.",
-                                        status_code=400,
-                                    )
-                                if item.value_type and not isinstance(e[item.name], locate(item.value_type)):  # type: ignore[arg-type]
-                                    return self._generate_http_response(
-                                        f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different "
-                                        f"with the implementation of Back-End site (*{value_py_data_type}*).",
-                                        status_code=400,
-                                    )
-                        elif len(param_info.items) == 1:
-                            assert isinstance(
-                                e, (str, int, float)
-                            ), "The data type of item object must be *str*, *int* or *float* type."
-                            item = param_info.items[0]
-                            if item.value_type and not isinstance(e, locate(item.value_type)):  # type: ignore[arg-type]
-                                return self._generate_http_response(
-                                    f"The type of data from Font-End site (*{type(one_req_param_value)}*) is different "
-                                    f"with the implementation of Back-End site (*{value_py_data_type}*).",
-                                    status_code=400,
-                                )
-                # Check the data format of parameter
-                assert param_info.value_type, "Miss required property *value_type*."
-                assert isinstance(value_py_data_type, type)
-                value_format = param_info.value_format
-                if param_info.value_format and not value_format.value_format_is_match(  # type: ignore[union-attr]
-                    data_type=value_py_data_type, value=one_req_param_value
-                ):
-                    return self._generate_http_response(
-                        f"The format of data from Font-End site (param: '{param_info.name}', "
-                        f"value: '{one_req_param_value}') is incorrect. Its format should be "
-                        f"{param_info.value_format.expect_format_log_msg(data_type=value_py_data_type)}.",
-                        status_code=400,
-                    )
+        ]
+        err_msg = self._get_validator(api_config, count_lookup=True).validate(req_params)
+        if err_msg:
+            return self._generate_http_response(err_msg, status_code=400)
         return self._generate_http_response(body="OK.", status_code=200)
 
+    def _get_validator(self, api_config: MockAPI, count_lookup: bool = False) -> RequestParametersValidator:
+        compiled_validator = self._validators.get(id(api_config), None)
+        if count_lookup and self.metrics is not None:
+            self.metrics.count_cache(
+                "validator", hit=compiled_validator is not None and compiled_validator[0] is api_config
+            )
+        if compiled_validator is None or compiled_validator[0] is not api_config:
+            api_params_info: List[APIParameter] = api_config.http.request.parameters  # type: ignore[union-attr]
+            validator = RequestParametersValidator(
+                parameters=api_params_info,
+                int_type_value_is_string=self._request.int_type_value_is_string,
+            )
+            compiled_validator = (api_config, validator)
+            self._validators[id(api_config)] = compiled_validator
+        return compiled_validator[1]
+
     def _generate_http_response(self, body: str, status_code: int) -> Any:
         return self._response.generate(body=body, status_code=status_code)
 
 
 class HTTPResponseProcess(BaseHTTPProcess):
-    def process(self, **kwargs) -> Union[str, dict]:
+    def __init__(
+        self,
+        request: BaseCurrentRequest,
+        response: Optional[BaseResponse] = None,
+        pool_refiller: Optional[BaseValuePoolRefiller] = None,
+    ):
+        super().__init__(request=request)
+        self._response: Optional[BaseResponse] = response
+        self._pool_refiller: BaseValuePoolRefiller = pool_refiller or ThreadValuePoolRefiller()
+
+        # Settings of the deterministic mode. The responses would be generated by the random instance which is
+        # seeded from the seed and the request. The data structure of cache would be:
+        # {
+        #     (<id of the HTTP response setting>, <seed of the request>): <response>
+        # }
+        self._seed: Optional[int] = None
+        self._seeded_responses: "OrderedDict[Tuple[int, int], Any]" = OrderedDict()
+        self._seeded_responses_max_size: int = 0
+        self._seeded_responses_lock = threading.Lock()
+
+        # The data structure would be:
+        # {
+        #     <id of the HTTP response setting>: (<HTTP response setting>, <compiled HTTP response>)
+        # }
+        # The compiled HTTP response is the serialized response for strategy *string*, the file path and content type
+        # for strategy *file* with streaming, or the response generator (or the generator of response body chunks with
+        # streaming) for strategy *object*.
+        self._compiled_responses: Dict[int, Tuple[HTTPResponse, Any]] = {}
+        # The data structure would be:
+        # {
+        #     <id of the latency setting>: (<latency setting>, <simulated latency>)
+        # }
+        self._simulated_latencies: Dict[int, Tuple[Latency, SimulatedLatency]] = {}
+
+    @BaseHTTPProcess.mock_api_details.setter  # type: ignore[attr-defined]
+    def mock_api_details(self, details: Dict[str, Dict[str, MockAPI]]) -> None:
+        if details is not self._mock_api_details:
+            # Reuse the compiled responses of the APIs which are the same objects, and only compile the others
+            compiled_responses = self._compiled_responses
+            self._compiled_responses = {}
+            # The simulated latencies are cheap to create, so create them again when they're used
+            self._simulated_latencies = {}
+            for api_details in details.values():
+                for api_config in api_details.values():
+                    if not is_deserialized(api_config):
+                        # Compile it when it's requested at the first time
+                        continue
+                    response = cast(HTTPResponse, self._ensure_http(api_config, "response"))
+                    compiled_response = compiled_responses.get(id(response), None)
+                    if compiled_response is not None and compiled_response[0] is response:
+                        self._compiled_responses[id(response)] = compiled_response
+                    else:
+                        self._compile_response(api_config)
+        self._mock_api_details = details
+
+    def update_mock_api_details(
+        self,
+        details: Dict[str, Dict[str, MockAPI]],
+        added: Iterable[MockAPI] = (),
+        removed: Iterable[MockAPI] = (),
+    ) -> None:
+        self.compile_mock_apis(added)
+        self._mock_api_details = details
+        for api_config in removed:
+            if not is_deserialized(api_config):
+                continue
+            response = cast(HTTPResponse, self._ensure_http(api_config, "response"))
+            compiled_response = self._compiled_responses.get(id(response), None)
+            if compiled_response is not None and compiled_response[0] is response:
+                del self._compiled_responses[id(response)]
+            if response.latency is not None:
+                self._simulated_latencies.pop(id(response.latency), None)
+
+    def compile_mock_apis(self, api_configs: Iterable[MockAPI]) -> None:
+        for api_config in api_configs:
+            if is_deserialized(api_config):
+                self._compile_response(api_config)
+
+    def _compile_response(self, api_config: MockAPI) -> None:
+        response = cast(HTTPResponse, self._ensure_http(api_config, "response"))
+        try:
+            self._get_compiled_response(response)
+        except Exception as e:  # pylint: disable=broad-except
+            # Let it raise the error when it's requested as before.
+            logger.warning(f"Cannot compile the HTTP response of API *{api_config.url}*: {e}")
+
+    @property
+    def seed(self) -> Optional[int]:
+        return self._seed
+
+    def set_seed(self, seed: Optional[int], cache_size: int = 0) -> None:
+        """Enable the deterministic mode with the seed. All the random values of the response would be generated by
+        the random instance which is seeded from the seed and the request (its path, HTTP method and parameters), so
+        the same request always gets the same response.
+
+        Args:
+            seed (Optional[int]): The seed. It disables the deterministic mode if it's ``None``.
+            cache_size (int): The maximum amount of the responses which be cached by the seed of request. It won't
+                cache anything if it's *0*.
+
+        Returns:
+            None
+
+        """
+        if seed != self._seed:
+            # The value pools don't be used in deterministic mode, so it needs to compile the response again.
+            self._compiled_responses = {}
+        self._seed = seed
+        self._seeded_responses_max_size = cache_size
+        with self._seeded_responses_lock:
+            self._seeded_responses.clear()
+
+    def process(self, **kwargs) -> Any:
+        return self.process_with_latency(**kwargs)[0]
+
+    def process_with_latency(self, **kwargs) -> Tuple[Any, Optional[SimulatedLatency]]:
+        """Generate the response of the mocked API, and get the simulated latency of it. The web application should
+        delay the response and throttle the bandwidth by the simulated latency.
+
+        Returns:
+            A tuple of the response and the simulated latency. The simulated latency is ``None`` if the mocked API
+            doesn't set it.
+
+        """
         request = self._get_current_request(**kwargs)
-        api_params_info: MockAPI = self._find_detail_by_api_path(self._get_current_api_path(request))[
-            self._get_current_request_http_method(request)
-        ]
+        api_path = self._get_current_api_path(request)
+        http_method = self._get_current_request_http_method(request)
+        api_params_info: MockAPI = self._find_detail_by_api_path(api_path, **kwargs)[http_method]
         response = cast(HTTPResponse, self._ensure_http(api_params_info, "response"))
+        return (
+            self._generate_response(response, current_request=request, http_method=http_method, **kwargs),
+            self._get_simulated_latency(response),
+        )
+
+    def _generate_response(self, response: HTTPResponse, current_request: Any, http_method: str, **kwargs) -> Any:
+        if response.strategy is ResponseStrategy.STRING and self._response is not None:
+            prepared_response: PreparedResponse = self._get_compiled_response(response, count_lookup=True)
+            return self._response.generate_raw(body=prepared_response.body, content_type=prepared_response.content_type)
+        elif response.strategy is ResponseStrategy.FILE and response.stream and self._response is not None:
+            prepared_file: PreparedFile = self._get_compiled_response(response, count_lookup=True)
+            return self._response.generate_file(path=prepared_file.path, content_type=prepared_file.content_type)
+        elif response.strategy is ResponseStrategy.OBJECT and response.stream and self._response is not None:
+            prepared_stream: PreparedStream = self._get_compiled_response(response, count_lookup=True)
+            chunks = prepared_stream.generate()
+            if self._seed is not None:
+                request_seed = self._request_seed(self._request.request_path(current_request), http_method, **kwargs)
+                chunks = seeded_iterator(request_seed, chunks)
+            return self._response.generate_stream(chunks=chunks, content_type=prepared_stream.content_type)
+        elif response.strategy is ResponseStrategy.OBJECT:
+            if self._seed is not None:
+                return self._generate_seeded_response(
+                    response, self._request.request_path(current_request), http_method, **kwargs
+                )
+            return self._get_compiled_response(response, count_lookup=True)()
         return MockHTTPResponse.generate(data=response)
 
+    def _request_seed(self, request_path: str, http_method: str, **kwargs) -> int:
+        assert self._seed is not None
+        req_params = self._get_current_api_parameters(**kwargs)
+        request_key = f"{http_method} {request_path} {json.dumps(req_params, sort_keys=True, default=str)}"
+        return seed_by_key(self._seed, request_key)
+
+    def _generate_seeded_response(self, response: HTTPResponse, request_path: str, http_method: str, **kwargs) -> Any:
+        seed = self._request_seed(request_path, http_method, **kwargs)
+        cache_key = (id(response), seed)
+        if self._seeded_responses_max_size > 0:
+            with self._seeded_responses_lock:
+                if cache_key in self._seeded_responses:
+                    self._seeded_responses.move_to_end(cache_key)
+                    if self.metrics is not None:
+                        self.metrics.count_cache("seeded_response", hit=True)
+                    return self._seeded_responses[cache_key]
+            if self.metrics is not None:
+                self.metrics.count_cache("seeded_response", hit=False)
+
+        with seeded_random(seed):
+            generated_response = self._get_compiled_response(response, count_lookup=True)()
+
+        if self._seeded_responses_max_size > 0:
+            with self._seeded_responses_lock:
+                self._seeded_responses[cache_key] = generated_response
+                if len(self._seeded_responses) > self._seeded_responses_max_size:
+                    self._seeded_responses.popitem(last=False)
+        return generated_response
+
+    def _get_simulated_latency(self, response: HTTPResponse) -> Optional[SimulatedLatency]:
+        latency = response.latency
+        if latency is None:
+            return None
+        simulated_latency = self._simulated_latencies.get(id(latency), None)
+        if simulated_latency is None or simulated_latency[0] is not latency:
+            simulated_latency = (latency, SimulatedLatency(latency))
+            self._simulated_latencies[id(latency)] = simulated_latency
+        return simulated_latency[1]
+
+    def _get_compiled_response(self, response: HTTPResponse, count_lookup: bool = False) -> Any:
+        compiled_response = self._compiled_responses.get(id(response), None)
+        if count_lookup and self.metrics is not None:
+            self.metrics.count_cache(
+                "compiled_response", hit=compiled_response is not None and compiled_response[0] is response
+            )
+        if compiled_response is None or compiled_response[0] is not response:
+            if response.strategy is ResponseStrategy.STRING:
+                compiled_response = (response, MockHTTPResponse.prepare_string(response))
+            elif response.strategy is ResponseStrategy.FILE and response.stream:
+                compiled_response = (response, MockHTTPResponse.prepare_file(response))
+            elif response.strategy is ResponseStrategy.OBJECT and response.stream:
+                compiled_response = (
+                    response,
+                    MockHTTPResponse.compile_object_stream(
+                        response, pool_refiller=self._pool_refiller, enable_pool=self._seed is None
+                    ),
+                )
+            elif response.strategy is ResponseStrategy.OBJECT:
+                compiled_response = (
+                    response,
+                    MockHTTPResponse.compile_object(
+                        response, pool_refiller=self._pool_refiller, enable_pool=self._seed is None
+                    ),
+                )
+            else:
+                return None
+            self._compiled_responses[id(response)] = compiled_response
+        return compiled_response[1]
+
     def _ensure_http(self, api_config: MockAPI, http_attr: str) -> Union[HTTPRequest, HTTPResponse]:
         assert api_config.http and getattr(
             api_config.http, http_attr
@@ -1,15 +1,41 @@
 import json
-import re
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
 
 from fake_api_server._utils import import_web_lib
 from fake_api_server.model.api_config.apis import APIParameter
 
+from .asgi import ASGIRequestContext
+from .route import APIRouteIndex
+
 
 class BaseCurrentRequest(metaclass=ABCMeta):
     int_type_value_is_string: bool = False
 
+    _route_index: Optional[APIRouteIndex] = None
+    _route_index_source: Optional[Dict[str, dict]] = None
+
+    @property
+    def route_index(self) -> Optional[APIRouteIndex]:
+        return self._route_index
+
+    @route_index.setter
+    def route_index(self, index: APIRouteIndex) -> None:
+        self._route_index = index
+        self._route_index_source = None
+
+    def _ensure_route_index(self, mock_api_details: Dict[str, dict]) -> APIRouteIndex:
+        # The index would be built by the web application when it creates APIs. Here is a fallback for the case which
+        # doesn't set it, e.g., use it directly with another API details.
+        if self._route_index is None or (
+            self._route_index_source is not None
+            and (self._route_index_source is not mock_api_details or len(self._route_index) != len(mock_api_details))
+        ):
+            self._route_index = APIRouteIndex(mock_api_details.keys())
+            self._route_index_source = mock_api_details
+        return self._route_index
+
     @abstractmethod
     def request_instance(self, **kwargs) -> Any:
         pass
@@ -29,6 +55,11 @@ class BaseCurrentRequest(metaclass=ABCMeta):
     def http_method(self, request: Any) -> str:
         pass
 
+    def request_path(self, request: Any) -> str:
+        """The real URL path of the request. It's different with *api_path* if the web framework returns the API path
+        with variables, e.g., */foo/{id}*."""
+        return self.api_path(request)
+
 
 class FlaskRequest(BaseCurrentRequest):
     # For Flask, the API parameter always be string even it's integer.
@@ -67,27 +98,12 @@ class FlaskRequest(BaseCurrentRequest):
         return api_params
 
     def find_api_detail_by_api_path(self, mock_api_details: Dict[str, dict], api_path: str) -> dict:
-
-        def _find_mapping_api(api: str):
-            simple_api_path_parts = re.sub(r"<\w{1,32}>", "<>", api).split("<>")
-            search_regular = r""
-            for api_part in simple_api_path_parts:
-                search_regular += re.escape(api_part) + r"\w{1,256}"
-            return re.search(search_regular, api_path)
-
         try:
             return mock_api_details[api_path]
         except KeyError:
-            api_has_variable = list(filter(lambda p: re.search(r"<\w{1,32}>", p) is not None, mock_api_details.keys()))
-            mapping_variable_api = list(filter(lambda api: _find_mapping_api(api) is not None, api_has_variable))
-            if len(mapping_variable_api) > 1:
-                mapping_variable_api = list(
-                    filter(
-                        lambda api: len(api) == max(map(lambda a: len(a), mapping_variable_api)), mapping_variable_api
-                    )
-                )
-            assert len(mapping_variable_api) == 1
-            return mock_api_details[mapping_variable_api[0]]
+            mapping_variable_api = self._ensure_route_index(mock_api_details).match(api_path)
+            assert mapping_variable_api is not None and mapping_variable_api in mock_api_details
+            return mock_api_details[mapping_variable_api]
 
     def api_path(self, request: "flask.Request") -> str:  # type: ignore[name-defined]
         return request.path
@@ -120,3 +136,42 @@ class FastAPIRequest(BaseCurrentRequest):
 
     def http_method(self, request: "fastapi.Request") -> str:  # type: ignore[name-defined]
         return request.method.upper()
+
+    def request_path(self, request: "fastapi.Request") -> str:  # type: ignore[name-defined]
+        return request.url.path
+
+
+class ASGIRequest(BaseCurrentRequest):
+    # Same as Flask, the API parameter from query string or form always be string even it's integer.
+    int_type_value_is_string: bool = True
+
+    def request_instance(self, **kwargs) -> ASGIRequestContext:
+        return kwargs["request"]
+
+    def api_parameters(self, **kwargs) -> dict:
+        request: ASGIRequestContext = kwargs.get("request", None)
+        if request.method == "GET":
+            mock_api_details = kwargs.get("mock_api_details", None)
+            if not mock_api_details:
+                raise ValueError("Missing necessary argument *mock_api_details*.")
+            mock_api_params_info: List[APIParameter] = mock_api_details[request.api_path][
+                request.method
+            ].http.request.parameters
+            iterable_param_names = [p.name for p in mock_api_params_info if p.value_type == "list"]
+            return {k: (v if k in iterable_param_names else v[0]) for k, v in request.query.items()}
+
+        if not request.body:
+            return {}
+        if request.content_type.startswith("application/x-www-form-urlencoded"):
+            form = parse_qs(request.body.decode("utf-8"), keep_blank_values=True)
+            return {k: v[0] for k, v in form.items()}
+        return json.loads(request.body.decode("utf-8"))
+
+    def api_path(self, request: ASGIRequestContext) -> str:
+        return request.api_path
+
+    def http_method(self, request: ASGIRequestContext) -> str:
+        return request.method
+
+    def request_path(self, request: ASGIRequestContext) -> str:
+        return request.path
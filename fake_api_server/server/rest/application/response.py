@@ -1,18 +1,59 @@
 import json
+import mimetypes
 import os
 from abc import ABCMeta, abstractmethod
+from collections import namedtuple
 from decimal import Decimal
 from pydoc import locate
-from typing import Any, Callable, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from fake_api_server._utils import import_web_lib
+from fake_api_server._utils.file.cache import FileContentCache
+from fake_api_server._utils.random import RandomInteger
 from fake_api_server.exceptions import FileFormatNotSupport
-from fake_api_server.model.api_config import ResponseProperty
+from fake_api_server.model.api_config import IteratorItem, ResponseProperty
 from fake_api_server.model.api_config.apis import (
     HTTPResponse as MockAPIHTTPResponseConfig,
 )
+from fake_api_server.model.api_config.apis import StreamFormat
 from fake_api_server.model.api_config.apis.response_strategy import ResponseStrategy
 
+from .asgi import ASGIFileBody, ASGIHTTPResponse
+from .pool import BaseValuePoolRefiller, RandomValuePool
+
+PreparedResponse = namedtuple("PreparedResponse", ("body", "content_type"))
+PreparedFile = namedtuple("PreparedFile", ("path", "content_type"))
+PreparedStream = namedtuple("PreparedStream", ("generate", "content_type"))
+_PropertyGenerator = namedtuple("_PropertyGenerator", ("one", "many"))
+
+JSON_Content_Type: str = "application/json"
+Text_Content_Type: str = "text/plain; charset=utf-8"
+NDJSON_Content_Type: str = "application/x-ndjson"
+Binary_Content_Type: str = "application/octet-stream"
+
+# The content types of the file extensions which may not be registered in module *mimetypes*
+_File_Content_Types: Dict[str, str] = {
+    ".json": JSON_Content_Type,
+    ".ndjson": NDJSON_Content_Type,
+    ".jsonl": NDJSON_Content_Type,
+}
+
+
+_Not_Cached = object()
+
+
+def _copy_json(value: Any) -> Any:
+    # It's faster than *copy.deepcopy* because the JSON data only has dict, list and immutable values
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def _dump_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
 
 class BaseResponse(metaclass=ABCMeta):
     @abstractmethod
@@ -21,16 +62,78 @@ class BaseResponse(metaclass=ABCMeta):
         [Data processing for both HTTP request] (May also could provide this feature for HTTP response part?)
         """
 
+    @abstractmethod
+    def generate_raw(self, body: bytes, content_type: str, status_code: int = 200) -> Any:
+        """
+        [Data processing for HTTP response] Return the body which has been serialized as bytes directly.
+        """
+
+    @abstractmethod
+    def generate_file(self, path: str, content_type: str, status_code: int = 200) -> Any:
+        """
+        [Data processing for HTTP response] Stream the file as the body chunk by chunk without loading it.
+        """
+
+    @abstractmethod
+    def generate_stream(self, chunks: Iterator[bytes], content_type: str, status_code: int = 200) -> Any:
+        """
+        [Data processing for HTTP response] Send the body chunk by chunk while the chunks are being generated.
+        """
+
 
 class FlaskResponse(BaseResponse):
     def generate(self, body: str, status_code: int) -> "flask.Response":  # type: ignore
         return import_web_lib.flask().Response(body, status=status_code)
 
+    def generate_raw(self, body: bytes, content_type: str, status_code: int = 200) -> "flask.Response":  # type: ignore
+        return import_web_lib.flask().Response(body, status=status_code, content_type=content_type)
+
+    def generate_file(self, path: str, content_type: str, status_code: int = 200) -> "flask.Response":  # type: ignore
+        # It would be sent by the file wrapper of WSGI server, e.g., *sendfile* of *gunicorn*
+        response = import_web_lib.flask().send_file(path, mimetype=content_type)
+        if status_code != 200:
+            response.status_code = status_code
+        return response
+
+    def generate_stream(
+        self, chunks: Iterator[bytes], content_type: str, status_code: int = 200
+    ) -> "flask.Response":  # type: ignore[name-defined]
+        flask = import_web_lib.flask()
+        return flask.Response(flask.stream_with_context(chunks), status=status_code, content_type=content_type)
+
 
 class FastAPIResponse(BaseResponse):
     def generate(self, body: str, status_code: int) -> "fastapi.Response":  # type: ignore
         return import_web_lib.fastapi().Response(body, status_code=status_code)
 
+    def generate_raw(self, body: bytes, content_type: str, status_code: int = 200) -> "fastapi.Response":  # type: ignore
+        return import_web_lib.fastapi().Response(body, status_code=status_code, media_type=content_type)
+
+    def generate_file(self, path: str, content_type: str, status_code: int = 200) -> "fastapi.Response":  # type: ignore
+        return import_web_lib.fastapi().responses.FileResponse(path, status_code=status_code, media_type=content_type)
+
+    def generate_stream(
+        self, chunks: Iterator[bytes], content_type: str, status_code: int = 200
+    ) -> "fastapi.Response":  # type: ignore[name-defined]
+        # The chunks would be generated in the thread pool, so generating them never blocks the event loop
+        return import_web_lib.fastapi().responses.StreamingResponse(
+            chunks, status_code=status_code, media_type=content_type
+        )
+
+
+class ASGIResponse(BaseResponse):
+    def generate(self, body: str, status_code: int) -> ASGIHTTPResponse:
+        return ASGIHTTPResponse(body=body.encode("utf-8"), status_code=status_code, content_type=Text_Content_Type)
+
+    def generate_raw(self, body: bytes, content_type: str, status_code: int = 200) -> ASGIHTTPResponse:
+        return ASGIHTTPResponse(body=body, status_code=status_code, content_type=content_type)
+
+    def generate_file(self, path: str, content_type: str, status_code: int = 200) -> ASGIHTTPResponse:
+        return ASGIHTTPResponse(body=ASGIFileBody(path), status_code=status_code, content_type=content_type)
+
+    def generate_stream(self, chunks: Iterator[bytes], content_type: str, status_code: int = 200) -> ASGIHTTPResponse:
+        return ASGIHTTPResponse(body=chunks, status_code=status_code, content_type=content_type)
+
 
 class HTTPResponse:
     """*Data processing of HTTP response for mocked HTTP application*
@@ -40,6 +143,44 @@ class HTTPResponse:
 
     valid_file_format: List[str] = ["json"]
 
+    _default_value_by_type: Dict[type, str] = {
+        str: "random string",
+        int: "random integer",
+        float: "random big decimal",
+        bool: "random boolean",
+    }
+
+    # The cache of the parsed file contents. It's built by the environment variables when it's used at the first time,
+    # and every web server resets it, so the environment variables could be changed before setting up the server.
+    _file_cache: Optional[FileContentCache] = None
+
+    # The amount of elements of list property which be generated and sent at once when streaming the response
+    stream_batch_size: int = 1000
+
+    @classmethod
+    def file_cache(cls) -> FileContentCache:
+        """Get the cache of the parsed file contents. It would be built by the environment variables if it doesn't
+        exist.
+
+        Returns:
+            A **FileContentCache** type object.
+
+        """
+        if cls._file_cache is None:
+            cls._file_cache = FileContentCache.from_env()
+        return cls._file_cache
+
+    @classmethod
+    def reset_file_cache(cls) -> None:
+        """Drop the cache of the parsed file contents. It would be built by the current environment variables again
+        when it's used next time.
+
+        Returns:
+            None
+
+        """
+        cls._file_cache = None
+
     @classmethod
     def generate(cls, data: MockAPIHTTPResponseConfig) -> Union[str, dict]:
         """Generate the HTTP response by the data. It would try to parse it as JSON format data in the beginning. If it
@@ -63,6 +204,63 @@ class HTTPResponse:
         else:
             raise TypeError(f"Cannot identify invalid HTTP response strategy *{data.strategy}*.")
 
+    @classmethod
+    def prepare_string(cls, data: MockAPIHTTPResponseConfig) -> PreparedResponse:
+        """Serialize the HTTP response with strategy *string* as bytes with its content type. The response value is
+        static, so it only needs to be classified as JSON format or plain text once.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting with strategy *string*.
+
+        Returns:
+            A **PreparedResponse** type object which has the body as UTF-8 bytes and its content type.
+
+        """
+        response_value = data.value or ""
+        try:
+            is_json = isinstance(json.loads(response_value), (dict, list))
+        except ValueError:
+            is_json = False
+        return PreparedResponse(
+            body=response_value.encode("utf-8"),
+            content_type=JSON_Content_Type if is_json else Text_Content_Type,
+        )
+
+    @classmethod
+    def prepare_file(cls, data: MockAPIHTTPResponseConfig) -> PreparedFile:
+        """Prepare the HTTP response with strategy *file* which streams the file. The file won't be read or parsed, it
+        only resolves the absolute path and infers the content type from the file extension once.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting with strategy *file* and *stream*.
+
+        Returns:
+            A **PreparedFile** type object which has the absolute file path and its content type.
+
+        """
+        if not os.path.isfile(data.path):
+            raise FileNotFoundError(f"The file {data.path} which is the response content doesn't exist.")
+        return PreparedFile(path=os.path.abspath(data.path), content_type=cls.file_content_type(data.path))
+
+    @staticmethod
+    def file_content_type(path: str) -> str:
+        """Infer the content type from the file extension.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            The content type. It's *application/octet-stream* if the file extension is unknown.
+
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension in _File_Content_Types:
+            return _File_Content_Types[extension]
+        content_type = mimetypes.guess_type(path)[0]
+        if content_type is None:
+            return Binary_Content_Type
+        return f"{content_type}; charset=utf-8" if content_type.startswith("text/") else content_type
+
     @classmethod
     def _generate_response_as_string(cls, data: MockAPIHTTPResponseConfig) -> str:
         response_value = data.value
@@ -81,65 +279,226 @@ class HTTPResponse:
 
     @classmethod
     def _generate_response_from_object(cls, data: MockAPIHTTPResponseConfig) -> dict:
+        return cls.compile_object(data)()
+
+    @classmethod
+    def compile_object(
+        cls,
+        data: MockAPIHTTPResponseConfig,
+        pool_refiller: Optional[BaseValuePoolRefiller] = None,
+        enable_pool: bool = True,
+    ) -> Callable[[], dict]:
+        """Compile the HTTP response setting with strategy *object* as a generator. It resolves the data type, format
+        and size settings of all the properties only once, so it only needs to call the generator to get a new
+        response in every request.
+
+        If the setting has *pool*, the random values of every property with format setting would be popped from the
+        value pools which be refilled in background.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting with strategy *object*.
+            pool_refiller (Optional[BaseValuePoolRefiller]): The refiller of value pools. The value pools would be
+                refilled directly when handling request if it's ``None``.
+            enable_pool (bool): Whether it uses the value pools or not if the setting has *pool*.
+
+        Returns:
+            A callable object which generates the response data.
+
+        """
+        pooled = cls._pooled(data, pool_refiller=pool_refiller, enable_pool=enable_pool)
+        properties_generator = [(v.name, cls._compile_property(v, pooled).one) for v in data.properties]
+
+        def _generate_response() -> dict:
+            response = {}
+            for name, generator in properties_generator:
+                response[name] = generator()
+            return response
+
+        return _generate_response
+
+    @classmethod
+    def compile_object_stream(
+        cls,
+        data: MockAPIHTTPResponseConfig,
+        pool_refiller: Optional[BaseValuePoolRefiller] = None,
+        enable_pool: bool = True,
+    ) -> PreparedStream:
+        """Compile the HTTP response setting with strategy *object* and *stream* as a generator of the response body
+        chunks. The elements of the list properties would be generated batch by batch while sending them, so it only
+        keeps one batch of elements in memory even if the list is huge.
+
+        Args:
+            data (MockAPIHTTPResponseConfig): The HTTP response setting with strategy *object* and *stream*.
+            pool_refiller (Optional[BaseValuePoolRefiller]): The refiller of value pools. The value pools would be
+                refilled directly when handling request if it's ``None``.
+            enable_pool (bool): Whether it uses the value pools or not if the setting has *pool*.
+
+        Returns:
+            A **PreparedStream** type object which has the generator of response body chunks and its content type.
 
-        def _initial_resp_details(v: ResponseProperty) -> Union[str, int, Decimal, bool, list, dict]:
-
-            def _process_collection_data(
-                _v: ResponseProperty,
-                init_data: Union[list, dict],
-                insert_callback: Callable[[Union[list, dict], dict], Union[list, dict]],
-            ) -> Union[list, dict]:
-                _value = init_data
-                _item = {}  # type: ignore[var-annotated]
-                for i in _v.items or []:
-                    if len(_v.items) == 1 and i.name == "":  # type: ignore[arg-type]
-                        _item = _initial_resp_details(i)  # type: ignore[arg-type, assignment]
-                    else:
-                        _item[i.name] = _initial_resp_details(i)  # type: ignore[arg-type]
-                _value = insert_callback(_value, _item)
-                return _value
-
-            assert v.value_type
-            data_type = locate(v.value_type)
-            assert isinstance(data_type, type)
-            if locate(v.value_type) is str:
-                value = v.generate_value_by_format(data_type=data_type, default="random string")
-            elif locate(v.value_type) is int:
-                value = v.generate_value_by_format(data_type=data_type, default="random integer")
-            elif locate(v.value_type) is float:
-                value = v.generate_value_by_format(data_type=data_type, default="random big decimal")
-            elif locate(v.value_type) is bool:
-                value = v.generate_value_by_format(data_type=data_type, default="random boolean")
-            elif locate(v.value_type) is list:
-
-                def _insert_callback(init_value: list, item: dict) -> list:
-                    init_value.append(item)
-                    return init_value
-
-                list_size = 1
-                if v.value_format is not None and v.value_format.size is not None:
-                    list_size = v.value_format.size.generate_random_int()
-                value = []  # type: ignore[assignment]
-                for _ in range(list_size):
-                    one_element_value = _process_collection_data(v, init_data=[], insert_callback=_insert_callback)  # type: ignore[arg-type]
-                    value.extend(one_element_value)  # type: ignore[union-attr]
-            elif locate(v.value_type) is dict:
-
-                def _insert_callback(init_value: dict, item: dict) -> dict:  # type: ignore[misc]
-                    init_value.update(item)
-                    return init_value
-
-                value = _process_collection_data(v, init_data={}, insert_callback=_insert_callback)  # type: ignore[arg-type,assignment]
+        """
+        pooled = cls._pooled(data, pool_refiller=pool_refiller, enable_pool=enable_pool)
+        # The data structure would be:
+        # [
+        #     (<property name>, <whether it's list or not>, <generator of elements batches or generator of value>)
+        # ]
+        properties_generator: List[Tuple[str, bool, Callable[[], Any]]] = []
+        for v in data.properties:
+            if locate(v.value_type) is list:  # type: ignore[arg-type]
+                properties_generator.append((v.name, True, cls._compile_streamed_list(v, pooled)))
             else:
-                raise NotImplementedError
-            return value
-
-        response_properties = data.properties
-        response = {}
-        for v in response_properties:
-            # TODO: Handle the value with key *format*
-            response[v.name] = _initial_resp_details(v)
-        return response
+                properties_generator.append((v.name, False, cls._compile_property(v, pooled).one))
+
+        if data.stream_format is StreamFormat.NDJSON:
+            assert len(properties_generator) == 1 and properties_generator[0][1]
+            generate_elements = properties_generator[0][2]
+
+            def _generate_ndjson() -> Iterator[bytes]:
+                for elements in generate_elements():
+                    yield "".join(f"{_dump_json(element)}\n" for element in elements).encode("utf-8")
+
+            return PreparedStream(generate=_generate_ndjson, content_type=NDJSON_Content_Type)
+
+        def _generate_json() -> Iterator[bytes]:
+            yield b"{"
+            for index, (name, is_list, generator) in enumerate(properties_generator):
+                key = f"{', ' if index else ''}{_dump_json(name)}: "
+                if not is_list:
+                    yield f"{key}{_dump_json(generator())}".encode("utf-8")
+                    continue
+                yield f"{key}[".encode("utf-8")
+                separator = ""
+                for elements in generator():
+                    if elements:
+                        yield f"{separator}{', '.join(map(_dump_json, elements))}".encode("utf-8")
+                        separator = ", "
+                yield b"]"
+            yield b"}"
+
+        return PreparedStream(generate=_generate_json, content_type=JSON_Content_Type)
+
+    @classmethod
+    def _compile_streamed_list(
+        cls,
+        v: ResponseProperty,
+        pooled: Optional[Callable[[_PropertyGenerator], _PropertyGenerator]] = None,
+    ) -> Callable[[], Iterator[List[Any]]]:
+        item_generator = cls._compile_collection_item(v, pooled)
+        list_size = v.value_format.size.to_value_size() if v.value_format and v.value_format.size else None
+
+        def _generate_elements() -> Iterator[List[Any]]:
+            # Generate the elements batch by batch, so it only keeps one batch of them in memory
+            size = RandomInteger.generate_many(1, value_range=list_size)[0] if list_size is not None else 1
+            for start in range(0, size, cls.stream_batch_size):
+                yield item_generator.many(min(cls.stream_batch_size, size - start))
+
+        return _generate_elements
+
+    @classmethod
+    def _pooled(
+        cls,
+        data: MockAPIHTTPResponseConfig,
+        pool_refiller: Optional[BaseValuePoolRefiller] = None,
+        enable_pool: bool = True,
+    ) -> Optional[Callable[[_PropertyGenerator], _PropertyGenerator]]:
+        if not enable_pool or data.pool is None:
+            return None
+        pool_setting = data.pool
+
+        def pooled(generator: _PropertyGenerator) -> _PropertyGenerator:
+            pool = RandomValuePool(
+                generator=generator.many,
+                size=pool_setting.size,
+                watermark=pool_setting.watermark,
+                refiller=pool_refiller,
+            )
+            return _PropertyGenerator(one=pool.pop, many=pool.pop_many)
+
+        return pooled
+
+    @classmethod
+    def _compile_property(
+        cls,
+        v: Union[ResponseProperty, IteratorItem],
+        pooled: Optional[Callable[[_PropertyGenerator], _PropertyGenerator]] = None,
+    ) -> _PropertyGenerator:
+        assert v.value_type
+        data_type = locate(v.value_type)
+        assert isinstance(data_type, type)
+        if data_type in cls._default_value_by_type:
+            if v.value_format is None:
+                default_value = cls._default_value_by_type[data_type]
+                return _PropertyGenerator(one=lambda: default_value, many=lambda n: [default_value] * n)
+            generator = _PropertyGenerator(
+                one=v.value_format.value_generator(data_type=data_type),
+                many=v.value_format.values_generator(data_type=data_type),
+            )
+            return pooled(generator) if pooled is not None else generator
+        elif data_type is list:
+            item_generator = cls._compile_collection_item(v, pooled)
+            if v.value_format is not None and v.value_format.size is not None:
+                list_size = v.value_format.size.to_value_size()
+
+                def _generate_lists(n: int) -> List[list]:
+                    # Generate all the elements of all the lists in one batch and split them by the random sizes
+                    sizes = RandomInteger.generate_many(n, value_range=list_size)
+                    elements = item_generator.many(sum(sizes))
+                    lists, start = [], 0
+                    for size in sizes:
+                        lists.append(elements[start : start + size])
+                        start += size
+                    return lists
+
+                return _PropertyGenerator(one=lambda: _generate_lists(1)[0], many=_generate_lists)
+            return _PropertyGenerator(
+                one=lambda: [item_generator.one()],
+                many=lambda n: [[element] for element in item_generator.many(n)],
+            )
+        elif data_type is dict:
+            item_generator = cls._compile_collection_item(v, pooled)
+
+            def _generate_dict() -> dict:
+                value: dict = {}
+                value.update(item_generator.one())
+                return value
+
+            def _generate_dicts(n: int) -> List[dict]:
+                values: List[dict] = [{} for _ in range(n)]
+                for value, item in zip(values, item_generator.many(n)):
+                    value.update(item)
+                return values
+
+            return _PropertyGenerator(one=_generate_dict, many=_generate_dicts)
+        else:
+            raise NotImplementedError
+
+    @classmethod
+    def _compile_collection_item(
+        cls,
+        v: Union[ResponseProperty, IteratorItem],
+        pooled: Optional[Callable[[_PropertyGenerator], _PropertyGenerator]] = None,
+    ) -> _PropertyGenerator:
+        items = v.items or []
+        if len(items) == 1 and items[0].name == "":
+            # The element is a value directly without any key
+            return cls._compile_property(items[0], pooled)
+        items_generator = [(i.name, cls._compile_property(i, pooled)) for i in items]
+
+        def _generate_item() -> dict:
+            item = {}
+            for name, generator in items_generator:
+                item[name] = generator.one()
+            return item
+
+        def _generate_items(n: int) -> List[dict]:
+            # Generate the values column by column, so every property could be generated in one batch
+            items: List[dict] = [{} for _ in range(n)]
+            for name, generator in items_generator:
+                for item, value in zip(items, generator.many(n)):
+                    item[name] = value
+            return items
+
+        return _PropertyGenerator(one=_generate_item, many=_generate_items)
 
     @classmethod
     def _is_file(cls, path: str) -> bool:
@@ -173,10 +532,23 @@ class HTTPResponse:
             A dict type value which be parsed from JSON format value.
 
         """
+        file_cache = cls.file_cache()
+        # The file content may be JSON *null*, so it needs a sentinel to know whether it's cached or not
+        cached_data = file_cache.get(path, default=_Not_Cached)
+        if cached_data is not _Not_Cached:
+            return _copy_json(cached_data)
+
         exist_file = os.path.exists(path)
         if not exist_file:
             raise FileNotFoundError(f"The target configuration file {path} doesn't exist.")
 
+        # Get the file status before reading it, so the cache would be invalidated if the file changes after reading.
+        stat_result = file_cache.stat(path) if file_cache.enable else None
         with open(path, "r", encoding="utf-8") as file_stream:
             data = file_stream.read()
-        return json.loads(data)
+        json_data = json.loads(data)
+        if stat_result is not None:
+            file_cache.set(path, json_data, stat_result)
+            # Every request gets its own copy, so modifying the response never changes the cached content
+            return _copy_json(json_data)
+        return json_data
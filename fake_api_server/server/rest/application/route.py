@@ -0,0 +1,140 @@
+"""*Index of the mocked API routes*
+
+This module provides a prebuilt index of all the mocked API URL paths so that the current request path could be
+mapped to its API setting without scanning every URL path in configuration.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern
+
+_VARIABLE_REGEX: Pattern = re.compile(r"<\w{1,32}>")
+_VARIABLE_VALUE_REGEX: str = r"\w{1,256}"
+_VARIABLE_VALUE_PATTERN: Pattern = re.compile(_VARIABLE_VALUE_REGEX)
+
+
+class _RouteNode:
+    __slots__ = ("static_children", "pattern_children", "variable_child", "url")
+
+    def __init__(self):
+        # The segment which doesn't have any variable, e.g., *foo* in */foo/<id>*
+        self.static_children: Dict[str, "_RouteNode"] = {}
+        # The segment which mixes static string and variable(s), e.g., *foo-<id>*
+        self.pattern_children: List[tuple] = []
+        # The segment which is only one variable, e.g., *<id>*
+        self.variable_child: Optional["_RouteNode"] = None
+        # The registered URL path if one of URL paths ends at this node
+        self.url: Optional[str] = None
+
+
+class APIRouteIndex:
+    """*Segment trie of the mocked API URL paths*
+
+    The URL path would be split by slash and every segment would be put into the trie. When it matches a request
+    path, the static segment has higher priority than the segment with variable, and it would backtrack to try the
+    other options if the higher priority one cannot match the rest of segments. So the time to resolve a request
+    path only depends on the number of its segments instead of the number of all mocked APIs.
+    """
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._root = _RouteNode()
+        self._size: int = 0
+        for url in urls:
+            self.add(url)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _split(url: str) -> List[str]:
+        return url.split("/")
+
+    @staticmethod
+    def _segment_regex(segment: str) -> str:
+        return "".join(
+            re.escape(part) if i % 2 == 0 else _VARIABLE_VALUE_REGEX
+            for i, part in enumerate(re.split(r"(<\w{1,32}>)", segment))
+        )
+
+    def add(self, url: str) -> None:
+        node = self._root
+        for segment in self._split(url):
+            if not _VARIABLE_REGEX.search(segment):
+                node = node.static_children.setdefault(segment, _RouteNode())
+            elif _VARIABLE_REGEX.fullmatch(segment):
+                if node.variable_child is None:
+                    node.variable_child = _RouteNode()
+                node = node.variable_child
+            else:
+                segment_regex = self._segment_regex(segment)
+                for pattern, child in node.pattern_children:
+                    if pattern.pattern == segment_regex:
+                        node = child
+                        break
+                else:
+                    child = _RouteNode()
+                    node.pattern_children.append((re.compile(segment_regex), child))
+                    node = child
+        if node.url is None:
+            self._size += 1
+        node.url = url
+
+    def remove(self, url: str) -> None:
+        """Remove the registered URL path. The nodes of its segments would be kept, so other URL paths which share the
+        nodes won't be affected.
+
+        Args:
+            url (str): The registered URL path.
+
+        Returns:
+            None
+
+        """
+        node: Optional[_RouteNode] = self._root
+        for segment in self._split(url):
+            assert node is not None
+            if not _VARIABLE_REGEX.search(segment):
+                node = node.static_children.get(segment, None)
+            elif _VARIABLE_REGEX.fullmatch(segment):
+                node = node.variable_child
+            else:
+                segment_regex = self._segment_regex(segment)
+                node = next(
+                    (child for pattern, child in node.pattern_children if pattern.pattern == segment_regex), None
+                )
+            if node is None:
+                return
+        if node is not None and node.url == url:
+            node.url = None
+            self._size -= 1
+
+    def match(self, api_path: str) -> Optional[str]:
+        """Find the registered URL path which maps to the request path.
+
+        Args:
+            api_path (str): The URL path of current request.
+
+        Returns:
+            The registered URL path (it may have variables in it, e.g., */foo/<id>*). It returns *None* if it cannot
+            find any one.
+
+        """
+        return self._match(self._root, self._split(api_path), 0)
+
+    def _match(self, node: _RouteNode, segments: List[str], index: int) -> Optional[str]:
+        if index == len(segments):
+            return node.url
+
+        segment = segments[index]
+        static_child = node.static_children.get(segment)
+        if static_child is not None:
+            url = self._match(static_child, segments, index + 1)
+            if url is not None:
+                return url
+        for pattern, child in node.pattern_children:
+            if pattern.fullmatch(segment):
+                url = self._match(child, segments, index + 1)
+                if url is not None:
+                    return url
+        if node.variable_child is not None and _VARIABLE_VALUE_PATTERN.fullmatch(segment):
+            return self._match(node.variable_child, segments, index + 1)
+        return None
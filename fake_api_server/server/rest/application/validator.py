@@ -0,0 +1,125 @@
+"""*Compiled validation plan of the API parameters*
+
+This module resolves the API parameters settings of one API (one URL path with one HTTP method) only once, e.g.,
+the Python data type, the regular expression of format, etc. And it keeps them as a flat list of checking steps.
+So the request handling only needs to run through the steps without resolving the settings again.
+"""
+
+import re
+from pydoc import locate
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from fake_api_server.model.api_config.apis import APIParameter
+
+_Number_Value_Pattern: Pattern = re.compile(r"\d{1,128}")
+
+
+class _ParameterCheckPlan:
+    __slots__ = (
+        "name",
+        "required",
+        "value_type",
+        "py_data_type",
+        "check_number_in_string",
+        "items",
+        "format_matcher",
+        "format_log_msg",
+    )
+
+    def __init__(self, param: APIParameter, int_type_value_is_string: bool):
+        self.name: str = param.name
+        self.required: Optional[bool] = param.required
+        self.value_type: Optional[str] = param.value_type
+        self.py_data_type: Any = locate(param.value_type) if param.value_type else None
+        # For the Flask part. It would always be string type of each API parameter.
+        self.check_number_in_string: bool = (
+            self.py_data_type in [int, float, "big_decimal"] and int_type_value_is_string
+        )
+
+        # The item settings of list type parameter as (name, required, Python data type)
+        self.items: Optional[List[Tuple[str, Optional[bool], Any]]] = None
+        if self.value_type and self.py_data_type is list and param.items:
+            self.items = [
+                (item.name, item.required, locate(item.value_type) if item.value_type else None) for item in param.items
+            ]
+
+        self.format_matcher: Optional[Callable[[Any], bool]] = None
+        self.format_log_msg: str = ""
+        if param.value_format and isinstance(self.py_data_type, type):
+            self.format_matcher = param.value_format.value_format_matcher(data_type=self.py_data_type)
+            self.format_log_msg = param.value_format.expect_format_log_msg(data_type=self.py_data_type)
+
+
+class RequestParametersValidator:
+    """*The validator of the API parameters which has been compiled from the API settings*"""
+
+    def __init__(self, parameters: List[APIParameter], int_type_value_is_string: bool = False):
+        self._plans: List[_ParameterCheckPlan] = [
+            _ParameterCheckPlan(param, int_type_value_is_string=int_type_value_is_string) for param in parameters
+        ]
+
+    def validate(self, req_params: Dict[str, Any]) -> Optional[str]:
+        """Check the API parameters of current request.
+
+        Args:
+            req_params (Dict[str, Any]): The API parameters of current request.
+
+        Returns:
+            The error message if the API parameters is invalid. Otherwise, it returns *None*.
+
+        """
+        for plan in self._plans:
+            # Check the required parameter
+            one_req_param_value = req_params.get(plan.name, None)
+            if plan.required and (plan.name not in req_params.keys() or one_req_param_value is None):
+                return f"Miss required parameter *{plan.name}*."
+            if one_req_param_value:
+                err_msg = self._check_value(plan, one_req_param_value)
+                if err_msg:
+                    return err_msg
+        return None
+
+    def _check_value(self, plan: _ParameterCheckPlan, value: Any) -> Optional[str]:
+        # Check the data type of parameter
+        assert plan.value_type, "It must cannot miss the value type value of each parameters."
+        value_py_data_type = plan.py_data_type
+        if plan.check_number_in_string:
+            if _Number_Value_Pattern.search(str(value)) is None:
+                return self._type_err_msg(value, value_py_data_type)
+        elif not isinstance(value, value_py_data_type):
+            return self._type_err_msg(value, value_py_data_type)
+
+        # Check the element of list
+        if plan.items:
+            assert isinstance(value, list)
+            for e in value:
+                if len(plan.items) > 1:
+                    assert isinstance(e, dict), "The data type of item object must be *dict* type."
+                    for item_name, item_required, item_py_data_type in plan.items:
+                        if item_required is True and item_name not in e.keys():
+                            return f"Miss required parameter *{plan.name}.{item_name}*."
+                        if item_py_data_type and not isinstance(e[item_name], item_py_data_type):
+                            return self._type_err_msg(value, value_py_data_type)
+                else:
+                    assert isinstance(
+                        e, (str, int, float)
+                    ), "The data type of item object must be *str*, *int* or *float* type."
+                    item_py_data_type = plan.items[0][2]
+                    if item_py_data_type and not isinstance(e, item_py_data_type):
+                        return self._type_err_msg(value, value_py_data_type)
+
+        # Check the data format of parameter
+        assert isinstance(value_py_data_type, type)
+        if plan.format_matcher and not plan.format_matcher(value):
+            return (
+                f"The format of data from Font-End site (param: '{plan.name}', value: '{value}') is incorrect. Its "
+                f"format should be {plan.format_log_msg}."
+            )
+        return None
+
+    @staticmethod
+    def _type_err_msg(value: Any, py_data_type: Any) -> str:
+        return (
+            f"The type of data from Font-End site (*{type(value)}*) is different with the implementation of Back-End "
+            f"site (*{py_data_type}*)."
+        )
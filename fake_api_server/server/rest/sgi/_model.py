@@ -15,6 +15,7 @@ class CommandOptions:
     log_level: str
     daemon: bool
     access_log_file: str
+    preload: str = ""
 
     def __str__(self):
         """Combine all command line options as one line which be concatenated by a one space string value `' '`.
@@ -28,7 +29,10 @@ class CommandOptions:
     @property
     def all_options(self) -> List[str]:
         """:obj:`list` of :obj:`str`: Properties with only getter for a list object of all properties."""
-        return [self.bind, self.workers, self.log_level]
+        options = [self.bind, self.workers, self.log_level]
+        if self.preload:
+            options.append(self.preload)
+        return options
 
 
 @dataclass
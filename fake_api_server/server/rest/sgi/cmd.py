@@ -43,6 +43,7 @@ class BaseSGIServer(metaclass=ABCMeta):
                 log_level=self.options.log_level(level=parser_args.log_level),
                 daemon=parser_args.daemon,
                 access_log_file=parser_args.access_log_file,
+                preload=self.options.preload(enable=parser_args.preload),
             ),
         )
 
@@ -1,7 +1,11 @@
+import logging
+import os
 import re
 from abc import ABCMeta, abstractmethod
 from typing import Optional, TypeVar
 
+logger = logging.getLogger(__name__)
+
 
 class BaseCommandOption(metaclass=ABCMeta):
     """*Define what command line options it would have be converted from the arguments by PyFake-API-Server command*"""
@@ -51,6 +55,17 @@ class BaseCommandOption(metaclass=ABCMeta):
 
         """
 
+    def preload(self, enable: bool) -> str:
+        """Option for loading the application in the master process before forking the worker processes.
+
+        Returns:
+            A string value which is this option usage. It's an empty string if it doesn't enable this option.
+
+        """
+        if enable:
+            logger.warning("The SGI tool doesn't support preloading application. It would ignore this option.")
+        return ""
+
     def _is_valid_address(self, address: str) -> bool:
         if not re.search(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}", str(address)):
             raise ValueError(
@@ -75,6 +90,10 @@ class WSGICmdOption(BaseCommandOption):
     2. -w INT, --workers INT    The number of worker processes for handling requests. [1]
 
     3. --log-level LEVEL    The granularity of Error log outputs. [info]
+
+    4. --preload    Load application code before the worker processes are forked. [False]
+       -c CONFIG, --config CONFIG    The Gunicorn config file. It uses the server hooks of *PyFake-API-Server* to
+       freeze the preloaded objects and report the memory usage of every worker if it doesn't have any config file.
     """
 
     def bind(self, address: Optional[str] = None, host: Optional[str] = None, port: Optional[str] = None) -> str:
@@ -93,6 +112,28 @@ class WSGICmdOption(BaseCommandOption):
     def log_level(self, level: str) -> str:
         return f"--log-level {level}"
 
+    def preload(self, enable: bool) -> str:
+        if not enable:
+            return ""
+        if self._has_gunicorn_config():
+            # Don't override the config file of the user, it could import the server hooks from module
+            # *fake_api_server.server.rest.sgi.gunicorn_hooks* by itself.
+            logger.info(
+                "Use the gunicorn config file of the user. Import the server hooks from module "
+                "*fake_api_server.server.rest.sgi.gunicorn_hooks* into it to freeze the preloaded objects."
+            )
+            return "--preload"
+        return "--preload --config python:fake_api_server.server.rest.sgi.gunicorn_hooks"
+
+    @staticmethod
+    def _has_gunicorn_config() -> bool:
+        # *gunicorn* loads the config file which be set by environment variable *GUNICORN_CMD_ARGS*, or the file
+        # *gunicorn.conf.py* in current directory in default
+        gunicorn_cmd_args = os.environ.get("GUNICORN_CMD_ARGS", "").split()
+        if any(arg in ("-c", "--config") or arg.startswith("--config=") for arg in gunicorn_cmd_args):
+            return True
+        return os.path.exists("gunicorn.conf.py")
+
 
 class ASGICmdOption(BaseCommandOption):
     """*ASGI application*
@@ -0,0 +1,42 @@
+"""*Server hooks of the WSGI server *gunicorn**
+
+It's the configuration module of *gunicorn* which be used by option ``--config python:<module path>`` when it runs with
+option ``--preload``. The application (includes loading and compiling configuration) has been set up in the master
+process before forking the workers, so these hooks freeze the objects in the master process to let the workers share
+the memory pages by copy-on-write, and report the memory usage of every worker.
+
+It won't be used if there is a config file of *gunicorn* already, e.g., *gunicorn.conf.py* in current directory. The
+config file could import the hooks by itself:
+
+.. code-block:: python
+
+    from fake_api_server.server.rest.sgi.gunicorn_hooks import post_fork, post_worker_init, when_ready
+"""
+
+import gc
+
+from fake_api_server._utils.memory import format_memory_usage, memory_usage
+
+
+def when_ready(server) -> None:
+    """Freeze all objects which be tracked by garbage collector in the master process.
+
+    The garbage collector would write the reference counting information into every objects it visits. It would copy
+    the memory pages of the objects in worker processes. It moves the objects to the permanent generation and the
+    garbage collector would ignore them.
+    """
+    if server.cfg.preload_app:
+        gc.collect()
+        gc.freeze()
+        server.log.info(f"Freeze {gc.get_freeze_count()} objects of the preloaded application in master process.")
+    server.log.info(f"Memory usage of master process (pid: {server.pid}): {format_memory_usage(memory_usage())}")
+
+
+def post_fork(server, worker) -> None:
+    server.log.info(f"Memory usage of worker (pid: {worker.pid}) after forking: {format_memory_usage(memory_usage())}")
+
+
+def post_worker_init(worker) -> None:
+    worker.log.info(
+        f"Memory usage of worker (pid: {worker.pid}) after initializing: {format_memory_usage(memory_usage())}"
+    )
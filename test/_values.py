@@ -699,6 +699,11 @@ _Workers_Amount: _Cmd_Option = _Cmd_Option(option_name="--workers", value=3)
 _Log_Level: _Cmd_Option = _Cmd_Option(option_name="--log-level", value="info")
 _Daemon: _Cmd_Option = _Cmd_Option(option_name="--daemon", value=False)
 _Access_Log_File: _Cmd_Option = _Cmd_Option(option_name="--access-log-file", value="./pytest-fake-api-server.log")
+_Preload: _Cmd_Option = _Cmd_Option(option_name="--preload", value=False)
+_Watch: _Cmd_Option = _Cmd_Option(option_name="--watch", value=False)
+_Lazy_Loading: _Cmd_Option = _Cmd_Option(option_name="--lazy-loading", value=False)
+_Metrics_Path: _Cmd_Option = _Cmd_Option(option_name="--metrics-path", value="")
+_Snapshot: _Cmd_Option = _Cmd_Option(option_name="--snapshot", value="")
 
 # Test command line options
 _Test_SubCommand_Run: str = "run"
@@ -781,3 +786,4 @@ class SubCommand:
     Get: str = "get"
     Sample: str = "sample"
     Pull: str = "pull"
+    Compile: str = "compile"
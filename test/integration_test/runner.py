@@ -121,6 +121,7 @@ class TestSubCmdRestServer(CommandFunctionTestSpec):
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Add.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Get.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Sample.value)
+        self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Compile.value)
 
 
 class TestSubCmdRestServerHelp(CommandFunctionTestSpec):
@@ -138,3 +139,4 @@ class TestSubCmdRestServerHelp(CommandFunctionTestSpec):
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Add.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Get.value)
         self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Sample.value)
+        self._should_contains_chars_in_result(cmd_running_result, SubCommandLine.Compile.value)
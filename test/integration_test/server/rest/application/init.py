@@ -1,6 +1,10 @@
+import asyncio
+import inspect
 import json
+import time
 from abc import abstractmethod
-from typing import Any, Union
+from typing import Any, Callable, Optional, Union
+from unittest.mock import patch
 
 import fastapi
 import flask
@@ -10,13 +14,15 @@ from flask.app import Response as FlaskResponse
 from httpx import Response as FastAPIResponse
 
 from fake_api_server import FakeAPIConfig
-from fake_api_server.model import MockAPI, load_config
+from fake_api_server.model import MockAPI, MockAPIs, load_config
 from fake_api_server.model.api_config.apis import APIParameter
 from fake_api_server.server.rest.application import (
     BaseAppServer,
     FastAPIServer,
     FlaskServer,
+    PureASGIServer,
 )
+from fake_api_server.server.rest.application.asgi import ASGIApplication
 from fake_api_server.server.rest.application.response import (
     HTTPResponse as _HTTPResponse,
 )
@@ -277,3 +283,480 @@ class TestMockHTTPServerWithFastAPIApp(MockHTTPServerTestSpec):
             return response.json()
         except:
             return response.text
+
+
+class TestMockHTTPServerWithPureASGIApp(TestMockHTTPServerWithFastAPIApp):
+    @pytest.fixture(scope="class")
+    def server_app_type(self) -> PureASGIServer:
+        return PureASGIServer()
+
+    @pytest.fixture(scope="function")
+    def client(self, mock_server_app: ASGIApplication) -> FastAPITestClient:
+        return FastAPITestClient(mock_server_app)
+
+    @pytest.mark.parametrize(
+        ("method", "path", "expected_status_code"),
+        [
+            ("GET", "/not-exist-api", 404),
+            ("PATCH", f"{_Base_URL}{_Google_Home_Value['url']}", 405),
+        ],
+    )
+    def test_invalid_request(self, client: FastAPITestClient, method: str, path: str, expected_status_code: int):
+        assert client.request(method, path).status_code == expected_status_code
+
+    def test_invalid_parameter(self, client: FastAPITestClient):
+        response = client.get(f"{_Base_URL}{_Google_Home_Value['url']}")
+        assert response.status_code == 400
+        assert "Miss required parameter" in response.text
+
+
+_Seeded_Mock_APIs = {
+    "base": {"url": "/api", "seed": 42, "seed_cache_size": 8},
+    "apis": {
+        "foo": {
+            "url": "/foo",
+            "http": {
+                "request": {"method": "GET", "parameters": [{"name": "id", "required": False, "type": "int"}]},
+                "response": {
+                    "strategy": "object",
+                    "properties": [
+                        {
+                            "name": "value",
+                            "required": True,
+                            "type": "str",
+                            "format": {"strategy": "by_data_type", "size": {"max": 20, "min": 5}},
+                        },
+                        {
+                            "name": "uuid",
+                            "required": True,
+                            "type": "str",
+                            "format": {
+                                "strategy": "customize",
+                                "customize": "<id>",
+                                "variables": [{"name": "id", "value_format": "uuid"}],
+                            },
+                        },
+                    ],
+                },
+            },
+        },
+    },
+}
+
+
+@pytest.mark.parametrize("server", [FlaskServer, FastAPIServer, PureASGIServer])
+def test_seeded_response(server: type):
+    app_server: BaseAppServer = server()
+    app_server.create_api(MockAPIs().deserialize(_Seeded_Mock_APIs))
+    app = app_server.web_application
+    client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+
+    def _get(req_id: int) -> Optional[dict]:
+        if isinstance(client, FastAPITestClient):
+            return client.get("/api/foo", params={"id": req_id}).json()
+        return client.get("/api/foo", query_string={"id": req_id}).json
+
+    first_response = _get(1)
+    assert _get(1) == first_response
+    assert _get(2) != first_response
+
+    # Another server with the same seed should reproduce the same response
+    another_app_server: BaseAppServer = server()
+    another_app_server.create_api(MockAPIs().deserialize(_Seeded_Mock_APIs))
+    another_app = another_app_server.web_application
+    client = another_app.test_client() if isinstance(another_app, flask.Flask) else FastAPITestClient(another_app)
+    assert _get(1) == first_response
+
+
+def _string_api(url: str, value: str) -> dict:
+    return {
+        "url": url,
+        "http": {
+            "request": {"method": "GET", "parameters": []},
+            "response": {"strategy": "string", "value": value},
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ("server", "expected_updated_api_keys"),
+    [
+        (FlaskServer, ["foo"]),
+        (FastAPIServer, ["foo"]),
+        (PureASGIServer, ["foo", "bar", "baz"]),
+    ],
+)
+def test_update_apis(server: type, expected_updated_api_keys: list):
+    app_server: BaseAppServer = server()
+    mocked_apis = MockAPIs().deserialize(
+        {"base": {"url": "/api"}, "apis": {"foo": _string_api("/foo", "foo v1"), "bar": _string_api("/bar", "bar")}}
+    )
+    app_server.create_api(mocked_apis)
+    app = app_server.web_application
+    client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+    assert client.get("/api/foo").text == "foo v1"
+
+    new_apis = (
+        MockAPIs().deserialize({"apis": {"foo": _string_api("/foo", "foo v2"), "baz": _string_api("/baz", "baz")}}).apis
+    )
+    updated_api_keys = app_server.update_apis(
+        {
+            "foo": (mocked_apis.apis["foo"], new_apis["foo"]),
+            "bar": (mocked_apis.apis["bar"], None),
+            "baz": (None, new_apis["baz"]),
+        },
+        base_url="/api",
+    )
+
+    assert updated_api_keys == expected_updated_api_keys
+    assert client.get("/api/foo").text == "foo v2"
+    if "bar" in updated_api_keys:
+        assert client.get("/api/bar").status_code == 404
+        assert client.get("/api/baz").text == "baz"
+    else:
+        # The routes of web framework cannot be changed without restarting
+        assert client.get("/api/bar").text == "bar"
+
+
+@pytest.mark.parametrize("server", [FlaskServer, FastAPIServer, PureASGIServer])
+def test_update_apis_while_processing_request(server: type):
+    app_server: BaseAppServer = server()
+    mocked_apis = MockAPIs().deserialize({"base": {"url": "/api"}, "apis": {"foo": _string_api("/foo", "foo v1")}})
+    app_server.create_api(mocked_apis)
+    app = app_server.web_application
+    client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+    new_apis = MockAPIs().deserialize({"apis": {"foo": _string_api("/foo", "foo v2")}}).apis
+
+    request_process = app_server._request_process
+
+    def _update_apis_after_validation(**kwargs) -> Any:
+        response = request_process(**kwargs)
+        app_server.update_apis({"foo": (mocked_apis.apis["foo"], new_apis["foo"])}, base_url="/api")
+        return response
+
+    # The request which is being processed keeps using the API details before updating
+    with patch.object(app_server, "_request_process", side_effect=_update_apis_after_validation):
+        assert client.get("/api/foo").text == "foo v1"
+    # The shared processes are only swapped by updating APIs, the requests never set them
+    assert app_server._http_request.mock_api_details is app_server.mock_api_details
+    assert app_server._http_response.mock_api_details is app_server.mock_api_details
+    updated_details = app_server.mock_api_details
+    assert client.get("/api/foo").text == "foo v2"
+    assert app_server._http_request.mock_api_details is updated_details
+
+
+@pytest.mark.parametrize("server", [FlaskServer, FastAPIServer, PureASGIServer])
+def test_metrics(server: type):
+    app_server: BaseAppServer = server()
+    metrics = app_server.enable_metrics(path="/_fake/metrics")
+    assert app_server.metrics is metrics
+    app_server.create_api(MockAPIs().deserialize(_Seeded_Mock_APIs))
+    app = app_server.web_application
+    client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+
+    def _get_status_code(path: str, **params: Any) -> int:
+        response = (
+            client.get(path, params=params)
+            if isinstance(client, FastAPITestClient)
+            else client.get(path, query_string=params)
+        )
+        # The WSGI server closes the response after sending its body, and the request is recorded at that time
+        response.close()
+        return response.status_code
+
+    for req_id in (1, 1, 2):
+        assert _get_status_code("/api/foo", id=req_id) == 200
+    assert _get_status_code("/api/not-exist") == 404
+
+    response = client.get("/_fake/metrics")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    metric_lines = response.text.splitlines()
+    assert 'fake_api_server_requests_total{api="/api/foo",method="GET",status="200"} 3' in metric_lines
+    assert 'fake_api_server_requests_total{api="",method="",status="404"} 1' in metric_lines
+    expected_phases = ["framework", "generation", "request", "validation"]
+    if server is PureASGIServer:
+        expected_phases.append("routing")
+    for phase in expected_phases:
+        count_line = f'fake_api_server_request_phase_seconds_count{{api="/api/foo",method="GET",phase="{phase}"}} 3'
+        assert count_line in metric_lines
+    # The seed of every request is different except the repeated one
+    assert 'fake_api_server_cache_lookups_total{cache="seeded_response",result="hit"} 1' in metric_lines
+    assert 'fake_api_server_cache_lookups_total{cache="seeded_response",result="miss"} 2' in metric_lines
+
+
+_Latency_Mock_APIs = {
+    "base": {"url": "/api"},
+    "apis": {
+        "slow": {
+            "url": "/slow",
+            "http": {
+                "request": {"method": "GET", "parameters": []},
+                "response": {
+                    "strategy": "string",
+                    "value": "slow",
+                    "latency": {"distribution": "fixed", "value": 0.2},
+                },
+            },
+        },
+        "throttled": {
+            "url": "/throttled",
+            "http": {
+                "request": {"method": "GET", "parameters": []},
+                "response": {
+                    "strategy": "object",
+                    "properties": [
+                        {
+                            "name": "name",
+                            "required": True,
+                            "type": "str",
+                            "format": {"strategy": "from_enums", "enums": ["x" * 40]},
+                        },
+                    ],
+                    "latency": {"bandwidth": 100},
+                },
+            },
+        },
+    },
+}
+
+
+@pytest.mark.parametrize("server", [FlaskServer, FastAPIServer, PureASGIServer])
+def test_latency(server: type):
+    app_server: BaseAppServer = server()
+    app_server.enable_metrics()
+    app_server.create_api(MockAPIs().deserialize(_Latency_Mock_APIs))
+    app = app_server.web_application
+    client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+
+    start = time.perf_counter()
+    response = client.get("/api/slow")
+    response.close()
+    assert time.perf_counter() - start >= 0.2
+    assert response.status_code == 200
+    assert response.text == "slow"
+
+    # The body is about 50 bytes, it takes about 0.5 second to send it with 100 bytes per second
+    start = time.perf_counter()
+    response = client.get("/api/throttled")
+    assert (response.json() if isinstance(response, FastAPIResponse) else response.json) == {"name": "x" * 40}
+    assert time.perf_counter() - start >= 0.4
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("application/json")
+
+    metric_lines = client.get("/_fake/metrics").text.splitlines()
+    assert (
+        'fake_api_server_request_phase_seconds_count{api="/api/slow",method="GET",phase="simulated_latency"} 1'
+        in metric_lines
+    )
+
+
+@pytest.mark.parametrize("server", [FlaskServer, FastAPIServer, PureASGIServer])
+def test_latency_with_float_property(server: type):
+    app_server: BaseAppServer = server()
+    app_server.create_api(
+        MockAPIs().deserialize(
+            {
+                "base": {"url": "/api"},
+                "apis": {
+                    "price": {
+                        "url": "/price",
+                        "http": {
+                            "request": {"method": "GET", "parameters": []},
+                            "response": {
+                                "strategy": "object",
+                                "properties": [
+                                    {
+                                        "name": "price",
+                                        "required": True,
+                                        "type": "float",
+                                        "format": {"strategy": "by_data_type"},
+                                    }
+                                ],
+                                "latency": {"bandwidth": 100000},
+                            },
+                        },
+                    },
+                },
+            }
+        )
+    )
+    app = app_server.web_application
+    client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+
+    response = client.get("/api/price")
+    assert response.status_code == 200
+    body = response.json() if isinstance(response, FastAPIResponse) else response.json
+    assert body is not None
+    # The decimal value is serialized as the same as the response without latency of every web framework
+    assert isinstance(body["price"], float if server is FastAPIServer else str)
+    float(body["price"])
+
+
+def test_fastapi_handler_is_sync_without_latency():
+    app_server = FastAPIServer()
+    mocked_apis = MockAPIs().deserialize(
+        {
+            "base": {"url": "/api"},
+            "apis": {"fast": _string_api("/fast", "fast"), **_Latency_Mock_APIs["apis"]},
+        }
+    )
+    app_server.create_api(mocked_apis)
+    handlers = {route.path: route.endpoint for route in app_server.web_application.routes}
+
+    # Only the APIs with latency wait on the event loop, the others are processed in the thread pool
+    assert inspect.iscoroutinefunction(handlers["/api/slow"])
+    assert inspect.iscoroutinefunction(handlers["/api/throttled"])
+    assert not inspect.iscoroutinefunction(handlers["/api/fast"])
+    assert FastAPITestClient(app_server.web_application).get("/api/fast").text == "fast"
+
+    # The handler cannot be changed between synchronous and asynchronous without restarting
+    slow_api = _string_api("/fast", "slow")
+    slow_api["http"]["response"]["latency"] = {"distribution": "fixed", "value": 0.1}
+    new_apis = MockAPIs().deserialize({"apis": {"fast": slow_api}}).apis
+    assert app_server.update_apis({"fast": (mocked_apis.apis["fast"], new_apis["fast"])}, base_url="/api") == []
+
+
+def _stream_file_api(url: str, path: str, latency: Optional[dict] = None) -> dict:
+    response: dict = {"strategy": "file", "path": path, "stream": True}
+    if latency:
+        response["latency"] = latency
+    return {"url": url, "http": {"request": {"method": "GET", "parameters": []}, "response": response}}
+
+
+@pytest.mark.parametrize("server", [FlaskServer, FastAPIServer, PureASGIServer])
+def test_stream_file(server: type, tmp_path):
+    binary_content = bytes(range(256)) * 1024
+    binary_file = tmp_path / "data.bin"
+    binary_file.write_bytes(binary_content)
+    ndjson_content = b"".join(json.dumps({"id": i}).encode("utf-8") + b"\n" for i in range(1000))
+    ndjson_file = tmp_path / "events.ndjson"
+    ndjson_file.write_bytes(ndjson_content)
+
+    app_server: BaseAppServer = server()
+    app_server.create_api(
+        MockAPIs().deserialize(
+            {
+                "base": {"url": "/api"},
+                "apis": {
+                    "binary": _stream_file_api("/binary", str(binary_file)),
+                    "events": _stream_file_api("/events", str(ndjson_file)),
+                    "throttled": _stream_file_api("/throttled", str(ndjson_file), latency={"bandwidth": 40000}),
+                },
+            }
+        )
+    )
+    app = app_server.web_application
+    client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+
+    def _get(path: str) -> tuple:
+        response = client.get(path)
+        body = response.content if isinstance(response, FastAPIResponse) else response.get_data()
+        return response.status_code, response.headers["Content-Type"], body
+
+    assert _get("/api/binary") == (200, "application/octet-stream", binary_content)
+    assert _get("/api/events") == (200, "application/x-ndjson", ndjson_content)
+
+    # The body is about 12 KB, it takes about 0.3 second to send it with 40 KB per second
+    start = time.perf_counter()
+    assert _get("/api/throttled") == (200, "application/x-ndjson", ndjson_content)
+    assert time.perf_counter() - start >= 0.25
+
+
+def test_stream_file_with_pathsend(tmp_path):
+    binary_file = tmp_path / "data.bin"
+    binary_file.write_bytes(b"\x00" * 1024)
+    app_server = PureASGIServer()
+    app_server.create_api(MockAPIs().deserialize({"apis": {"binary": _stream_file_api("/binary", str(binary_file))}}))
+    app = app_server.web_application
+    messages = []
+
+    async def _receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def _send(message: dict) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/binary",
+        "query_string": b"",
+        "headers": [],
+        "extensions": {"http.response.pathsend": {}},
+    }
+    asyncio.run(app(scope, _receive, _send))
+
+    # The ASGI server sends the file directly
+    assert messages[0]["status"] == 200
+    assert (b"content-length", b"1024") in messages[0]["headers"]
+    assert messages[1] == {"type": "http.response.pathsend", "path": str(binary_file)}
+
+
+def _stream_object_api(url: str, stream_format: str, properties: list) -> dict:
+    response = {"strategy": "object", "properties": properties, "stream": True, "stream_format": stream_format}
+    return {"url": url, "http": {"request": {"method": "GET", "parameters": []}, "response": response}}
+
+
+_Streamed_User_List = {
+    "name": "users",
+    "required": True,
+    "type": "list",
+    "format": {"strategy": "by_data_type", "size": {"max": 2500, "min": 2500}},
+    "items": [
+        {"name": "id", "required": True, "type": "int", "format": {"strategy": "by_data_type"}},
+        {"name": "name", "required": True, "type": "str", "format": {"strategy": "from_enums", "enums": ["a", "b"]}},
+    ],
+}
+
+
+def _stream_object_mock_apis(seed: Optional[int] = None) -> dict:
+    base: dict = {"url": "/api"}
+    if seed is not None:
+        base["seed"] = seed
+    return {
+        "base": base,
+        "apis": {
+            "json": _stream_object_api(
+                "/json",
+                "json",
+                [{"name": "message", "required": True, "type": "str"}, _Streamed_User_List],
+            ),
+            "ndjson": _stream_object_api("/ndjson", "ndjson", [_Streamed_User_List]),
+        },
+    }
+
+
+@pytest.mark.parametrize("server", [FlaskServer, FastAPIServer, PureASGIServer])
+def test_stream_object(server: type):
+    def _client(mock_apis: dict) -> Callable[[str], tuple]:
+        app_server: BaseAppServer = server()
+        app_server.create_api(MockAPIs().deserialize(mock_apis))
+        app = app_server.web_application
+        client = app.test_client() if isinstance(app, flask.Flask) else FastAPITestClient(app)
+
+        def _get(path: str) -> tuple:
+            response = client.get(path)
+            body = response.content if isinstance(response, FastAPIResponse) else response.get_data()
+            return response.status_code, response.headers["Content-Type"], body
+
+        return _get
+
+    get = _client(_stream_object_mock_apis())
+    status_code, content_type, body = get("/api/json")
+    assert (status_code, content_type) == (200, "application/json")
+    resp_data = json.loads(body)
+    assert list(resp_data.keys()) == ["message", "users"]
+    assert len(resp_data["users"]) == 2500
+    assert all(isinstance(user["id"], int) and user["name"] in ("a", "b") for user in resp_data["users"])
+
+    status_code, content_type, body = get("/api/ndjson")
+    assert (status_code, content_type) == (200, "application/x-ndjson")
+    lines = body.decode("utf-8").splitlines()
+    assert len(lines) == 2500
+    assert all(json.loads(line)["name"] in ("a", "b") for line in lines)
+
+    # The streamed responses are deterministic with the seed
+    seeded_get = _client(_stream_object_mock_apis(seed=42))
+    assert seeded_get("/api/json") == seeded_get("/api/json")
+    assert seeded_get("/api/ndjson") == _client(_stream_object_mock_apis(seed=42))("/api/ndjson")
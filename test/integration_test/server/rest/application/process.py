@@ -13,16 +13,21 @@ from flask import Flask
 from flask import Response as LibFlaskResponse
 
 from fake_api_server.model import MockAPI
+from fake_api_server.model.api_config.apis.lazy import LazyMockAPI, is_deserialized
+from fake_api_server.server.rest.application.asgi import ASGIRequestContext
 from fake_api_server.server.rest.application.process import (
     BaseHTTPProcess,
     HTTPRequestProcess,
+    HTTPResponseProcess,
 )
 from fake_api_server.server.rest.application.request import (
+    ASGIRequest,
     BaseCurrentRequest,
     FastAPIRequest,
     FlaskRequest,
 )
 from fake_api_server.server.rest.application.response import (
+    ASGIResponse,
     BaseResponse,
     FastAPIResponse,
     FlaskResponse,
@@ -392,3 +397,76 @@ class TestHTTPRequestWithFastAPI(HTTPProcessTestSpec):
     @property
     def _expected_response_type(self) -> Type[LibFastAPIResponse]:
         return LibFastAPIResponse
+
+
+@pytest.mark.parametrize("process_type", [HTTPRequestProcess, HTTPResponseProcess])
+def test_update_mock_api_details(process_type: Type[Union[HTTPRequestProcess, HTTPResponseProcess]]):
+    process = process_type(request=ASGIRequest(), response=ASGIResponse())
+    compiled_cache_attr = "_validators" if process_type is HTTPRequestProcess else "_compiled_responses"
+
+    def _compiled(api_config: MockAPI) -> Any:
+        assert api_config.http is not None
+        cache_key = id(api_config if process_type is HTTPRequestProcess else api_config.http.response)
+        return getattr(process, compiled_cache_attr)[cache_key]
+
+    google_home = MockAPI().deserialize(_Google_Home_Value)
+    post_google_home = MockAPI().deserialize(_Post_Google_Home_Value)
+    process.mock_api_details = {"/google": {"GET": google_home}}
+    compiled_google_home = _compiled(google_home)
+
+    # Only compile the added one and discard the removed one
+    new_google_home = MockAPI().deserialize(_Google_Home_Value)
+    details = {"/google": {"GET": new_google_home, "POST": post_google_home}}
+    process.update_mock_api_details(details, added=[new_google_home, post_google_home], removed=[google_home])
+    assert process.mock_api_details is details
+    assert len(getattr(process, compiled_cache_attr)) == 2
+    compiled_post_google_home = _compiled(post_google_home)
+
+    # Setting the new details would reuse the compiled one of the same objects
+    process.mock_api_details = {"/google": {"POST": post_google_home}}
+    assert len(getattr(process, compiled_cache_attr)) == 1
+    assert _compiled(post_google_home) is compiled_post_google_home
+    assert compiled_google_home is not compiled_post_google_home
+
+
+@pytest.mark.parametrize("process_type", [HTTPRequestProcess, HTTPResponseProcess])
+def test_mock_api_details_with_lazy_mock_api(process_type: Type[Union[HTTPRequestProcess, HTTPResponseProcess]]):
+    process = process_type(request=ASGIRequest(), response=ASGIResponse())
+    compiled_cache_attr = "_validators" if process_type is HTTPRequestProcess else "_compiled_responses"
+    lazy_google_home = LazyMockAPI(
+        url="/google",
+        method="GET",
+        source="google_home",
+        deserialize=lambda: MockAPI().deserialize(_Google_Home_Value),
+    )
+
+    # It doesn't deserialize the lazy mocked API to compile it before it's requested
+    process.mock_api_details = {"/google": {"GET": lazy_google_home}}
+    assert not is_deserialized(lazy_google_home)
+    assert getattr(process, compiled_cache_attr) == {}
+
+
+def test_process_with_latency():
+    process = HTTPResponseProcess(request=ASGIRequest(), response=ASGIResponse())
+    slow_api = MockAPI().deserialize(
+        {
+            "url": "/slow",
+            "http": {
+                "request": {"method": "GET"},
+                "response": {"strategy": "string", "value": "OK", "latency": {"distribution": "fixed", "value": 0.3}},
+            },
+        }
+    )
+    google_home = MockAPI().deserialize(_Google_Home_Value)
+    process.mock_api_details = {"/slow": {"GET": slow_api}, "/google": {"GET": google_home}}
+
+    def _process(path: str) -> Any:
+        request = ASGIRequestContext(method="GET", path=path, query={}, headers={}, body=b"", api_path=path)
+        return process.process_with_latency(request=request)
+
+    response, latency = _process("/slow")
+    assert response.body == b"OK"
+    assert latency is not None and latency.delay() == 0.3
+    # The simulated latency would be reused
+    assert _process("/slow")[1] is latency
+    assert _process("/google")[1] is None
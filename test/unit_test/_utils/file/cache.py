@@ -0,0 +1,163 @@
+import json
+import os
+import pathlib
+
+import pytest
+
+from fake_api_server._utils.file.cache import (
+    Default_Check_Interval,
+    Default_Max_Bytes,
+    FileContentCache,
+)
+from fake_api_server.model.api_config.apis import (
+    HTTPResponse as MockAPIHTTPResponseConfig,
+)
+from fake_api_server.model.api_config.apis import ResponseStrategy
+from fake_api_server.server.rest.application import FlaskServer
+from fake_api_server.server.rest.application.response import HTTPResponse
+
+
+def _write(path: pathlib.Path, content: str, mtime_ns: int) -> os.stat_result:
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return os.stat(path)
+
+
+class TestFileContentCache:
+    @pytest.fixture(scope="function")
+    def cache(self) -> FileContentCache:
+        return FileContentCache(max_bytes=16, check_interval=0)
+
+    def test_get_and_set(self, cache: FileContentCache, tmp_path: pathlib.Path):
+        file_path = tmp_path / "a.json"
+        stat_result = _write(file_path, '{"a": 1}', mtime_ns=1_000_000_000)
+
+        assert cache.get(str(file_path)) is None
+        cache.set(str(file_path), {"a": 1}, stat_result)
+        assert cache.get(str(file_path)) == {"a": 1}
+
+        cache_info = cache.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+        assert cache_info.currsize == 1
+        assert cache_info.currbytes == stat_result.st_size
+
+    def test_invalidate_by_modified_time(self, cache: FileContentCache, tmp_path: pathlib.Path):
+        file_path = tmp_path / "a.json"
+        stat_result = _write(file_path, '{"a": 1}', mtime_ns=1_000_000_000)
+        cache.set(str(file_path), {"a": 1}, stat_result)
+
+        _write(file_path, '{"a": 2}', mtime_ns=2_000_000_000)
+        assert cache.get(str(file_path)) is None
+        assert cache.cache_info().invalidations == 1
+        assert cache.cache_info().currsize == 0
+
+    def test_invalidate_by_deleted_file(self, cache: FileContentCache, tmp_path: pathlib.Path):
+        file_path = tmp_path / "a.json"
+        stat_result = _write(file_path, '{"a": 1}', mtime_ns=1_000_000_000)
+        cache.set(str(file_path), {"a": 1}, stat_result)
+
+        file_path.unlink()
+        assert cache.get(str(file_path)) is None
+
+    def test_not_check_file_within_interval(self, tmp_path: pathlib.Path):
+        cache = FileContentCache(max_bytes=16, check_interval=3600)
+        file_path = tmp_path / "a.json"
+        stat_result = _write(file_path, '{"a": 1}', mtime_ns=1_000_000_000)
+        cache.set(str(file_path), {"a": 1}, stat_result)
+
+        _write(file_path, '{"a": 2}', mtime_ns=2_000_000_000)
+        assert cache.get(str(file_path)) == {"a": 1}
+
+    def test_evict_by_total_bytes(self, cache: FileContentCache, tmp_path: pathlib.Path):
+        stat_results = {}
+        for name in ("a", "b", "c"):
+            file_path = tmp_path / f"{name}.json"
+            stat_results[name] = _write(file_path, f'{{"{name}": 1}}', mtime_ns=1_000_000_000)
+        cache.set(str(tmp_path / "a.json"), "a", stat_results["a"])
+        cache.set(str(tmp_path / "b.json"), "b", stat_results["b"])
+        # Use *a* to let *b* be the least recently used one
+        assert cache.get(str(tmp_path / "a.json")) == "a"
+        cache.set(str(tmp_path / "c.json"), "c", stat_results["c"])
+
+        assert cache.cache_info().evictions == 1
+        assert cache.cache_info().currbytes <= 16
+        assert cache.get(str(tmp_path / "b.json")) is None
+        assert cache.get(str(tmp_path / "a.json")) == "a"
+        assert cache.get(str(tmp_path / "c.json")) == "c"
+
+    def test_not_cache_too_large_file(self, cache: FileContentCache, tmp_path: pathlib.Path):
+        file_path = tmp_path / "large.json"
+        stat_result = _write(file_path, json.dumps({"key": "x" * 32}), mtime_ns=1_000_000_000)
+        cache.set(str(file_path), {}, stat_result)
+        assert cache.cache_info().currsize == 0
+
+    def test_disable(self, tmp_path: pathlib.Path):
+        cache = FileContentCache(max_bytes=0)
+        file_path = tmp_path / "a.json"
+        stat_result = _write(file_path, '{"a": 1}', mtime_ns=1_000_000_000)
+        cache.set(str(file_path), {"a": 1}, stat_result)
+        assert cache.enable is False
+        assert cache.get(str(file_path)) is None
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("MockAPI_File_Cache_Max_Bytes", "1024")
+        monkeypatch.setenv("MockAPI_File_Cache_Check_Interval", "0.5")
+        cache = FileContentCache.from_env()
+        assert cache.cache_info().maxbytes == 1024
+        assert cache.enable is True
+
+    def test_from_env_with_invalid_value(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("MockAPI_File_Cache_Max_Bytes", "64MB")
+        monkeypatch.setenv("MockAPI_File_Cache_Check_Interval", "1s")
+        cache = FileContentCache.from_env()
+        assert cache.cache_info().maxbytes == Default_Max_Bytes
+        assert cache._check_interval == Default_Check_Interval
+
+
+def test_http_response_with_file_cache(tmp_path: pathlib.Path):
+    file_path = tmp_path / "response.json"
+    _write(file_path, '{"content": "cached"}', mtime_ns=1_000_000_000)
+    response_config = MockAPIHTTPResponseConfig(strategy=ResponseStrategy.FILE, path=str(file_path))
+
+    hits = HTTPResponse.file_cache().cache_info().hits
+    assert HTTPResponse.generate(data=response_config) == {"content": "cached"}
+    assert HTTPResponse.generate(data=response_config) == {"content": "cached"}
+    assert HTTPResponse.file_cache().cache_info().hits == hits + 1
+
+
+def test_http_response_with_file_cache_returns_copy(tmp_path: pathlib.Path):
+    file_path = tmp_path / "response.json"
+    _write(file_path, '{"content": {"values": [1, 2]}}', mtime_ns=1_000_000_000)
+    response_config = MockAPIHTTPResponseConfig(strategy=ResponseStrategy.FILE, path=str(file_path))
+
+    response = HTTPResponse.generate(data=response_config)
+    response["content"]["values"].append(3)
+    cached_response = HTTPResponse.generate(data=response_config)
+    cached_response["content"]["extra"] = True
+    assert HTTPResponse.generate(data=response_config) == {"content": {"values": [1, 2]}}
+
+
+def test_http_response_with_cached_null_file(tmp_path: pathlib.Path):
+    file_path = tmp_path / "response.json"
+    _write(file_path, "null", mtime_ns=1_000_000_000)
+    response_config = MockAPIHTTPResponseConfig(strategy=ResponseStrategy.FILE, path=str(file_path))
+
+    assert HTTPResponse.generate(data=response_config) is None
+    misses = HTTPResponse.file_cache().cache_info().misses
+    assert HTTPResponse.generate(data=response_config) is None
+    assert HTTPResponse.file_cache().cache_info().misses == misses
+
+
+def test_http_response_file_cache_from_env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MockAPI_File_Cache_Max_Bytes", "1024")
+    HTTPResponse.reset_file_cache()
+    assert HTTPResponse.file_cache().cache_info().maxbytes == 1024
+    assert HTTPResponse.file_cache() is HTTPResponse.file_cache()
+
+    monkeypatch.setenv("MockAPI_File_Cache_Max_Bytes", "0")
+    FlaskServer()
+    assert HTTPResponse.file_cache().enable is False
+
+    monkeypatch.delenv("MockAPI_File_Cache_Max_Bytes")
+    HTTPResponse.reset_file_cache()
@@ -1,9 +1,24 @@
+import datetime
+import glob
+import os
+import pathlib
 from abc import ABCMeta, abstractmethod
+from typing import Any, List, Tuple
 from unittest.mock import mock_open, patch
 
 import pytest
+import yaml
 
-from fake_api_server._utils.file.operation import JSON, YAML, _BaseFileOperation
+from fake_api_server._utils.file.operation import (
+    JSON,
+    YAML,
+    Loader,
+    MappingConverter,
+    _BaseFileOperation,
+    record_read_files,
+)
+
+_Test_Data_Dir = pathlib.Path(pathlib.Path(__file__).parent.parent.parent.parent, "data")
 
 
 class _FileOptTestSpec(metaclass=ABCMeta):
@@ -32,6 +47,43 @@ class _FileOptTestSpec(metaclass=ABCMeta):
                 mock_file_stream.assert_not_called()
                 mock_load.assert_not_called()
 
+    def test_record_read_files(self, file_opt: _BaseFileOperation, tmp_path: pathlib.Path):
+        file_path = str(tmp_path / self.not_exist_file)
+        file_opt.write(path=file_path, config={"key": "value"})
+
+        with record_read_files() as read_files:
+            file_opt.read(path=file_path)
+            file_opt.read(path=file_path)
+        assert read_files == [os.path.abspath(file_path)] * 2
+
+        # It doesn't record anything out of the context
+        file_opt.read(path=file_path)
+        assert len(read_files) == 2
+
+    def test_record_read_files_in_nested_contexts(self, file_opt: _BaseFileOperation, tmp_path: pathlib.Path):
+        file_path = str(tmp_path / self.not_exist_file)
+        file_opt.write(path=file_path, config={"key": "value"})
+
+        with record_read_files() as outer_read_files:
+            file_opt.read(path=file_path)
+            with record_read_files() as inner_read_files:
+                file_opt.read(path=file_path)
+        assert outer_read_files == [os.path.abspath(file_path)] * 2
+        assert inner_read_files == [os.path.abspath(file_path)]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_read_many(self, file_opt: _BaseFileOperation, workers: int, tmp_path: pathlib.Path):
+        file_paths = []
+        for i in range(5):
+            file_path = str(tmp_path / f"{i}-{self.not_exist_file}")
+            file_opt.write(path=file_path, config={"index": i})
+            file_paths.append(file_path)
+
+        with record_read_files() as read_files:
+            data = file_opt.read_many(file_paths, workers=workers)
+        assert data == [{"index": i} for i in range(5)]
+        assert read_files == [os.path.abspath(p) for p in file_paths]
+
     @property
     @abstractmethod
     def _load_function_path(self) -> str:
@@ -51,6 +103,91 @@ class TestYAML(_FileOptTestSpec):
     def _load_function_path(self) -> str:
         return "fake_api_server._utils.file.operation.load"
 
+    @pytest.mark.parametrize("path", sorted(glob.glob(str(_Test_Data_Dir / "**" / "*.yaml"), recursive=True))[::10])
+    def test_read_as_same_as_yaml_load(self, file_opt: YAML, path: str):
+        with open(path, "r", encoding="utf-8") as file_stream:
+            expected_data = yaml.load(file_stream, Loader=Loader)
+        data = file_opt.read(path)
+        assert data == expected_data
+        if isinstance(data, dict):
+            assert list(data.keys()) == list(expected_data.keys())
+
+    @pytest.mark.parametrize(
+        ("content", "expected_data"),
+        [
+            ("", None),
+            (
+                "int: 1\nfloat: 2.5\nnull: null\nbool: true\ndate: 2024-01-01\nquoted: '1'\nbinary: !!binary aGk=\n",
+                {
+                    "int": 1,
+                    "float": 2.5,
+                    None: None,
+                    "bool": True,
+                    "date": datetime.date(2024, 1, 1),
+                    "quoted": "1",
+                    "binary": b"hi",
+                },
+            ),
+            (
+                "base: &base {url: /foo, method: GET}\napi:\n  <<: *base\n  url: /bar\nlist: [*base, '<<']\n",
+                {
+                    "base": {"url": "/foo", "method": "GET"},
+                    "api": {"url": "/bar", "method": "GET"},
+                    "list": [{"url": "/foo", "method": "GET"}, "<<"],
+                },
+            ),
+            # The contents which would be parsed by function *yaml.load*
+            ("!!set {a: null}\n", {"a"}),
+            ("? [1, 2]\n: value\n", yaml.constructor.ConstructorError),
+            ("a: 1\n---\nb: 2\n", yaml.composer.ComposerError),
+        ],
+    )
+    def test_read_contents(self, file_opt: YAML, tmp_path: pathlib.Path, content: str, expected_data: Any):
+        file_path = tmp_path / "content.yaml"
+        file_path.write_text(content)
+        if isinstance(expected_data, type) and issubclass(expected_data, Exception):
+            with pytest.raises(expected_data):
+                file_opt.read(str(file_path))
+        else:
+            assert file_opt.read(str(file_path)) == expected_data
+
+    def test_read_recursive_object(self, file_opt: YAML, tmp_path: pathlib.Path):
+        file_path = tmp_path / "recursive.yaml"
+        file_path.write_text("a: &a [1, *a]\n")
+        data = file_opt.read(str(file_path))
+        assert data["a"][1] is data["a"]
+
+    def test_read_with_mapping_converter(self, file_opt: YAML, tmp_path: pathlib.Path):
+        file_path = tmp_path / "api.yaml"
+        file_path.write_text(
+            "name: test\n"
+            "mocked_apis:\n"
+            "  base: {url: /api}\n"
+            "  apis:\n"
+            "    foo: {url: /foo}\n"
+            "    bar: {url: /bar}\n"
+            "  template: {}\n"
+            "other:\n"
+            "  apis:\n"
+            "    foo: {url: /foo}\n"
+        )
+        called: List[Tuple[str, Any]] = []
+
+        def _prepare(data: dict) -> None:
+            called.append(("prepare", dict(data)))
+
+        def _convert(key: str, value: dict) -> str:
+            called.append(("convert", key))
+            return value["url"]
+
+        data = file_opt.read(
+            str(file_path),
+            mapping_converter=MappingConverter(path=("mocked_apis", "apis"), prepare=_prepare, convert=_convert),
+        )
+        assert called == [("prepare", {"base": {"url": "/api"}}), ("convert", "foo"), ("convert", "bar")]
+        assert data["mocked_apis"] == {"base": {"url": "/api"}, "apis": {"foo": "/foo", "bar": "/bar"}, "template": {}}
+        assert data["other"] == {"apis": {"foo": {"url": "/foo"}}}
+
 
 class TestJSON(_FileOptTestSpec):
     @pytest.fixture(scope="function")
@@ -0,0 +1,86 @@
+import pathlib
+import threading
+from typing import Set
+
+import pytest
+
+from fake_api_server._utils.file.watch import FileWatcher
+
+
+class TestFileWatcher:
+    @pytest.fixture(scope="function")
+    def watched_file(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        watched_file = tmp_path / "api.yaml"
+        watched_file.write_text("name: test\n")
+        return watched_file
+
+    @pytest.fixture(scope="function")
+    def watcher(self, tmp_path: pathlib.Path, watched_file: pathlib.Path) -> FileWatcher:
+        return FileWatcher(files=[str(watched_file)], directories=[str(tmp_path)], extensions=(".yaml",))
+
+    def test_poll_without_changes(self, watcher: FileWatcher):
+        assert watcher.poll() == set()
+
+    def test_poll_modified_file(self, watcher: FileWatcher, watched_file: pathlib.Path):
+        watched_file.write_text("name: modified test\n")
+        assert watcher.poll() == {str(watched_file)}
+        # It only reports the changes once
+        assert watcher.poll() == set()
+
+    def test_poll_removed_file(self, watcher: FileWatcher, watched_file: pathlib.Path):
+        watched_file.unlink()
+        assert watcher.poll() == {str(watched_file)}
+
+    def test_poll_added_file(self, watcher: FileWatcher, tmp_path: pathlib.Path):
+        added_file = tmp_path / "foo-api.yaml"
+        added_file.write_text("url: /foo\n")
+        # It doesn't watch the file which doesn't have the extensions
+        (tmp_path / "foo-api.yaml.swp").write_text("")
+        assert watcher.poll() == {str(added_file)}
+        assert str(added_file) in watcher.files
+
+        # The added file would be watched
+        added_file.write_text("url: /new-foo\n")
+        assert watcher.poll() == {str(added_file)}
+
+    def test_poll_added_directory(self, watcher: FileWatcher, tmp_path: pathlib.Path):
+        added_directory = tmp_path / "foo"
+        added_directory.mkdir()
+        assert watcher.poll() == {str(added_directory)}
+
+    def test_add(self, watcher: FileWatcher, tmp_path: pathlib.Path):
+        other_file = tmp_path / "other.json"
+        other_file.write_text("{}")
+        watcher.add(files=[str(other_file)])
+        assert watcher.files == {str(tmp_path / "api.yaml"), str(other_file)}
+
+        other_file.write_text('{"key": "value"}')
+        assert watcher.poll() == {str(other_file)}
+
+    def test_start_and_stop(self, watcher: FileWatcher, watched_file: pathlib.Path):
+        all_changed_paths: Set[str] = set()
+        changed = threading.Event()
+
+        def _on_change(changed_paths: Set[str]) -> None:
+            all_changed_paths.update(changed_paths)
+            changed.set()
+
+        watcher.start(on_change=_on_change, interval=0.01)
+        try:
+            watched_file.write_text("name: modified test\n")
+            assert changed.wait(timeout=5)
+        finally:
+            watcher.stop()
+        assert all_changed_paths == {str(watched_file)}
+
+    def test_reset_after_fork(self, watcher: FileWatcher):
+        watcher.start(on_change=lambda _: None, interval=10)
+        parent_thread, parent_stop_event = watcher._thread, watcher._stop_event
+        # Simulate the child process which doesn't have the thread
+        watcher._reset_after_fork()
+        try:
+            assert watcher._thread is not None and watcher._thread is not parent_thread
+            assert watcher._thread.is_alive()
+        finally:
+            watcher.stop()
+            parent_stop_event.set()
@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+from fake_api_server._utils.memory import MemoryUsage, format_memory_usage, memory_usage
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="It reads the memory usage from procfs in Linux.")
+def test_memory_usage_in_linux():
+    usage = memory_usage()
+    assert usage.rss > 0
+    assert usage.shared is not None and usage.private is not None
+
+    assert memory_usage(pid=os.getpid()).rss > 0
+
+
+def test_memory_usage_of_not_exist_process():
+    usage = memory_usage(pid=-1)
+    assert usage == MemoryUsage(rss=None, shared=None, private=None)
+
+
+@pytest.mark.parametrize(
+    ("usage", "expected"),
+    [
+        (
+            MemoryUsage(rss=3 * 1024 * 1024, shared=2 * 1024 * 1024, private=1024 * 1024),
+            "RSS: 3.0 MB, shared: 2.0 MB, private: 1.0 MB",
+        ),
+        (MemoryUsage(rss=1024 * 1024, shared=None, private=None), "RSS: 1.0 MB, shared: unknown, private: unknown"),
+    ],
+)
+def test_format_memory_usage(usage: MemoryUsage, expected: str):
+    assert format_memory_usage(usage) == expected
@@ -19,6 +19,10 @@ from fake_api_server._utils.random import (
     RandomString,
     RandomURI,
     RandomUUID,
+    ValueSize,
+    seed_by_key,
+    seeded_iterator,
+    seeded_random,
 )
 from fake_api_server._utils.uri_protocol import IPVersion, URIScheme
 
@@ -143,3 +147,76 @@ class TestRandomIP(BaseRandomGeneratorTestSuite):
     def test_generate_with_invalid_version(self, generator: RandomURI):
         with pytest.raises(NotImplementedError):
             generator.generate(version="invalid IP protocol version")
+
+
+@pytest.mark.parametrize(
+    ("generator", "kwargs", "expect_regex"),
+    [
+        (RandomString, {"size": ValueSize(min=2, max=4)}, r"^\w{2,4}$"),
+        (RandomInteger, {"value_range": ValueSize(min=-9, max=9)}, r"^-?\d$"),
+        (RandomInteger, {"value_range": ValueSize(min=0, max=2**70)}, r"^\d{1,22}$"),
+        (
+            RandomBigDecimal,
+            {"integer_range": ValueSize(min=-99, max=99), "decimal_range": ValueSize(min=0, max=9)},
+            r"^-?\d{1,2}\.\d$",
+        ),
+        (RandomBoolean, {}, r"^(True|False)$"),
+        (RandomFromSequence, {"sequence": ["A", "B"]}, r"^(A|B)$"),
+        (RandomDate, {}, r"^\d{4}-\d{1,2}-\d{1,2}$"),
+        (RandomDateTime, {}, r"^\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}Z$"),
+        (RandomIP, {"version": IPVersion.IPv4}, r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$"),
+        (RandomIP, {"version": IPVersion.IPv6}, r"^((\d|[a-f]){4}:){7}(\d|[a-f]){4}$"),
+        (RandomUUID, {}, r"^\w{8}-\w{4}-\w{4}-\w{4}-\w{12}$"),
+    ],
+)
+def test_generate_many(generator: Type[BaseRandomGenerator], kwargs: dict, expect_regex: str):
+    values = generator.generate_many(50, **kwargs)
+    assert len(values) == 50
+    for value in values:
+        assert re.search(expect_regex, str(value)), f"The value *{value}* is not expected."
+    assert generator.generate_many(0, **kwargs) == []
+
+
+class TestSeededRandom:
+    def _generate_values(self) -> list:
+        return [
+            RandomString.generate(size=ValueSize(min=5, max=10)),
+            RandomInteger.generate_many(5, value_range=ValueSize(min=0, max=1000)),
+            RandomBigDecimal.generate(),
+            RandomFromSequence.generate(["A", "B", "C"]),
+            RandomIP.generate(IPVersion.IPv6),
+            RandomUUID.generate(),
+            RandomURI.generate(),
+        ]
+
+    def test_reproduce_values_with_same_seed(self):
+        with seeded_random(42):
+            values = self._generate_values()
+        with seeded_random(42):
+            assert self._generate_values() == values
+        with seeded_random(43):
+            assert self._generate_values() != values
+
+    def test_not_affect_global_random_state(self):
+        with seeded_random(42):
+            pass
+        assert RandomUUID.generate() != RandomUUID.generate()
+
+    def test_reproduce_values_with_seeded_iterator(self):
+        def _lazy_values():
+            for _ in range(3):
+                yield self._generate_values()
+
+        values = list(seeded_iterator(42, _lazy_values()))
+        # The other random values between generating them lazily don't affect them
+        reproduced_values = []
+        for value in seeded_iterator(42, _lazy_values()):
+            reproduced_values.append(value)
+            RandomUUID.generate()
+        assert reproduced_values == values
+        assert list(seeded_iterator(43, _lazy_values())) != values
+
+    def test_seed_by_key(self):
+        assert seed_by_key(42, "GET /foo") == seed_by_key(42, "GET /foo")
+        assert seed_by_key(42, "GET /foo") != seed_by_key(42, "GET /bar")
+        assert seed_by_key(42, "GET /foo") != seed_by_key(43, "GET /foo")
@@ -0,0 +1,73 @@
+import re
+from unittest.mock import Mock
+
+import pytest
+
+from fake_api_server._utils.random import DigitRange, ValueSize
+from fake_api_server._utils.regex import Regex_Cache, RegexCache
+from fake_api_server.model.api_config.value import ValueFormat
+
+
+class TestRegexCache:
+    @pytest.fixture(scope="function")
+    def cache(self) -> RegexCache:
+        return RegexCache(maxsize=2)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            RegexCache(maxsize=0)
+
+    def test_compile(self, cache: RegexCache):
+        regex = Mock(return_value=r"\d{1,3}")
+
+        pattern = cache.compile(key="integer", regex=regex)
+        assert isinstance(pattern, re.Pattern)
+        assert pattern.pattern == r"\d{1,3}"
+        assert cache.compile(key="integer", regex=regex) is pattern
+        regex.assert_called_once()
+
+        cache_info = cache.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+        assert cache_info.currsize == 1
+
+    def test_compile_with_different_flags(self, cache: RegexCache):
+        pattern = cache.compile(key="abc", regex=lambda: "abc")
+        pattern_ignore_case = cache.compile(key="abc", regex=lambda: "abc", flags=re.IGNORECASE)
+        assert pattern is not pattern_ignore_case
+        assert pattern_ignore_case.search("ABC")
+
+    def test_compile_over_maxsize(self, cache: RegexCache):
+        cache.compile(key="a", regex=lambda: "a")
+        cache.compile(key="b", regex=lambda: "b")
+        # Use *a* to let *b* be the least recently used one
+        cache.compile(key="a", regex=lambda: "a")
+        cache.compile(key="c", regex=lambda: "c")
+
+        assert cache.cache_info().currsize == 2
+        regex = Mock(return_value="b")
+        cache.compile(key="b", regex=regex)
+        regex.assert_called_once()
+        regex = Mock(return_value="a")
+        cache.compile(key="a", regex=regex)
+        regex.assert_called_once()
+
+    def test_compile_with_unhashable_key(self, cache: RegexCache):
+        pattern = cache.compile(key=(["unhashable"],), regex=lambda: "a")
+        assert pattern.pattern == "a"
+        assert cache.cache_info().currsize == 0
+
+    def test_clear(self, cache: RegexCache):
+        cache.compile(key="a", regex=lambda: "a")
+        cache.clear()
+        assert cache.cache_info() == (0, 0, 2, 0)
+
+
+def test_value_format_generate_regex_with_cache():
+    size = ValueSize(min=3, max=7)
+    hits = Regex_Cache.cache_info().hits
+    regex = ValueFormat.String.generate_regex(size=size)
+    assert ValueFormat.String.generate_regex(size=size) == regex
+    assert ValueFormat.String.compile_regex(size=size).pattern == regex
+    assert Regex_Cache.cache_info().hits >= hits + 2
+    assert ValueFormat.Integer.generate_regex(digit=DigitRange(integer=3, decimal=0)) == r"\d{1,3}"
@@ -0,0 +1,109 @@
+import pathlib
+import re
+import shutil
+import sys
+from argparse import Namespace
+from typing import Callable, List, Optional, Type
+from unittest.mock import Mock, patch
+
+import pytest
+
+# isort: off
+from test._values import SubCommand, _Test_Config
+from test.unit_test.command._base.process import BaseCommandProcessorTestSpec
+
+# isort: on
+
+from fake_api_server.command.rest_server.compile.process import SubCmdCompile
+from fake_api_server.command.subcommand import SubCommandLine
+from fake_api_server.model import SubcmdCompileArguments, load_config
+from fake_api_server.model.snapshot import ConfigSnapshot, default_snapshot_path
+from fake_api_server.model.subcmd_common import SysArg
+
+_Divided_Config_Dir = pathlib.Path(
+    pathlib.Path(__file__).parent.parent.parent.parent.parent,
+    "data",
+    "divide_test_load",
+    "has-base-info_and_tags_apply_test",
+)
+
+
+class TestSubCmdCompile(BaseCommandProcessorTestSpec):
+    @pytest.fixture(scope="function")
+    def cmd_ps(self) -> SubCmdCompile:
+        return SubCmdCompile()
+
+    @pytest.fixture(scope="function")
+    def config_path(self, tmp_path: pathlib.Path) -> str:
+        config_dir = tmp_path / "config"
+        shutil.copytree(_Divided_Config_Dir, config_dir)
+        # Let the divided configuration files be loaded from the copied directory
+        api_config_file = config_dir / "api.yaml"
+        api_config_file.write_text(
+            re.sub(r"base_file_path: '[^']*'", f"base_file_path: '{config_dir}/'", api_config_file.read_text())
+        )
+        return str(config_dir / "api.yaml")
+
+    @pytest.mark.parametrize("output_path", ["", "compiled.snapshot"])
+    def test_with_command_processor(
+        self, output_path: str, config_path: str, tmp_path: pathlib.Path, object_under_test: Callable
+    ):
+        kwargs = {
+            "config_path": config_path,
+            "output_path": str(tmp_path / output_path) if output_path else "",
+            "cmd_ps": object_under_test,
+        }
+        self._test_process(**kwargs)
+
+    @pytest.mark.parametrize("output_path", ["", "compiled.snapshot"])
+    def test_with_run_entry_point(
+        self, output_path: str, config_path: str, tmp_path: pathlib.Path, entry_point_under_test: Callable
+    ):
+        kwargs = {
+            "config_path": config_path,
+            "output_path": str(tmp_path / output_path) if output_path else "",
+            "cmd_ps": entry_point_under_test,
+        }
+        self._test_process(**kwargs)
+
+    def _test_process(self, config_path: str, output_path: str, cmd_ps: Callable):
+        with patch.object(sys, "argv", self._given_command_line()):
+            cmd_ps(Mock(), self._given_parser_args(config_path=config_path, output_path=output_path))
+
+        snapshot = ConfigSnapshot(config_path=config_path, snapshot_path=output_path or None)
+        assert pathlib.Path(output_path or default_snapshot_path(config_path)).exists()
+        assert snapshot.is_fresh()
+        assert snapshot.load().serialize() == load_config(config_path).serialize()
+
+    def test_compile_not_exist_config(self, cmd_ps: SubCmdCompile, tmp_path: pathlib.Path):
+        with patch.object(sys, "argv", self._given_command_line()):
+            with pytest.raises(SystemExit) as exc_info:
+                cmd_ps.process(Mock(), self._given_parser_args(config_path=str(tmp_path / "not-exist.yaml")))
+        assert exc_info.value.code == 1
+
+    def _given_command_line(self) -> List[str]:
+        return ["rest-server", "compile"]
+
+    def _given_parser_args(self, config_path: Optional[str] = None, output_path: str = "") -> SubcmdCompileArguments:
+        return SubcmdCompileArguments(
+            subparser_structure=SysArg.parse([SubCommand.RestServer, SubCommand.Compile]),
+            config_path=(config_path or _Test_Config),
+            output_path=output_path,
+        )
+
+    def _given_cmd_args_namespace(self) -> Namespace:
+        args_namespace = Namespace()
+        args_namespace.subcommand = SubCommand.RestServer
+        setattr(args_namespace, SubCommand.RestServer, SubCommand.Compile)
+        args_namespace.config_path = _Test_Config
+        args_namespace.output_path = ""
+        return args_namespace
+
+    def _given_subcmd(self) -> Optional[SysArg]:
+        return SysArg(
+            pre_subcmd=SysArg(pre_subcmd=SysArg(subcmd=SubCommandLine.Base), subcmd=SubCommandLine.RestServer),
+            subcmd=SubCommandLine.Compile,
+        )
+
+    def _expected_argument_type(self) -> Type[SubcmdCompileArguments]:
+        return SubcmdCompileArguments
@@ -17,6 +17,11 @@ from test._values import (
     _Workers_Amount,
     _Daemon,
     _Access_Log_File,
+    _Preload,
+    _Watch,
+    _Lazy_Loading,
+    _Metrics_Path,
+    _Snapshot,
 )
 from test.unit_test.command._base.process import BaseCommandProcessorTestSpec
 
@@ -40,6 +45,7 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
             (_Test_App_Type, False),
             (_Test_FastAPI_App_Type, False),
             (_Test_Auto_Type, False),
+            ("asgi", False),
             ("invalid app-type which is not a Python web library or framework", True),
         ],
     )
@@ -57,6 +63,7 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
             (_Test_App_Type, False),
             (_Test_FastAPI_App_Type, False),
             (_Test_Auto_Type, False),
+            ("asgi", False),
             ("invalid app-type which is not a Python web library or framework", True),
         ],
     )
@@ -92,7 +99,7 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
                         elif app_type == "flask":
                             mock_asgi_generate.assert_not_called()
                             mock_wsgi_generate.assert_called_once_with(mock_parser_arg)
-                        elif app_type == "fastapi":
+                        elif app_type in ("fastapi", "asgi"):
                             mock_asgi_generate.assert_called_once_with(mock_parser_arg)
                             mock_wsgi_generate.assert_not_called()
                         else:
@@ -139,6 +146,11 @@ class TestSubCmdRun(BaseCommandProcessorTestSpec):
         args_namespace.log_level = _Log_Level.value
         args_namespace.daemon = _Daemon.value
         args_namespace.access_log_file = _Access_Log_File.value
+        args_namespace.preload = _Preload.value
+        args_namespace.watch = _Watch.value
+        args_namespace.lazy_loading = _Lazy_Loading.value
+        args_namespace.metrics_path = _Metrics_Path.value
+        args_namespace.snapshot = _Snapshot.value
         return args_namespace
 
     def _given_subcmd(self) -> Optional[SysArg]:
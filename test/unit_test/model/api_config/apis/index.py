@@ -0,0 +1,101 @@
+import copy
+import pickle
+from typing import Dict, List, Optional
+
+import pytest
+
+from fake_api_server.model import MockAPI
+from fake_api_server.model.api_config.apis.index import IndexedMockAPIs
+from fake_api_server.model.api_config.apis.lazy import LazyMockAPI, is_deserialized
+
+
+def _mock_api(url: str, method: str, tag: str = "") -> MockAPI:
+    api_config = MockAPI(url=url, tag=tag)
+    api_config.set_request(method=method)
+    return api_config
+
+
+def _urls(apis: IndexedMockAPIs) -> Dict[Optional[str], List[str]]:
+    return {url: list(apis.keys_by_url(url)) for url in apis.urls()}
+
+
+class TestIndexedMockAPIs:
+    @pytest.fixture(scope="function")
+    def apis(self) -> IndexedMockAPIs:
+        return IndexedMockAPIs(
+            {
+                "get_foo": _mock_api("/foo", "GET", tag="foo"),
+                "post_foo": _mock_api("/foo", "post", tag="foo"),
+                "get_boo": _mock_api("/boo", "GET"),
+                "no_api": None,
+            }
+        )
+
+    def test_look_up(self, apis: IndexedMockAPIs):
+        assert isinstance(apis, dict)
+        assert _urls(apis) == {"/foo": ["get_foo", "post_foo"], "/boo": ["get_boo"]}
+        assert apis.has_url("/foo") and not apis.has_url("/not-exist")
+        assert apis.get_by_url("/foo") is apis["get_foo"]
+        assert apis.get_by_url("/not-exist") is None
+        assert apis.get_all_by_url("/foo") == {"GET": apis["get_foo"], "POST": apis["post_foo"]}
+        assert apis.get_by_url_and_method("/foo", "Post") is apis["post_foo"]
+        assert apis.get_by_url_and_method("/boo", "POST") is None
+        assert apis.get_all_by_tag("foo") == [apis["get_foo"], apis["post_foo"]]
+        assert apis.get_all_by_tag("") == [apis["get_boo"]]
+
+    def test_set_and_remove(self, apis: IndexedMockAPIs):
+        apis.get_by_url("/foo")
+
+        # Add new one
+        apis["put_foo"] = _mock_api("/foo", "PUT")
+        assert _urls(apis)["/foo"] == ["get_foo", "post_foo", "put_foo"]
+        assert apis.get_by_url_and_method("/foo", "PUT") is apis["put_foo"]
+
+        # Replace with the same URL
+        new_get_foo = _mock_api("/foo", "GET")
+        apis["get_foo"] = new_get_foo
+        assert _urls(apis)["/foo"] == ["get_foo", "post_foo", "put_foo"]
+        assert apis.get_by_url("/foo") is new_get_foo
+
+        # Replace with the different URL
+        apis["get_foo"] = _mock_api("/new-foo", "GET")
+        assert _urls(apis) == {"/foo": ["post_foo", "put_foo"], "/boo": ["get_boo"], "/new-foo": ["get_foo"]}
+        assert apis.get_by_url("/foo") is apis["post_foo"]
+
+        # Remove
+        del apis["post_foo"]
+        assert apis.pop("put_foo") is not None
+        assert apis.pop("put_foo", None) is None
+        with pytest.raises(KeyError):
+            apis.pop("put_foo")
+        assert not apis.has_url("/foo")
+        assert apis.get_all_by_url("/foo") == {}
+
+        apis.update({"get_foo": _mock_api("/foo", "GET", tag="foo")})
+        assert apis.get_by_url_and_method("/foo", "GET") is apis["get_foo"]
+        assert apis.get_all_by_tag("foo") == [apis["get_foo"]]
+
+        apis.clear()
+        assert list(apis.urls()) == []
+
+    def test_same_url_and_method(self):
+        apis = IndexedMockAPIs({"get_foo": _mock_api("/foo", "GET"), "get_foo_again": _mock_api("/foo", "GET")})
+        # The last one is used as before
+        assert apis.get_by_url_and_method("/foo", "GET") is apis["get_foo_again"]
+        del apis["get_foo_again"]
+        assert apis.get_by_url_and_method("/foo", "GET") is apis["get_foo"]
+
+    def test_lazy_mock_api(self):
+        lazy_api = LazyMockAPI(url="/foo", method="get", source="api.yaml", deserialize=lambda: None)
+        apis = IndexedMockAPIs({"get_foo": lazy_api})
+        assert apis.get_by_url_and_method("/foo", "GET") is lazy_api
+        # Looking it up by URL and HTTP method doesn't deserialize it
+        assert not is_deserialized(lazy_api)
+
+    @pytest.mark.parametrize("copy_function", [lambda o: pickle.loads(pickle.dumps(o)), copy.deepcopy, copy.copy])
+    def test_copy(self, apis: IndexedMockAPIs, copy_function):
+        apis.get_by_url("/foo")
+        copied_apis = copy_function(apis)
+        assert type(copied_apis) is IndexedMockAPIs
+        assert list(copied_apis.keys()) == list(apis.keys())
+        assert _urls(copied_apis) == _urls(apis)
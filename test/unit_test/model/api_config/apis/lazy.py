@@ -0,0 +1,120 @@
+import pathlib
+import pickle
+import shutil
+from typing import List, Optional
+
+import pytest
+
+from fake_api_server._utils import YAML
+from fake_api_server.model import FakeAPIConfig, MockAPI, load_config
+from fake_api_server.model.api_config.apis.lazy import (
+    LazyMockAPI,
+    http_method,
+    is_deserialized,
+    lazy_mock_api,
+)
+
+# isort: off
+from test._values import _Test_URL, _TestConfig
+
+# isort: on
+
+_Divided_Config_Name = "has-base-info_and_tags_no_mocked_apis_with_divide_http_test"
+_Divided_Config_Dir = pathlib.Path(
+    pathlib.Path(__file__).parent.parent.parent.parent.parent,
+    "data",
+    "divide_test_load",
+    _Divided_Config_Name,
+)
+
+
+class TestLazyMockAPI:
+    @pytest.fixture(scope="function")
+    def deserialized_times(self) -> List[int]:
+        return []
+
+    @pytest.fixture(scope="function")
+    def lazy_api(self, deserialized_times: List[int]) -> LazyMockAPI:
+        def _deserialize() -> Optional[MockAPI]:
+            deserialized_times.append(1)
+            return MockAPI().deserialize(_TestConfig.Mock_API)
+
+        return LazyMockAPI(url=_Test_URL, method="GET", source="test_config", deserialize=_deserialize)
+
+    def test_stub_attributes(self, lazy_api: LazyMockAPI, deserialized_times: List[int]):
+        assert isinstance(lazy_api, MockAPI)
+        assert lazy_api.url == _Test_URL
+        assert lazy_api.method == "GET"
+        assert lazy_api.source == "test_config"
+        assert http_method(lazy_api) == "GET"
+        assert repr(lazy_api) == f"LazyMockAPI(url='{_Test_URL}', method='GET', source='test_config')"
+        assert not is_deserialized(lazy_api)
+        assert deserialized_times == []
+
+    def test_deserialize_when_using(self, lazy_api: LazyMockAPI, deserialized_times: List[int]):
+        assert lazy_api.http.request.method == "GET"
+        assert type(lazy_api) is MockAPI
+        assert is_deserialized(lazy_api)
+        assert lazy_api.serialize() == MockAPI().deserialize(_TestConfig.Mock_API).serialize()
+
+        # It only deserializes once
+        assert lazy_api.tag == _TestConfig.Mock_API["tag"]
+        assert deserialized_times == [1]
+
+    def test_pickle(self, lazy_api: LazyMockAPI):
+        api_config = pickle.loads(pickle.dumps(lazy_api))
+        assert type(api_config) is MockAPI
+        assert api_config.url == _Test_URL
+
+    def test_deserialize_empty_config(self):
+        lazy_api = LazyMockAPI(url=_Test_URL, method="GET", source="empty", deserialize=lambda: None)
+        with pytest.raises(ValueError) as exc_info:
+            lazy_api.deserialize_now()
+        assert "empty" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    ("data", "is_lazy"),
+    [
+        (_TestConfig.Mock_API, True),
+        # The HTTP settings are in the other divided file
+        ({"url": _Test_URL}, False),
+        ({"url": _Test_URL, "http": {"request": {}}}, False),
+        (None, False),
+    ],
+)
+def test_lazy_mock_api(data: Optional[dict], is_lazy: bool):
+    lazy_api = lazy_mock_api(data, source="test_config", deserialize=lambda: None)
+    assert (lazy_api is not None) is is_lazy
+
+
+def test_load_config_lazily(tmp_path: pathlib.Path):
+    config_path = tmp_path / "api.yaml"
+    YAML().write(path=str(config_path), config=_TestConfig.API_Config)
+
+    api_config = load_config(str(config_path), lazy=True)
+    assert isinstance(api_config, FakeAPIConfig)
+    lazy_api = api_config.apis.apis["test_config"]
+    assert not is_deserialized(lazy_api)
+    assert api_config.apis.get_api_config_by_url(_Test_URL) is lazy_api
+    assert api_config.serialize() == load_config(str(config_path)).serialize()
+    assert is_deserialized(lazy_api)
+
+
+def test_load_divided_config_lazily(tmp_path: pathlib.Path):
+    config_dir = tmp_path / "config"
+    shutil.copytree(_Divided_Config_Dir, config_dir)
+    # Let all the divided configuration files be loaded from the copied directory
+    for config_file in config_dir.glob("**/*.yaml"):
+        config_file.write_text(
+            config_file.read_text().replace(f"./test/data/divide_test_load/{_Divided_Config_Name}", str(config_dir))
+        )
+
+    api_config = load_config(str(config_dir / "api.yaml"), lazy=True)
+    assert isinstance(api_config, FakeAPIConfig)
+    apis = api_config.apis.apis
+    # The HTTP method of *get_foo* is in its divided request file
+    assert is_deserialized(apis["get_foo"])
+    assert not is_deserialized(apis["put_foo"])
+    assert apis["put_foo"].source == str(config_dir / "foo" / "put_foo-api.yaml")
+    assert api_config.serialize() == load_config(str(config_dir / "api.yaml")).serialize()
@@ -1,3 +1,4 @@
+import dataclasses
 import random
 import re
 from typing import Any, Type
@@ -6,7 +7,14 @@ import pytest
 
 from fake_api_server.model.api_config import ResponseProperty, _Config
 from fake_api_server.model.api_config._base import _HasItemsPropConfig
-from fake_api_server.model.api_config.apis import HTTPResponse, ResponseStrategy
+from fake_api_server.model.api_config.apis import (
+    HTTPResponse,
+    Latency,
+    LatencyDistribution,
+    ResponseStrategy,
+    StreamFormat,
+    ValuePool,
+)
 
 # isort: off
 from test._values import (
@@ -288,6 +296,10 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
                 HTTPResponse(strategy=ResponseStrategy.FILE, path="file path"),
                 {"strategy": ResponseStrategy.FILE.value, "path": "file path"},
             ),
+            (
+                HTTPResponse(strategy=ResponseStrategy.FILE, path="file path", stream=True),
+                {"strategy": ResponseStrategy.FILE.value, "path": "file path", "stream": True},
+            ),
             (
                 HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=MockModel().response_properties),
                 {
@@ -295,6 +307,20 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
                     "properties": [p.serialize() for p in MockModel().response_properties],
                 },
             ),
+            (
+                HTTPResponse(
+                    strategy=ResponseStrategy.OBJECT,
+                    properties=MockModel().response_properties,
+                    stream=True,
+                    stream_format=StreamFormat.NDJSON,
+                ),
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "stream": True,
+                    "stream_format": StreamFormat.NDJSON.value,
+                },
+            ),
         ],
     )
     def test_serialize_with_strategy(self, response: HTTPResponse, expected_data: dict):
@@ -311,6 +337,10 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
                 {"strategy": ResponseStrategy.FILE.value, "path": "file path"},
                 HTTPResponse(strategy=ResponseStrategy.FILE, path="file path"),
             ),
+            (
+                {"strategy": ResponseStrategy.FILE.value, "path": "file path", "stream": True},
+                HTTPResponse(strategy=ResponseStrategy.FILE, path="file path", stream=True),
+            ),
             (
                 {
                     "strategy": ResponseStrategy.OBJECT.value,
@@ -318,11 +348,81 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
                 },
                 HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=MockModel().response_properties),
             ),
+            (
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "stream": True,
+                },
+                HTTPResponse(
+                    strategy=ResponseStrategy.OBJECT,
+                    properties=MockModel().response_properties,
+                    stream=True,
+                    stream_format=StreamFormat.JSON,
+                ),
+            ),
+            (
+                {
+                    "strategy": ResponseStrategy.OBJECT.value,
+                    "properties": [p.serialize() for p in MockModel().response_properties],
+                    "stream": True,
+                    "stream_format": "ndjson",
+                },
+                HTTPResponse(
+                    strategy=ResponseStrategy.OBJECT,
+                    properties=MockModel().response_properties,
+                    stream=True,
+                    stream_format=StreamFormat.NDJSON,
+                ),
+            ),
         ],
     )
     def test_valid_deserialize_with_strategy(self, data: dict, expected_response: HTTPResponse):
         assert HTTPResponse().deserialize(data=data) == expected_response
 
+    def test_compare_stream_file(self):
+        assert HTTPResponse(strategy=ResponseStrategy.FILE, path="file path", stream=True) != HTTPResponse(
+            strategy=ResponseStrategy.FILE, path="file path"
+        )
+
+    def test_invalid_stream_file(self, tmp_path):
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(b"\x00\x01")
+        response = HTTPResponse(strategy=ResponseStrategy.FILE, path=str(file_path), stream=True)
+        response.stop_if_fail = False
+        assert response.is_work() is True
+        response.stream = "true"
+        assert response.is_work() is False
+
+    def test_compare_stream_object(self):
+        properties = MockModel().response_properties
+        assert HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=properties, stream=True) != HTTPResponse(
+            strategy=ResponseStrategy.OBJECT, properties=properties
+        )
+        assert HTTPResponse(
+            strategy=ResponseStrategy.OBJECT, properties=properties, stream=True, stream_format=StreamFormat.NDJSON
+        ) != HTTPResponse(strategy=ResponseStrategy.OBJECT, properties=properties, stream=True)
+
+    def test_invalid_stream_object(self):
+        list_property = ResponseProperty(
+            name="users",
+            required=True,
+            value_type="list",
+            items=[{"name": "id", "required": True, "type": "int"}],
+        )
+        response = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT, properties=[list_property], stream=True, stream_format="ndjson"
+        )
+        response.stop_if_fail = False
+        assert response.stream_format is StreamFormat.NDJSON
+        assert response.is_work() is True
+        # NDJSON streams the elements of the only one list
+        response.properties = [ResponseProperty(name="message", required=True, value_type="str"), list_property]
+        assert response.is_work() is False
+        response.properties = [list_property]
+        response.stream = "true"
+        assert response.is_work() is False
+
     def test_deserialize_with_missing_strategy(self):
         with pytest.raises(ValueError):
             HTTPResponse().deserialize(data={"miss strategy": ""})
@@ -332,3 +432,131 @@ class TestHTTPResponse(TemplatableConfigTestSuite, CheckableTestSuite):
             sut_with_nothing.strategy = "invalid strategy"
             sut_with_nothing.serialize()
         assert re.search(r".{0,128}data type is invalid.{0,128}", str(exc_info.value), re.IGNORECASE)
+
+
+class TestValuePool:
+    def test_deserialize_in_http_response(self):
+        response = HTTPResponse().deserialize(
+            {
+                "strategy": "object",
+                "properties": [{"name": "id", "required": True, "type": "int"}],
+                "pool": {"size": 100, "watermark": 10},
+            }
+        )
+        assert response.pool == ValuePool(size=100, watermark=10)
+        assert response.serialize()["pool"] == {"size": 100, "watermark": 10}
+
+    def test_not_serialize_if_no_pool(self):
+        response = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[ResponseProperty(name="id", required=True, value_type="int")],
+        )
+        assert "pool" not in response.serialize()
+
+    def test_deserialize_with_default_values(self):
+        pool = ValuePool().deserialize({"size": 10})
+        assert pool.size == 10
+        assert pool.watermark == ValuePool._default_watermark
+
+    def test_default_values_are_not_fields(self):
+        assert [field.name for field in dataclasses.fields(ValuePool)] == ["size", "watermark"]
+        assert ValuePool() == ValuePool(size=ValuePool._default_size, watermark=ValuePool._default_watermark)
+
+    @pytest.mark.parametrize(
+        ("size", "watermark", "is_work"),
+        [
+            (100, 10, True),
+            (100, 0, True),
+            (0, 0, False),
+            ("100", 10, False),
+            (100, 100, False),
+            (100, -1, False),
+        ],
+    )
+    def test_is_work(self, size: Any, watermark: Any, is_work: bool):
+        pool = ValuePool(size=size, watermark=watermark)
+        pool.stop_if_fail = False
+        assert pool.is_work() is is_work
+
+
+class TestLatency:
+    @pytest.mark.parametrize(
+        "strategy_data", [{"strategy": "string", "value": "OK"}, {"strategy": "file", "path": "a"}]
+    )
+    def test_deserialize_in_http_response(self, strategy_data: dict):
+        latency_data = {"distribution": "uniform", "min": 0.1, "max": 0.5, "bandwidth": 1024}
+        response = HTTPResponse().deserialize({**strategy_data, "latency": latency_data})
+        assert response.latency == Latency(distribution=LatencyDistribution.UNIFORM, min=0.1, max=0.5, bandwidth=1024)
+        assert response.serialize()["latency"] == latency_data
+
+    def test_not_serialize_if_no_latency(self):
+        response = HTTPResponse(strategy=ResponseStrategy.STRING, value="OK")
+        assert response.latency is None
+        assert "latency" not in response.serialize()
+
+    def test_compare_in_http_response(self):
+        response = HTTPResponse(strategy=ResponseStrategy.STRING, value="OK", latency={"distribution": "fixed"})
+        assert response != HTTPResponse(strategy=ResponseStrategy.STRING, value="OK")
+        assert response == HTTPResponse(
+            strategy=ResponseStrategy.STRING, value="OK", latency=Latency(distribution=LatencyDistribution.FIXED)
+        )
+
+    def test_invalid_set_latency(self):
+        with pytest.raises(TypeError) as exc_info:
+            HTTPResponse(strategy=ResponseStrategy.STRING, value="OK", latency="invalid")
+        assert re.search(r"data type .{0,32}latency.{0,32} must be dict or Latency", str(exc_info.value), re.IGNORECASE)
+
+    @pytest.mark.parametrize(
+        ("data", "expected_data"),
+        [
+            ({"distribution": "fixed", "value": 0.2}, {"distribution": "fixed", "value": 0.2}),
+            (
+                {"distribution": "normal", "mean": 1, "stddev": 0.3},
+                {"distribution": "normal", "mean": 1, "stddev": 0.3},
+            ),
+            (
+                {"distribution": "percentile", "percentiles": {50: 0.1, 99: 2}},
+                {"distribution": "percentile", "percentiles": {50: 0.1, 99: 2}},
+            ),
+            # Only the settings of the distribution would be serialized
+            ({"distribution": "fixed", "min": 1, "max": 2}, {"distribution": "fixed", "value": 0}),
+            ({"bandwidth": 100}, {"bandwidth": 100}),
+        ],
+    )
+    def test_serialize(self, data: dict, expected_data: dict):
+        assert Latency().deserialize(data).serialize() == expected_data
+
+    @pytest.mark.parametrize(
+        ("data", "is_work"),
+        [
+            ({"distribution": "fixed", "value": 0.5}, True),
+            ({"distribution": "fixed", "value": -1}, False),
+            ({"distribution": "fixed", "value": "1"}, False),
+            ({"distribution": "uniform", "min": 0.1, "max": 0.5}, True),
+            ({"distribution": "uniform", "min": 0.5, "max": 0.1}, False),
+            ({"distribution": "normal", "mean": 0.2, "stddev": 0.05}, True),
+            ({"distribution": "normal", "mean": 0.2, "stddev": -0.05}, False),
+            ({"distribution": "percentile", "percentiles": {50: 0.1, 90: 0.5, 100: 1}}, True),
+            ({"distribution": "percentile", "percentiles": {}}, False),
+            ({"distribution": "percentile", "percentiles": {0: 0.1}}, False),
+            ({"distribution": "percentile", "percentiles": {101: 0.1}}, False),
+            ({"distribution": "percentile", "percentiles": {50: 0.5, 90: 0.1}}, False),
+            ({"distribution": "fixed", "value": 0.1, "bandwidth": 1024}, True),
+            ({"bandwidth": 1024}, True),
+            ({"bandwidth": 0}, False),
+            ({"bandwidth": 10.5}, False),
+            ({}, False),
+        ],
+    )
+    def test_is_work(self, data: dict, is_work: bool):
+        latency = Latency()
+        latency.distribution = None
+        for key, value in data.items():
+            setattr(latency, key, LatencyDistribution(value) if key == "distribution" else value)
+        latency.stop_if_fail = False
+        assert latency.is_work() is is_work
+
+    def test_is_work_in_http_response(self):
+        response = HTTPResponse(strategy=ResponseStrategy.STRING, value="OK", latency={"bandwidth": -1})
+        response.stop_if_fail = False
+        assert response.is_work() is False
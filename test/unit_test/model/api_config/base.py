@@ -30,3 +30,19 @@ class TestBaseConfig(CheckableTestSuite):
     def _expected_deserialize_value(self, obj: BaseConfig) -> None:
         assert isinstance(obj, BaseConfig)
         assert obj.url == _Base_URL
+
+    def test_serialize_with_seed(self):
+        base_config = BaseConfig().deserialize({"url": _Base_URL, "seed": 42, "seed_cache_size": 16})
+        assert base_config.seed == 42
+        assert base_config.seed_cache_size == 16
+        assert base_config.serialize() == {"url": _Base_URL, "seed": 42, "seed_cache_size": 16}
+        assert base_config.is_work() is True
+
+    @pytest.mark.parametrize(("seed", "seed_cache_size"), [("42", 0), (True, 0), (42, -1)])
+    def test_invalid_seed_setting(self, seed: object, seed_cache_size: object, caplog: pytest.LogCaptureFixture):
+        base_config = BaseConfig(url=_Base_URL, seed=seed, seed_cache_size=seed_cache_size)
+        base_config.absolute_model_key = "mocked_apis"
+        base_config.stop_if_fail = False
+        assert base_config.is_work() is False
+        invalid_key = "seed" if seed != 42 else "seed_cache_size"
+        assert f"Configuration *mocked_apis.base.{invalid_key}* setting is invalid." in caplog.text
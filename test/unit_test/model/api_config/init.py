@@ -1,3 +1,4 @@
+import pathlib
 import re
 from typing import Any, List, Union
 from unittest.mock import Mock, patch
@@ -5,6 +6,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from fake_api_server import FakeAPIConfig
+from fake_api_server._utils import YAML
 from fake_api_server.model import BaseConfig, MockAPI, MockAPIs
 from fake_api_server.model.api_config import TemplateConfig
 
@@ -148,7 +150,9 @@ class TestFakeAPIConfig(CheckableTestSuite):
     @patch("fake_api_server._utils.file.operation.YAML.read", return_value=_TestConfig.API_Config)
     def test_from_yaml_file(self, mock_read_yaml: Mock, sut: FakeAPIConfig):
         config = sut.from_yaml(path="test-api.yaml")
-        mock_read_yaml.assert_called_once_with("test-api.yaml")
+        mock_read_yaml.assert_called_once()
+        assert mock_read_yaml.call_args.args == ("test-api.yaml",)
+        assert mock_read_yaml.call_args.kwargs["mapping_converter"].path == ("mocked_apis", "apis")
         assert isinstance(config, FakeAPIConfig)
         assert config.name == _Config_Name
         assert config.description == _Config_Description
@@ -156,6 +160,34 @@ class TestFakeAPIConfig(CheckableTestSuite):
         expected_data = self._clean_prop_with_empty_value(_TestConfig.Mock_APIs)
         assert clean_api_config == expected_data
 
+    @pytest.mark.parametrize(
+        ("template_is_before_apis", "read_times"),
+        [
+            (True, 1),
+            # It needs to parse the file again to deserialize the mocked APIs with section *template*
+            (False, 2),
+        ],
+    )
+    def test_from_yaml_file_with_deserializing_apis_while_parsing(
+        self, tmp_path: pathlib.Path, template_is_before_apis: bool, read_times: int
+    ):
+        mocked_apis = _TestConfig.Mock_APIs
+        sections = ["template", "base", "apis"] if template_is_before_apis else ["base", "apis", "template"]
+        api_config = dict(_TestConfig.API_Config)
+        api_config["mocked_apis"] = {section: mocked_apis[section] for section in sections}
+        config_path = tmp_path / "api.yaml"
+        YAML().write(path=str(config_path), config=api_config)
+
+        with patch(
+            "fake_api_server._utils.file.operation.YAML.read", autospec=True, side_effect=YAML.read
+        ) as mock_read:
+            config = FakeAPIConfig().from_yaml(path=str(config_path))
+        assert mock_read.call_count == read_times
+        assert isinstance(config, FakeAPIConfig)
+        assert config.apis.template is config.apis.apis["test_config"]._current_template
+        expected_config = FakeAPIConfig().deserialize(data=api_config)
+        assert config.serialize() == expected_config.serialize()
+
     @patch("fake_api_server._utils.file.operation.YAML.write", return_value=None)
     def test_to_yaml_file(self, mock_write_yaml: Mock, sut: FakeAPIConfig):
         sut.to_yaml(path=_Test_Config)
@@ -395,6 +427,34 @@ class TestMockAPIs(CheckableTestSuite, DividableTestSuite):
         ]
         assert [a.http.request.method for a in aggregated_apis["/foo-boo"]] == [foo_boo_api.http.request.method]
 
+    def test_get_api_config_by_url_and_method(self, sut_with_nothing: MockAPIs):
+        foo_get_api = MockAPI(url="/foo", tag="foo")
+        foo_get_api.set_request(method="GET")
+        foo_post_api = MockAPI(url="/foo", tag="foo")
+        foo_post_api.set_request(method="POST")
+        sut_with_nothing.apis = {"get_foo": foo_get_api, "post_foo": foo_post_api}
+        base = BaseConfig(url="/api")
+
+        assert sut_with_nothing.has_api_url("/api/foo", base=base)
+        assert not sut_with_nothing.has_api_url("/api/boo", base=base)
+        assert sut_with_nothing.get_api_config_by_url("/api/foo", base=base) is foo_get_api
+        assert sut_with_nothing.get_api_config_by_url_and_method("/api/foo", "post", base=base) is foo_post_api
+        assert sut_with_nothing.get_api_config_by_url_and_method("/api/foo", "PUT", base=base) is None
+        assert sut_with_nothing.get_all_api_config_by_url("/api/foo", base=base) == {
+            "GET": foo_get_api,
+            "POST": foo_post_api,
+        }
+        assert sut_with_nothing.get_all_api_config_by_tag("foo") == [foo_get_api, foo_post_api]
+
+        # The indexes are kept in sync when setting the mocked APIs
+        foo_put_api = MockAPI(url="/foo")
+        foo_put_api.set_request(method="PUT")
+        sut_with_nothing.apis["put_foo"] = foo_put_api
+        assert sut_with_nothing.get_api_config_by_url_and_method("/foo", "PUT") is foo_put_api
+        assert sut_with_nothing.get_all_api_config_by_tag("foo") == [foo_get_api, foo_post_api]
+        sut_with_nothing._set_mocked_apis()
+        assert sut_with_nothing.get_api_config_by_url("/foo") is None
+
     @property
     def _lower_layer_data_modal_for_divide(self) -> MockAPI:
         return self._Mock_Model.mock_api["test_config"]
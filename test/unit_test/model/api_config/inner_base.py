@@ -1,3 +1,5 @@
+import copy
+import pickle
 import re
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock
@@ -5,6 +7,11 @@ from unittest.mock import MagicMock
 import pytest
 
 from fake_api_server.model.api_config import _Checkable, _Config
+from fake_api_server.model.api_config._base import _BaseConfig
+from fake_api_server.model.api_config.apis import APIParameter, ResponseProperty
+from fake_api_server.model.api_config.format import Format
+from fake_api_server.model.api_config.item import IteratorItem
+from fake_api_server.model.api_config.variable import Digit, Size, Variable
 
 
 @pytest.mark.parametrize(
@@ -75,3 +82,78 @@ class TestCheckableConfig:
             valid_callback=mock_callback_func,
         )
         mock_callback_func.assert_called_once_with("key", "invalid value", ["invalid value"])
+
+
+class TestSlots:
+    @pytest.fixture(scope="function")
+    def response_property(self) -> ResponseProperty:
+        response_property = ResponseProperty()
+        response_property.absolute_model_key = "response"
+        return response_property.deserialize(
+            {
+                "name": "values",
+                "required": True,
+                "type": "list",
+                "items": [{"name": "value", "required": True, "type": "str"}],
+                "format": None,
+            }
+        )
+
+    @pytest.mark.parametrize(
+        "data_model", [APIParameter, ResponseProperty, IteratorItem, Format, Digit, Size, Variable]
+    )
+    def test_no_dict(self, data_model: type):
+        assert "__slots__" in data_model.__dict__
+        assert not hasattr(data_model(), "__dict__")
+
+    def test_inherited_slots(self):
+        # The subclass only has its own attribute, the others are in the slots of parent class
+        assert APIParameter.__slots__ == ("default",)
+        assert ResponseProperty.__slots__ == ("is_empty",)
+
+    def test_super_in_methods(self, response_property: ResponseProperty):
+        # The methods use *super()* without arguments, e.g., *serialize* of all the parent classes
+        assert response_property.serialize() == {
+            "name": "values",
+            "required": True,
+            "type": "list",
+            "items": [{"name": "value", "required": True, "type": "str"}],
+        }
+        assert response_property.is_work() is True
+
+    def test_attribute_if_not_set(self):
+        digit = Digit()
+        # It hasn't been set, so it gets the default value
+        assert digit.stop_if_fail is None
+        assert digit.absolute_model_key == ""
+        digit.stop_if_fail = True
+        assert digit.stop_if_fail is True
+        with pytest.raises(AttributeError):
+            digit.not_exist_attribute
+        with pytest.raises(AttributeError):
+            digit.not_exist_attribute = "value"
+
+    def test_absolute_model_key(self, response_property: ResponseProperty):
+        assert response_property.absolute_model_key == "response.properties.<property item>"
+        another_property = ResponseProperty()
+        another_property.absolute_model_key = "response"
+        # The same keys share one string object
+        assert another_property.absolute_model_key is response_property.absolute_model_key
+
+    def test_pickle_and_copy(self, response_property: ResponseProperty):
+        for copied_property in (
+            pickle.loads(pickle.dumps(response_property)),
+            copy.deepcopy(response_property),
+            copy.copy(response_property),
+        ):
+            assert type(copied_property) is ResponseProperty
+            assert copied_property == response_property
+            assert copied_property.absolute_model_key == response_property.absolute_model_key
+            # It doesn't keep the attribute which hasn't been set
+            assert copied_property.stop_if_fail is None
+
+    def test_mixin_classes_without_dict(self):
+        # The mixin classes only have empty *__slots__*, so they could be inherited together
+        for mixin_class in (_Config, _Checkable, _BaseConfig):
+            assert "__dict__" not in mixin_class.__dict__
+        assert _Config.__slots__ == _Checkable.__slots__ == ()
@@ -323,6 +323,17 @@ class TestTemplateFormatConfig(CheckableTestSuite):
         ut_variable = sut.get_variable(name="not exist name")
         assert ut_variable is None
 
+    def test_get_by_name_after_modifying(self, sut: TemplateFormatConfig):
+        assert sut.get_format(name="new_format") is None
+        assert sut.get_variable(name="new_variable") is None
+
+        new_format = TemplateFormatEntity(name="new_format", config=_General_Format)
+        sut.entities.append(new_format)
+        sut.variables = [Variable(name="new_variable")]
+        assert sut.get_format(name="new_format") is new_format.config
+        assert sut.get_variable(name="new_variable") is sut.variables[0]
+        assert sut.get_variable(name="currency_code") is None
+
 
 class TestTemplateCommonConfig(CheckableTestSuite):
     test_data_dir = ("template_sections", "template_common_config")
@@ -1,13 +1,21 @@
+import glob
+import pathlib
 from typing import List
+from unittest.mock import patch
 
 import pytest
 
+from fake_api_server.model import load_config
 from fake_api_server.model.api_config import (
     FakeAPIConfig,
     TemplatableConfigLoadable,
     _BaseTemplateConfigLoader,
 )
-from fake_api_server.model.api_config.template._load.process import TemplateConfigOpts
+from fake_api_server.model.api_config.template._load import process as load_process
+from fake_api_server.model.api_config.template._load.process import (
+    TemplateConfigOpts,
+    config_loading_workers,
+)
 
 # isort: off
 from test.unit_test.model.api_config.template._test_case import (
@@ -19,6 +27,10 @@ from test.unit_test.model.api_config.template._test_case import (
 test_case_factory.load()
 _Test_Data: List[str] = test_case_factory.get_test_case()
 
+_Divided_Config_Test_Data: List[str] = sorted(
+    glob.glob(str(pathlib.Path(pathlib.Path(__file__).parents[5], "data", "divide_test_load", "*", "api.yaml")))
+)
+
 
 @pytest.fixture(scope="function")
 def api_config() -> FakeAPIConfig:
@@ -57,3 +69,47 @@ def test_loader_independent(api_config: FakeAPIConfig, api_config_yaml_path: str
             != get_template_config_opts_id(api_modal)
             != get_template_config_opts_id(http_modal)
         )
+
+
+@pytest.mark.parametrize("api_config_yaml_path", _Divided_Config_Test_Data)
+def test_load_divided_config_in_parallel(api_config_yaml_path: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MockAPI_Config_Loading_Workers", "1")
+    serial_api_config = load_config(path=api_config_yaml_path)
+
+    monkeypatch.setenv("MockAPI_Config_Loading_Workers", "2")
+    monkeypatch.setattr(load_process, "Parallel_Loading_Threshold", 1)
+    with patch.object(
+        load_process._BaseTemplateConfigLoader, "_read_config", autospec=True, side_effect=_read_config_spy
+    ):
+        parallel_api_config = load_config(path=api_config_yaml_path)
+
+    assert parallel_api_config.serialize() == serial_api_config.serialize()
+    # It should merge the divided configuration in deterministic order
+    assert list(parallel_api_config.apis.apis.keys()) == list(serial_api_config.apis.apis.keys())
+
+
+_Original_Read_Config = load_process._BaseTemplateConfigLoader._read_config
+
+
+def _read_config_spy(loader: _BaseTemplateConfigLoader, path: str) -> dict:
+    # All divided configuration files should have been parsed in parallel
+    assert load_process._Parsed_Configs.get() is not None
+    return _Original_Read_Config(loader, path)
+
+
+@pytest.mark.parametrize(
+    ("env_value", "cpu_count", "expected"),
+    [
+        ("4", 2, 4),
+        ("0", 2, 1),
+        ("", 2, 2),
+        ("", 32, 8),
+        ("", None, 1),
+        ("four", 2, 2),
+        ("1.5", 32, 8),
+    ],
+)
+def test_config_loading_workers(env_value: str, cpu_count: int, expected: int, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MockAPI_Config_Loading_Workers", env_value)
+    monkeypatch.setattr(load_process.os, "cpu_count", lambda: cpu_count)
+    assert config_loading_workers() == expected
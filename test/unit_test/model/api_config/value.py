@@ -76,6 +76,32 @@ class TestValueFormat(EnumTestSuite):
         if enums:
             assert value in enums
 
+    @pytest.mark.parametrize(
+        ("formatter", "enums", "expect_type"),
+        [
+            (ValueFormat.Date, [], str),
+            (ValueFormat.DateTime, [], str),
+            (ValueFormat.String, [], str),
+            (ValueFormat.Integer, [], int),
+            (ValueFormat.BigDecimal, [], Decimal),
+            (ValueFormat.Boolean, [], bool),
+            (ValueFormat.Enum, ["ENUM_1", "ENUM_2", "ENUM_3"], str),
+            (ValueFormat.EMail, [], str),
+            (ValueFormat.UUID, [], str),
+            (ValueFormat.URI, [], str),
+            (ValueFormat.URL, [], str),
+            (ValueFormat.IPv4, [], str),
+            (ValueFormat.IPv6, [], str),
+        ],
+    )
+    def test_generate_many_values(self, formatter: ValueFormat, enums: List[str], expect_type: object):
+        values = formatter.generate_many_values(5, enums=enums)
+        assert len(values) == 5
+        for value in values:
+            assert isinstance(value, expect_type)
+            if enums:
+                assert value in enums
+
     @pytest.mark.parametrize(
         ("formatter", "size", "expect_type"),
         [
@@ -60,6 +60,11 @@ from test._values import (
     _Workers_Amount,
     _Daemon,
     _Access_Log_File,
+    _Preload,
+    _Watch,
+    _Lazy_Loading,
+    _Metrics_Path,
+    _Snapshot,
 )
 
 # isort: on
@@ -104,6 +109,11 @@ class TestSubcmdRunArguments(CmdArgsDeserializeTestSuite):
             "log_level": _Log_Level.value,
             "daemon": _Daemon.value,
             "access_log_file": _Access_Log_File.value,
+            "preload": _Preload.value,
+            "watch": _Watch.value,
+            "lazy_loading": _Lazy_Loading.value,
+            "metrics_path": _Metrics_Path.value,
+            "snapshot": _Snapshot.value,
         }
         return Namespace(**namespace_args)
 
@@ -117,6 +127,11 @@ class TestSubcmdRunArguments(CmdArgsDeserializeTestSuite):
         assert argument.log_level == _Log_Level.value
         assert argument.daemon == _Daemon.value
         assert argument.access_log_file == _Access_Log_File.value
+        assert argument.preload == _Preload.value
+        assert argument.watch == _Watch.value
+        assert argument.lazy_loading == _Lazy_Loading.value
+        assert argument.metrics_path == _Metrics_Path.value
+        assert argument.snapshot == _Snapshot.value
 
 
 class TestSubcmdAddArguments(CmdArgsDeserializeTestSuite):
@@ -0,0 +1,111 @@
+import pathlib
+import shutil
+
+import pytest
+
+from fake_api_server.model import FakeAPIConfig, load_config
+from fake_api_server.model.reload import ConfigReloader
+
+_Divided_Config_Name = "has-base-info_and_tags_no_mocked_apis_with_divide_http_test"
+_Divided_Config_Dir = pathlib.Path(
+    pathlib.Path(__file__).parent.parent.parent,
+    "data",
+    "divide_test_load",
+    _Divided_Config_Name,
+)
+
+
+class TestConfigReloader:
+    @pytest.fixture(scope="function")
+    def config_dir(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        config_dir = tmp_path / "config"
+        shutil.copytree(_Divided_Config_Dir, config_dir)
+        # Let all the divided configuration files be loaded from the copied directory
+        for config_file in config_dir.glob("**/*.yaml"):
+            config_file.write_text(
+                config_file.read_text().replace(f"./test/data/divide_test_load/{_Divided_Config_Name}", str(config_dir))
+            )
+        return config_dir
+
+    @pytest.fixture(scope="function")
+    def api_config(self, config_dir: pathlib.Path) -> FakeAPIConfig:
+        api_config = load_config(str(config_dir / "api.yaml"))
+        assert api_config is not None
+        return api_config
+
+    @pytest.fixture(scope="function")
+    def reloader(self, config_dir: pathlib.Path, api_config: FakeAPIConfig) -> ConfigReloader:
+        return ConfigReloader(config_path=str(config_dir / "api.yaml"), api_config=api_config)
+
+    def test_api_sources(self, api_config: FakeAPIConfig, config_dir: pathlib.Path):
+        api_sources = api_config.apis.api_sources
+        assert set(api_sources.keys()) == {"get_foo", "put_foo", "get_foo-boo_export"}
+        assert api_sources["get_foo"].path == str(config_dir / "foo" / "get_foo-api.yaml")
+        assert api_sources["get_foo"].files == [
+            str(config_dir / "foo" / "get_foo-api.yaml"),
+            str(config_dir / "foo" / "get_foo-request.yaml"),
+        ]
+
+    def test_watched_files(self, reloader: ConfigReloader, config_dir: pathlib.Path):
+        assert reloader.watched_files[0] == str(config_dir / "api.yaml")
+        assert str(config_dir / "foo" / "get_foo-request.yaml") in reloader.watched_files
+        assert reloader.watched_directories == [str(config_dir), str(config_dir / "foo"), str(config_dir / "foo-boo")]
+
+    def test_reload_by_divided_file(
+        self, reloader: ConfigReloader, api_config: FakeAPIConfig, config_dir: pathlib.Path
+    ):
+        old_apis = dict(api_config.apis.apis)
+        request_file = config_dir / "foo" / "get_foo-request.yaml"
+        request_file.write_text(request_file.read_text().replace("'date'", "'new_date'"))
+
+        reloaded = reloader.reload([str(request_file)])
+
+        # Only reload the mocked API which reads the changed file
+        assert list(reloaded.changes.keys()) == ["get_foo"]
+        old_api_config, new_api_config = reloaded.changes["get_foo"]
+        assert old_api_config is old_apis["get_foo"]
+        assert new_api_config.http.request.parameters[0].name == "new_date"
+        # It doesn't modify the configuration before applying it
+        assert api_config.apis.apis["get_foo"] is old_apis["get_foo"]
+
+        reloader.apply(reloaded)
+        assert api_config.apis.apis["get_foo"] is new_api_config
+        assert api_config.apis.apis["put_foo"] is old_apis["put_foo"]
+
+    def test_reload_by_added_and_removed_files(
+        self, reloader: ConfigReloader, api_config: FakeAPIConfig, config_dir: pathlib.Path
+    ):
+        removed_file = config_dir / "foo" / "put_foo-api.yaml"
+        added_file = config_dir / "foo" / "post_foo-api.yaml"
+        added_file.write_text(removed_file.read_text().replace("/foo", "/new-foo"))
+        removed_file.unlink()
+
+        reloaded = reloader.reload([str(removed_file), str(added_file)])
+        assert set(reloaded.changes.keys()) == {"put_foo", "post_foo"}
+        assert reloaded.changes["put_foo"][1] is None
+        assert reloaded.changes["post_foo"][0] is None
+
+        reloader.apply(reloaded)
+        assert "put_foo" not in api_config.apis.apis
+        assert api_config.apis.apis["post_foo"].url == "/new-foo"
+        assert str(added_file) in reloader.watched_files
+        assert str(removed_file) not in reloader.watched_files
+
+    def test_reload_by_main_config_file(
+        self, reloader: ConfigReloader, api_config: FakeAPIConfig, config_dir: pathlib.Path
+    ):
+        reloaded = reloader.reload([str(config_dir / "api.yaml")])
+        assert reloaded.config is not None
+        assert set(reloaded.changes.keys()) == set(api_config.apis.apis.keys())
+
+    def test_apply_part_of_changes(self, reloader: ConfigReloader, api_config: FakeAPIConfig, config_dir: pathlib.Path):
+        old_apis = dict(api_config.apis.apis)
+        reloaded = reloader.reload([str(config_dir / "api.yaml")])
+        reloader.apply(reloaded, api_keys=["put_foo"])
+        assert api_config.apis.apis["put_foo"] is reloaded.changes["put_foo"][1]
+        assert api_config.apis.apis["get_foo"] is old_apis["get_foo"]
+
+    def test_reload_by_not_config_file(self, reloader: ConfigReloader, config_dir: pathlib.Path):
+        not_config_file = config_dir / "foo" / "data.json"
+        not_config_file.write_text("{}")
+        assert reloader.reload([str(not_config_file)]).changes == {}
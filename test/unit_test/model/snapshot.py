@@ -0,0 +1,90 @@
+import pathlib
+import pickle
+import re
+import shutil
+
+import pytest
+
+from fake_api_server.model import load_config
+from fake_api_server.model.snapshot import ConfigSnapshot, default_snapshot_path
+
+_Divided_Config_Dir = pathlib.Path(
+    pathlib.Path(__file__).parent.parent.parent,
+    "data",
+    "divide_test_load",
+    "has-base-info_and_tags_apply_test",
+)
+
+
+class TestConfigSnapshot:
+    @pytest.fixture(scope="function")
+    def config_dir(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        config_dir = tmp_path / "config"
+        shutil.copytree(_Divided_Config_Dir, config_dir)
+        # Let the divided configuration files be loaded from the copied directory
+        api_config_file = config_dir / "api.yaml"
+        api_config_file.write_text(
+            re.sub(r"base_file_path: '[^']*'", f"base_file_path: '{config_dir}/'", api_config_file.read_text())
+        )
+        return config_dir
+
+    @pytest.fixture(scope="function")
+    def snapshot(self, config_dir: pathlib.Path) -> ConfigSnapshot:
+        snapshot = ConfigSnapshot(config_path=str(config_dir / "api.yaml"))
+        assert snapshot.compile() is not None
+        return snapshot
+
+    def test_compile(self, config_dir: pathlib.Path):
+        config_path = str(config_dir / "api.yaml")
+        snapshot_info = ConfigSnapshot(config_path=config_path).compile()
+
+        assert snapshot_info.path == default_snapshot_path(config_path)
+        # It should record the divided configuration files
+        assert str(config_dir / "api.yaml") in snapshot_info.sources
+        assert len(snapshot_info.sources) > 1
+        assert len(snapshot_info.content_hash) == 64
+
+    def test_load_fresh_snapshot(self, snapshot: ConfigSnapshot, config_dir: pathlib.Path):
+        assert snapshot.is_fresh()
+        api_config = snapshot.load()
+        assert api_config is not None
+        assert api_config.serialize() == load_config(str(config_dir / "api.yaml")).serialize()
+
+    def test_not_exist_snapshot(self, config_dir: pathlib.Path):
+        snapshot = ConfigSnapshot(config_path=str(config_dir / "api.yaml"))
+        assert snapshot.is_fresh() is False
+        assert snapshot.load() is None
+
+    def test_stale_by_modifying_divided_file(self, snapshot: ConfigSnapshot, config_dir: pathlib.Path):
+        divided_file = config_dir / "foo" / "get_foo-api.yaml"
+        divided_file.write_text(divided_file.read_text() + "\n# modified\n")
+        assert snapshot.is_fresh() is False
+        assert snapshot.load() is None
+
+    def test_stale_by_adding_divided_file(self, snapshot: ConfigSnapshot, config_dir: pathlib.Path):
+        (config_dir / "new-tag").mkdir()
+        assert snapshot.is_fresh() is False
+
+    def test_stale_by_removing_divided_file(self, snapshot: ConfigSnapshot, config_dir: pathlib.Path):
+        (config_dir / "foo" / "put_foo-api.yaml").unlink()
+        assert snapshot.is_fresh() is False
+
+    def test_not_stale_by_other_files(self, snapshot: ConfigSnapshot, config_dir: pathlib.Path):
+        (config_dir / "README.md").write_text("not configuration")
+        assert snapshot.is_fresh()
+
+    def test_stale_by_format_version(self, snapshot: ConfigSnapshot):
+        with open(snapshot.path, "rb") as snapshot_file:
+            header = pickle.load(snapshot_file)
+            api_config = pickle.load(snapshot_file)
+        header["format_version"] = -1
+        with open(snapshot.path, "wb") as snapshot_file:
+            pickle.dump(header, snapshot_file)
+            pickle.dump(api_config, snapshot_file)
+        assert snapshot.is_fresh() is False
+        assert snapshot.load() is None
+
+    def test_broken_snapshot(self, snapshot: ConfigSnapshot):
+        pathlib.Path(snapshot.path).write_bytes(b"broken snapshot")
+        assert snapshot.is_fresh() is False
+        assert snapshot.load() is None
@@ -108,7 +108,7 @@ class TestMockHTTPServer:
                     f"The instance {invalid_server} must be *fake_api_server.application.BaseAppServer* type object."
                 )
                 assert str(exc_info) == expected_err_msg, f"The error message should be same as '{expected_err_msg}'."
-                mock_load_config.assert_called_once_with(path="api.yaml")
+                mock_load_config.assert_called_once_with(path="api.yaml", lazy=False)
 
     def test_instantiate_arg_auto_setup(self):
         def _instantiate() -> MockHTTPServer:
@@ -125,7 +125,135 @@ class TestMockHTTPServer:
         mock_server = MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer(), auto_setup=False)
         mock_server.create_apis(apis)
         mock_create_apis.assert_called_once_with(apis)
-        mock_load_config.assert_called_once_with(path=_Test_Config)
+        mock_load_config.assert_called_once_with(path=_Test_Config, lazy=False)
+
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch("fake_api_server.server.mock.ConfigSnapshot")
+    def test_load_config_from_fresh_snapshot(self, mock_snapshot: Mock, mock_load_config: Mock):
+        snapshot_api_config = Mock(FakeAPIConfig())
+        mock_snapshot.return_value.load.return_value = snapshot_api_config
+        mock_server = MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer(), snapshot_path="api.snapshot")
+        mock_snapshot.assert_called_once_with(config_path=_Test_Config, snapshot_path="api.snapshot")
+        mock_load_config.assert_not_called()
+        assert mock_server._api_config is snapshot_api_config
+
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch("fake_api_server.server.mock.ConfigSnapshot")
+    def test_load_config_from_yaml_with_stale_snapshot(self, mock_snapshot: Mock, mock_load_config: Mock):
+        mock_snapshot.return_value.load.return_value = None
+        with patch.dict("os.environ", {"MockAPI_Config_Snapshot": "api.snapshot"}):
+            mock_server = MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer())
+        mock_snapshot.assert_called_once_with(config_path=_Test_Config, snapshot_path="api.snapshot")
+        mock_load_config.assert_called_once_with(path=_Test_Config, lazy=False)
+        assert mock_server._api_config is mock_api_config
+
+    @patch.dict("os.environ", {"MockAPI_Config_Snapshot": ""})
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch("fake_api_server.server.mock.ConfigSnapshot")
+    def test_load_config_without_snapshot(self, mock_snapshot: Mock, mock_load_config: Mock):
+        mock_server = MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer())
+        mock_snapshot.assert_not_called()
+        mock_load_config.assert_called_once_with(path=_Test_Config, lazy=False)
+        assert mock_server._api_config is mock_api_config
+
+    @pytest.mark.parametrize(
+        ("lazy_loading", "environment_variable", "expected_lazy"),
+        [
+            (None, "", False),
+            (None, "true", True),
+            (True, "", True),
+            (False, "true", False),
+        ],
+    )
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch("fake_api_server.server.mock.ConfigSnapshot")
+    def test_lazy_loading(
+        self,
+        mock_snapshot: Mock,
+        mock_load_config: Mock,
+        lazy_loading: Optional[bool],
+        environment_variable: str,
+        expected_lazy: bool,
+    ):
+        mock_snapshot.return_value.load.return_value = None
+        with patch.dict("os.environ", {"MockAPI_Config_Lazy_Loading": environment_variable}):
+            MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer(), lazy_loading=lazy_loading)
+        mock_load_config.assert_called_once_with(path=_Test_Config, lazy=expected_lazy)
+
+    @pytest.mark.parametrize(
+        ("metrics_path", "environment_variable", "expected_path"),
+        [
+            (None, "", None),
+            (None, "/_fake/metrics", "/_fake/metrics"),
+            ("/metrics", "/_fake/metrics", "/metrics"),
+        ],
+    )
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch("fake_api_server.server.mock.ConfigSnapshot")
+    def test_metrics_path(
+        self,
+        mock_snapshot: Mock,
+        mock_load_config: Mock,
+        metrics_path: Optional[str],
+        environment_variable: str,
+        expected_path: Optional[str],
+    ):
+        mock_snapshot.return_value.load.return_value = None
+        with patch.object(FakeWebServer, "enable_metrics") as mock_enable_metrics:
+            with patch.dict("os.environ", {"MockAPI_Metrics_Path": environment_variable}):
+                MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer(), metrics_path=metrics_path)
+        if expected_path:
+            mock_enable_metrics.assert_called_once_with(path=expected_path)
+        else:
+            mock_enable_metrics.assert_not_called()
+
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch("fake_api_server.server.mock.FileWatcher")
+    @patch("fake_api_server.server.mock.ConfigReloader")
+    def test_watch(self, mock_reloader: Mock, mock_watcher: Mock, mock_load_config: Mock):
+        mock_server = MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer())
+        mock_server.watch(interval=0.5)
+        mock_reloader.assert_called_once_with(config_path=_Test_Config, api_config=mock_api_config)
+        mock_watcher.assert_called_once_with(
+            files=mock_reloader.return_value.watched_files,
+            directories=mock_reloader.return_value.watched_directories,
+            extensions=(".yaml", ".yml", ".json"),
+        )
+        mock_watcher.return_value.start.assert_called_once_with(on_change=mock_server.reload, interval=0.5)
+
+    @patch.dict("os.environ", {"MockAPI_Config_Watch": "true", "MockAPI_Config_Watch_Interval": "3"})
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch.object(MockHTTPServer, "watch")
+    @patch.object(MockHTTPServer, "create_apis")
+    def test_watch_by_environment_variable(self, mock_create_apis: Mock, mock_watch: Mock, mock_load_config: Mock):
+        MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer(), auto_setup=True)
+        mock_create_apis.assert_called_once()
+        mock_watch.assert_called_once_with(interval=3.0)
+
+    @patch("fake_api_server.server.mock.load_config", return_value=mock_api_config)
+    @patch("fake_api_server.server.mock.ConfigReloader")
+    @patch.object(FakeWebServer, "update_apis", return_value=["foo"])
+    def test_reload(self, mock_update_apis: Mock, mock_reloader: Mock, mock_load_config: Mock):
+        reloader = mock_reloader.return_value
+        reloaded_api = Mock(MockAPI())
+        reloader.reload.return_value = Mock(changes={"foo": (None, reloaded_api)}, sources={})
+        reloader.mocked_apis.base.url = "/api"
+
+        mock_server = MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer())
+        mock_server.reload(["foo-api.yaml"])
+
+        reloader.reload.assert_called_once_with(["foo-api.yaml"])
+        mock_update_apis.assert_called_once_with({"foo": (None, reloaded_api)}, base_url="/api")
+        reloader.apply.assert_called_once_with(reloader.reload.return_value, api_keys=["foo"])
+
+    @patch("fake_api_server.server.mock.load_config", return_value=None)
+    @patch("fake_api_server.server.mock.ConfigReloader")
+    def test_reload_without_config(self, mock_reloader: Mock, mock_load_config: Mock):
+        mock_server = MockHTTPServer(config_path=_Test_Config, app_server=FakeWebServer())
+        with pytest.raises(ValueError) as exc_info:
+            mock_server.reload(["foo-api.yaml"])
+        assert "Cannot reload the mocked APIs" in str(exc_info.value)
+        mock_reloader.assert_not_called()
 
     @staticmethod
     def _template_test(
@@ -140,7 +268,7 @@ class TestMockHTTPServer:
                 instantiate_callback()
 
                 # Verify running result
-                mock_load_config.assert_called_once_with(path=assert_config_path)
+                mock_load_config.assert_called_once_with(path=assert_config_path, lazy=False)
 
                 if instantiate_flask_app_server:
                     mock_app_server.assert_called_once()
@@ -1,24 +1,18 @@
-import re
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 from typing import Dict, List, Optional, Union
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
 from fake_api_server.model import MockAPI
-from fake_api_server.model.api_config.apis import HTTP, APIParameter
+from fake_api_server.model.api_config.apis import HTTP
 from fake_api_server.server.rest.application.code_generator import (
     BaseWebServerCodeGenerator,
     FastAPICodeGenerator,
     FlaskCodeGenerator,
 )
 
-# isort: off
-from test._values import _Test_API_Parameters
-
-# isort: on
-
 
 class WebServerCodeGeneratorTestSpec(metaclass=ABCMeta):
     @pytest.fixture(scope="function")
@@ -32,65 +26,32 @@ class WebServerCodeGeneratorTestSpec(metaclass=ABCMeta):
             # NOTE: It should implement the test data here in child-class
         ],
     )
-    def test_generate_pycode_about_annotating_function(
+    def test_api_function_name(
         self, sut: BaseWebServerCodeGenerator, mock_api_key: str, mock_api: MockAPI, expected_api_func_naming: str
     ):
-        mock_api.http.request.parameters = [APIParameter().deserialize(p) for p in _Test_API_Parameters]
-
-        annotate_function_pycode = sut.annotate_function(
+        api_function_name = sut.api_function_name(
             api_name=mock_api_key, api_config=self._mock_api_config_data(mock_api)
         )
-
-        assert f"def {expected_api_func_naming}(" in annotate_function_pycode
-        return annotate_function_pycode
+        assert api_function_name == expected_api_func_naming
 
     @abstractmethod
     def _mock_api_config_data(self, api: MockAPI) -> Union[MockAPI, List[MockAPI]]:
         pass
 
-    @pytest.mark.parametrize("base_url", [None, "Has base URL"])
-    def test_generate_pycode_about_adding_api(self, sut: BaseWebServerCodeGenerator, base_url: Optional[str]):
-        for_test_api_name = "Function name"
-        for_test_url = "this is an url path"
-        for_test_req_method = "HTTP method"
-        api_config = Mock(MockAPI(url=Mock(), http=Mock(HTTP())))
-        api_config.url = for_test_url
-        api_config.http.request.method = for_test_req_method
+    @pytest.mark.parametrize("base_url", [None, "/base"])
+    def test_record_api(self, sut: BaseWebServerCodeGenerator, base_url: Optional[str]):
+        mock_api = MockAPI(url="/foo/api/url", http=Mock(HTTP()))
+        mock_api.http.request.method = "GET"
 
-        add_api_pycode = sut.add_api(
-            api_name=for_test_api_name, api_config=self._get_api_config_param(api_config), base_url=base_url
+        url_path = sut.record_api(
+            api_name=self._api_name(mock_api), api_config=self._mock_api_config_data(mock_api), base_url=base_url
         )
 
-        clean_add_api_pycode = add_api_pycode.replace("  ", "").replace("\n", "")
-        expect_pycode = self._expect_controller_pycode(
-            method=for_test_req_method, base_url=base_url, url=for_test_url, api_name=for_test_api_name
-        )
-        search_expect_pycode = re.search(re.escape(expect_pycode), clean_add_api_pycode)
-
-        assert (
-            self._get_url_criteria(base_url) in add_api_pycode
-            and self._get_http_method_in_generating_code(for_test_req_method) in add_api_pycode
-        )
-        assert search_expect_pycode is not None
+        assert url_path == f"{base_url or ''}/foo/api/url"
+        assert sut._mock_api_details == {url_path: {"GET": mock_api}}
 
     @abstractmethod
-    def _get_api_config_param(self, api_config: MockAPI) -> Union[MockAPI, List[MockAPI]]:
-        pass
-
-    @property
-    def _server_instance(self) -> str:
-        return "self.web_application"
-
-    @abstractmethod
-    def _expect_controller_pycode(self, method: str, base_url: Optional[str], url: str, api_name: str) -> str:
-        pass
-
-    @abstractmethod
-    def _get_url_criteria(self, base_url: Optional[str]) -> str:
-        pass
-
-    @abstractmethod
-    def _get_http_method_in_generating_code(self, method: str) -> str:
+    def _api_name(self, api: MockAPI) -> str:
         pass
 
     def test__record_api_params_info_with_invalid_value(self, sut: BaseWebServerCodeGenerator):
@@ -129,39 +90,18 @@ class TestFlaskCodeGenerator(WebServerCodeGeneratorTestSpec):
             ),
         ],
     )
-    def test_generate_pycode_about_annotating_function(
+    def test_api_function_name(
         self, sut: FlaskCodeGenerator, mock_api_key: str, mock_api: MockAPI, expected_api_func_naming: str
     ):
-        super().test_generate_pycode_about_annotating_function(
+        super().test_api_function_name(
             sut=sut, mock_api_key=mock_api_key, mock_api=mock_api, expected_api_func_naming=expected_api_func_naming
         )
 
     def _mock_api_config_data(self, api: MockAPI) -> List[MockAPI]:
         return [api]
 
-    def _get_api_config_param(self, api_config: MockAPI) -> List[MockAPI]:
-        return [api_config]
-
-    def _expect_controller_pycode(self, method: str, base_url: Optional[str], url: str, api_name: str) -> str:
-        """
-        Python code:
-        self.web_application.route("Function name", methods=['HTTP method'])()
-        """
-        new_api_name = f"{base_url}{api_name}" if base_url else api_name
-        return f"{self._server_instance}.route(\"{new_api_name}\", methods=['{self._get_http_method_in_generating_code(method)}'])()"
-
-    def _get_url_criteria(self, base_url: Optional[str]) -> str:
-        return "Function name"
-
-    def _get_http_method_in_generating_code(self, method: str) -> str:
-        return method
-
-    def test__add_api_with_invalid_value(self, sut: BaseWebServerCodeGenerator):
-        ut_url = "This is URL path"
-        ut_api_config = MockAPI(url=ut_url)
-        with patch.object(sut, "_record_api_params_info"):
-            with pytest.raises(TypeError):
-                sut.add_api(api_name=ut_url, api_config=ut_api_config)
+    def _api_name(self, api: MockAPI) -> str:
+        return api.url
 
     @pytest.mark.parametrize(
         ("api_name", "expect_var_mapping_table"),
@@ -213,41 +153,24 @@ class TestFastAPICodeGenerator(WebServerCodeGeneratorTestSpec):
             ),
         ],
     )
-    def test_generate_pycode_about_annotating_function(
+    def test_api_function_name(
         self,
         sut: FastAPICodeGenerator,
         mock_api_key: str,
         mock_api: MockAPI,
         expect: FastAPIGenCodeExpect,
     ):
-        annotate_function_pycode = super().test_generate_pycode_about_annotating_function(
+        super().test_api_function_name(
             sut=sut, mock_api_key=mock_api_key, mock_api=mock_api, expected_api_func_naming=expect.func_naming
         )
-
-        assert expect.req_body_obj_naming in annotate_function_pycode
+        api_parameters_model_name = sut.api_parameters_model_name(api_name=mock_api_key, api_config=mock_api)
+        assert api_parameters_model_name == expect.req_body_obj_naming
 
     def _mock_api_config_data(self, api: MockAPI) -> MockAPI:
         return api
 
-    def _get_api_config_param(self, api_config: MockAPI) -> MockAPI:
-        return api_config
-
-    def _expect_controller_pycode(self, method: str, base_url: Optional[str], url: str, api_name: str) -> str:
-        """
-        Python code:
-        self.web_application.http method(path="this is an url path")(function name)
-        """
-        api_path = f"{base_url}{url}" if base_url else url
-        return (
-            f'{self._server_instance}.{self._get_http_method_in_generating_code(method)}(path="{api_path}")({api_name})'
-        )
-
-    def _get_url_criteria(self, base_url: Optional[str]) -> str:
-        for_test_url = "this is an url path"
-        return f"{base_url}{for_test_url}" if base_url else for_test_url
-
-    def _get_http_method_in_generating_code(self, method: str) -> str:
-        return method.lower()
+    def _api_name(self, api: MockAPI) -> str:
+        return "get_foo_api_url"
 
     @pytest.mark.parametrize(
         ("api_name", "expect_api_name"),
@@ -260,13 +183,6 @@ class TestFastAPICodeGenerator(WebServerCodeGeneratorTestSpec):
         api_name_with_camel_case = sut._api_name_as_camel_case(api_name=api_name)
         assert api_name_with_camel_case == expect_api_name
 
-    def test__add_api_with_invalid_value(self, sut: BaseWebServerCodeGenerator):
-        ut_url = "This is URL path"
-        ut_api_config = ["Invalid API configuration"]
-        with patch.object(sut, "_record_api_params_info"):
-            with pytest.raises(TypeError):
-                sut.add_api(api_name=ut_url, api_config=ut_api_config)
-
     @pytest.mark.parametrize(
         ("api_name", "expect_var_mapping_table"),
         [
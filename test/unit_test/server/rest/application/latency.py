@@ -0,0 +1,123 @@
+import asyncio
+import random
+import sys
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fake_api_server.model.api_config.apis import Latency, LatencyDistribution
+from fake_api_server.server.rest.application.latency import (
+    SimulatedLatency,
+    async_throttled_body,
+    cooperative_sleep,
+    throttled_body,
+)
+from fake_api_server.server.rest.application.metrics import RequestTiming
+
+
+def _samples(latency: Latency, amount: int = 2000) -> List[float]:
+    simulated_latency = SimulatedLatency(latency)
+    return [simulated_latency.delay() for _ in range(amount)]
+
+
+class TestSimulatedLatency:
+    def test_fixed(self):
+        assert set(_samples(Latency(distribution=LatencyDistribution.FIXED, value=0.25), 10)) == {0.25}
+
+    def test_uniform(self):
+        samples = _samples(Latency(distribution=LatencyDistribution.UNIFORM, min=0.1, max=0.3))
+        assert all(0.1 <= s <= 0.3 for s in samples)
+        assert sum(samples) / len(samples) == pytest.approx(0.2, abs=0.01)
+
+    def test_normal(self):
+        samples = _samples(Latency(distribution=LatencyDistribution.NORMAL, mean=0.05, stddev=0.05))
+        # The negative values would be 0
+        assert min(samples) == 0
+        assert sorted(samples)[len(samples) // 2] == pytest.approx(0.05, abs=0.01)
+
+    def test_percentile(self):
+        samples = sorted(
+            _samples(Latency(distribution=LatencyDistribution.PERCENTILE, percentiles={50: 0.1, 90: 1, 100: 2}))
+        )
+        assert samples[0] >= 0 and samples[-1] <= 2
+        assert sum(1 for s in samples if s <= 0.1) / len(samples) == pytest.approx(0.5, abs=0.05)
+        assert sum(1 for s in samples if s <= 1) / len(samples) == pytest.approx(0.9, abs=0.03)
+
+    def test_percentile_clamp_at_last_one(self):
+        samples = _samples(Latency(distribution=LatencyDistribution.PERCENTILE, percentiles={10: 0.5}))
+        assert max(samples) == 0.5
+        assert sum(1 for s in samples if s == 0.5) > len(samples) * 0.8
+
+    def test_only_bandwidth(self):
+        simulated_latency = SimulatedLatency(Latency(distribution=None, bandwidth=100))
+        assert simulated_latency.delay() == 0
+        assert simulated_latency.bandwidth == 100
+
+    def test_not_affected_by_seeded_random(self):
+        latency = Latency(distribution=LatencyDistribution.UNIFORM, min=0.1, max=0.3)
+        random.seed(1)
+        samples = _samples(latency, 10)
+        random.seed(1)
+        assert _samples(latency, 10) != samples
+
+    @pytest.mark.parametrize(
+        ("bandwidth", "body", "expected_chunks"),
+        [
+            (None, b"x" * 50, [(0.0, b"x" * 50)]),
+            (100, b"x" * 25, [(0.1, b"x" * 10), (0.1, b"x" * 10), (0.05, b"x" * 5)]),
+            (5, b"xy", [(0.2, b"x"), (0.2, b"y")]),
+            (100, b"", [(0.0, b"")]),
+        ],
+    )
+    def test_throttle(self, bandwidth: int, body: bytes, expected_chunks: list):
+        simulated_latency = SimulatedLatency(Latency(distribution=LatencyDistribution.FIXED, bandwidth=bandwidth))
+        assert simulated_latency.throttle(body) == pytest.approx(expected_chunks)
+
+
+def test_cooperative_sleep_with_gevent():
+    gevent = MagicMock()
+    with patch.dict(sys.modules, {"gevent": gevent}), patch("time.sleep") as mock_sleep:
+        cooperative_sleep(0.5)
+    gevent.sleep.assert_called_once_with(0.5)
+    mock_sleep.assert_not_called()
+
+
+def test_cooperative_sleep_without_gevent():
+    with patch.dict(sys.modules, {"gevent": None}), patch("time.sleep") as mock_sleep:
+        cooperative_sleep(0.5)
+        cooperative_sleep(0)
+    mock_sleep.assert_called_once_with(0.5)
+
+
+def test_throttled_body():
+    simulated_latency = SimulatedLatency(Latency(distribution=None, bandwidth=200))
+    start = time.perf_counter()
+    assert b"".join(throttled_body(simulated_latency, b"x" * 50)) == b"x" * 50
+    assert time.perf_counter() - start >= 0.2
+
+
+def test_async_throttled_body():
+    simulated_latency = SimulatedLatency(Latency(distribution=None, bandwidth=200))
+    timing = RequestTiming()
+
+    async def _read() -> bytes:
+        return b"".join([chunk async for chunk in async_throttled_body(simulated_latency, b"x" * 50, timing)])
+
+    assert asyncio.run(_read()) == b"x" * 50
+    assert timing.simulated == pytest.approx(0.25)
+
+
+def test_throttled_streaming_body():
+    simulated_latency = SimulatedLatency(Latency(distribution=None, bandwidth=1000))
+
+    async def _chunks():
+        for chunk in (b"a" * 150, b"b" * 50):
+            yield chunk
+
+    async def _read() -> List[bytes]:
+        return [chunk async for chunk in async_throttled_body(simulated_latency, _chunks())]
+
+    assert list(throttled_body(simulated_latency, iter([b"a" * 150, b"b" * 50]))) == [b"a" * 100, b"a" * 50, b"b" * 50]
+    assert asyncio.run(_read()) == [b"a" * 100, b"a" * 50, b"b" * 50]
@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Any, Callable, Iterator, List
+
+import pytest
+
+from fake_api_server.server.rest.application.metrics import (
+    RequestTiming,
+    ServerMetrics,
+    WSGIMetricsMiddleware,
+)
+
+
+def _timing(api: str = "/foo", method: str = "GET", **phases: float) -> RequestTiming:
+    timing = RequestTiming()
+    timing.api = api
+    timing.method = method
+    for phase, seconds in phases.items():
+        setattr(timing, phase, seconds)
+    return timing
+
+
+def _lines_of(metrics: ServerMetrics, prefix: str) -> List[str]:
+    return [line for line in metrics.render().splitlines() if line.startswith(prefix)]
+
+
+class TestServerMetrics:
+    @pytest.fixture(scope="function")
+    def metrics(self) -> ServerMetrics:
+        return ServerMetrics(buckets=(0.01, 0.1), aggregate_size=1000)
+
+    def test_requests(self, metrics: ServerMetrics):
+        metrics.observe_request(_timing(), 200, 0.05)
+        metrics.observe_request(_timing(), 200, 0.05)
+        metrics.observe_request(_timing(), 400, 0.05)
+        metrics.observe_request(_timing(api="", method=""), 404, 0.001)
+        assert _lines_of(metrics, "fake_api_server_requests_total") == [
+            'fake_api_server_requests_total{api="",method="",status="404"} 1',
+            'fake_api_server_requests_total{api="/foo",method="GET",status="200"} 2',
+            'fake_api_server_requests_total{api="/foo",method="GET",status="400"} 1',
+        ]
+
+    def test_phase_histograms(self, metrics: ServerMetrics):
+        metrics.observe_request(_timing(routing=0.001, validation=0.004, generation=0.02), 200, 0.05)
+        metrics.observe_request(_timing(routing=0.001, validation=0.5), 400, 1.0)
+
+        lines = _lines_of(
+            metrics, 'fake_api_server_request_phase_seconds_bucket{api="/foo",method="GET",phase="validation"'
+        )
+        assert [line.rsplit(" ", 1)[1] for line in lines] == ["1", "1", "2"]
+        assert 'le="+Inf"' in lines[-1]
+        assert _lines_of(
+            metrics, 'fake_api_server_request_phase_seconds_count{api="/foo",method="GET",phase="generation"}'
+        ) == ['fake_api_server_request_phase_seconds_count{api="/foo",method="GET",phase="generation"} 1']
+        framework_sum = _lines_of(
+            metrics, 'fake_api_server_request_phase_seconds_sum{api="/foo",method="GET",phase="framework"}'
+        )
+        assert float(framework_sum[0].rsplit(" ", 1)[1]) == pytest.approx((0.05 - 0.025) + (1.0 - 0.501))
+
+    def test_simulated_latency_phase(self, metrics: ServerMetrics):
+        metrics.observe_request(_timing(validation=0.001, generation=0.004, simulated=0.5), 200, 0.51)
+        assert _lines_of(
+            metrics, 'fake_api_server_request_phase_seconds_sum{api="/foo",method="GET",phase="simulated_latency"}'
+        ) == ['fake_api_server_request_phase_seconds_sum{api="/foo",method="GET",phase="simulated_latency"} 0.5']
+        framework_sum = _lines_of(
+            metrics, 'fake_api_server_request_phase_seconds_sum{api="/foo",method="GET",phase="framework"}'
+        )
+        assert float(framework_sum[0].rsplit(" ", 1)[1]) == pytest.approx(0.005)
+
+    def test_no_framework_phase_for_unmatched_request(self, metrics: ServerMetrics):
+        metrics.observe_request(_timing(api="", method=""), 404, 0.001)
+        assert not any('phase="framework"' in line for line in metrics.render().splitlines())
+
+    def test_cache_hit_ratio(self, metrics: ServerMetrics):
+        for hit in (True, True, True, False):
+            metrics.count_cache("compiled_response", hit=hit)
+        assert _lines_of(metrics, "fake_api_server_cache_") == [
+            'fake_api_server_cache_lookups_total{cache="compiled_response",result="hit"} 3',
+            'fake_api_server_cache_lookups_total{cache="compiled_response",result="miss"} 1',
+            'fake_api_server_cache_hit_ratio{cache="compiled_response"} 0.75',
+        ]
+
+    def test_escape_label_value(self, metrics: ServerMetrics):
+        metrics.observe_request(_timing(api='/foo"\\\n'), 200, 0.001)
+        assert _lines_of(metrics, "fake_api_server_requests_total{") == [
+            'fake_api_server_requests_total{api="/foo\\"\\\\\\n",method="GET",status="200"} 1'
+        ]
+
+    def test_aggregate_when_full(self):
+        metrics = ServerMetrics(aggregate_size=3)
+        for _ in range(2):
+            metrics.count_cache("validator", hit=True)
+        assert len(metrics._records) == 2
+        metrics.count_cache("validator", hit=True)
+        assert len(metrics._records) == 0
+        assert metrics._caches == {"validator": [3, 0]}
+
+    def test_record_by_multiple_threads(self):
+        metrics = ServerMetrics(aggregate_size=64)
+
+        def _record() -> None:
+            for _ in range(1000):
+                metrics.observe_request(_timing(validation=0.001), 200, 0.002)
+
+        threads = [threading.Thread(target=_record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert _lines_of(metrics, "fake_api_server_requests_total{") == [
+            'fake_api_server_requests_total{api="/foo",method="GET",status="200"} 8000'
+        ]
+
+
+class TestWSGIMetricsMiddleware:
+    def test_record_after_sending_body(self):
+        closed: List[bool] = []
+
+        class _SlowBody:
+            def __iter__(self) -> Iterator[bytes]:
+                for chunk in (b"slow", b"body"):
+                    time.sleep(0.1)
+                    yield chunk
+
+            def close(self) -> None:
+                closed.append(True)
+
+        def _app(environ: dict, start_response: Callable) -> Any:
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return _SlowBody()
+
+        metrics = ServerMetrics(buckets=(0.1, 1.0), aggregate_size=1000)
+        middleware = WSGIMetricsMiddleware(_app, metrics=metrics)
+        body = middleware({"PATH_INFO": "/foo"}, lambda status, headers, exc_info=None: None)
+        assert not _lines_of(metrics, "fake_api_server_requests_total{")
+
+        assert b"".join(body) == b"slowbody"
+        body.close()  # type: ignore[attr-defined]
+        assert closed == [True]
+        assert _lines_of(metrics, "fake_api_server_requests_total{") == [
+            'fake_api_server_requests_total{api="",method="",status="200"} 1'
+        ]
+        request_sum = _lines_of(metrics, 'fake_api_server_request_phase_seconds_sum{api="",method="",phase="request"}')
+        assert float(request_sum[0].rsplit(" ", 1)[1]) >= 0.2
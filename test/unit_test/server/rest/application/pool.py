@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from fake_api_server.model.api_config import ResponseProperty
+from fake_api_server.model.api_config.apis import (
+    HTTPResponse,
+    ResponseStrategy,
+    ValuePool,
+)
+from fake_api_server.model.api_config.format import Format
+from fake_api_server.model.api_config.value import FormatStrategy
+from fake_api_server.server.rest.application.pool import (
+    AsyncioValuePoolRefiller,
+    BaseValuePoolRefiller,
+    RandomValuePool,
+    ThreadValuePoolRefiller,
+)
+from fake_api_server.server.rest.application.response import (
+    HTTPResponse as _HTTPResponse,
+)
+
+
+def _counter_generator() -> Mock:
+    counter = iter(range(1_000_000))
+    return Mock(side_effect=lambda n: [next(counter) for _ in range(n)])
+
+
+class TestRandomValuePool:
+    def test_fill_directly_without_refiller(self):
+        generator = _counter_generator()
+        pool = RandomValuePool(generator=generator, size=5, watermark=2)
+        assert len(pool) == 5
+        assert pool.pop_many(4) == [0, 1, 2, 3]
+        # It's less than watermark, so it would be refilled
+        assert len(pool) == 5
+        assert pool.pop() == 4
+        assert pool.misses == 0
+
+    def test_notify_refiller_under_watermark(self):
+        refiller = Mock(spec=BaseValuePoolRefiller)
+        pool = RandomValuePool(generator=_counter_generator(), size=5, watermark=2, refiller=refiller)
+        refiller.notify.assert_called_once_with(pool)
+        assert pool.refill() == 0
+
+        pool.pop_many(3)
+        assert refiller.notify.call_count == 1
+        pool.pop()
+        assert refiller.notify.call_count == 2
+        # It has notified the refiller, so it won't notify again before refilling
+        pool.pop()
+        assert refiller.notify.call_count == 2
+
+    def test_generate_directly_if_pool_is_drained(self):
+        refiller = Mock(spec=BaseValuePoolRefiller)
+        pool = RandomValuePool(generator=_counter_generator(), size=3, watermark=1, refiller=refiller)
+        assert pool.pop_many(2) == [0, 1]
+        assert pool.misses == 1
+
+    def test_refill_by_chunk(self):
+        refiller = Mock(spec=BaseValuePoolRefiller)
+        pool = RandomValuePool(generator=_counter_generator(), size=5, watermark=2, refiller=refiller)
+        assert pool.refill(max_amount=2) == 3
+        assert pool.refill(max_amount=2) == 1
+        assert pool.refill(max_amount=2) == 0
+        assert len(pool) == 5
+
+
+def test_thread_refiller():
+    refiller = ThreadValuePoolRefiller()
+    refilled = threading.Event()
+    generator = _counter_generator()
+
+    def _generate(n: int) -> List[int]:
+        values = generator(n)
+        refilled.set()
+        return values
+
+    try:
+        pool = RandomValuePool(generator=_generate, size=10, watermark=5, refiller=refiller)
+        assert refilled.wait(timeout=5)
+        refiller.stop()
+        assert len(pool) == 10
+    finally:
+        refiller.stop()
+
+
+def test_thread_refiller_reset_after_fork():
+    refiller = ThreadValuePoolRefiller()
+    pool = RandomValuePool(generator=_counter_generator(), size=10, watermark=5, refiller=Mock())
+    # The pool is waiting in queue but the thread doesn't exist after forking
+    getattr(refiller, "_queue").put(pool)
+    try:
+        getattr(refiller, "_reset_after_fork")()
+        for _ in range(100):
+            if len(pool) == 10:
+                break
+            time.sleep(0.05)
+        assert len(pool) == 10
+    finally:
+        refiller.stop()
+
+
+def test_asyncio_refiller():
+    async def _run() -> RandomValuePool:
+        refiller = AsyncioValuePoolRefiller(chunk_size=3)
+        pool = RandomValuePool(generator=_counter_generator(), size=10, watermark=5, refiller=refiller)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        refiller.stop()
+        return pool
+
+    assert len(asyncio.run(_run())) == 10
+
+
+def test_asyncio_refiller_without_event_loop():
+    pool = RandomValuePool(generator=_counter_generator(), size=10, watermark=5, refiller=AsyncioValuePoolRefiller())
+    assert len(pool) == 10
+
+
+@pytest.mark.parametrize("pool", [None, ValuePool(size=20, watermark=5)])
+def test_compile_object_with_value_pool(pool: ValuePool):
+    response = HTTPResponse(
+        strategy=ResponseStrategy.OBJECT,
+        properties=[
+            ResponseProperty(
+                name="code",
+                required=True,
+                value_type="str",
+                value_format=Format(strategy=FormatStrategy.FROM_ENUMS, enums=["A", "B"]),
+            ),
+        ],
+        pool=pool,
+    )
+    generator = _HTTPResponse.compile_object(response)
+    for _ in range(50):
+        assert generator()["code"] in ["A", "B"]
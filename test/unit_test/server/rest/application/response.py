@@ -9,7 +9,11 @@ import pytest
 
 from fake_api_server.exceptions import FileFormatNotSupport
 from fake_api_server.model.api_config import IteratorItem, ResponseProperty
-from fake_api_server.model.api_config.apis import HTTPResponse, ResponseStrategy
+from fake_api_server.model.api_config.apis import (
+    HTTPResponse,
+    ResponseStrategy,
+    StreamFormat,
+)
 from fake_api_server.model.api_config.format import Format
 from fake_api_server.model.api_config.value import FormatStrategy, ValueFormat
 from fake_api_server.model.api_config.variable import Size, Variable
@@ -76,6 +80,52 @@ class TestInnerHTTPResponse:
         resp_data = http_resp.generate(data=_MockHTTPResponse.with_json_format_string_strategy())
         assert resp_data == json.loads(json.dumps(_Json_File_Content)), ""
 
+    @pytest.mark.parametrize(
+        ("value", "expected_content_type"),
+        [
+            (_General_String_Value, "text/plain; charset=utf-8"),
+            (json.dumps(_Json_File_Content), "application/json"),
+            ('[{"id": 1}]', "application/json"),
+            ("123", "text/plain; charset=utf-8"),
+            ("{ not json", "text/plain; charset=utf-8"),
+        ],
+    )
+    def test_prepare_string(self, http_resp: Type[_HTTPResponse], value: str, expected_content_type: str):
+        prepared_resp = http_resp.prepare_string(data=HTTPResponse(strategy=ResponseStrategy.STRING, value=value))
+        assert prepared_resp.body == value.encode("utf-8")
+        assert prepared_resp.content_type == expected_content_type
+
+    @pytest.mark.parametrize(
+        ("path", "expected_content_type"),
+        [
+            ("./data.json", "application/json"),
+            ("./data.ndjson", "application/x-ndjson"),
+            ("./data.JSONL", "application/x-ndjson"),
+            ("./image.png", "image/png"),
+            ("./report.csv", "text/csv; charset=utf-8"),
+            ("./data.bin", "application/octet-stream"),
+            ("./no-extension", "application/octet-stream"),
+        ],
+    )
+    def test_file_content_type(self, http_resp: Type[_HTTPResponse], path: str, expected_content_type: str):
+        assert http_resp.file_content_type(path) == expected_content_type
+
+    def test_prepare_file(self, http_resp: Type[_HTTPResponse], tmp_path):
+        file_path = tmp_path / "events.ndjson"
+        file_path.write_bytes(b'{"id": 1}\n{"id": 2}\n')
+        with patch("builtins.open") as mock_file_stream:
+            prepared_file = http_resp.prepare_file(
+                data=HTTPResponse(strategy=ResponseStrategy.FILE, path=str(file_path), stream=True)
+            )
+            # It doesn't read the file
+            mock_file_stream.assert_not_called()
+        assert prepared_file.path == os.path.abspath(file_path)
+        assert prepared_file.content_type == "application/x-ndjson"
+
+    def test_prepare_not_exist_file(self, http_resp: Type[_HTTPResponse]):
+        with pytest.raises(FileNotFoundError):
+            http_resp.prepare_file(data=HTTPResponse(strategy=ResponseStrategy.FILE, path=_Not_Exist_File_Name))
+
     def test_response_with_json_file_name(self, http_resp: Type[_HTTPResponse]):
         with patch.object(os.path, "exists", return_value=True) as os_path_exists:
             json_content_str = json.dumps(_Json_File_Content)
@@ -1094,3 +1144,133 @@ class TestInnerHTTPResponse:
         with pytest.raises(TypeError) as exc_info:
             http_resp.generate(data=_MockHTTPResponse.with_invalid_strategy())
         assert re.search(r".{0,32}invalid.{0,32}", str(exc_info.value), re.IGNORECASE)
+
+    def test_compile_object(self, http_resp: Type[_HTTPResponse]):
+        mock_response_data = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[
+                ResponseProperty(name="id", required=True, value_type="int"),
+                ResponseProperty(
+                    name="code",
+                    required=True,
+                    value_type="str",
+                    value_format=Format(strategy=FormatStrategy.FROM_ENUMS, enums=["A", "B"]),
+                ),
+                ResponseProperty(
+                    name="tags",
+                    required=True,
+                    value_type="list",
+                    value_format=Format(size=Size(only_equal=3)),
+                    items=[IteratorItem(name="", value_type="str", required=True)],
+                ),
+            ],
+        )
+        generator = http_resp.compile_object(data=mock_response_data)
+
+        resp_data = generator()
+        assert resp_data["id"] == "random integer"
+        assert resp_data["code"] in ["A", "B"]
+        assert resp_data["tags"] == ["random string"] * 3
+        # Every calling should generate a new response data
+        another_resp_data = generator()
+        assert another_resp_data == {**resp_data, "code": another_resp_data["code"]}
+        assert another_resp_data["tags"] is not resp_data["tags"]
+
+    @staticmethod
+    def _response_with_streamed_list(stream_format: StreamFormat, with_other_property: bool = True) -> HTTPResponse:
+        properties = [
+            ResponseProperty(
+                name="users",
+                required=True,
+                value_type="list",
+                value_format=Format(size=Size(only_equal=25)),
+                items=[
+                    IteratorItem(
+                        name="id",
+                        value_type="int",
+                        required=True,
+                        value_format=Format(strategy=FormatStrategy.BY_DATA_TYPE),
+                    ),
+                ],
+            ),
+        ]
+        if with_other_property:
+            properties.insert(0, ResponseProperty(name="message", required=True, value_type="str"))
+            properties.append(
+                ResponseProperty(
+                    name="tags",
+                    required=True,
+                    value_type="list",
+                    value_format=Format(size=Size(max_value=0, min_value=0)),
+                    items=[IteratorItem(name="", value_type="str", required=True)],
+                )
+            )
+        return HTTPResponse(
+            strategy=ResponseStrategy.OBJECT, properties=properties, stream=True, stream_format=stream_format
+        )
+
+    def test_compile_object_stream_as_json(self, http_resp: Type[_HTTPResponse]):
+        with patch.object(http_resp, "stream_batch_size", 10):
+            prepared_stream = http_resp.compile_object_stream(data=self._response_with_streamed_list(StreamFormat.JSON))
+            chunks = list(prepared_stream.generate())
+        assert prepared_stream.content_type == "application/json"
+        resp_data = json.loads(b"".join(chunks))
+        assert list(resp_data.keys()) == ["message", "users", "tags"]
+        assert resp_data["message"] == "random string"
+        assert len(resp_data["users"]) == 25
+        assert all(isinstance(user["id"], int) for user in resp_data["users"])
+        assert resp_data["tags"] == []
+        # The elements are generated and sent batch by batch
+        assert sum(1 for chunk in chunks if b'"id"' in chunk) == 3
+
+    def test_compile_object_stream_is_lazy(self, http_resp: Type[_HTTPResponse]):
+        prepared_stream = http_resp.compile_object_stream(data=self._response_with_streamed_list(StreamFormat.JSON))
+        with patch.object(http_resp, "_compile_collection_item") as mock_compile:
+            chunks = prepared_stream.generate()
+            mock_compile.assert_not_called()
+        assert json.loads(b"".join(chunks))["message"] == "random string"
+
+    def test_compile_object_stream_as_ndjson(self, http_resp: Type[_HTTPResponse]):
+        with patch.object(http_resp, "stream_batch_size", 10):
+            prepared_stream = http_resp.compile_object_stream(
+                data=self._response_with_streamed_list(StreamFormat.NDJSON, with_other_property=False)
+            )
+            chunks = list(prepared_stream.generate())
+        assert prepared_stream.content_type == "application/x-ndjson"
+        assert len(chunks) == 3
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        assert len(lines) == 25
+        assert all(isinstance(json.loads(line)["id"], int) for line in lines)
+
+    def test_compile_object_with_list_of_objects(self, http_resp: Type[_HTTPResponse]):
+        mock_response_data = HTTPResponse(
+            strategy=ResponseStrategy.OBJECT,
+            properties=[
+                ResponseProperty(
+                    name="users",
+                    required=True,
+                    value_type="list",
+                    value_format=Format(size=Size(max_value=5, min_value=2)),
+                    items=[
+                        IteratorItem(
+                            name="id",
+                            value_type="int",
+                            required=True,
+                            value_format=Format(strategy=FormatStrategy.BY_DATA_TYPE),
+                        ),
+                        IteratorItem(
+                            name="tags",
+                            value_type="list",
+                            required=True,
+                            value_format=Format(size=Size(only_equal=2)),
+                            items=[IteratorItem(name="", value_type="str", required=True)],
+                        ),
+                    ],
+                ),
+            ],
+        )
+        resp_data = http_resp.compile_object(data=mock_response_data)()
+        assert 2 <= len(resp_data["users"]) <= 5
+        for user in resp_data["users"]:
+            assert isinstance(user["id"], int)
+            assert user["tags"] == ["random string"] * 2
@@ -0,0 +1,65 @@
+from typing import Optional
+
+import pytest
+
+from fake_api_server.server.rest.application.route import APIRouteIndex
+
+
+class TestAPIRouteIndex:
+    @pytest.fixture(scope="function")
+    def route_index(self) -> APIRouteIndex:
+        return APIRouteIndex(
+            [
+                "/foo",
+                "/foo/<id>",
+                "/foo/<id>/process/<work_id>",
+                "/foo/latest",
+                "/foo/<id>/latest",
+                "/bar/file-<name>.json",
+                "/test/v1/<id>",
+            ]
+        )
+
+    def test_size(self, route_index: APIRouteIndex):
+        assert len(route_index) == 7
+        route_index.add("/foo")
+        assert len(route_index) == 7
+        route_index.add("/new")
+        assert len(route_index) == 8
+
+    @pytest.mark.parametrize(
+        ("api_path", "expected_url"),
+        [
+            ("/foo", "/foo"),
+            ("/foo/123", "/foo/<id>"),
+            ("/foo/latest", "/foo/latest"),
+            ("/foo/123/latest", "/foo/<id>/latest"),
+            ("/foo/latest/latest", "/foo/<id>/latest"),
+            ("/foo/123/process/666", "/foo/<id>/process/<work_id>"),
+            ("/bar/file-data.json", "/bar/file-<name>.json"),
+            ("/test/v1/1", "/test/v1/<id>"),
+            ("/foo/123/process", None),
+            ("/foo/123/process/666/extra", None),
+            ("/foo/1-2", None),
+            ("/bar/data.json", None),
+            ("/not-exist", None),
+        ],
+    )
+    def test_match(self, route_index: APIRouteIndex, api_path: str, expected_url: Optional[str]):
+        assert route_index.match(api_path) == expected_url
+
+    def test_remove(self, route_index: APIRouteIndex):
+        route_index.remove("/foo/<id>")
+        assert len(route_index) == 6
+        # It could still match the other URL paths which share the segments
+        assert route_index.match("/foo/123") is None
+        assert route_index.match("/foo/123/latest") == "/foo/<id>/latest"
+        assert route_index.match("/foo/latest") == "/foo/latest"
+
+        route_index.remove("/bar/file-<name>.json")
+        assert route_index.match("/bar/file-data.json") is None
+
+        # Remove the URL path which doesn't exist
+        route_index.remove("/not-exist/<id>")
+        route_index.remove("/foo/<id>")
+        assert len(route_index) == 5
@@ -0,0 +1,88 @@
+import re
+from typing import Any, Dict, Optional
+
+import pytest
+
+from fake_api_server.model.api_config.apis import APIParameter
+from fake_api_server.server.rest.application.validator import (
+    RequestParametersValidator,
+)
+
+
+def _param(**kwargs) -> APIParameter:
+    return APIParameter().deserialize(kwargs)
+
+
+class TestRequestParametersValidator:
+    @pytest.fixture(scope="class")
+    def validator(self) -> RequestParametersValidator:
+        return RequestParametersValidator(
+            parameters=[
+                _param(name="name", required=True, type="str"),
+                _param(name="age", required=False, type="int"),
+                _param(
+                    name="code",
+                    required=False,
+                    type="str",
+                    format={"strategy": "from_enums", "enums": ["A", "B"]},
+                ),
+                _param(
+                    name="price",
+                    required=False,
+                    type="str",
+                    format={
+                        "strategy": "customize",
+                        "customize": "<amount> USD",
+                        "variables": [{"name": "amount", "value_format": "int"}],
+                    },
+                ),
+                _param(name="ids", required=False, type="list", items=[{"type": "int"}]),
+                _param(
+                    name="users",
+                    required=False,
+                    type="list",
+                    items=[{"name": "id", "required": True, "type": "int"}, {"name": "nick", "type": "str"}],
+                ),
+            ]
+        )
+
+    @pytest.mark.parametrize(
+        ("req_params", "expected_err_msg"),
+        [
+            ({"name": "Bob"}, None),
+            ({"name": "Bob", "age": 18, "code": "A", "price": "100 USD"}, None),
+            ({"name": "Bob", "ids": [1, 2], "users": [{"id": 1, "nick": "b"}]}, None),
+            ({}, r"Miss required parameter \*name\*"),
+            ({"name": None}, r"Miss required parameter \*name\*"),
+            ({"name": "Bob", "age": "18"}, r"type of data .{1,64} different"),
+            ({"name": "Bob", "ids": [1, "2"]}, r"type of data .{1,64} different"),
+            ({"name": "Bob", "users": [{"nick": "b"}]}, r"Miss required parameter \*users.id\*"),
+            ({"name": "Bob", "users": [{"id": "1", "nick": "b"}]}, r"type of data .{1,64} different"),
+            ({"name": "Bob", "code": "C"}, r"format of data .{1,64}'code'.{1,128}enums"),
+            ({"name": "Bob", "price": "abc USD"}, r"format of data .{1,64}'price'.{1,128}<amount> USD"),
+        ],
+    )
+    def test_validate(
+        self, validator: RequestParametersValidator, req_params: Dict[str, Any], expected_err_msg: Optional[str]
+    ):
+        err_msg = validator.validate(req_params)
+        if expected_err_msg is None:
+            assert err_msg is None
+        else:
+            assert err_msg is not None
+            assert re.search(expected_err_msg, err_msg, re.IGNORECASE)
+
+    @pytest.mark.parametrize(
+        ("value", "is_valid"),
+        [
+            ("18", True),
+            ("abc", False),
+        ],
+    )
+    def test_validate_number_value_in_string(self, value: str, is_valid: bool):
+        validator = RequestParametersValidator(
+            parameters=[_param(name="age", required=True, type="int")],
+            int_type_value_is_string=True,
+        )
+        err_msg = validator.validate({"age": value})
+        assert (err_msg is None) is is_valid
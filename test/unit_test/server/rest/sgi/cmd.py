@@ -90,6 +90,7 @@ class BaseSGIServerTestSpec(metaclass=ABCMeta):
             log_level=sgi_cmd.options.log_level(level=mock_parser_arg_obj.log_level),
             daemon=mock_parser_arg_obj.daemon,
             access_log_file=mock_parser_arg_obj.access_log_file,
+            preload=sgi_cmd.options.preload(enable=mock_parser_arg_obj.preload),
         )
         assert isinstance(command, Command)
 
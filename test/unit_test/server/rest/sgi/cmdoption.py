@@ -1,3 +1,4 @@
+import pathlib
 from abc import ABCMeta, abstractmethod
 from typing import List, Tuple
 
@@ -98,12 +99,45 @@ class BaseCommandOptionTest(metaclass=ABCMeta):
     def _expected_log_level_option(self, log_level: str) -> str:
         return f"--log-level {log_level}"
 
+    @pytest.mark.parametrize("enable", [True, False])
+    def test_preload(self, cmd_option: BaseCommandOption, enable: bool):
+        assert cmd_option.preload(enable=enable) == self._expected_preload_option(enable)
+
+    def _expected_preload_option(self, enable: bool) -> str:
+        return ""
+
 
 class TestWSGICmdOption(BaseCommandOptionTest):
     @pytest.fixture(scope="function")
     def cmd_option(self) -> WSGICmdOption:
         return WSGICmdOption()
 
+    def _expected_preload_option(self, enable: bool) -> str:
+        return "--preload --config python:fake_api_server.server.rest.sgi.gunicorn_hooks" if enable else ""
+
+    @pytest.mark.parametrize(
+        ("gunicorn_cmd_args", "has_config_file"),
+        [
+            ("--config ./my.conf.py", False),
+            ("--workers 2 -c ./my.conf.py", False),
+            ("--config=./my.conf.py", False),
+            ("", True),
+        ],
+    )
+    def test_preload_with_gunicorn_config(
+        self,
+        cmd_option: WSGICmdOption,
+        gunicorn_cmd_args: str,
+        has_config_file: bool,
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GUNICORN_CMD_ARGS", gunicorn_cmd_args)
+        if has_config_file:
+            (tmp_path / "gunicorn.conf.py").write_text("workers = 2\n")
+        assert cmd_option.preload(enable=True) == "--preload"
+
 
 class TestASGICmdOption(BaseCommandOptionTest):
     @pytest.fixture(scope="function")
@@ -0,0 +1,29 @@
+import gc
+from unittest.mock import Mock
+
+import pytest
+
+from fake_api_server.server.rest.sgi import gunicorn_hooks
+
+
+@pytest.mark.parametrize("preload", [True, False])
+def test_when_ready(preload: bool):
+    server = Mock()
+    server.cfg.preload_app = preload
+    try:
+        gunicorn_hooks.when_ready(server)
+        assert (gc.get_freeze_count() > 0) is preload
+    finally:
+        gc.unfreeze()
+    assert server.log.info.call_count == (2 if preload else 1)
+
+
+def test_post_fork_and_post_worker_init():
+    server, worker = Mock(), Mock()
+    worker.pid = 1234
+
+    gunicorn_hooks.post_fork(server, worker)
+    gunicorn_hooks.post_worker_init(worker)
+
+    assert "pid: 1234" in server.log.info.call_args[0][0]
+    assert "after initializing" in worker.log.info.call_args[0][0]
@@ -47,6 +47,11 @@ class TestCommandOptions:
         expected_options = " ".join([host_and_port, workers, log_level])
         assert options == expected_options, "The string value should be the same."
 
+    def test_all_options_with_preload(self, command_options: CommandOptions):
+        command_options.preload = "--preload"
+        host_and_port, workers, log_level = _get_cmd_options()
+        assert command_options.all_options == [host_and_port, workers, log_level, "--preload"]
+
     def test_all_options(self, command_options: CommandOptions):
         host_and_port, workers, log_level = _get_cmd_options()
         assert command_options.all_options == [